@@ -101,6 +101,7 @@ from .setup import (
     async_notify_setup_error,
     async_set_domains_to_be_loaded,
     async_setup_component,
+    async_trace_setup,
 )
 from .util.async_ import create_eager_task
 from .util.hass_dict import HassKey
@@ -140,6 +141,9 @@ STAGE_2_TIMEOUT = 300
 WRAP_UP_TIMEOUT = 300
 COOLDOWN_TIME = 60
 
+# Name the bootstrap stages are recorded under in the startup trace
+TRACE_BOOTSTRAP = "bootstrap"
+
 # Core integrations are unconditionally loaded
 CORE_INTEGRATIONS = {"homeassistant", "persistent_notification"}
 
@@ -458,6 +462,7 @@ async def async_load_base_functionality(hass: core.HomeAssistant) -> None:
         create_eager_task(label_registry.async_load(hass)),
         hass.async_add_executor_job(_init_blocking_io_modules_in_executor),
         create_eager_task(template.async_load_custom_templates(hass)),
+        create_eager_task(template.async_load_template_bytecode(hass)),
         create_eager_task(restore_state.async_load(hass)),
         create_eager_task(hass.config_entries.async_initialize()),
         create_eager_task(async_get_system_info(hass)),
@@ -475,6 +480,7 @@ async def async_from_config_dict(
     start = monotonic()
 
     hass.config_entries = config_entries.ConfigEntries(hass, config)
+    await loader.async_load_integration_cache(hass)
     # Prime custom component cache early so we know if registry entries are tied
     # to a custom integration
     await loader.async_get_custom_components(hass)
@@ -518,6 +524,11 @@ async def async_from_config_dict(
 
     stop = monotonic()
     _LOGGER.info("Home Assistant initialized in %.2fs", stop - start)
+    _LOGGER.info(
+        "Integrations resolved for startup: %s",
+        loader.async_describe_integration_cache(hass),
+    )
+    loader.async_save_integration_cache(hass)
 
     if (
         REQUIRED_NEXT_PYTHON_HA_RELEASE
@@ -925,46 +936,53 @@ async def _async_set_up_integrations(
         async_set_domains_to_be_loaded(hass, to_be_loaded)
         stage_2_domains -= to_be_loaded
 
-        if timeout is None:
-            await _async_setup_multi_components(hass, domain_group, config)
-        else:
-            try:
-                async with hass.timeout.async_timeout(timeout, cool_down=COOLDOWN_TIME):
-                    await _async_setup_multi_components(hass, domain_group, config)
-            except TimeoutError:
-                _LOGGER.warning(
-                    "Setup timed out for %s waiting on %s - moving forward",
-                    name,
-                    hass._active_tasks,  # noqa: SLF001
-                )
+        with async_trace_setup(hass, TRACE_BOOTSTRAP, name):
+            if timeout is None:
+                await _async_setup_multi_components(hass, domain_group, config)
+            else:
+                try:
+                    async with hass.timeout.async_timeout(
+                        timeout, cool_down=COOLDOWN_TIME
+                    ):
+                        await _async_setup_multi_components(hass, domain_group, config)
+                except TimeoutError:
+                    _LOGGER.warning(
+                        "Setup timed out for %s waiting on %s - moving forward",
+                        name,
+                        hass._active_tasks,  # noqa: SLF001
+                    )
 
     # Add after dependencies when setting up stage 2 domains
     async_set_domains_to_be_loaded(hass, stage_2_domains)
 
     if stage_2_domains:
         _LOGGER.info("Setting up stage 2: %s", stage_2_domains)
+        with async_trace_setup(hass, TRACE_BOOTSTRAP, "stage 2"):
+            try:
+                async with hass.timeout.async_timeout(
+                    STAGE_2_TIMEOUT, cool_down=COOLDOWN_TIME
+                ):
+                    await _async_setup_multi_components(hass, stage_2_domains, config)
+            except TimeoutError:
+                _LOGGER.warning(
+                    "Setup timed out for stage 2 waiting on %s - moving forward",
+                    hass._active_tasks,  # noqa: SLF001
+                )
+
+    # Wrap up startup
+    _LOGGER.debug("Waiting for startup to wrap up")
+    with async_trace_setup(hass, TRACE_BOOTSTRAP, "wrap up"):
         try:
             async with hass.timeout.async_timeout(
-                STAGE_2_TIMEOUT, cool_down=COOLDOWN_TIME
+                WRAP_UP_TIMEOUT, cool_down=COOLDOWN_TIME
             ):
-                await _async_setup_multi_components(hass, stage_2_domains, config)
+                await hass.async_block_till_done()
         except TimeoutError:
             _LOGGER.warning(
-                "Setup timed out for stage 2 waiting on %s - moving forward",
+                "Setup timed out for bootstrap waiting on %s - moving forward",
                 hass._active_tasks,  # noqa: SLF001
             )
 
-    # Wrap up startup
-    _LOGGER.debug("Waiting for startup to wrap up")
-    try:
-        async with hass.timeout.async_timeout(WRAP_UP_TIMEOUT, cool_down=COOLDOWN_TIME):
-            await hass.async_block_till_done()
-    except TimeoutError:
-        _LOGGER.warning(
-            "Setup timed out for bootstrap waiting on %s - moving forward",
-            hass._active_tasks,  # noqa: SLF001
-        )
-
     watcher.async_stop()
 
     if _LOGGER.isEnabledFor(logging.DEBUG):
@@ -973,6 +991,9 @@ async def _async_set_up_integrations(
             "Integration setup times: %s",
             dict(sorted(setup_time.items(), key=itemgetter(1), reverse=True)),
         )
+        _LOGGER.debug(
+            "Platform import times: %s", loader.async_get_platform_import_timings(hass)
+        )
 
 
 class _WatchPendingSetups:
@@ -56,6 +56,7 @@ from homeassistant.helpers.issue_registry import (
     async_create_issue,
     async_delete_issue,
 )
+from homeassistant.helpers.reference_index import ReferenceIndex
 from homeassistant.helpers.restore_state import RestoreEntity
 from homeassistant.helpers.script import (
     ATTR_CUR,
@@ -99,6 +100,7 @@ from .helpers import async_get_blueprints
 from .trace import trace_automation
 
 DATA_COMPONENT: HassKey[EntityComponent[BaseAutomationEntity]] = HassKey(DOMAIN)
+DATA_REFERENCE_INDEX: HassKey[ReferenceIndex] = HassKey(f"{DOMAIN}_reference_index")
 ENTITY_ID_FORMAT = DOMAIN + ".{}"
 
 
@@ -137,14 +139,10 @@ def _automations_with_x(
     hass: HomeAssistant, referenced_id: str, property_name: str
 ) -> list[str]:
     """Return all automations that reference the x."""
-    if DATA_COMPONENT not in hass.data:
+    if DATA_REFERENCE_INDEX not in hass.data:
         return []
 
-    return [
-        automation_entity.entity_id
-        for automation_entity in hass.data[DATA_COMPONENT].entities
-        if referenced_id in getattr(automation_entity, property_name)
-    ]
+    return hass.data[DATA_REFERENCE_INDEX].async_get(property_name, referenced_id)
 
 
 def _x_in_automation(
@@ -223,14 +221,7 @@ def labels_in_automation(hass: HomeAssistant, entity_id: str) -> list[str]:
 @callback
 def automations_with_blueprint(hass: HomeAssistant, blueprint_path: str) -> list[str]:
     """Return all automations that reference the blueprint."""
-    if DOMAIN not in hass.data:
-        return []
-
-    return [
-        automation_entity.entity_id
-        for automation_entity in hass.data[DATA_COMPONENT].entities
-        if automation_entity.referenced_blueprint == blueprint_path
-    ]
+    return _automations_with_x(hass, blueprint_path, "referenced_blueprint")
 
 
 @callback
@@ -250,6 +241,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     hass.data[DATA_COMPONENT] = component = EntityComponent[BaseAutomationEntity](
         LOGGER, DOMAIN, hass
     )
+    hass.data[DATA_REFERENCE_INDEX] = ReferenceIndex()
 
     # Register automation as valid domain for Blueprint
     async_get_blueprints(hass)
@@ -376,6 +368,16 @@ class BaseAutomationEntity(ToggleEntity, ABC):
     ) -> ScriptRunResult | None:
         """Trigger automation."""
 
+    async def async_internal_added_to_hass(self) -> None:
+        """Add the automation to the reference index."""
+        await super().async_internal_added_to_hass()
+        self.hass.data[DATA_REFERENCE_INDEX].async_add(self)
+
+    async def async_internal_will_remove_from_hass(self) -> None:
+        """Remove the automation from the reference index."""
+        self.hass.data[DATA_REFERENCE_INDEX].async_remove(self)
+        await super().async_internal_will_remove_from_hass()
+
 
 class UnavailableAutomationEntity(BaseAutomationEntity):
     """A non-functional automation entity with its state set to unavailable.
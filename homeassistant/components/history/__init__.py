@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime as dt, timedelta
 from http import HTTPStatus
+import threading
 from typing import cast
 
 from aiohttp import web
@@ -13,10 +15,11 @@ from homeassistant.components import frontend
 from homeassistant.components.http import KEY_HASS, HomeAssistantView
 from homeassistant.components.recorder import get_instance, history
 from homeassistant.components.recorder.util import session_scope
-from homeassistant.const import CONF_EXCLUDE, CONF_INCLUDE
+from homeassistant.const import CONF_EXCLUDE, CONF_INCLUDE, CONTENT_TYPE_JSON
 from homeassistant.core import HomeAssistant, valid_entity_id
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.entityfilter import INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA
+from homeassistant.helpers.json import json_bytes
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.util import dt as dt_util
 
@@ -60,7 +63,7 @@ class HistoryPeriodView(HomeAssistantView):
 
     async def get(
         self, request: web.Request, datetime: str | None = None
-    ) -> web.Response:
+    ) -> web.StreamResponse:
         """Return history over a period of time."""
         datetime_ = None
         query = request.query
@@ -121,6 +124,18 @@ class HistoryPeriodView(HomeAssistantView):
         ):
             return self.json([])
 
+        if "stream" in query:
+            return await self._async_stream_significant_states_json(
+                request,
+                start_time,
+                end_time,
+                entity_ids,
+                include_start_time_state,
+                significant_changes_only,
+                minimal_response,
+                no_attributes,
+            )
+
         return cast(
             web.Response,
             await get_instance(hass).async_add_executor_job(
@@ -165,3 +180,102 @@ class HistoryPeriodView(HomeAssistantView):
                     ).values()
                 )
             )
+
+    async def _async_stream_significant_states_json(
+        self,
+        request: web.Request,
+        start_time: dt,
+        end_time: dt,
+        entity_ids: list[str],
+        include_start_time_state: bool,
+        significant_changes_only: bool,
+        minimal_response: bool,
+        no_attributes: bool,
+    ) -> web.StreamResponse:
+        """Stream significant states from the database as json.
+
+        The states of all entities are fetched with a single query and the
+        states of each entity are written to the response as soon as its
+        rows have been read. The query never waits on the client, so a slow
+        client does not hold a database connection while it reads.
+        """
+        hass = request.app[KEY_HASS]
+        queue: asyncio.Queue[bytes | None] = asyncio.Queue()
+        cancel = threading.Event()
+        producer = get_instance(hass).async_add_executor_job(
+            self._stream_significant_states_json,
+            hass,
+            queue,
+            cancel,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+        )
+        try:
+            # The response is only prepared once the query succeeded so
+            # a database error does not leave a truncated response behind
+            if (chunk := await queue.get()) is None:
+                await producer
+                return self.json([])
+            response = web.StreamResponse(headers={"Content-Type": CONTENT_TYPE_JSON})
+            response.enable_compression()
+            await response.prepare(request)
+            separator = b"["
+            while chunk is not None:
+                await response.write(separator + chunk)
+                separator = b","
+                chunk = await queue.get()
+            await producer
+            await response.write(b"]")
+            await response.write_eof()
+            return response
+        finally:
+            cancel.set()
+            while not queue.empty():
+                queue.get_nowait()
+
+    def _stream_significant_states_json(
+        self,
+        hass: HomeAssistant,
+        queue: asyncio.Queue[bytes | None],
+        cancel: threading.Event,
+        start_time: dt,
+        end_time: dt,
+        entity_ids: list[str],
+        include_start_time_state: bool,
+        significant_changes_only: bool,
+        minimal_response: bool,
+        no_attributes: bool,
+    ) -> None:
+        """Fetch significant states from the database and queue them as json.
+
+        None is queued once all entities have been queued, or the
+        query failed.
+        """
+
+        def _put(chunk: bytes | None) -> None:
+            hass.loop.call_soon_threadsafe(queue.put_nowait, chunk)
+
+        try:
+            with session_scope(hass=hass, read_only=True) as session:
+                for _, states in history.iter_significant_states_with_session(
+                    hass,
+                    session,
+                    start_time,
+                    end_time,
+                    list(dict.fromkeys(entity_ids)),
+                    include_start_time_state,
+                    significant_changes_only,
+                    minimal_response,
+                    no_attributes,
+                ):
+                    if cancel.is_set():
+                        return
+                    _put(json_bytes(states))
+        finally:
+            if not cancel.is_set():
+                _put(None)
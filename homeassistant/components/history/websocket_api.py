@@ -13,6 +13,7 @@ import voluptuous as vol
 
 from homeassistant.components import websocket_api
 from homeassistant.components.recorder import get_instance, history
+from homeassistant.components.recorder.util import session_scope
 from homeassistant.components.websocket_api import ActiveConnection, messages
 from homeassistant.const import (
     COMPRESSED_STATE_ATTRIBUTES,
@@ -228,29 +229,31 @@ def _generate_historical_response(
     send_empty: bool,
 ) -> tuple[float, dt | None, bytes | None]:
     """Generate a historical response."""
-    states = cast(
-        dict[str, list[dict[str, Any]]],
-        history.get_significant_states(
+    states: dict[str, list[dict[str, Any]]] = {}
+    last_time_ts = 0.0
+    with session_scope(hass=hass, read_only=True) as session:
+        for entity_id, state_list in history.iter_significant_states_with_session(
             hass,
+            session,
             start_time,
             end_time,
             entity_ids,
-            None,
             include_start_time_state,
             significant_changes_only,
             minimal_response,
             no_attributes,
             True,
-        ),
-    )
-    last_time_ts = 0.0
-    for state_list in states.values():
-        if (
-            state_list
-            and (state_last_time := state_list[-1][COMPRESSED_STATE_LAST_UPDATED])
-            > last_time_ts
         ):
-            last_time_ts = cast(float, state_last_time)
+            entity_states = cast(list[dict[str, Any]], state_list)
+            states[entity_id] = entity_states
+            if (
+                entity_states
+                and (
+                    state_last_time := entity_states[-1][COMPRESSED_STATE_LAST_UPDATED]
+                )
+                > last_time_ts
+            ):
+                last_time_ts = cast(float, state_last_time)
 
     if last_time_ts == 0:
         # If we did not send any states ever, we need to send an empty response
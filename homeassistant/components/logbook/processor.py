@@ -2,13 +2,14 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable, Generator, Sequence
+from collections.abc import Callable, Generator, Iterable, Sequence
 from dataclasses import dataclass
 from datetime import datetime as dt
 import logging
 import time
 from typing import TYPE_CHECKING, Any
 
+from lru import LRU
 from sqlalchemy.engine import Result
 from sqlalchemy.engine.row import Row
 
@@ -21,8 +22,8 @@ from homeassistant.components.recorder.models import (
     process_timestamp_to_utc_isoformat,
 )
 from homeassistant.components.recorder.util import (
-    execute_stmt_lambda_element,
     session_scope,
+    stream_stmt_lambda_element,
 )
 from homeassistant.components.sensor import DOMAIN as SENSOR_DOMAIN
 from homeassistant.const import (
@@ -36,6 +37,7 @@ from homeassistant.const import (
 )
 from homeassistant.core import HomeAssistant, split_entity_id
 from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.json import json_bytes
 from homeassistant.util import dt as dt_util
 from homeassistant.util.event_type import EventType
 
@@ -84,12 +86,23 @@ from .queries.common import PSEUDO_EVENT_STATE_CHANGED
 
 _LOGGER = logging.getLogger(__name__)
 
+# The caches are bounded so the memory used by a logbook run stays flat
+# no matter how many rows it has to humanify. Contexts are usually
+# referenced shortly after their origin, so only the least recently
+# used ones are dropped. An entry whose context origin was dropped is
+# not augmented with the context_* keys of the origin (context_entity_id,
+# context_event_type, context_domain, ...), only context_user_id is kept
+# since it is stored with the entry's own row.
+CONTEXT_LOOKUP_SIZE = 65536
+EVENT_CACHE_SIZE = 8192
+ENTITY_NAME_CACHE_SIZE = 4096
+
 
 @dataclass(slots=True)
 class LogbookRun:
     """A logbook run which may be a long running event stream or single request."""
 
-    context_lookup: dict[bytes | None, Row | EventAsRow | None]
+    context_lookup: LRU[bytes | None, Row | EventAsRow | None]
     external_events: dict[
         EventType[Any] | str,
         tuple[str, Callable[[LazyEventPartialState], dict[str, Any]]],
@@ -126,8 +139,12 @@ class EventProcessor:
         self.context_id = context_id
         logbook_config: LogbookConfig = hass.data[DOMAIN]
         self.filters: Filters | None = logbook_config.sqlalchemy_filter
+        context_lookup: LRU[bytes | None, Row | EventAsRow | None] = LRU(
+            CONTEXT_LOOKUP_SIZE
+        )
+        context_lookup[None] = None
         self.logbook_run = LogbookRun(
-            context_lookup={None: None},
+            context_lookup=context_lookup,
             external_events=logbook_config.external_events,
             event_cache=EventCache({}),
             entity_name_cache=EntityNameCache(self.hass),
@@ -156,6 +173,17 @@ class EventProcessor:
         end_day: dt,
     ) -> list[dict[str, Any]]:
         """Get events for a period of time."""
+        return list(self.iter_events(start_day, end_day))
+
+    def iter_events(
+        self,
+        start_day: dt,
+        end_day: dt,
+    ) -> Generator[dict[str, Any]]:
+        """Generate the events for a period of time as the rows are fetched.
+
+        The session stays open until the generator is exhausted or closed.
+        """
         with session_scope(hass=self.hass, read_only=True) as session:
             metadata_ids: list[int] | None = None
             instance = get_instance(self.hass)
@@ -180,8 +208,12 @@ class EventProcessor:
                 self.filters,
                 self.context_id,
             )
-            return self.humanify(
-                execute_stmt_lambda_element(session, stmt, orm_rows=False)
+            yield from _humanify(
+                self.hass,
+                stream_stmt_lambda_element(session, stmt),
+                self.ent_reg,
+                self.logbook_run,
+                self.context_augmenter,
             )
 
     def humanify(
@@ -199,6 +231,20 @@ class EventProcessor:
         )
 
 
+def events_to_json_array(
+    events: Iterable[dict[str, Any]],
+) -> tuple[bytes, dict[str, Any] | None]:
+    """Convert events to a JSON array one event at a time.
+
+    Returns the JSON array and the last event.
+    """
+    fragments: list[bytes] = []
+    event: dict[str, Any] | None = None
+    for event in events:
+        fragments.append(json_bytes(event))
+    return b"".join((b"[", b",".join(fragments), b"]")), event
+
+
 def _humanify(
     hass: HomeAssistant,
     rows: Generator[EventAsRow] | Sequence[Row] | Result,
@@ -400,20 +446,22 @@ class EntityNameCache:
     def __init__(self, hass: HomeAssistant) -> None:
         """Init the cache."""
         self._hass = hass
-        self._names: dict[str, str] = {}
+        self._names: LRU[str, str] = LRU(ENTITY_NAME_CACHE_SIZE)
 
     def get(self, entity_id: str) -> str:
         """Lookup an the friendly name."""
-        if entity_id in self._names:
-            return self._names[entity_id]
+        if (name := self._names.get(entity_id)) is not None:
+            return name
         if (current_state := self._hass.states.get(entity_id)) and (
             friendly_name := current_state.attributes.get(ATTR_FRIENDLY_NAME)
         ):
-            self._names[entity_id] = friendly_name
+            name = friendly_name
         else:
-            return split_entity_id(entity_id)[1].replace("_", " ")
-
-        return self._names[entity_id]
+            # Entities without a friendly name are cached as well
+            # so rows of removed entities do not look them up again
+            name = split_entity_id(entity_id)[1].replace("_", " ")
+        self._names[entity_id] = name
+        return name
 
 
 class EventCache:
@@ -422,7 +470,9 @@ class EventCache:
     def __init__(self, event_data_cache: dict[str, dict[str, Any]]) -> None:
         """Init the cache."""
         self._event_data_cache = event_data_cache
-        self.event_cache: dict[Row | EventAsRow, LazyEventPartialState] = {}
+        self.event_cache: LRU[Row | EventAsRow, LazyEventPartialState] = LRU(
+            EVENT_CACHE_SIZE
+        )
 
     def get(self, row: EventAsRow | Row) -> LazyEventPartialState:
         """Get the event from the row."""
@@ -438,4 +488,4 @@ class EventCache:
     def clear(self) -> None:
         """Clear the event cache."""
         self._event_data_cache = {}
-        self.event_cache = {}
+        self.event_cache.clear()
@@ -8,6 +8,7 @@ from http import HTTPStatus
 from typing import Any
 
 from aiohttp import web
+import orjson
 import voluptuous as vol
 
 from homeassistant.components.http import KEY_HASS, HomeAssistantView
@@ -20,7 +21,7 @@ from homeassistant.helpers.typing import ConfigType
 from homeassistant.util import dt as dt_util
 
 from .helpers import async_determine_event_types
-from .processor import EventProcessor
+from .processor import EventProcessor, events_to_json_array
 
 
 @callback
@@ -109,6 +110,9 @@ class LogbookView(HomeAssistantView):
 
         def json_events() -> web.Response:
             """Fetch events and generate JSON."""
-            return self.json(event_processor.get_events(start_day, end_day))
+            events, _ = events_to_json_array(
+                event_processor.iter_events(start_day, end_day)
+            )
+            return self.json(orjson.Fragment(events))
 
         return await get_instance(hass).async_add_executor_job(json_events)
@@ -9,6 +9,7 @@ from datetime import datetime as dt, timedelta
 import logging
 from typing import Any
 
+import orjson
 import voluptuous as vol
 
 from homeassistant.components import websocket_api
@@ -27,7 +28,7 @@ from .helpers import (
     async_subscribe_events,
 )
 from .models import LogbookConfig, async_event_to_row
-from .processor import EventProcessor
+from .processor import EventProcessor, events_to_json_array
 
 MAX_PENDING_LOGBOOK_EVENTS = 2048
 EVENT_COALESCE_TIME = 0.35
@@ -174,7 +175,7 @@ async def _async_get_ws_stream_events(
 
 
 def _generate_stream_message(
-    events: list[dict[str, Any]], start_day: dt, end_day: dt
+    events: list[dict[str, Any]] | orjson.Fragment, start_day: dt, end_day: dt
 ) -> dict[str, Any]:
     """Generate a logbook stream message response."""
     return {
@@ -192,11 +193,13 @@ def _ws_stream_get_events(
     partial: bool,
 ) -> tuple[bytes, dt | None]:
     """Fetch events and convert them to json in the executor."""
-    events = event_processor.get_events(start_day, end_day)
+    events, last_event = events_to_json_array(
+        event_processor.iter_events(start_day, end_day)
+    )
     last_time = None
-    if events:
-        last_time = dt_util.utc_from_timestamp(events[-1]["when"])
-    message = _generate_stream_message(events, start_day, end_day)
+    if last_event:
+        last_time = dt_util.utc_from_timestamp(last_event["when"])
+    message = _generate_stream_message(orjson.Fragment(events), start_day, end_day)
     if partial:
         # This is a hint to consumers of the api that
         # we are about to send a another block of historical
@@ -434,11 +437,8 @@ def _ws_formatted_get_events(
     event_processor: EventProcessor,
 ) -> bytes:
     """Fetch events and convert them to json in the executor."""
-    return json_bytes(
-        messages.result_message(
-            msg_id, event_processor.get_events(start_time, end_time)
-        )
-    )
+    events, _ = events_to_json_array(event_processor.iter_events(start_time, end_time))
+    return messages.construct_result_message(msg_id, events)
 
 
 @websocket_api.websocket_command(
@@ -116,6 +116,10 @@ MAX_UNSUBSCRIBES_PER_CALL = 500
 
 MAX_PACKETS_TO_READ = 500
 
+# The number of distinct topics for which the matching subscriptions
+# are cached. Least recently used topics are evicted first.
+MATCHING_SUBSCRIPTIONS_CACHE_SIZE = 8192
+
 type SocketType = socket.socket | ssl.SSLSocket | mqtt._WebsocketWrapper | Any  # noqa: SLF001
 
 type SubscribePayloadType = str | bytes | bytearray  # Only bytes if encoding is None
@@ -265,12 +269,104 @@ class Subscription:
 
     topic: str
     is_simple_match: bool
-    complex_matcher: Callable[[str], bool] | None
     job: HassJob[[ReceiveMessage], Coroutine[Any, Any, None] | None]
     qos: int = 0
     encoding: str | None = "utf-8"
 
 
+class _SubscriptionTrieNode:
+    """Class to hold a single topic level of the subscription trie."""
+
+    __slots__ = ("children", "subscriptions")
+
+    def __init__(self) -> None:
+        """Initialize the node."""
+        self.children: dict[str, _SubscriptionTrieNode] = {}
+        # To ensure the subscriptions order is preserved, we use a dict
+        # with `None` values instead of a set.
+        self.subscriptions: dict[Subscription, None] = {}
+
+
+class SubscriptionTrie:
+    """Index of wildcard subscriptions keyed by topic level.
+
+    Matching a topic walks the trie one topic level at a time, following
+    the literal level, the single level wildcard `+` and the multi level
+    wildcard `#`. The cost of a match depends on the depth of the topic
+    instead of on the number of wildcard subscriptions.
+    """
+
+    __slots__ = ("_root",)
+
+    def __init__(self) -> None:
+        """Initialize the trie."""
+        self._root = _SubscriptionTrieNode()
+
+    def add(self, subscription: Subscription) -> None:
+        """Add a subscription to the trie."""
+        node = self._root
+        for level in subscription.topic.split("/"):
+            if (child := node.children.get(level)) is None:
+                child = node.children[level] = _SubscriptionTrieNode()
+            node = child
+        node.subscriptions[subscription] = None
+
+    def remove(self, subscription: Subscription) -> None:
+        """Remove a subscription from the trie.
+
+        Raises KeyError if the subscription is not in the trie.
+        """
+        node = self._root
+        path: list[tuple[_SubscriptionTrieNode, str]] = []
+        for level in subscription.topic.split("/"):
+            path.append((node, level))
+            node = node.children[level]
+        del node.subscriptions[subscription]
+        # Prune the branches that no longer hold any subscriptions
+        for parent, level in reversed(path):
+            child = parent.children[level]
+            if child.subscriptions or child.children:
+                break
+            del parent.children[level]
+
+    def has_topic(self, topic: str) -> bool:
+        """Return True if a subscription with exactly this topic filter exists."""
+        node = self._root
+        for level in topic.split("/"):
+            if (child := node.children.get(level)) is None:
+                return False
+            node = child
+        return bool(node.subscriptions)
+
+    def match(self, topic: str) -> list[Subscription]:
+        """Return the subscriptions with a topic filter that matches the topic.
+
+        Topics starting with `$` are not matched by a wildcard
+        on the first topic level.
+        """
+        levels = topic.split("/")
+        num_levels = len(levels)
+        # Wildcards on the first level must not match topics starting with $
+        normal = topic[:1] != "$"
+        matches: list[Subscription] = []
+        pending: list[tuple[_SubscriptionTrieNode, int]] = [(self._root, 0)]
+        while pending:
+            node, idx = pending.pop()
+            children = node.children
+            wildcard_allowed = normal or idx > 0
+            if wildcard_allowed and (multi_level := children.get("#")) is not None:
+                # A multi level wildcard also matches the parent level
+                matches.extend(multi_level.subscriptions)
+            if idx == num_levels:
+                matches.extend(node.subscriptions)
+                continue
+            if wildcard_allowed and (single_level := children.get("+")) is not None:
+                pending.append((single_level, idx + 1))
+            if (literal := children.get(levels[idx])) is not None:
+                pending.append((literal, idx + 1))
+        return matches
+
+
 class MqttClientSetup:
     """Helper class to setup the paho mqtt client from config."""
 
@@ -378,6 +474,9 @@ class MQTT:
         # To ensure the wildcard subscriptions order is preserved, we use a dict
         # with `None` values instead of a set.
         self._wildcard_subscriptions: dict[Subscription, None] = {}
+        # The wildcard subscriptions are indexed in a trie keyed by topic level
+        # so matching a topic does not need to test every wildcard subscription.
+        self._wildcard_subscriptions_trie = SubscriptionTrie()
         # _retained_topics prevents a Subscription from receiving a
         # retained message more than once per topic. This prevents flooding
         # already active subscribers when new subscribers subscribe to a topic
@@ -625,8 +724,9 @@ class MQTT:
 
     def _is_active_subscription(self, topic: str) -> bool:
         """Check if a topic has an active subscription."""
-        return topic in self._simple_subscriptions or any(
-            other.topic == topic for other in self._wildcard_subscriptions
+        return (
+            topic in self._simple_subscriptions
+            or self._wildcard_subscriptions_trie.has_topic(topic)
         )
 
     async def async_publish(
@@ -759,6 +859,7 @@ class MQTT:
             self._simple_subscriptions[subscription.topic].add(subscription)
         else:
             self._wildcard_subscriptions[subscription] = None
+            self._wildcard_subscriptions_trie.add(subscription)
 
     @callback
     def _async_untrack_subscription(self, subscription: Subscription) -> None:
@@ -777,6 +878,7 @@ class MQTT:
                     del simple_subscriptions[topic]
             else:
                 del self._wildcard_subscriptions[subscription]
+                self._wildcard_subscriptions_trie.remove(subscription)
         except (KeyError, ValueError) as exc:
             raise HomeAssistantError(
                 translation_domain=DOMAIN,
@@ -847,9 +949,8 @@ class MQTT:
 
         job = HassJob(msg_callback, job_type=job_type)
         is_simple_match = not ("+" in topic or "#" in topic)
-        matcher = None if is_simple_match else _matcher_for_topic(topic)
 
-        subscription = Subscription(topic, is_simple_match, matcher, job, qos, encoding)
+        subscription = Subscription(topic, is_simple_match, job, qos, encoding)
         self._async_track_subscription(subscription)
         self._matching_subscriptions.cache_clear()
 
@@ -1057,18 +1158,13 @@ class MQTT:
             queue_only=True,
         )
 
-    @lru_cache(None)  # pylint: disable=method-cache-max-size-none
+    @lru_cache(MATCHING_SUBSCRIPTIONS_CACHE_SIZE)
     def _matching_subscriptions(self, topic: str) -> list[Subscription]:
         subscriptions: list[Subscription] = []
         if topic in self._simple_subscriptions:
             subscriptions.extend(self._simple_subscriptions[topic])
-        subscriptions.extend(
-            subscription
-            for subscription in self._wildcard_subscriptions
-            # mypy doesn't know that complex_matcher is always set when
-            # is_simple_match is False
-            if subscription.complex_matcher(topic)  # type: ignore[misc]
-        )
+        if self._wildcard_subscriptions:
+            subscriptions.extend(self._wildcard_subscriptions_trie.match(topic))
         return subscriptions
 
     @callback
@@ -1291,13 +1387,3 @@ class MQTT:
                 now if self._pending_subscriptions else self._last_subscribe
             )
             wait_until = max(last_discovery, last_subscribe) + DISCOVERY_COOLDOWN
-
-
-def _matcher_for_topic(subscription: str) -> Callable[[str], bool]:
-    # pylint: disable-next=import-outside-toplevel
-    from paho.mqtt.matcher import MQTTMatcher
-
-    matcher = MQTTMatcher()  # type: ignore[no-untyped-call]
-    matcher[subscription] = True
-
-    return lambda topic: next(matcher.iter_match(topic), False)  # type: ignore[no-untyped-call]
@@ -24,7 +24,10 @@ from homeassistant.core import HomeAssistant, ServiceCall, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.json import save_json
 from homeassistant.helpers.service import async_register_admin_service
+from homeassistant.loader import async_get_platform_import_timings
+from homeassistant.setup import SetupTraceSpan, async_get_setup_trace
 
 from .const import DOMAIN
 
@@ -40,6 +43,7 @@ SERVICE_LOG_THREAD_FRAMES = "log_thread_frames"
 SERVICE_LOG_EVENT_LOOP_SCHEDULED = "log_event_loop_scheduled"
 SERVICE_SET_ASYNCIO_DEBUG = "set_asyncio_debug"
 SERVICE_LOG_CURRENT_TASKS = "log_current_tasks"
+SERVICE_DUMP_STARTUP_TRACE = "dump_startup_trace"
 
 _LRU_CACHE_WRAPPER_OBJECT = _lru_cache_wrapper.__name__
 _SQLALCHEMY_LRU_OBJECT = "LRUCache"
@@ -63,6 +67,7 @@ SERVICES = (
     SERVICE_LOG_EVENT_LOOP_SCHEDULED,
     SERVICE_SET_ASYNCIO_DEBUG,
     SERVICE_LOG_CURRENT_TASKS,
+    SERVICE_DUMP_STARTUP_TRACE,
 )
 
 DEFAULT_SCAN_INTERVAL = timedelta(seconds=30)
@@ -260,6 +265,24 @@ async def async_setup_entry(  # noqa: C901
                 if not handle.cancelled():
                     _LOGGER.critical("Scheduled: %s", handle)
 
+    async def _async_dump_startup_trace(call: ServiceCall) -> None:
+        """Write the startup trace in the Chrome trace event format."""
+        start_time = int(time.time() * 1000000)
+        trace_path = hass.config.path(f"startup_trace.{start_time}.json")
+        trace = _startup_trace_events(
+            async_get_setup_trace(hass), async_get_platform_import_timings(hass)
+        )
+        await hass.async_add_executor_job(save_json, trace_path, trace)
+        persistent_notification.async_create(
+            hass,
+            (
+                f"Wrote the startup trace to {trace_path}, it can be opened with"
+                " chrome://tracing or https://ui.perfetto.dev"
+            ),
+            title="Startup trace written",
+            notification_id=f"profiler_startup_trace_{start_time}",
+        )
+
     async def _async_asyncio_debug(call: ServiceCall) -> None:
         """Enable or disable asyncio debug."""
         enabled = call.data[CONF_ENABLED]
@@ -382,6 +405,13 @@ async def async_setup_entry(  # noqa: C901
         _async_dump_current_tasks,
     )
 
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_DUMP_STARTUP_TRACE,
+        _async_dump_startup_trace,
+    )
+
     return True
 
 
@@ -478,6 +508,48 @@ def _write_memory_profile(heap, heap_path):
     heap.byrcs.dump(heap_path)
 
 
+def _startup_trace_events(
+    spans: list[SetupTraceSpan], platform_import_times: dict[str, float]
+) -> dict[str, Any]:
+    """Convert the startup trace to the Chrome trace event format.
+
+    Each integration gets its own thread so the spans of an integration
+    are shown on one row, ordered by when the integration started.
+    """
+    origin = spans[0].start if spans else 0.0
+    thread_ids: dict[str, int] = {}
+    events: list[dict[str, Any]] = []
+    for span in spans:
+        if (tid := thread_ids.get(span.integration)) is None:
+            tid = thread_ids[span.integration] = len(thread_ids) + 1
+            events.append(
+                {
+                    "name": "thread_name",
+                    "ph": "M",
+                    "pid": 1,
+                    "tid": tid,
+                    "args": {"name": span.integration},
+                }
+            )
+        events.append(
+            {
+                "name": span.name,
+                "cat": span.integration,
+                "ph": "X",
+                "pid": 1,
+                "tid": tid,
+                "ts": round((span.start - origin) * 1000000),
+                "dur": round((span.end - span.start) * 1000000),
+                "args": {"group": span.group},
+            }
+        )
+    return {
+        "traceEvents": events,
+        "displayTimeUnit": "ms",
+        "otherData": {"platform_import_times": platform_import_times},
+    }
+
+
 def _log_objects(*_):
     # Imports deferred to avoid loading modules
     # in memory since usually only one part of this
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from datetime import timedelta
 import logging
 from typing import Any
 
@@ -61,11 +62,15 @@ DEFAULT_COMMIT_INTERVAL = 5
 
 CONF_AUTO_PURGE = "auto_purge"
 CONF_AUTO_REPACK = "auto_repack"
+CONF_BULK_INSERT_STATES = "bulk_insert_states"
 CONF_DB_URL = "db_url"
 CONF_DB_MAX_RETRIES = "db_max_retries"
 CONF_DB_RETRY_WAIT = "db_retry_wait"
 CONF_PURGE_KEEP_DAYS = "purge_keep_days"
 CONF_PURGE_INTERVAL = "purge_interval"
+CONF_PARTITION_STATES = "partition_states"
+CONF_PURGE_ROWS_PER_SECOND = "purge_rows_per_second"
+CONF_RECENT_HISTORY_WINDOW = "recent_history_window"
 CONF_EVENT_TYPES = "event_types"
 CONF_COMMIT_INTERVAL = "commit_interval"
 
@@ -103,11 +108,19 @@ CONFIG_SCHEMA = vol.Schema(
                 {
                     vol.Optional(CONF_AUTO_PURGE, default=True): cv.boolean,
                     vol.Optional(CONF_AUTO_REPACK, default=True): cv.boolean,
+                    vol.Optional(CONF_BULK_INSERT_STATES, default=False): cv.boolean,
                     vol.Optional(CONF_PURGE_KEEP_DAYS, default=10): vol.All(
                         vol.Coerce(int), vol.Range(min=1)
                     ),
                     vol.Optional(CONF_PURGE_INTERVAL, default=1): cv.positive_int,
+                    vol.Optional(CONF_PARTITION_STATES, default=False): cv.boolean,
+                    vol.Optional(
+                        CONF_PURGE_ROWS_PER_SECOND, default=0
+                    ): cv.positive_int,
                     vol.Optional(CONF_DB_URL): vol.All(cv.string, validate_db_url),
+                    vol.Optional(
+                        CONF_RECENT_HISTORY_WINDOW, default=timedelta(0)
+                    ): cv.positive_time_period,
                     vol.Optional(
                         CONF_COMMIT_INTERVAL, default=DEFAULT_COMMIT_INTERVAL
                     ): cv.positive_int,
@@ -170,6 +183,10 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         db_retry_wait=db_retry_wait,
         entity_filter=entity_filter,
         exclude_event_types=exclude_event_types,
+        bulk_insert_states=conf[CONF_BULK_INSERT_STATES],
+        recent_history_window=conf[CONF_RECENT_HISTORY_WINDOW].total_seconds(),
+        purge_rows_per_second=conf[CONF_PURGE_ROWS_PER_SECOND],
+        partition_states=conf[CONF_PARTITION_STATES],
     )
     get_instance.cache_clear()
     instance.async_initialize()
@@ -0,0 +1,297 @@
+"""Bulk insert pipeline for the states written by the recorder."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import insert
+from sqlalchemy.orm.session import Session
+
+from homeassistant.util.collection import chunked_or_all
+
+from .db_schema import StateAttributes, States, StatesMeta
+
+if TYPE_CHECKING:
+    from .core import Recorder
+
+
+# The columns of the states table written for each new row
+_STATES_COLUMNS = (
+    "state",
+    "last_updated_ts",
+    "last_changed_ts",
+    "last_reported_ts",
+    "origin_idx",
+    "context_id_bin",
+    "context_user_id_bin",
+    "context_parent_id_bin",
+)
+
+
+class StatesBulkInserter:
+    """Collect new states and write them with multi row INSERTs.
+
+    The ORM path adds one States object per state_changed event to the
+    session and lets the unit of work flush them. The self referential
+    old_state relationship forces the unit of work to insert the rows
+    one at a time, which dominates the recorder thread on busy systems.
+
+    This class keeps the States, StatesMeta and StateAttributes objects
+    out of the session. At commit time the missing metadata_ids and
+    attributes_ids are resolved with one query per table, the new
+    states_meta and state_attributes rows are inserted with executemany,
+    and the states rows are inserted in waves so each row can reference
+    the state_id of the previous state of the same entity.
+
+    All methods must be called from the recorder thread.
+    """
+
+    def __init__(self, recorder: Recorder) -> None:
+        """Initialize the bulk inserter."""
+        self.recorder = recorder
+        self._states: list[tuple[States, str]] = []
+        # States that were recorded for an entity that was removed.
+        # They are only written if the entity already has a metadata_id.
+        self._removed_states: dict[States, str] = {}
+        # StatesMeta and StateAttributes which ids must still be resolved
+        self._unresolved_states_meta: dict[str, StatesMeta] = {}
+        self._unresolved_state_attributes: dict[str, StateAttributes] = {}
+        # Objects that were assigned ids by the current write
+        self._assigned: list[States | StatesMeta | StateAttributes] = []
+
+    @staticmethod
+    def is_supported(recorder: Recorder) -> bool:
+        """Return if the database can return ids from a multi row INSERT."""
+        assert recorder.engine is not None
+        return bool(
+            recorder.engine.dialect.insert_executemany_returning_sort_by_parameter_order
+        )
+
+    @property
+    def has_pending_writes(self) -> bool:
+        """Return if there are states waiting to be written."""
+        return bool(self._states)
+
+    def add_state(
+        self,
+        dbstate: States,
+        entity_id: str,
+        shared_attrs: str,
+        shared_attrs_bytes: bytes,
+        entity_removed: bool,
+    ) -> None:
+        """Add a new state to be written at the next commit.
+
+        The metadata_id and attributes_id are resolved from the pending
+        objects or the caches when possible. Anything else is resolved
+        in bulk when the states are written.
+        """
+        recorder = self.recorder
+        states_meta_manager = recorder.states_meta_manager
+        state_attributes_manager = recorder.state_attributes_manager
+
+        # Map the entity_id to the StatesMeta table
+        if pending_states_meta := states_meta_manager.get_pending(entity_id):
+            dbstate.states_meta_rel = pending_states_meta
+        elif metadata_id := states_meta_manager.get_from_cache(entity_id):
+            dbstate.metadata_id = metadata_id
+        elif entity_removed:
+            # If the entity was removed, it is only recorded if it already
+            # has a metadata_id allocated to it in the database.
+            self._removed_states[dbstate] = entity_id
+        else:
+            states_meta = StatesMeta(entity_id=entity_id)
+            states_meta_manager.add_pending(states_meta)
+            self._unresolved_states_meta[entity_id] = states_meta
+            dbstate.states_meta_rel = states_meta
+
+        # Map the event data to the StateAttributes table
+        if pending_attributes := state_attributes_manager.get_pending(shared_attrs):
+            dbstate.state_attributes = pending_attributes
+        elif attributes_id := state_attributes_manager.get_from_cache(shared_attrs):
+            dbstate.attributes_id = attributes_id
+        else:
+            dbstate_attributes = StateAttributes(
+                shared_attrs=shared_attrs,
+                hash=StateAttributes.hash_shared_attrs_bytes(shared_attrs_bytes),
+            )
+            state_attributes_manager.add_pending(dbstate_attributes)
+            self._unresolved_state_attributes[shared_attrs] = dbstate_attributes
+            dbstate.state_attributes = dbstate_attributes
+
+        self._states.append((dbstate, entity_id))
+
+    def write(self, session: Session) -> None:
+        """Write the pending states to the database.
+
+        Must be called before the session is committed. If writing
+        fails, the ids assigned by this call are cleared so the
+        write can be retried.
+        """
+        if not self._states:
+            return
+        # Flush the objects in the session first so states
+        # written by the ORM path have their state_id assigned
+        if session.new:
+            session.flush()
+        try:
+            with session.no_autoflush:
+                self._resolve_states_meta(session)
+                self._resolve_state_attributes(session)
+                self._insert_states(session)
+        except BaseException:
+            for obj in self._assigned:
+                _clear_id(obj)
+            self._assigned.clear()
+            raise
+        self._assigned.clear()
+
+    def post_commit(self) -> None:
+        """Call after commit to forget the states that were written."""
+        self._states.clear()
+        self._removed_states.clear()
+        self._unresolved_states_meta.clear()
+        self._unresolved_state_attributes.clear()
+
+    def reset(self) -> None:
+        """Reset after the database has been reset or changed."""
+        self.post_commit()
+        self._assigned.clear()
+
+    def _resolve_states_meta(self, session: Session) -> None:
+        """Resolve or insert the metadata_ids of the pending states."""
+        unresolved = self._unresolved_states_meta
+        removed_states = self._removed_states
+        if not unresolved and not removed_states:
+            return
+        metadata_ids = self.recorder.states_meta_manager.get_many(
+            {*unresolved, *removed_states.values()}, session, True
+        )
+        to_insert: list[StatesMeta] = []
+        for entity_id, states_meta in unresolved.items():
+            if (metadata_id := metadata_ids.get(entity_id)) is not None:
+                self._assign(states_meta, "metadata_id", metadata_id)
+            else:
+                to_insert.append(states_meta)
+        self._insert_returning(
+            session,
+            StatesMeta,
+            "metadata_id",
+            to_insert,
+            [{"entity_id": states_meta.entity_id} for states_meta in to_insert],
+        )
+        for dbstate, entity_id in removed_states.items():
+            dbstate.metadata_id = metadata_ids.get(entity_id)
+
+    def _resolve_state_attributes(self, session: Session) -> None:
+        """Resolve or insert the attributes_ids of the pending states."""
+        if not (unresolved := self._unresolved_state_attributes):
+            return
+        attributes_ids = self.recorder.state_attributes_manager.get_many(
+            (
+                (shared_attrs, dbstate_attributes.hash)
+                for shared_attrs, dbstate_attributes in unresolved.items()
+                if dbstate_attributes.hash is not None
+            ),
+            session,
+        )
+        to_insert: list[StateAttributes] = []
+        for shared_attrs, dbstate_attributes in unresolved.items():
+            if (attributes_id := attributes_ids.get(shared_attrs)) is not None:
+                self._assign(dbstate_attributes, "attributes_id", attributes_id)
+            else:
+                to_insert.append(dbstate_attributes)
+        self._insert_returning(
+            session,
+            StateAttributes,
+            "attributes_id",
+            to_insert,
+            [
+                {"shared_attrs": attrs.shared_attrs, "hash": attrs.hash}
+                for attrs in to_insert
+            ],
+        )
+
+    def _insert_states(self, session: Session) -> None:
+        """Insert the pending states.
+
+        A state can reference a state of the same entity that is
+        written by this call. The n-th state of each entity is
+        inserted in the n-th wave so the referenced state always has
+        its state_id assigned and the state_ids of an entity keep
+        increasing in the order the states were recorded.
+        """
+        removed_states = self._removed_states
+        waves: list[list[States]] = []
+        occurrences: dict[str, int] = {}
+        for dbstate, entity_id in self._states:
+            if dbstate in removed_states and dbstate.metadata_id is None:
+                continue
+            wave_idx = occurrences.get(entity_id, 0)
+            occurrences[entity_id] = wave_idx + 1
+            if wave_idx == len(waves):
+                waves.append([])
+            waves[wave_idx].append(dbstate)
+        for wave in waves:
+            self._insert_returning(
+                session, States, "state_id", wave, [_states_row(row) for row in wave]
+            )
+
+    def _insert_returning(
+        self,
+        session: Session,
+        table: type[States | StatesMeta | StateAttributes],
+        id_column: str,
+        objs: list[Any],
+        rows: list[dict[str, Any]],
+    ) -> None:
+        """Insert rows with executemany and assign the returned ids to the objects."""
+        if not rows:
+            return
+        id_attr = getattr(table, id_column)
+        max_rows = self.recorder.max_bind_vars // len(rows[0])
+        offset = 0
+        for chunk in chunked_or_all(rows, max_rows):
+            rows_chunk = list(chunk)
+            returned_ids = session.execute(
+                insert(table).returning(id_attr, sort_by_parameter_order=True),
+                rows_chunk,
+            ).scalars()
+            for obj, returned_id in zip(
+                objs[offset : offset + len(rows_chunk)], returned_ids, strict=True
+            ):
+                self._assign(obj, id_column, returned_id)
+            offset += len(rows_chunk)
+
+    def _assign(self, obj: Any, id_column: str, value: int) -> None:
+        """Assign an id to an object and remember it for rollback."""
+        setattr(obj, id_column, value)
+        self._assigned.append(obj)
+
+
+def _clear_id(obj: States | StatesMeta | StateAttributes) -> None:
+    """Clear the id assigned to an object by a failed write."""
+    if isinstance(obj, States):
+        obj.state_id = None  # type: ignore[assignment]
+    elif isinstance(obj, StatesMeta):
+        obj.metadata_id = None  # type: ignore[assignment]
+    else:
+        obj.attributes_id = None  # type: ignore[assignment]
+
+
+def _states_row(dbstate: States) -> dict[str, Any]:
+    """Return the parameters to insert a States object."""
+    row = {column: getattr(dbstate, column) for column in _STATES_COLUMNS}
+    if (states_meta := dbstate.states_meta_rel) is not None:
+        row["metadata_id"] = states_meta.metadata_id
+    else:
+        row["metadata_id"] = dbstate.metadata_id
+    if (state_attributes := dbstate.state_attributes) is not None:
+        row["attributes_id"] = state_attributes.attributes_id
+    else:
+        row["attributes_id"] = dbstate.attributes_id
+    if (old_state := dbstate.old_state) is not None:
+        row["old_state_id"] = old_state.state_id
+    else:
+        row["old_state_id"] = dbstate.old_state_id
+    return row
@@ -50,6 +50,7 @@ from homeassistant.util.enum import try_parse_enum
 from homeassistant.util.event_type import EventType
 
 from . import migration, statistics
+from .bulk_insert import StatesBulkInserter
 from .const import (
     DB_WORKER_PREFIX,
     DEFAULT_MAX_BIND_VARS,
@@ -78,8 +79,11 @@ from .db_schema import (
     StatisticsShortTerm,
 )
 from .executor import DBInterruptibleThreadPoolExecutor
+from .history.recent_states import RecentStatesCache
 from .models import DatabaseEngine, StatisticData, StatisticMetaData, UnsupportedDialect
+from .partition import create_upcoming_states_partitions, states_table_is_partitioned
 from .pool import POOL_SIZE, MutexPool, RecorderPool
+from .purge import PurgeProgress
 from .table_managers.event_data import EventDataManager
 from .table_managers.event_types import EventTypeManager
 from .table_managers.recorder_runs import RecorderRunsManager
@@ -94,6 +98,7 @@ from .tasks import (
     ClearStatisticsTask,
     CommitTask,
     CompileMissingStatisticsTask,
+    CompileStatisticsRollupsTask,
     DatabaseLockTask,
     ImportStatisticsTask,
     KeepAliveTask,
@@ -164,6 +169,10 @@ class Recorder(threading.Thread):
         db_retry_wait: int,
         entity_filter: Callable[[str], bool] | None,
         exclude_event_types: set[EventType[Any] | str],
+        bulk_insert_states: bool = False,
+        recent_history_window: float = 0,
+        purge_rows_per_second: int = 0,
+        partition_states: bool = False,
     ) -> None:
         """Initialize the recorder."""
         threading.Thread.__init__(self, name="Recorder")
@@ -174,6 +183,12 @@ class Recorder(threading.Thread):
         self.auto_purge = auto_purge
         self.auto_repack = auto_repack
         self.keep_days = keep_days
+        # A budget of 0 purges as fast as possible
+        self.purge_rows_per_second = purge_rows_per_second
+        self.purge_progress: PurgeProgress | None = None
+        # The states table is only partitioned with PostgreSQL
+        self.partition_states = partition_states
+        self.use_states_partitions = False
         self.is_running: bool = False
         self._hass_started: asyncio.Future[object] = hass.loop.create_future()
         self.commit_interval = commit_interval
@@ -211,6 +226,17 @@ class Recorder(threading.Thread):
         self.states_meta_manager = StatesMetaManager(self)
         self.state_attributes_manager = StateAttributesManager(self)
         self.statistics_meta_manager = StatisticsMetaManager(self)
+        # The bulk inserter is only used if requested and
+        # the database supports it, see _setup_recorder
+        self.bulk_insert_states = bulk_insert_states
+        self.states_bulk_inserter: StatesBulkInserter | None = None
+        # The states of the recent history window are kept in memory
+        # to serve the history queries without hitting the database
+        self.recent_states_cache: RecentStatesCache | None = None
+        if recent_history_window > 0:
+            self.recent_states_cache = RecentStatesCache(
+                recent_history_window, time.time()
+            )
 
         self.event_session: Session | None = None
         self._get_session: Callable[[], Session] | None = None
@@ -218,6 +244,7 @@ class Recorder(threading.Thread):
         self.migration_in_progress = False
         self.migration_is_live = False
         self.use_legacy_events_index = False
+        self.use_statistics_rollups = False
         self._database_lock_task: DatabaseLockTask | None = None
         self._db_executor: DBInterruptibleThreadPoolExecutor | None = None
 
@@ -557,6 +584,15 @@ class Recorder(threading.Thread):
             )
         )
 
+    def recompile_statistics_rollups(self) -> None:
+        """Recompile the statistics rollups.
+
+        The rollups are not used until they are recompiled. This method
+        is thread-safe.
+        """
+        self.use_statistics_rollups = False
+        self.queue_task(CompileStatisticsRollupsTask())
+
     @callback
     def async_clear_statistics(
         self, statistic_ids: list[str], *, on_done: Callable[[], None] | None = None
@@ -788,6 +824,8 @@ class Recorder(threading.Thread):
             self._dismiss_migration_in_progress()
             self._setup_run()
 
+        self._setup_states_partitions()
+
         # Catch up with missed statistics
         self._schedule_compile_missing_statistics()
         _LOGGER.debug("Recorder processing the queue")
@@ -815,6 +853,44 @@ class Recorder(threading.Thread):
         # and not the old ones as soon as the API is available.
         self.hass.add_job(self.async_set_db_ready)
 
+    def _setup_states_partitions(self) -> None:
+        """Partition the states table if requested and create the next partitions.
+
+        The states table is partitioned once the schema is up to date, it
+        stays partitioned if partition_states is disabled afterwards.
+        """
+        assert self.engine is not None
+        if self.engine.dialect.name != SupportedDialect.POSTGRESQL:
+            if self.partition_states:
+                _LOGGER.warning(
+                    "Partitioning the states table is only supported with PostgreSQL"
+                )
+            return
+        with session_scope(session=self.get_session(), read_only=True) as session:
+            self.use_states_partitions = states_table_is_partitioned(session)
+        if self.partition_states and not self.use_states_partitions:
+            self.migration_in_progress = True
+            try:
+                migration.migrate_states_to_partitions(self, self.get_session)
+            except SQLAlchemyError:
+                _LOGGER.exception(
+                    "Error converting the states table to a partitioned table"
+                )
+                return
+            finally:
+                self.migration_in_progress = False
+            self.use_states_partitions = True
+            if not self._event_listener:
+                # The backlog may have reached its maximum size during
+                # the conversion
+                self.hass.add_job(self.async_initialize)
+        if self.use_states_partitions:
+            try:
+                with session_scope(session=self.get_session()) as session:
+                    create_upcoming_states_partitions(session, dt_util.utcnow())
+            except SQLAlchemyError:
+                _LOGGER.exception("Error creating the states partitions")
+
     def _run_event_loop(self) -> None:
         """Run the event loop for the recorder."""
         # Use a session for the event read loop
@@ -1119,6 +1195,18 @@ class Recorder(threading.Thread):
         ):
             return
 
+        if (
+            bulk_inserter := self.states_bulk_inserter
+        ) is not None and states_meta_manager.active:
+            self._event_session_has_pending_writes = True
+            shared_attrs = shared_attrs_bytes.decode("utf-8")
+            bulk_inserter.add_state(
+                dbstate, entity_id, shared_attrs, shared_attrs_bytes, entity_removed
+            )
+            if self.recent_states_cache is not None:
+                self.recent_states_cache.add_pending(dbstate, shared_attrs)
+            return
+
         # Map the entity_id to the StatesMeta table
         if pending_states_meta := states_meta_manager.get_pending(entity_id):
             dbstate.states_meta_rel = pending_states_meta
@@ -1161,6 +1249,8 @@ class Recorder(threading.Thread):
             dbstate.state_attributes = dbstate_attributes
 
         self._add_to_session(session, dbstate)
+        if self.recent_states_cache is not None and states_meta_manager.active:
+            self.recent_states_cache.add_pending(dbstate, shared_attrs)
 
     def _handle_database_error(self, err: Exception, *, setup_run: bool) -> bool:
         """Handle a database error that may result in moving away the corrupt db."""
@@ -1223,6 +1313,8 @@ class Recorder(threading.Thread):
                         for state_id, last_reported_timestamp in pending_last_reported.items()
                     ],
                 )
+        if self.states_bulk_inserter is not None:
+            self.states_bulk_inserter.write(session)
         session.commit()
 
         self._event_session_has_pending_writes = False
@@ -1235,6 +1327,10 @@ class Recorder(threading.Thread):
         self.event_data_manager.post_commit_pending()
         self.event_type_manager.post_commit_pending()
         self.states_meta_manager.post_commit_pending()
+        if self.states_bulk_inserter is not None:
+            self.states_bulk_inserter.post_commit()
+        if self.recent_states_cache is not None:
+            self.recent_states_cache.post_commit_pending(time.time())
 
         # Expire is an expensive operation (frequently more expensive
         # than the flush and commit itself) so we only
@@ -1263,6 +1359,10 @@ class Recorder(threading.Thread):
         self.event_type_manager.reset()
         self.states_meta_manager.reset()
         self.statistics_meta_manager.reset()
+        if self.states_bulk_inserter is not None:
+            self.states_bulk_inserter.reset()
+        if self.recent_states_cache is not None:
+            self.recent_states_cache.reset_pending()
 
         if not self.event_session:
             return
@@ -1426,6 +1526,18 @@ class Recorder(threading.Thread):
         migration.pre_migrate_schema(self.engine)
         Base.metadata.create_all(self.engine)
         self._get_session = scoped_session(sessionmaker(bind=self.engine, future=True))
+        self.states_bulk_inserter = None
+        if self.bulk_insert_states:
+            if StatesBulkInserter.is_supported(self):
+                self.states_bulk_inserter = StatesBulkInserter(self)
+            else:
+                _LOGGER.warning(
+                    "The database does not support returning ids from multi row"
+                    " inserts, states will be written one row at a time"
+                )
+        if self.recent_states_cache is not None:
+            # The database may have been replaced
+            self.recent_states_cache.clear(time.time())
         _LOGGER.debug("Connected to recorder database")
 
     def _close_connection(self) -> None:
@@ -77,7 +77,7 @@ class LegacyBase(DeclarativeBase):
     """Base class for tables, used for schema migration."""
 
 
-SCHEMA_VERSION = 48
+SCHEMA_VERSION = 49
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -93,6 +93,8 @@ TABLE_STATISTICS = "statistics"
 TABLE_STATISTICS_META = "statistics_meta"
 TABLE_STATISTICS_RUNS = "statistics_runs"
 TABLE_STATISTICS_SHORT_TERM = "statistics_short_term"
+TABLE_STATISTICS_DAILY = "statistics_daily"
+TABLE_STATISTICS_MONTHLY = "statistics_monthly"
 TABLE_MIGRATION_CHANGES = "migration_changes"
 
 STATISTICS_TABLES = ("statistics", "statistics_short_term")
@@ -116,6 +118,8 @@ ALL_TABLES = [
     TABLE_STATISTICS_META,
     TABLE_STATISTICS_RUNS,
     TABLE_STATISTICS_SHORT_TERM,
+    TABLE_STATISTICS_DAILY,
+    TABLE_STATISTICS_MONTHLY,
 ]
 
 TABLES_TO_CHECK = [
@@ -834,6 +838,70 @@ class LegacyStatisticsShortTerm(LegacyBase, _StatisticsShortTerm):
     )
 
 
+class StatisticsRollupBase:
+    """Statistics rollup base class.
+
+    Rollups summarize the hourly statistics of a day or a month in the
+    configured time zone, mean_weight is the number of hourly means the
+    mean was calculated from.
+    """
+
+    id: Mapped[int] = mapped_column(ID_TYPE, Identity(), primary_key=True)
+    created_ts: Mapped[float | None] = mapped_column(TIMESTAMP_TYPE, default=time.time)
+    metadata_id: Mapped[int | None] = mapped_column(
+        ID_TYPE,
+        ForeignKey(f"{TABLE_STATISTICS_META}.id", ondelete="CASCADE"),
+    )
+    start_ts: Mapped[float | None] = mapped_column(TIMESTAMP_TYPE, index=True)
+    mean: Mapped[float | None] = mapped_column(DOUBLE_TYPE)
+    mean_weight: Mapped[int | None] = mapped_column(Integer)
+    min: Mapped[float | None] = mapped_column(DOUBLE_TYPE)
+    max: Mapped[float | None] = mapped_column(DOUBLE_TYPE)
+    last_reset_ts: Mapped[float | None] = mapped_column(TIMESTAMP_TYPE)
+    state: Mapped[float | None] = mapped_column(DOUBLE_TYPE)
+    sum: Mapped[float | None] = mapped_column(DOUBLE_TYPE)
+
+    duration: timedelta
+
+
+class StatisticsDaily(Base, StatisticsRollupBase):
+    """Daily statistics rollup."""
+
+    # Days with a daylight saving time transition are shorter or longer
+    duration = timedelta(days=1)
+
+    __table_args__ = (
+        # Used for fetching statistics for a certain entity at a specific time
+        Index(
+            "ix_statistics_daily_statistic_id_start_ts",
+            "metadata_id",
+            "start_ts",
+            unique=True,
+        ),
+        _DEFAULT_TABLE_ARGS,
+    )
+    __tablename__ = TABLE_STATISTICS_DAILY
+
+
+class StatisticsMonthly(Base, StatisticsRollupBase):
+    """Monthly statistics rollup."""
+
+    # Months have a different number of days, this is the longest month
+    duration = timedelta(days=31)
+
+    __table_args__ = (
+        # Used for fetching statistics for a certain entity at a specific time
+        Index(
+            "ix_statistics_monthly_statistic_id_start_ts",
+            "metadata_id",
+            "start_ts",
+            unique=True,
+        ),
+        _DEFAULT_TABLE_ARGS,
+    )
+    __tablename__ = TABLE_STATISTICS_MONTHLY
+
+
 class _StatisticsMeta:
     """Statistics meta data."""
 
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
 from datetime import datetime
 from typing import Any
 
@@ -17,6 +18,7 @@ from .modern import (
     get_last_state_changes as _modern_get_last_state_changes,
     get_significant_states as _modern_get_significant_states,
     get_significant_states_with_session as _modern_get_significant_states_with_session,
+    iter_significant_states_with_session as _modern_iter_significant_states_with_session,
     state_changes_during_period as _modern_state_changes_during_period,
 )
 
@@ -28,6 +30,7 @@ __all__ = [
     "get_last_state_changes",
     "get_significant_states",
     "get_significant_states_with_session",
+    "iter_significant_states_with_session",
     "state_changes_during_period",
 ]
 
@@ -152,6 +155,53 @@ def get_significant_states_with_session(
     )
 
 
+def iter_significant_states_with_session(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None = None,
+    entity_ids: list[str] | None = None,
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+    minimal_response: bool = False,
+    no_attributes: bool = False,
+    compressed_state_format: bool = False,
+) -> Iterator[tuple[str, list[State | dict[str, Any]]]]:
+    """Yield the significant states of each entity during a time period."""
+    if not get_instance(hass).states_meta_manager.active:
+        from .legacy import (  # pylint: disable=import-outside-toplevel
+            get_significant_states_with_session as _legacy_get_significant_states_with_session,
+        )
+
+        return iter(
+            _legacy_get_significant_states_with_session(
+                hass,
+                session,
+                start_time,
+                end_time,
+                entity_ids,
+                None,
+                include_start_time_state,
+                significant_changes_only,
+                minimal_response,
+                no_attributes,
+                compressed_state_format,
+            ).items()
+        )
+    return _modern_iter_significant_states_with_session(
+        hass,
+        session,
+        start_time,
+        end_time,
+        entity_ids,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
+        compressed_state_format,
+    )
+
+
 def state_changes_during_period(
     hass: HomeAssistant,
     start_time: datetime,
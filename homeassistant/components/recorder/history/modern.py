@@ -41,7 +41,11 @@ from ..models import (
     extract_metadata_ids,
     row_to_compressed_state,
 )
-from ..util import execute_stmt_lambda_element, session_scope
+from ..util import (
+    execute_stmt_lambda_element,
+    session_scope,
+    stream_stmt_lambda_element,
+)
 from .const import (
     LAST_CHANGED_KEY,
     NEED_ATTRIBUTE_DOMAINS,
@@ -232,6 +236,95 @@ def get_significant_states_with_session(
         raise NotImplementedError("Filters are no longer supported")
     if not entity_ids:
         raise ValueError("entity_ids must be provided")
+    if (
+        query := _significant_states_rows(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            no_attributes,
+        )
+    ) is None:
+        return {}
+    rows, start_time_ts, entity_id_to_metadata_id = query
+    return _sorted_states_to_dict(
+        rows,
+        start_time_ts,
+        entity_ids,
+        entity_id_to_metadata_id,
+        minimal_response,
+        compressed_state_format,
+        no_attributes=no_attributes,
+    )
+
+
+def iter_significant_states_with_session(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None = None,
+    entity_ids: list[str] | None = None,
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+    minimal_response: bool = False,
+    no_attributes: bool = False,
+    compressed_state_format: bool = False,
+) -> Iterator[tuple[str, list[State | dict[str, Any]]]]:
+    """Yield the significant states of each entity during a time period.
+
+    The rows are streamed from the database and the states of an entity
+    are only built once the previous entity has been consumed. The
+    entities are yielded in the order of the database, not in the order
+    of entity_ids, and entities without states are not yielded.
+
+    The iterator must be consumed before the session is used again.
+    """
+    if not entity_ids:
+        raise ValueError("entity_ids must be provided")
+    if (
+        query := _significant_states_rows(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            no_attributes,
+        )
+    ) is None:
+        return iter(())
+    rows, start_time_ts, entity_id_to_metadata_id = query
+    return _iter_sorted_states(
+        rows,
+        start_time_ts,
+        entity_ids,
+        entity_id_to_metadata_id,
+        minimal_response,
+        compressed_state_format,
+        no_attributes=no_attributes,
+    )
+
+
+def _significant_states_rows(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    no_attributes: bool,
+) -> tuple[Iterable[Row], float | None, dict[str, int | None]] | None:
+    """Return the rows of the significant states sorted by entity.
+
+    Returns the rows, the start time if the start time states are
+    included, and the metadata_ids of the entities, or None if none
+    of the entities has been recorded.
+    """
     entity_id_to_metadata_id: dict[str, int | None] | None = None
     metadata_ids_in_significant_domains: list[int] = []
     instance = get_instance(hass)
@@ -240,7 +333,7 @@ def get_significant_states_with_session(
             entity_ids, session, False
         )
     ) or not (possible_metadata_ids := extract_metadata_ids(entity_id_to_metadata_id)):
-        return {}
+        return None
     metadata_ids = possible_metadata_ids
     if significant_changes_only:
         metadata_ids_in_significant_domains = [
@@ -256,6 +349,23 @@ def get_significant_states_with_session(
         include_start_time_state = False
     start_time_ts = start_time.timestamp()
     end_time_ts = datetime_to_timestamp_or_none(end_time)
+    if (recent_states_cache := instance.recent_states_cache) is not None and (
+        cached_rows := recent_states_cache.get_rows(
+            metadata_ids,
+            start_time_ts,
+            end_time_ts,
+            include_start_time_state,
+            significant_changes_only,
+            metadata_ids_in_significant_domains,
+            no_attributes,
+        )
+    ) is not None:
+        # The whole period is in the recent history window
+        return (
+            cast(list[Row], cached_rows),
+            start_time_ts if include_start_time_state else None,
+            entity_id_to_metadata_id,
+        )
     single_metadata_id = metadata_ids[0] if len(metadata_ids) == 1 else None
     stmt = lambda_stmt(
         lambda: _significant_states_stmt(
@@ -278,14 +388,10 @@ def get_significant_states_with_session(
             include_start_time_state,
         ],
     )
-    return _sorted_states_to_dict(
-        execute_stmt_lambda_element(session, stmt, None, end_time, orm_rows=False),
+    return (
+        stream_stmt_lambda_element(session, stmt),
         start_time_ts if include_start_time_state else None,
-        entity_ids,
         entity_id_to_metadata_id,
-        minimal_response,
-        compressed_state_format,
-        no_attributes=no_attributes,
     )
 
 
@@ -444,9 +550,7 @@ def state_changes_during_period(
         return cast(
             dict[str, list[State]],
             _sorted_states_to_dict(
-                execute_stmt_lambda_element(
-                    session, stmt, None, end_time, orm_rows=False
-                ),
+                stream_stmt_lambda_element(session, stmt),
                 start_time_ts if include_start_time_state else None,
                 entity_ids,
                 entity_id_to_metadata_id,
@@ -589,6 +693,9 @@ def _get_start_time_state_for_entities_stmt(
                 .scalar_subquery()
                 .correlate(StatesMeta),
                 States.metadata_id == StatesMeta.metadata_id,
+                # Lets PostgreSQL prune the partitions after epoch_time
+                # when the states table is partitioned
+                States.last_updated_ts < epoch_time,
             ),
         )
         .where(StatesMeta.metadata_id.in_(metadata_ids))
@@ -690,6 +797,44 @@ def _sorted_states_to_dict(
     each list of states, otherwise our graphs won't start on the Y
     axis correctly.
     """
+    # Set all entity IDs to empty lists in result set to maintain the order
+    result: dict[str, list[State | dict[str, Any]]] = {
+        entity_id: [] for entity_id in entity_ids
+    }
+    for entity_id, entity_states in _iter_sorted_states(
+        states,
+        start_time_ts,
+        entity_ids,
+        entity_id_to_metadata_id,
+        minimal_response,
+        compressed_state_format,
+        descending,
+        no_attributes,
+    ):
+        if ent_results := result[entity_id]:
+            ent_results.extend(entity_states)
+        else:
+            result[entity_id] = entity_states
+
+    # Filter out the empty lists if some states had 0 results.
+    return {key: val for key, val in result.items() if val}
+
+
+def _iter_sorted_states(
+    states: Iterable[Row],
+    start_time_ts: float | None,
+    entity_ids: list[str],
+    entity_id_to_metadata_id: dict[str, int | None],
+    minimal_response: bool = False,
+    compressed_state_format: bool = False,
+    descending: bool = False,
+    no_attributes: bool = False,
+) -> Iterator[tuple[str, list[State | dict[str, Any]]]]:
+    """Convert SQL results into the states of each entity.
+
+    States must be sorted by entity_id and last_updated, the rows are
+    only consumed as the states of the entities are yielded.
+    """
     field_map = _FIELD_MAP
     state_class: Callable[
         [Row, dict[str, dict[str, Any]], float | None, str, str, float | None, bool],
@@ -704,10 +849,6 @@ def _sorted_states_to_dict(
         attr_time = LAST_CHANGED_KEY
         attr_state = STATE_KEY
 
-    # Set all entity IDs to empty lists in result set to maintain the order
-    result: dict[str, list[State | dict[str, Any]]] = {
-        entity_id: [] for entity_id in entity_ids
-    }
     metadata_id_to_entity_id: dict[int, str] = {}
     metadata_id_to_entity_id = {
         v: k for k, v in entity_id_to_metadata_id.items() if v is not None
@@ -730,37 +871,32 @@ def _sorted_states_to_dict(
     for metadata_id, group in states_iter:
         entity_id = metadata_id_to_entity_id[metadata_id]
         attr_cache: dict[str, dict[str, Any]] = {}
-        ent_results = result[entity_id]
+        ent_results: list[State | dict[str, Any]]
         if (
             not minimal_response
             or split_entity_id(entity_id)[0] in NEED_ATTRIBUTE_DOMAINS
         ):
-            ent_results.extend(
-                [
-                    state_class(
-                        db_state,
-                        attr_cache,
-                        start_time_ts,
-                        entity_id,
-                        db_state[state_idx],
-                        db_state[last_updated_ts_idx],
-                        False,
-                    )
-                    for db_state in group
-                ]
-            )
-            continue
-
-        prev_state: str | None = None
+            ent_results = [
+                state_class(
+                    db_state,
+                    attr_cache,
+                    start_time_ts,
+                    entity_id,
+                    db_state[state_idx],
+                    db_state[last_updated_ts_idx],
+                    False,
+                )
+                for db_state in group
+            ]
         # With minimal response we only provide a native
         # State for the first and last response. All the states
         # in-between only provide the "state" and the
         # "last_changed".
-        if not ent_results:
-            if (first_state := next(group, None)) is None:
-                continue
+        elif (first_state := next(group, None)) is None:
+            continue
+        else:
             prev_state = first_state[state_idx]
-            ent_results.append(
+            ent_results = [
                 state_class(
                     first_state,
                     attr_cache,
@@ -770,47 +906,45 @@ def _sorted_states_to_dict(
                     first_state[last_updated_ts_idx],
                     no_attributes,
                 )
-            )
-
-        #
-        # minimal_response only makes sense with last_updated == last_updated
-        #
-        # We use last_updated for for last_changed since its the same
-        #
-        # With minimal response we do not care about attribute
-        # changes so we can filter out duplicate states
-        if compressed_state_format:
-            # Compressed state format uses the timestamp directly
-            ent_results.extend(
-                [
-                    {
-                        attr_state: (prev_state := state),
-                        attr_time: row[last_updated_ts_idx],
-                    }
-                    for row in group
-                    if (state := row[state_idx]) != prev_state
-                ]
-            )
-            continue
-
-        # Non-compressed state format returns an ISO formatted string
-        _utc_from_timestamp = dt_util.utc_from_timestamp
-        ent_results.extend(
-            [
-                {
-                    attr_state: (prev_state := state),
-                    attr_time: _utc_from_timestamp(
-                        row[last_updated_ts_idx]
-                    ).isoformat(),
-                }
-                for row in group
-                if (state := row[state_idx]) != prev_state
             ]
-        )
 
-    if descending:
-        for ent_results in result.values():
-            ent_results.reverse()
+            #
+            # minimal_response only makes sense with last_updated == last_updated
+            #
+            # We use last_updated for for last_changed since its the same
+            #
+            # With minimal response we do not care about attribute
+            # changes so we can filter out duplicate states
+            if compressed_state_format:
+                # Compressed state format uses the timestamp directly
+                ent_results.extend(
+                    [
+                        {
+                            attr_state: (prev_state := state),
+                            attr_time: row[last_updated_ts_idx],
+                        }
+                        for row in group
+                        if (state := row[state_idx]) != prev_state
+                    ]
+                )
+            else:
+                # Non-compressed state format returns an ISO formatted string
+                _utc_from_timestamp = dt_util.utc_from_timestamp
+                ent_results.extend(
+                    [
+                        {
+                            attr_state: (prev_state := state),
+                            attr_time: _utc_from_timestamp(
+                                row[last_updated_ts_idx]
+                            ).isoformat(),
+                        }
+                        for row in group
+                        if (state := row[state_idx]) != prev_state
+                    ]
+                )
 
-    # Filter out the empty lists if some states had 0 results.
-    return {key: val for key, val in result.items() if val}
+        if not ent_results:
+            continue
+        if descending:
+            ent_results.reverse()
+        yield entity_id, ent_results
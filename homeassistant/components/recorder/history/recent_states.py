@@ -0,0 +1,290 @@
+"""In memory cache of the states recorded in the recent history window."""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable
+import threading
+from typing import NamedTuple
+
+from ..db_schema import States
+
+# The cache never holds more states than this per entity. When an entity
+# reaches the limit the oldest states are dropped, and queries which start
+# before the oldest remaining state fall back to the database.
+MAX_CACHED_STATES_PER_ENTITY = 8640
+
+# The expired states of an entity are only trimmed once at least this
+# many states expired to avoid shifting the arrays on every new state.
+MIN_STATES_TO_TRIM = 16
+
+
+class CachedStateRow(NamedTuple):
+    """A cached state in the shape of a history database row."""
+
+    metadata_id: int
+    state: str | None
+    last_updated_ts: float
+    last_changed_ts: float | None
+    attributes: str | None
+
+
+class _EntityStates:
+    """Columnar storage of the recent states of a single entity.
+
+    All states recorded after complete_after_ts are in the cache,
+    the states are sorted by last_updated_ts.
+    """
+
+    __slots__ = (
+        "attributes",
+        "complete_after_ts",
+        "last_changed_ts",
+        "last_updated_ts",
+        "states",
+    )
+
+    def __init__(self, complete_after_ts: float) -> None:
+        """Initialize the entity states."""
+        self.complete_after_ts = complete_after_ts
+        self.last_updated_ts = array("d")
+        # 0 if last_changed is the same as last_updated
+        self.last_changed_ts = array("d")
+        self.states: list[str | None] = []
+        # The attributes are references to the shared attributes strings
+        # which are shared between all states with the same attributes.
+        self.attributes: list[str | None] = []
+
+    def append(
+        self,
+        state: str | None,
+        last_updated_ts: float,
+        last_changed_ts: float,
+        attributes: str | None,
+    ) -> None:
+        """Append a state."""
+        self.last_updated_ts.append(last_updated_ts)
+        self.last_changed_ts.append(last_changed_ts)
+        self.states.append(state)
+        self.attributes.append(attributes)
+
+    def drop_first(self, count: int) -> None:
+        """Drop the oldest states."""
+        if count <= 0:
+            return
+        del self.last_updated_ts[:count]
+        del self.last_changed_ts[:count]
+        del self.states[:count]
+        del self.attributes[:count]
+        if self.last_updated_ts:
+            self.complete_after_ts = max(
+                self.complete_after_ts, self.last_updated_ts[0]
+            )
+
+
+class RecentStatesCache:
+    """Cache the states recorded during the recent history window.
+
+    States are added once they are committed to the database so the
+    cache always matches the database. A history query can be served
+    from the cache when every requested entity has all its states
+    for the requested period in the cache, including the state at
+    the start time.
+
+    States are added from the recorder thread while queries are
+    served from the database executor threads.
+    """
+
+    def __init__(self, window: float, started_ts: float) -> None:
+        """Initialize the cache.
+
+        window is the number of seconds of history to keep, started_ts
+        is the time from which all recorded states are added.
+        """
+        self.window = window
+        self._started_ts = started_ts
+        self._lock = threading.Lock()
+        self._entities: dict[int, _EntityStates] = {}
+        self._pending: list[tuple[States, str | None]] = []
+
+    def add_pending(self, dbstate: States, shared_attrs: str | None) -> None:
+        """Add a state that will be committed at the next interval.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._pending.append((dbstate, shared_attrs))
+
+    def reset_pending(self) -> None:
+        """Forget the states that were not committed.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._pending.clear()
+
+    def post_commit_pending(self, now_ts: float) -> None:
+        """Call after commit to add the committed states to the cache.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        if not self._pending:
+            return
+        trim_before_ts = now_ts - self.window
+        touched: set[_EntityStates] = set()
+        with self._lock:
+            entities = self._entities
+            for dbstate, shared_attrs in self._pending:
+                metadata_id: int | None = dbstate.metadata_id
+                if metadata_id is None and (states_meta := dbstate.states_meta_rel):
+                    metadata_id = states_meta.metadata_id
+                if metadata_id is None:
+                    # The state was not written
+                    continue
+                if (last_updated_ts := dbstate.last_updated_ts) is None:
+                    continue
+                if (entity := entities.get(metadata_id)) is None:
+                    entity = entities[metadata_id] = _EntityStates(self._started_ts)
+                entity.append(
+                    dbstate.state,
+                    last_updated_ts,
+                    dbstate.last_changed_ts or 0,
+                    shared_attrs,
+                )
+                touched.add(entity)
+            for entity in touched:
+                _trim(entity, trim_before_ts)
+        self._pending.clear()
+
+    def get_rows(
+        self,
+        metadata_ids: Iterable[int],
+        start_time_ts: float,
+        end_time_ts: float | None,
+        include_start_time_state: bool,
+        significant_changes_only: bool,
+        metadata_ids_in_significant_domains: Iterable[int],
+        no_attributes: bool,
+    ) -> list[CachedStateRow] | None:
+        """Return the history rows of the entities.
+
+        The rows are grouped by metadata_id and sorted by last_updated_ts
+        the same way as the rows of the history database queries.
+
+        Returns None if any of the entities is not fully covered by
+        the cache.
+
+        This call is thread-safe.
+        """
+        significant_metadata_ids = set(metadata_ids_in_significant_domains)
+        rows: list[CachedStateRow] = []
+        with self._lock:
+            for metadata_id in metadata_ids:
+                if (
+                    entity := self._entities.get(metadata_id)
+                ) is None or start_time_ts < entity.complete_after_ts:
+                    return None
+                last_updated = entity.last_updated_ts
+                # States in the period are > start_time_ts and < end_time_ts
+                first_idx = bisect_right(last_updated, start_time_ts)
+                if include_start_time_state:
+                    # The state at the start time is the last state
+                    # updated before start_time_ts
+                    if not (start_idx := bisect_left(last_updated, start_time_ts)):
+                        # The state at the start time is not in the cache
+                        return None
+                    start_idx -= 1
+                    rows.append(
+                        CachedStateRow(
+                            metadata_id,
+                            entity.states[start_idx],
+                            0,
+                            None if significant_changes_only else 0,
+                            None if no_attributes else entity.attributes[start_idx],
+                        )
+                    )
+                end_idx = (
+                    len(last_updated)
+                    if not end_time_ts
+                    else bisect_left(last_updated, end_time_ts, first_idx)
+                )
+                only_state_changes = (
+                    significant_changes_only
+                    and metadata_id not in significant_metadata_ids
+                )
+                last_changed = entity.last_changed_ts
+                states = entity.states
+                attributes = entity.attributes
+                rows.extend(
+                    CachedStateRow(
+                        metadata_id,
+                        states[idx],
+                        last_updated[idx],
+                        None if significant_changes_only else last_changed[idx] or None,
+                        None if no_attributes else attributes[idx],
+                    )
+                    for idx in range(first_idx, end_idx)
+                    if not only_state_changes
+                    or not (last_changed_ts := last_changed[idx])
+                    or last_changed_ts == last_updated[idx]
+                )
+        return rows
+
+    def evict_purged(
+        self, purge_before_ts: float, metadata_ids: Iterable[int] | None = None
+    ) -> None:
+        """Drop the states which are purged from the database.
+
+        If metadata_ids is None, the states of all entities are dropped.
+
+        This call is thread-safe.
+        """
+        with self._lock:
+            entities = self._entities
+            for entity in (
+                entities.values()
+                if metadata_ids is None
+                else [
+                    entity
+                    for metadata_id in metadata_ids
+                    if (entity := entities.get(metadata_id)) is not None
+                ]
+            ):
+                entity.drop_first(bisect_left(entity.last_updated_ts, purge_before_ts))
+
+    def evict_metadata_ids(self, metadata_ids: Iterable[int]) -> None:
+        """Forget the entities which were purged from the states_meta table.
+
+        This call is thread-safe.
+        """
+        with self._lock:
+            for metadata_id in metadata_ids:
+                self._entities.pop(metadata_id, None)
+
+    def clear(self, started_ts: float) -> None:
+        """Clear the cache after the database has been reset or changed.
+
+        This call is thread-safe.
+        """
+        with self._lock:
+            self._entities.clear()
+            self._started_ts = started_ts
+        self._pending.clear()
+
+
+def _trim(entity: _EntityStates, trim_before_ts: float) -> None:
+    """Trim the states that are no longer needed.
+
+    The newest state before trim_before_ts is kept since it is
+    the state at the start of the window.
+    """
+    last_updated = entity.last_updated_ts
+    expired = bisect_left(last_updated, trim_before_ts) - 1
+    if expired >= MIN_STATES_TO_TRIM or (
+        expired > 0 and expired >= len(last_updated) // 4
+    ):
+        entity.drop_first(expired)
+    if (overflow := len(last_updated) - MAX_CACHED_STATES_PER_ENTITY) > 0:
+        entity.drop_first(max(overflow, MAX_CACHED_STATES_PER_ENTITY // 4))
@@ -30,6 +30,7 @@ from sqlalchemy.sql.expression import true
 from sqlalchemy.sql.lambdas import StatementLambdaElement
 
 from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
 from homeassistant.util.enum import try_parse_enum
 from homeassistant.util.ulid import ulid_at_time, ulid_to_bytes
 
@@ -54,6 +55,7 @@ from .const import (
     EVENT_TYPE_IDS_SCHEMA_VERSION,
     LEGACY_STATES_EVENT_ID_INDEX_SCHEMA_VERSION,
     STATES_META_SCHEMA_VERSION,
+    STATISTICS_ROLLUP_SCHEMA_VERSION,
     SupportedDialect,
 )
 from .db_schema import (
@@ -82,6 +84,13 @@ from .db_schema import (
 )
 from .models import process_timestamp
 from .models.time import datetime_to_timestamp_or_none
+from .partition import (
+    STATES_DEFAULT_PARTITION,
+    STATES_PARTITION_DAYS_AHEAD,
+    create_states_partitions,
+    states_partitions_between,
+    states_table_is_partitioned,
+)
 from .queries import (
     batch_cleanup_entity_ids,
     delete_duplicate_short_term_statistics_row,
@@ -102,7 +111,11 @@ from .queries import (
     migrate_single_short_term_statistics_row_to_timestamp,
     migrate_single_statistics_row_to_timestamp,
 )
-from .statistics import cleanup_statistics_timestamp_migration, get_start_time
+from .statistics import (
+    cleanup_statistics_timestamp_migration,
+    compile_statistics_rollups,
+    get_start_time,
+)
 from .tasks import RecorderTask
 from .util import (
     database_job_retry_wrapper,
@@ -824,6 +837,18 @@ def _restore_foreign_key_constraints(
             _LOGGER.info("Did not find a matching constraint for %s.%s", table, column)
             continue
 
+        if table == foreign_table == TABLE_STATES and _states_table_is_partitioned(
+            session_maker, engine
+        ):
+            # A partitioned table can't be referenced by a foreign key
+            _LOGGER.info(
+                "The partitioned %s table has no constraint for %s.%s",
+                table,
+                table,
+                column,
+            )
+            continue
+
         inspector = sqlalchemy.inspect(engine)
         if any(
             foreign_key["name"] and foreign_key["constrained_columns"] == [column]
@@ -862,6 +887,16 @@ def _restore_foreign_key_constraints(
             _add_constraint(session_maker, add_constraint, table, column)
 
 
+def _states_table_is_partitioned(
+    session_maker: Callable[[], Session], engine: Engine
+) -> bool:
+    """Return if the states table is a partitioned table."""
+    if engine.dialect.name != SupportedDialect.POSTGRESQL:
+        return False
+    with session_scope(session=session_maker(), read_only=True) as session:
+        return states_table_is_partitioned(session)
+
+
 def _add_constraint(
     session_maker: Callable[[], Session],
     add_constraint: AddConstraint,
@@ -1987,6 +2022,14 @@ class _SchemaVersion48Migrator(_SchemaVersionMigrator, target_version=48):
         _migrate_columns_to_timestamp(self.instance, self.session_maker, self.engine)
 
 
+class _SchemaVersion49Migrator(_SchemaVersionMigrator, target_version=49):
+    def _apply_update(self) -> None:
+        """Version specific update method."""
+        # The statistics_daily and statistics_monthly tables are created by
+        # create_all, the rollups of existing statistics are compiled by the
+        # StatisticsRollupMigration live data migration.
+
+
 def _migrate_statistics_columns_to_timestamp_removing_duplicates(
     hass: HomeAssistant,
     instance: Recorder,
@@ -2353,6 +2396,132 @@ def post_migrate_entity_ids(instance: Recorder) -> bool:
     return is_done
 
 
+def migrate_states_to_partitions(
+    instance: Recorder, session_maker: Callable[[], Session]
+) -> None:
+    """Convert the states table to a table partitioned by day.
+
+    PostgreSQL requires the partition key in the primary key of a partitioned
+    table and a partitioned table can't be referenced by a foreign key, so the
+    partitioned states table has the primary key (state_id, last_updated_ts)
+    and no foreign key on old_state_id. States without a last_updated_ts are
+    not copied, states outside of the daily partitions are copied to the
+    default partition.
+
+    The states are copied to the new table one day at a time and the old
+    table is replaced in a single transaction once all states are copied. If
+    the conversion is interrupted, it starts over on the next start.
+    """
+    _LOGGER.warning(
+        "Converting the states table to a partitioned table. %s", MIGRATION_NOTE_WHILE
+    )
+    partitioned_table = f"{TABLE_STATES}_partitioned"
+    sequence = f"{partitioned_table}_state_id_seq"
+    with session_scope(session=session_maker()) as session:
+        # Dropping the table of an interrupted conversion drops its
+        # partitions and sequence as well
+        session.execute(text(f"DROP TABLE IF EXISTS {partitioned_table}"))
+        session.execute(
+            text(
+                f"CREATE TABLE {partitioned_table}"
+                f" (LIKE {TABLE_STATES} INCLUDING DEFAULTS)"
+                " PARTITION BY RANGE (last_updated_ts)"
+            )
+        )
+        session.execute(
+            text(f"CREATE SEQUENCE {sequence} OWNED BY {partitioned_table}.state_id")
+        )
+        session.execute(
+            text(
+                f"ALTER TABLE {partitioned_table} ALTER COLUMN state_id"
+                f" SET DEFAULT nextval('{sequence}')"
+            )
+        )
+        session.execute(
+            text(
+                f"ALTER TABLE {partitioned_table}"
+                " ADD PRIMARY KEY (state_id, last_updated_ts)"
+            )
+        )
+        session.execute(
+            text(
+                f"CREATE TABLE {STATES_DEFAULT_PARTITION}"
+                f" PARTITION OF {partitioned_table} DEFAULT"
+            )
+        )
+        oldest_ts: float | None = session.execute(
+            text(f"SELECT min(last_updated_ts) FROM {TABLE_STATES}")  # noqa: S608
+        ).scalar()
+        now = dt_util.utcnow()
+        # States older than the purge window, for example with a skewed
+        # timestamp, go to the default partition and are purged row by row
+        start = now - timedelta(days=instance.keep_days + 1)
+        if oldest_ts is not None:
+            start = max(start, dt_util.utc_from_timestamp(oldest_ts))
+        partitions = states_partitions_between(
+            start, now + timedelta(days=STATES_PARTITION_DAYS_AHEAD + 1)
+        )
+        create_states_partitions(session, partitions, table=partitioned_table)
+
+    for partition in partitions:
+        with session_scope(session=session_maker()) as session:
+            session.execute(
+                text(
+                    f"INSERT INTO {partition.name} SELECT * FROM {TABLE_STATES}"  # noqa: S608
+                    " WHERE last_updated_ts >= :start_ts AND last_updated_ts < :end_ts"
+                ),
+                {"start_ts": partition.start_ts, "end_ts": partition.end_ts},
+            )
+        _LOGGER.debug("Copied the states to partition %s", partition.name)
+
+    with session_scope(session=session_maker()) as session:
+        session.execute(
+            text(
+                f"INSERT INTO {STATES_DEFAULT_PARTITION} SELECT * FROM {TABLE_STATES}"  # noqa: S608
+                " WHERE last_updated_ts < :start_ts OR last_updated_ts >= :end_ts"
+            ),
+            {"start_ts": partitions[0].start_ts, "end_ts": partitions[-1].end_ts},
+        )
+        session.execute(
+            text(
+                f"SELECT setval('{sequence}',"  # noqa: S608
+                f" (SELECT COALESCE(max(state_id), 0) + 1 FROM {TABLE_STATES}), false)"
+            )
+        )
+        session.execute(text(f"DROP TABLE {TABLE_STATES}"))
+        session.execute(
+            text(f"ALTER TABLE {partitioned_table} RENAME TO {TABLE_STATES}")
+        )
+        session.execute(
+            text(f"ALTER SEQUENCE {sequence} RENAME TO {TABLE_STATES}_state_id_seq")
+        )
+        session.execute(
+            text(
+                f"ALTER TABLE {TABLE_STATES} RENAME CONSTRAINT"
+                f" {partitioned_table}_pkey TO {TABLE_STATES}_pkey"
+            )
+        )
+        session.execute(
+            text(
+                f"ALTER TABLE {TABLE_STATES} ADD FOREIGN KEY (attributes_id)"
+                " REFERENCES state_attributes (attributes_id)"
+            )
+        )
+        session.execute(
+            text(
+                f"ALTER TABLE {TABLE_STATES} ADD FOREIGN KEY (metadata_id)"
+                " REFERENCES states_meta (metadata_id)"
+            )
+        )
+
+    for index in Table(TABLE_STATES, Base.metadata).indexes:
+        _create_index(instance, session_maker, TABLE_STATES, cast(str, index.name))
+
+    with session_scope(session=session_maker()) as session:
+        session.execute(text(f"ANALYZE {TABLE_STATES}"))
+    _LOGGER.warning("Finished converting the states table to a partitioned table")
+
+
 def _initialize_database(session: Session) -> bool:
     """Initialize a new database.
 
@@ -2947,6 +3116,34 @@ class EventIDPostMigration(BaseRunTimeMigration):
         return DataMigrationStatus(needs_migrate=False, migration_done=True)
 
 
+class StatisticsRollupMigration(BaseRunTimeMigration):
+    """Migration to compile the daily and monthly rollups of existing statistics."""
+
+    migration_id = "statistics_rollup"
+    max_initial_schema_version = STATISTICS_ROLLUP_SCHEMA_VERSION - 1
+    _next_start_ts: float | None = None
+
+    def migrate_data_impl(self, instance: Recorder) -> DataMigrationStatus:
+        """Compile the rollups of one month of statistics, returns True if completed."""
+        self._next_start_ts = compile_statistics_rollups(instance, self._next_start_ts)
+        is_done = self._next_start_ts is None
+        return DataMigrationStatus(needs_migrate=not is_done, migration_done=is_done)
+
+    def migration_done(self, instance: Recorder, session: Session) -> None:
+        """Start reading from the rollups."""
+        instance.use_statistics_rollups = True
+
+    def needs_migrate_impl(
+        self, instance: Recorder, session: Session
+    ) -> DataMigrationStatus:
+        """Return if the migration needs to run."""
+        has_statistics = session.query(Statistics.id).first()
+        return DataMigrationStatus(
+            needs_migrate=has_statistics is not None,
+            migration_done=has_statistics is None,
+        )
+
+
 class EntityIDPostMigration(BaseMigrationWithQuery, BaseOffLineMigration):
     """Migration to remove old entity_id strings from states.
 
@@ -2981,6 +3178,7 @@ NON_LIVE_DATA_MIGRATORS: tuple[type[BaseOffLineMigration], ...] = (
 
 LIVE_DATA_MIGRATORS: tuple[type[BaseRunTimeMigration], ...] = (
     EventIDPostMigration,  # Introduced in HA Core 2023.4 by PR #89901
+    StatisticsRollupMigration,
 )
 
 
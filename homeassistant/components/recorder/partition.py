@@ -0,0 +1,201 @@
+"""Support for the partitioned states table.
+
+When the states table is partitioned, which is only supported with
+PostgreSQL, it holds one range partition per UTC day of last_updated_ts.
+States outside of the daily partitions end up in the default partition.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+import logging
+import re
+from typing import NamedTuple
+
+from sqlalchemy import bindparam, text
+from sqlalchemy.orm.session import Session
+
+from homeassistant.util import dt as dt_util
+
+from .db_schema import TABLE_STATES
+
+_LOGGER = logging.getLogger(__name__)
+
+# Partitions are created ahead of time, so states are not written to the
+# default partition if the nightly tasks did not run for a few days
+STATES_PARTITION_DAYS_AHEAD = 3
+STATES_DEFAULT_PARTITION = f"{TABLE_STATES}_default"
+
+_STATES_PARTITION_FORMAT = f"{TABLE_STATES}_p%Y%m%d"
+_STATES_PARTITION_RE = re.compile(rf"^{TABLE_STATES}_p\d{{8}}$")
+_ONE_DAY = timedelta(days=1)
+
+
+class StatesPartition(NamedTuple):
+    """A daily partition of the states table."""
+
+    name: str
+    start_ts: float
+    end_ts: float
+
+
+def _states_partition(day: datetime) -> StatesPartition:
+    """Return the partition holding the states of a UTC day."""
+    return StatesPartition(
+        day.strftime(_STATES_PARTITION_FORMAT),
+        day.timestamp(),
+        (day + _ONE_DAY).timestamp(),
+    )
+
+
+def _start_of_utc_day(point_in_time: datetime) -> datetime:
+    """Return the start of the UTC day of point_in_time."""
+    return dt_util.as_utc(point_in_time).replace(
+        hour=0, minute=0, second=0, microsecond=0
+    )
+
+
+def states_partitions_between(start: datetime, end: datetime) -> list[StatesPartition]:
+    """Return the daily partitions holding the states from start up to end."""
+    day = _start_of_utc_day(start)
+    partitions: list[StatesPartition] = []
+    while day < end:
+        partitions.append(_states_partition(day))
+        day += _ONE_DAY
+    return partitions
+
+
+def states_table_is_partitioned(session: Session) -> bool:
+    """Return if the states table is a partitioned table."""
+    return (
+        session.execute(
+            text("SELECT relkind FROM pg_class WHERE oid = to_regclass(:table)"),
+            {"table": TABLE_STATES},
+        ).scalar()
+        == "p"
+    )
+
+
+def get_states_partitions(session: Session) -> list[StatesPartition]:
+    """Return the daily partitions of the states table, oldest first."""
+    partitions = [
+        _states_partition(
+            datetime.strptime(name, _STATES_PARTITION_FORMAT).replace(
+                tzinfo=dt_util.UTC
+            )
+        )
+        for name in session.execute(
+            text(
+                "SELECT child.relname FROM pg_inherits"
+                " JOIN pg_class child ON child.oid = pg_inherits.inhrelid"
+                " WHERE pg_inherits.inhparent = to_regclass(:table)"
+            ),
+            {"table": TABLE_STATES},
+        ).scalars()
+        if _STATES_PARTITION_RE.match(name)
+    ]
+    return sorted(partitions, key=lambda partition: partition.start_ts)
+
+
+def create_states_partitions(
+    session: Session, partitions: list[StatesPartition], table: str = TABLE_STATES
+) -> None:
+    """Create the partitions of the states table which do not exist yet.
+
+    PostgreSQL refuses to create a partition for a range which already has
+    rows in the default partition, these rows are moved to the new partition
+    before it is attached.
+    """
+    for partition in partitions:
+        if session.execute(
+            text("SELECT to_regclass(:partition)"), {"partition": partition.name}
+        ).scalar():
+            continue
+        bounds = f"FOR VALUES FROM ({partition.start_ts!r}) TO ({partition.end_ts!r})"
+        if (
+            session.execute(
+                text(
+                    f"SELECT 1 FROM {STATES_DEFAULT_PARTITION}"  # noqa: S608
+                    " WHERE last_updated_ts >= :start_ts"
+                    " AND last_updated_ts < :end_ts LIMIT 1"
+                ),
+                {"start_ts": partition.start_ts, "end_ts": partition.end_ts},
+            ).first()
+            is None
+        ):
+            session.execute(
+                text(f"CREATE TABLE {partition.name} PARTITION OF {table} {bounds}")
+            )
+            continue
+        session.execute(
+            text(f"CREATE TABLE {partition.name} (LIKE {table} INCLUDING DEFAULTS)")
+        )
+        moved = session.connection().execute(
+            text(
+                f"WITH moved AS (DELETE FROM {STATES_DEFAULT_PARTITION}"  # noqa: S608
+                " WHERE last_updated_ts >= :start_ts AND last_updated_ts < :end_ts"
+                f" RETURNING *) INSERT INTO {partition.name} SELECT * FROM moved"
+            ),
+            {"start_ts": partition.start_ts, "end_ts": partition.end_ts},
+        )
+        session.execute(
+            text(f"ALTER TABLE {table} ATTACH PARTITION {partition.name} {bounds}")
+        )
+        _LOGGER.debug(
+            "Moved %s states from the default partition to %s",
+            moved.rowcount,
+            partition.name,
+        )
+
+
+def create_upcoming_states_partitions(session: Session, now: datetime) -> None:
+    """Create the partitions of today and the next days."""
+    create_states_partitions(
+        session,
+        states_partitions_between(
+            now, now + timedelta(days=STATES_PARTITION_DAYS_AHEAD + 1)
+        ),
+    )
+
+
+def select_attributes_ids_in_partition(
+    session: Session, partition: StatesPartition
+) -> set[int]:
+    """Return the attributes ids used by the states of a partition."""
+    return set(
+        session.execute(
+            text(
+                f"SELECT DISTINCT attributes_id FROM {partition.name}"  # noqa: S608
+                " WHERE attributes_id IS NOT NULL"
+            )
+        ).scalars()
+    )
+
+
+def select_state_ids_in_partition(
+    session: Session, partition: StatesPartition, state_ids: list[int]
+) -> set[int]:
+    """Return the state ids which are in a partition."""
+    return set(
+        session.execute(
+            text(
+                f"SELECT state_id FROM {partition.name} WHERE state_id IN :state_ids"  # noqa: S608
+            ).bindparams(bindparam("state_ids", expanding=True)),
+            {"state_ids": state_ids},
+        ).scalars()
+    )
+
+
+def drop_states_partition(session: Session, partition: StatesPartition) -> None:
+    """Disconnect the newer states from the states of a partition and drop it."""
+    disconnected = session.connection().execute(
+        text(
+            f"UPDATE {TABLE_STATES} SET old_state_id = NULL"  # noqa: S608
+            " WHERE last_updated_ts >= :end_ts"
+            f" AND old_state_id IN (SELECT state_id FROM {partition.name})"
+        ),
+        {"end_ts": partition.end_ts},
+    )
+    _LOGGER.debug("Updated %s states to remove old_state_id", disconnected.rowcount)
+    session.execute(text(f"DROP TABLE {partition.name}"))
+    _LOGGER.debug("Dropped states partition %s", partition.name)
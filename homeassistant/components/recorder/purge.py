@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+from dataclasses import dataclass
 from datetime import datetime
 import logging
 import time
@@ -14,6 +15,12 @@ from homeassistant.util.collection import chunked_or_all
 
 from .db_schema import Events, States, StatesMeta
 from .models import DatabaseEngine
+from .partition import (
+    drop_states_partition,
+    get_states_partitions,
+    select_attributes_ids_in_partition,
+    select_state_ids_in_partition,
+)
 from .queries import (
     attributes_ids_exist_in_states,
     attributes_ids_exist_in_states_with_fast_in_distinct,
@@ -36,6 +43,7 @@ from .queries import (
     find_legacy_detached_states_and_attributes_to_purge,
     find_legacy_event_state_and_attributes_and_data_ids_to_purge,
     find_legacy_row,
+    find_oldest_state,
     find_short_term_statistics_to_purge,
     find_states_to_purge,
     find_statistics_runs_to_purge,
@@ -53,6 +61,100 @@ DEFAULT_STATES_BATCHES_PER_PURGE = 20  # We expect ~95% de-dupe rate
 DEFAULT_EVENTS_BATCHES_PER_PURGE = 15  # We expect ~92% de-dupe rate
 
 
+@dataclass(slots=True)
+class PurgeProgress:
+    """Progress of a purge, which runs in as many cycles as it needs."""
+
+    purge_before: float
+    started: float
+    oldest_ts: float | None
+    current_ts: float | None = None
+    rows: int = 0
+    cycle_rows: int = 0
+    cycles: int = 0
+    updated: float = 0.0
+    finished: bool = False
+
+    @property
+    def fraction_done(self) -> float:
+        """Return how much of the time range to purge has been purged."""
+        if self.finished:
+            return 1.0
+        if (
+            self.oldest_ts is None
+            or self.current_ts is None
+            or self.purge_before <= self.oldest_ts
+        ):
+            return 0.0
+        return min(
+            max(
+                (self.current_ts - self.oldest_ts)
+                / (self.purge_before - self.oldest_ts),
+                0.0,
+            ),
+            1.0,
+        )
+
+    @property
+    def rows_per_second(self) -> float:
+        """Return the rows purged per second since the purge started."""
+        if (elapsed := self.updated - self.started) <= 0:
+            return 0.0
+        return self.rows / elapsed
+
+
+def purge_throttle_delay(instance: Recorder, elapsed: float) -> float:
+    """Return how long to wait before the next purge cycle.
+
+    The wait keeps the purge within the rows per second budget, so
+    the recorder can catch up with its queue in between the cycles.
+    """
+    if not (rows_per_second := instance.purge_rows_per_second) or not (
+        progress := instance.purge_progress
+    ):
+        return 0.0
+    return max(progress.cycle_rows / rows_per_second - elapsed, 0.0)
+
+
+def _purge_batch_rows(instance: Recorder) -> int:
+    """Return the number of rows to select for a purge batch."""
+    if rows_per_second := instance.purge_rows_per_second:
+        return max(min(instance.max_bind_vars, rows_per_second), 1)
+    return instance.max_bind_vars
+
+
+def _count_purged_rows(instance: Recorder, rows: int) -> None:
+    """Add rows to the progress of the purge."""
+    if (progress := instance.purge_progress) is not None:
+        progress.rows += rows
+        progress.cycle_rows += rows
+
+
+def _start_purge_cycle(
+    instance: Recorder, session: Session, purge_before: datetime
+) -> PurgeProgress:
+    """Start a purge cycle and return the progress of the purge."""
+    purge_before_ts = purge_before.timestamp()
+    progress = instance.purge_progress
+    if (
+        progress is None
+        or progress.finished
+        or progress.purge_before != purge_before_ts
+    ):
+        progress = instance.purge_progress = PurgeProgress(
+            purge_before=purge_before_ts,
+            started=time.monotonic(),
+            oldest_ts=instance.states_manager.oldest_ts,
+        )
+    oldest_ts = session.execute(find_oldest_state()).scalar()
+    progress.current_ts = purge_before_ts if oldest_ts is None else oldest_ts
+    if progress.oldest_ts is None:
+        progress.oldest_ts = progress.current_ts
+    progress.cycles += 1
+    progress.cycle_rows = 0
+    return progress
+
+
 @retryable_database_job("purge")
 def purge_old_data(
     instance: Recorder,
@@ -64,13 +166,19 @@ def purge_old_data(
 ) -> bool:
     """Purge events and states older than purge_before.
 
-    Cleans up an timeframe of an hour, based on the oldest record.
+    Each call purges a batch of the oldest rows. When the recorder has a
+    purge_rows_per_second budget the batches are kept within it.
     """
     _LOGGER.debug(
         "Purging states and events before target %s",
         purge_before.isoformat(sep=" ", timespec="seconds"),
     )
+    if instance.recent_states_cache is not None:
+        instance.recent_states_cache.evict_purged(purge_before.timestamp())
+    if instance.purge_rows_per_second:
+        states_batch_size = events_batch_size = 1
     with session_scope(session=instance.get_session()) as session:
+        progress = _start_purge_cycle(instance, session, purge_before)
         # Purge a max of max_bind_vars, based on the oldest states or events record
         has_more_to_purge = False
         if instance.use_legacy_events_index and _purging_legacy_format(session):
@@ -85,6 +193,8 @@ def purge_old_data(
                 " remaining"
             )
             # Once we are done purging legacy rows, we use the new method
+            if instance.use_states_partitions:
+                _purge_states_partitions(instance, session, purge_before)
             has_more_to_purge |= _purge_states_and_attributes_ids(
                 instance, session, states_batch_size, purge_before
             )
@@ -103,10 +213,16 @@ def purge_old_data(
 
         if short_term_statistics:
             _purge_short_term_statistics(session, short_term_statistics)
+            _count_purged_rows(instance, len(short_term_statistics))
 
         if has_more_to_purge or statistics_runs or short_term_statistics:
             # Return false, as we might not be done yet.
-            _LOGGER.debug("Purging hasn't fully completed yet")
+            progress.updated = time.monotonic()
+            _LOGGER.debug(
+                "Purging hasn't fully completed yet, purged %s rows at %.0f rows/s",
+                progress.rows,
+                progress.rows_per_second,
+            )
             return False
 
         if apply_filter and not _purge_filtered_data(instance, session):
@@ -121,6 +237,14 @@ def purge_old_data(
             _purge_old_entity_ids(instance, session)
 
         _purge_old_recorder_runs(instance, session, purge_before)
+    progress.updated = time.monotonic()
+    progress.finished = True
+    _LOGGER.debug(
+        "Purge finished in %s cycles, purged %s rows at %.0f rows/s",
+        progress.cycles,
+        progress.rows,
+        progress.rows_per_second,
+    )
     with session_scope(session=instance.get_session(), read_only=True) as session:
         instance.recorder_runs_manager.load_from_db(session)
         instance.states_manager.load_from_db(session)
@@ -149,6 +273,7 @@ def _purge_legacy_format(
     _purge_state_ids(instance, session, state_ids)
     _purge_unused_attributes_ids(instance, session, attributes_ids)
     _purge_event_ids(session, event_ids)
+    _count_purged_rows(instance, len(event_ids))
     _purge_unused_data_ids(instance, session, data_ids)
 
     # The database may still have some rows that have an event_id but are not
@@ -192,10 +317,10 @@ def _purge_states_and_attributes_ids(
     # size batch of attributes_ids that will be around the size
     # max_bind_vars
     attributes_ids_batch: set[int] = set()
-    max_bind_vars = instance.max_bind_vars
+    batch_rows = _purge_batch_rows(instance)
     for _ in range(states_batch_size):
         state_ids, attributes_ids = _select_state_attributes_ids_to_purge(
-            session, purge_before, max_bind_vars
+            session, purge_before, batch_rows
         )
         if not state_ids:
             has_remaining_state_ids_to_purge = False
@@ -211,6 +336,32 @@ def _purge_states_and_attributes_ids(
     return has_remaining_state_ids_to_purge
 
 
+def _purge_states_partitions(
+    instance: Recorder, session: Session, purge_before: datetime
+) -> None:
+    """Drop the states partitions which only hold states older than purge_before.
+
+    The remaining states older than purge_before are deleted row by row.
+    """
+    purge_before_ts = purge_before.timestamp()
+    for partition in get_states_partitions(session):
+        if partition.end_ts > purge_before_ts:
+            break
+        attributes_ids = select_attributes_ids_in_partition(session, partition)
+        purged_state_ids: set[int] = set()
+        if committed_state_ids := instance.states_manager.committed_state_ids():
+            for state_ids_chunk in chunked_or_all(
+                committed_state_ids, instance.max_bind_vars
+            ):
+                purged_state_ids |= select_state_ids_in_partition(
+                    session, partition, list(state_ids_chunk)
+                )
+        drop_states_partition(session, partition)
+        # Evict any entries in the old_states cache referring to a purged state
+        instance.states_manager.evict_purged_state_ids(purged_state_ids)
+        _purge_unused_attributes_ids(instance, session, attributes_ids)
+
+
 def _purge_events_and_data_ids(
     instance: Recorder,
     session: Session,
@@ -227,15 +378,16 @@ def _purge_events_and_data_ids(
     # size batch of data_ids that will be around the size
     # max_bind_vars
     data_ids_batch: set[int] = set()
-    max_bind_vars = instance.max_bind_vars
+    batch_rows = _purge_batch_rows(instance)
     for _ in range(events_batch_size):
         event_ids, data_ids = _select_event_data_ids_to_purge(
-            session, purge_before, max_bind_vars
+            session, purge_before, batch_rows
         )
         if not event_ids:
             has_remaining_event_ids_to_purge = False
             break
         _purge_event_ids(session, event_ids)
+        _count_purged_rows(instance, len(event_ids))
         data_ids_batch = data_ids_batch | data_ids
 
     _purge_unused_data_ids(instance, session, data_ids_batch)
@@ -468,6 +620,7 @@ def _purge_state_ids(instance: Recorder, session: Session, state_ids: set[int])
 
     deleted_rows = session.execute(delete_states_rows(state_ids))
     _LOGGER.debug("Deleted %s states", deleted_rows)
+    _count_purged_rows(instance, len(state_ids))
 
     # Evict eny entries in the old_states cache referring to a purged state
     instance.states_manager.evict_purged_state_ids(state_ids)
@@ -482,6 +635,7 @@ def _purge_batch_attributes_ids(
             delete_states_attributes_rows(attributes_ids_chunk)
         )
         _LOGGER.debug("Deleted %s attribute states", deleted_rows)
+    _count_purged_rows(instance, len(attributes_ids))
 
     # Evict any entries in the state_attributes_ids cache referring to a purged state
     instance.state_attributes_manager.evict_purged(attributes_ids)
@@ -494,6 +648,7 @@ def _purge_batch_data_ids(
     for data_ids_chunk in chunked_or_all(data_ids, instance.max_bind_vars):
         deleted_rows = session.execute(delete_event_data_rows(data_ids_chunk))
         _LOGGER.debug("Deleted %s data events", deleted_rows)
+    _count_purged_rows(instance, len(data_ids))
 
     # Evict any entries in the event_data_ids cache referring to a purged state
     instance.event_data_manager.evict_purged(data_ids)
@@ -573,6 +728,8 @@ def _purge_old_entity_ids(instance: Recorder, session: Session) -> None:
     # Evict any entries in the event_type cache referring to a purged state
     instance.states_meta_manager.evict_purged(purge_entity_ids)
     instance.states_manager.evict_purged_entity_ids(purge_entity_ids)
+    if instance.recent_states_cache is not None:
+        instance.recent_states_cache.evict_metadata_ids(states_metadata_ids)
 
 
 def _purge_filtered_data(instance: Recorder, session: Session) -> bool:
@@ -588,7 +745,7 @@ def _purge_filtered_data(instance: Recorder, session: Session) -> bool:
     # Check if excluded entity_ids are in database
     entity_filter = instance.entity_filter
     has_more_to_purge = False
-    excluded_metadata_ids: list[str] = [
+    excluded_metadata_ids: list[int] = [
         metadata_id
         for (metadata_id, entity_id) in session.query(
             StatesMeta.metadata_id, StatesMeta.entity_id
@@ -623,7 +780,7 @@ def _purge_filtered_data(instance: Recorder, session: Session) -> bool:
 def _purge_filtered_states(
     instance: Recorder,
     session: Session,
-    metadata_ids_to_purge: list[str],
+    metadata_ids_to_purge: list[int],
     database_engine: DatabaseEngine,
     purge_before_timestamp: float,
 ) -> bool:
@@ -641,6 +798,10 @@ def _purge_filtered_states(
         .limit(instance.max_bind_vars)
         .all()
     )
+    if instance.recent_states_cache is not None:
+        instance.recent_states_cache.evict_purged(
+            purge_before_timestamp, metadata_ids_to_purge
+        )
     if not to_purge:
         return True
     state_ids, attributes_ids, event_ids = zip(*to_purge, strict=False)
@@ -721,7 +882,7 @@ def purge_entity_data(
     assert database_engine is not None
     purge_before_timestamp = purge_before.timestamp()
     with session_scope(session=instance.get_session()) as session:
-        selected_metadata_ids: list[str] = [
+        selected_metadata_ids: list[int] = [
             metadata_id
             for (metadata_id, entity_id) in session.query(
                 StatesMeta.metadata_id, StatesMeta.entity_id
@@ -18,6 +18,7 @@ from sqlalchemy import Select, and_, bindparam, func, lambda_stmt, select, text
 from sqlalchemy.engine.row import Row
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm.session import Session
+from sqlalchemy.sql.elements import ColumnElement
 from sqlalchemy.sql.lambdas import StatementLambdaElement
 import voluptuous as vol
 
@@ -64,7 +65,10 @@ from .db_schema import (
     STATISTICS_TABLES,
     Statistics,
     StatisticsBase,
+    StatisticsDaily,
     StatisticsMeta,
+    StatisticsMonthly,
+    StatisticsRollupBase,
     StatisticsRuns,
     StatisticsShortTerm,
 )
@@ -250,13 +254,12 @@ def get_display_unit(
     return state_unit
 
 
-def _get_statistic_to_display_unit_converter(
+def _get_statistic_to_display_unit_conversion(
     statistic_unit: str | None,
     state_unit: str | None,
     requested_units: dict[str, str] | None,
-    allow_none: bool = True,
-) -> Callable[[float | None], float | None] | Callable[[float], float] | None:
-    """Prepare a converter from the statistics unit to display unit."""
+) -> tuple[type[BaseUnitConverter], str | None] | None:
+    """Return the converter class and display unit if a conversion is needed."""
     if (converter := STATISTIC_UNIT_TO_UNIT_CONVERTER.get(statistic_unit)) is None:
         return None
 
@@ -274,11 +277,43 @@ def _get_statistic_to_display_unit_converter(
     if display_unit == statistic_unit:
         return None
 
-    if allow_none:
-        return converter.converter_factory_allow_none(
-            from_unit=statistic_unit, to_unit=display_unit
+    return converter, display_unit
+
+
+def _get_statistic_to_display_unit_converter(
+    statistic_unit: str | None,
+    state_unit: str | None,
+    requested_units: dict[str, str] | None,
+) -> Callable[[float | None], float | None] | None:
+    """Prepare a converter from the statistics unit to display unit."""
+    if (
+        conversion := _get_statistic_to_display_unit_conversion(
+            statistic_unit, state_unit, requested_units
         )
-    return converter.converter_factory(from_unit=statistic_unit, to_unit=display_unit)
+    ) is None:
+        return None
+    converter, display_unit = conversion
+    return converter.converter_factory_allow_none(
+        from_unit=statistic_unit, to_unit=display_unit
+    )
+
+
+def _get_statistic_to_display_unit_batch_converter(
+    statistic_unit: str | None,
+    state_unit: str | None,
+    requested_units: dict[str, str] | None,
+) -> Callable[[Iterable[float | None]], list[float | None]] | None:
+    """Prepare a batch converter from the statistics unit to display unit."""
+    if (
+        conversion := _get_statistic_to_display_unit_conversion(
+            statistic_unit, state_unit, requested_units
+        )
+    ) is None:
+        return None
+    converter, display_unit = conversion
+    return converter.converter_factory_batch(
+        from_unit=statistic_unit, to_unit=display_unit
+    )
 
 
 def _get_display_to_statistic_unit_converter(
@@ -456,6 +491,153 @@ def _compile_hourly_statistics(session: Session, start: datetime) -> None:
         for metadata_id, summary_item in summary.items()
     )
 
+    if summary:
+        _compile_statistics_rollups(session, start_time_ts, end_time_ts, None)
+
+
+def _iter_periods(
+    period_start_end: Callable[[float], tuple[float, float]],
+    start_ts: float,
+    end_ts: float,
+) -> Iterable[tuple[float, float]]:
+    """Return the start and end of the periods overlapping start_ts - end_ts."""
+    period_start, period_end = period_start_end(start_ts)
+    yield period_start, period_end
+    while period_end < end_ts:
+        period_start, period_end = period_start_end(period_end)
+        yield period_start, period_end
+
+
+def _compile_statistics_rollup(
+    session: Session,
+    table: type[StatisticsDaily | StatisticsMonthly],
+    start_ts: float,
+    end_ts: float,
+    metadata_id: int | None,
+) -> None:
+    """Compile the daily or monthly rollup of one period.
+
+    Daily rollups are compiled from the hourly statistics and monthly rollups
+    are compiled from the daily rollups. The mean is weighted by the number of
+    hourly means, so it matches the mean of the hourly means of the period.
+    The rollups of the period are replaced, for all statistics if metadata_id
+    is None.
+    """
+    source: type[Statistics | StatisticsDaily]
+    mean_columns: tuple[ColumnElement[Any], ColumnElement[Any]]
+    if table is StatisticsDaily:
+        source = Statistics
+        mean_columns = (func.avg(Statistics.mean), func.count(Statistics.mean))
+    else:
+        source = StatisticsDaily
+        mean_weight = func.sum(StatisticsDaily.mean_weight)
+        mean_columns = (
+            func.sum(StatisticsDaily.mean * StatisticsDaily.mean_weight)
+            / func.nullif(mean_weight, 0),
+            mean_weight,
+        )
+    period_filter = [source.start_ts >= start_ts, source.start_ts < end_ts]
+    if metadata_id is not None:
+        period_filter.append(source.metadata_id == metadata_id)
+
+    rollups: dict[int, StatisticsRollupBase] = {}
+    now_timestamp = time_time()
+    for row_metadata_id, _mean, _mean_weight, _min, _max in session.execute(
+        select(
+            source.metadata_id,
+            *mean_columns,
+            func.min(source.min),
+            func.max(source.max),
+        )
+        .filter(*period_filter)
+        .group_by(source.metadata_id)
+    ):
+        rollups[row_metadata_id] = table(
+            metadata_id=row_metadata_id,
+            created_ts=now_timestamp,
+            start_ts=start_ts,
+            mean=_mean,
+            mean_weight=_mean_weight,
+            min=_min,
+            max=_max,
+        )
+
+    # The state and sum are taken from the last statistics of the period
+    subquery = (
+        select(
+            source.metadata_id,
+            source.last_reset_ts,
+            source.state,
+            source.sum,
+            func.row_number()
+            .over(partition_by=source.metadata_id, order_by=source.start_ts.desc())
+            .label("rownum"),
+        )
+        .filter(*period_filter)
+        .subquery()
+    )
+    for row in session.execute(select(subquery).filter(subquery.c.rownum == 1)):
+        rollup = rollups[row.metadata_id]
+        rollup.last_reset_ts = row.last_reset_ts
+        rollup.state = row.state
+        rollup.sum = row.sum
+
+    rollup_query = session.query(table).filter(
+        table.start_ts >= start_ts, table.start_ts < end_ts
+    )
+    if metadata_id is not None:
+        rollup_query = rollup_query.filter(table.metadata_id == metadata_id)
+    rollup_query.delete(synchronize_session=False)
+    session.add_all(rollups.values())
+
+
+def _compile_statistics_rollups(
+    session: Session, start_ts: float, end_ts: float, metadata_id: int | None
+) -> None:
+    """Compile the daily and monthly rollups of the periods overlapping start_ts - end_ts.
+
+    This must be called after the hourly statistics of the periods are changed.
+    """
+    _, day_start_end = reduce_day_ts_factory()
+    _, month_start_end = reduce_month_ts_factory()
+    session.flush()
+    for period_start, period_end in _iter_periods(day_start_end, start_ts, end_ts):
+        _compile_statistics_rollup(
+            session, StatisticsDaily, period_start, period_end, metadata_id
+        )
+    session.flush()
+    for period_start, period_end in _iter_periods(month_start_end, start_ts, end_ts):
+        _compile_statistics_rollup(
+            session, StatisticsMonthly, period_start, period_end, metadata_id
+        )
+
+
+def compile_statistics_rollups(
+    instance: Recorder, start_ts: float | None
+) -> float | None:
+    """Compile the daily and monthly rollups of one month.
+
+    The rollups of the month start_ts is in are compiled, or of the month of the
+    oldest statistics if start_ts is None. Returns the start of the next month,
+    or None if there are no newer statistics.
+    """
+    with session_scope(session=instance.get_session()) as session:
+        if (
+            start_ts is None
+            and (start_ts := session.query(func.min(Statistics.start_ts)).scalar())
+            is None
+        ):
+            return None
+        _, month_start_end = reduce_month_ts_factory()
+        month_start, month_end = month_start_end(start_ts)
+        _LOGGER.debug("Compiling statistics rollups for %s-%s", month_start, month_end)
+        _compile_statistics_rollups(session, month_start, month_end, None)
+        newest_start_ts = session.query(func.max(Statistics.start_ts)).scalar()
+
+    if newest_start_ts is None or newest_start_ts < month_end:
+        return None
+    return month_end
+
 
 @retryable_database_job("compile missing statistics")
 def compile_missing_statistics(instance: Recorder) -> bool:
@@ -641,7 +823,7 @@ def _compile_statistics(
 
 def _adjust_sum_statistics(
     session: Session,
-    table: type[StatisticsBase],
+    table: type[StatisticsBase | StatisticsRollupBase],
     metadata_id: int,
     start_time: datetime,
     adj: float,
@@ -1122,7 +1304,7 @@ def _generate_statistics_during_period_stmt(
     start_time: datetime,
     end_time: datetime | None,
     metadata_ids: list[int] | None,
-    table: type[StatisticsBase],
+    table: type[StatisticsBase | StatisticsRollupBase],
     types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
 ) -> StatementLambdaElement:
     """Prepare a database query for statistics during a given period.
@@ -1614,12 +1796,12 @@ _type_column_mapping = {
 
 
 def _generate_select_columns_for_types_stmt(
-    table: type[StatisticsBase],
+    table: type[StatisticsBase | StatisticsRollupBase],
     types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
 ) -> StatementLambdaElement:
     columns = select(table.metadata_id, table.start_ts)
     track_on: list[str | None] = [
-        table.__tablename__,  # type: ignore[attr-defined]
+        table.__tablename__,  # type: ignore[attr-defined,union-attr]
     ]
     for key, column in _type_column_mapping.items():
         if key in types:
@@ -1703,6 +1885,77 @@ def _augment_result_with_change(
             prev_sum = _sum
 
 
+def _statistics_rollups_cover_period(
+    period: Literal["day", "month"], start_time: datetime, end_time: datetime | None
+) -> bool:
+    """Return if start_time and end_time are at the start of a day or month.
+
+    The rollups only hold whole days and months, other periods are reduced
+    from the hourly statistics.
+    """
+    if period == "day":
+        _, period_start_end = reduce_day_ts_factory()
+    else:
+        _, period_start_end = reduce_month_ts_factory()
+    return all(
+        period_start_end(point_in_time.timestamp())[0] == point_in_time.timestamp()
+        for point_in_time in (start_time, end_time)
+        if point_in_time is not None
+    )
+
+
+def _statistics_rollups_during_period(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    statistic_ids: set[str] | None,
+    metadata_ids: list[int] | None,
+    metadata: dict[str, tuple[int, StatisticMetaData]],
+    period: Literal["day", "month"],
+    units: dict[str, str] | None,
+    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
+) -> dict[str, list[StatisticsRow]] | None:
+    """Return daily or monthly statistics from the rollups.
+
+    Returns None if the rollups don't start at the start of a day or month in
+    the configured time zone, which happens if the time zone was changed.
+    """
+    table: type[StatisticsDaily | StatisticsMonthly]
+    if period == "day":
+        table = StatisticsDaily
+        _, period_start_end = reduce_day_ts_factory()
+    else:
+        table = StatisticsMonthly
+        _, period_start_end = reduce_month_ts_factory()
+    stmt = _generate_statistics_during_period_stmt(
+        start_time, end_time, metadata_ids, table, types
+    )
+    stats = cast(
+        Sequence[Row], execute_stmt_lambda_element(session, stmt, orm_rows=False)
+    )
+
+    if not stats:
+        return {}
+
+    result = _sorted_statistics_to_dict(
+        hass,
+        stats,
+        statistic_ids,
+        metadata,
+        True,
+        table,
+        units,
+        types,
+    )
+    for rows in result.values():
+        for row in rows:
+            start, row["end"] = period_start_end(row["start"])
+            if start != row["start"]:
+                return None
+    return result
+
+
 def _statistics_during_period_with_session(
     hass: HomeAssistant,
     session: Session,
@@ -1773,35 +2026,66 @@ def _statistics_during_period_with_session(
     table: type[Statistics | StatisticsShortTerm] = (
         Statistics if period != "5minute" else StatisticsShortTerm
     )
-    stmt = _generate_statistics_during_period_stmt(
-        start_time, end_time, metadata_ids, table, types
-    )
-    stats = cast(
-        Sequence[Row], execute_stmt_lambda_element(session, stmt, orm_rows=False)
-    )
+    rollup_result: dict[str, list[StatisticsRow]] | None = None
+    if (
+        period in ("day", "month")
+        and (instance := get_instance(hass)).use_statistics_rollups
+        and _statistics_rollups_cover_period(period, start_time, end_time)
+    ):
+        rollup_result = _statistics_rollups_during_period(
+            hass,
+            session,
+            start_time,
+            end_time,
+            statistic_ids,
+            metadata_ids,
+            metadata,
+            period,
+            units,
+            types,
+        )
+        if rollup_result is None:
+            _LOGGER.info(
+                "Statistics rollups were compiled for another time zone, "
+                "compiling them again"
+            )
+            instance.recompile_statistics_rollups()
 
-    if not stats:
-        return {}
+    if rollup_result is not None:
+        result = rollup_result
+    else:
+        stmt = _generate_statistics_during_period_stmt(
+            start_time, end_time, metadata_ids, table, types
+        )
+        stats = cast(
+            Sequence[Row], execute_stmt_lambda_element(session, stmt, orm_rows=False)
+        )
 
-    result = _sorted_statistics_to_dict(
-        hass,
-        stats,
-        statistic_ids,
-        metadata,
-        True,
-        table,
-        units,
-        types,
-    )
+        if not stats:
+            return {}
 
-    if period == "day":
-        result = _reduce_statistics_per_day(result, types)
+        result = _sorted_statistics_to_dict(
+            hass,
+            stats,
+            statistic_ids,
+            metadata,
+            True,
+            table,
+            units,
+            types,
+        )
+
+        if period == "day":
+            result = _reduce_statistics_per_day(result, types)
 
-    if period == "week":
-        result = _reduce_statistics_per_week(result, types)
+        if period == "week":
+            result = _reduce_statistics_per_week(result, types)
 
-    if period == "month":
-        result = _reduce_statistics_per_month(result, types)
+        if period == "month":
+            result = _reduce_statistics_per_month(result, types)
+
+    if not result:
+        return {}
 
     if "change" in _types:
         _augment_result_with_change(
@@ -2082,16 +2366,17 @@ def _build_sum_converted_stats(
     table_duration_seconds: float,
     start_ts_idx: int,
     sum_idx: int,
-    convert: Callable[[float | None], float | None] | Callable[[float], float],
+    convert: Callable[[Iterable[float | None]], list[float | None]],
 ) -> list[StatisticsRow]:
     """Build a list of sum statistics."""
+    sums = convert([db_row[sum_idx] for db_row in db_rows])
     return [
         {
             "start": (start_ts := db_row[start_ts_idx]),
             "end": start_ts + table_duration_seconds,
-            "sum": None if (v := db_row[sum_idx]) is None else convert(v),
+            "sum": sum_,
         }
-        for db_row in db_rows
+        for db_row, sum_ in zip(db_rows, sums, strict=True)
     ]
 
 
@@ -2134,19 +2419,20 @@ def _build_converted_stats(
     table_duration_seconds: float,
     start_ts_idx: int,
     row_mapping: tuple[tuple[str, int], ...],
-    convert: Callable[[float | None], float | None] | Callable[[float], float],
+    convert: Callable[[Iterable[float | None]], list[float | None]],
 ) -> list[StatisticsRow]:
     """Build a list of statistics with unit conversion."""
+    # Convert the values column by column to avoid a function call per value
+    columns = [
+        (key, convert([db_row[idx] for db_row in db_rows])) for key, idx in row_mapping
+    ]
     return [
         {
             "start": (start_ts := db_row[start_ts_idx]),
             "end": start_ts + table_duration_seconds,
-            **{
-                key: None if (v := db_row[idx]) is None else convert(v)  # type: ignore[typeddict-item]
-                for key, idx in row_mapping
-            },
+            **{key: values[row_idx] for key, values in columns},  # type: ignore[typeddict-item]
         }
-        for db_row in db_rows
+        for row_idx, db_row in enumerate(db_rows)
     ]
 
 
@@ -2156,7 +2442,7 @@ def _sorted_statistics_to_dict(
     statistic_ids: set[str] | None,
     _metadata: dict[str, tuple[int, StatisticMetaData]],
     convert_units: bool,
-    table: type[StatisticsBase],
+    table: type[StatisticsBase | StatisticsRollupBase],
     units: dict[str, str] | None,
     types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
 ) -> dict[str, list[StatisticsRow]]:
@@ -2201,8 +2487,8 @@ def _sorted_statistics_to_dict(
             state_unit = unit = metadata_by_id["unit_of_measurement"]
             if state := hass.states.get(statistic_id):
                 state_unit = state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
-            convert = _get_statistic_to_display_unit_converter(
-                unit, state_unit, units, allow_none=False
+            convert = _get_statistic_to_display_unit_batch_converter(
+                unit, state_unit, units
             )
         else:
             convert = None
@@ -2357,13 +2643,22 @@ def _import_statistics_with_session(
         session, metadata, old_metadata_dict
     )
     now_timestamp = time_time()
+    start_timestamps: list[float] = []
     for stat in statistics:
         if stat_id := _statistics_exists(session, table, metadata_id, stat["start"]):
             _update_statistics(session, table, stat_id, stat)
         else:
             _insert_statistics(session, table, metadata_id, stat, now_timestamp)
+        start_timestamps.append(stat["start"].timestamp())
 
     if table != StatisticsShortTerm:
+        if start_timestamps:
+            _compile_statistics_rollups(
+                session,
+                min(start_timestamps),
+                max(start_timestamps) + table.duration.total_seconds(),
+                metadata_id,
+            )
         return True
 
     # We just inserted new short term statistics, so we need to update the
@@ -2449,9 +2744,11 @@ def import_statistics(
             instance, "statistic"
         ),
     ) as session:
-        return _import_statistics_with_session(
-            instance, session, metadata, statistics, table
-        )
+        _import_statistics_with_session(instance, session, metadata, statistics, table)
+
+    # Don't retry if duplicated statistics were blocked, compiling the rollups
+    # flushes the imported statistics before they are committed
+    return True
 
 
 @retryable_database_job("adjust_statistics")
@@ -2493,12 +2790,38 @@ def adjust_statistics(
             sum_adjustment,
         )
 
+        _adjust_sum_statistics_rollups(
+            session,
+            metadata[statistic_id][0],
+            start_time.replace(minute=0).timestamp(),
+            sum_adjustment,
+        )
+
     return True
 
 
+def _adjust_sum_statistics_rollups(
+    session: Session, metadata_id: int, start_time_ts: float, adj: float
+) -> None:
+    """Adjust the rollups after the hourly statistics were adjusted.
+
+    The rollups of later periods are adjusted like the hourly statistics, the
+    rollups of the periods start_time_ts is in are compiled again.
+    """
+    for table, (_, period_start_end) in (
+        (StatisticsDaily, reduce_day_ts_factory()),
+        (StatisticsMonthly, reduce_month_ts_factory()),
+    ):
+        _, period_end = period_start_end(start_time_ts)
+        _adjust_sum_statistics(
+            session, table, metadata_id, dt_util.utc_from_timestamp(period_end), adj
+        )
+    _compile_statistics_rollups(session, start_time_ts, start_time_ts, metadata_id)
+
+
 def _change_statistics_unit_for_table(
     session: Session,
-    table: type[StatisticsBase],
+    table: type[StatisticsBase | StatisticsRollupBase],
     metadata_id: int,
     convert: Callable[[float | None], float | None],
 ) -> None:
@@ -2550,9 +2873,11 @@ def change_statistics_unit(
             )
             return
 
-        tables: tuple[type[StatisticsBase], ...] = (
+        tables: tuple[type[StatisticsBase | StatisticsRollupBase], ...] = (
             Statistics,
             StatisticsShortTerm,
+            StatisticsDaily,
+            StatisticsMonthly,
         )
         for table in tables:
             _change_statistics_unit_for_table(session, table, metadata_id, convert)
@@ -72,4 +72,15 @@ async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
             "oldest_recorder_run": recorder_runs_manager.first.start,
             "current_recorder_run": recorder_runs_manager.current.start,
         }
-    return db_runs | db_stats | db_engine_info
+    return db_runs | db_stats | db_engine_info | _async_get_purge_info(instance)
+
+
+@callback
+def _async_get_purge_info(instance: Recorder) -> dict[str, Any]:
+    """Get the progress of the last purge."""
+    if (progress := instance.purge_progress) is None:
+        return {}
+    return {
+        "purge_progress": f"{progress.fraction_done:.0%}",
+        "purge_rows_per_second": f"{progress.rows_per_second:.0f}",
+    }
@@ -9,6 +9,7 @@ from dataclasses import dataclass
 from datetime import datetime
 import logging
 import threading
+import time
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.helpers.typing import UndefinedType
@@ -117,6 +118,7 @@ class PurgeTask(RecorderTask):
 
     def run(self, instance: Recorder) -> None:
         """Purge the database."""
+        started = time.monotonic()
         if purge.purge_old_data(
             instance, self.purge_before, self.repack, self.apply_filter
         ):
@@ -126,9 +128,12 @@ class PurgeTask(RecorderTask):
             periodic_db_cleanups(instance)
             return
         # Schedule a new purge task if this one didn't finish
-        instance.queue_task(
-            PurgeTask(self.purge_before, self.repack, self.apply_filter)
-        )
+        task = PurgeTask(self.purge_before, self.repack, self.apply_filter)
+        if delay := purge.purge_throttle_delay(instance, time.monotonic() - started):
+            loop = instance.hass.loop
+            loop.call_soon_threadsafe(loop.call_later, delay, instance.queue_task, task)
+            return
+        instance.queue_task(task)
 
 
 @dataclass(slots=True)
@@ -235,6 +240,28 @@ class AdjustStatisticsTask(RecorderTask):
         )
 
 
+@dataclass(slots=True)
+class CompileStatisticsRollupsTask(RecorderTask):
+    """An object to insert into the recorder queue to recompile statistics rollups.
+
+    The rollups are recompiled one month at a time, starting with the oldest
+    statistics, and are used again when all months are recompiled.
+    """
+
+    start_ts: float | None = None
+
+    def run(self, instance: Recorder) -> None:
+        """Run statistics task."""
+        if (
+            next_start_ts := statistics.compile_statistics_rollups(
+                instance, self.start_ts
+            )
+        ) is not None:
+            instance.queue_task(CompileStatisticsRollupsTask(next_start_ts))
+            return
+        instance.use_statistics_rollups = True
+
+
 @dataclass(slots=True)
 class WaitTask(RecorderTask):
     """An object to insert into the recorder queue.
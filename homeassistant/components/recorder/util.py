@@ -50,6 +50,7 @@ from .models import (
     UnsupportedDialect,
     process_timestamp,
 )
+from .partition import create_upcoming_states_partitions
 
 if TYPE_CHECKING:
     from sqlite3.dbapi2 import Cursor as SQLiteCursor
@@ -201,6 +202,34 @@ def execute_stmt_lambda_element(
     raise RuntimeError  # pragma: no cover
 
 
+def stream_stmt_lambda_element(
+    session: Session,
+    stmt: StatementLambdaElement,
+    yield_per: int = DEFAULT_YIELD_STATES_ROWS,
+) -> Result:
+    """Execute a StatementLambdaElement and stream the rows.
+
+    The rows are fetched yield_per rows at a time with a server side
+    cursor on databases which support them, so the rows of a large
+    result are never all in memory at the same time.
+
+    The result must be consumed before the session is used again.
+    """
+    for tryno in range(RETRIES):
+        try:
+            return session.connection().execute(
+                stmt, execution_options={"yield_per": yield_per}
+            )
+        except SQLAlchemyError as err:
+            _LOGGER.error("Error executing query: %s", err)
+            if tryno == RETRIES - 1:
+                raise
+            time.sleep(QUERY_RETRY_WAIT)
+
+    # Unreachable
+    raise RuntimeError  # pragma: no cover
+
+
 def validate_or_move_away_sqlite_database(dburl: str) -> bool:
     """Ensure that the database is valid or move it away."""
     dbpath = dburl_to_path(dburl)
@@ -728,6 +757,12 @@ def periodic_db_cleanups(instance: Recorder) -> None:
     These cleanups will happen nightly or after any purge.
     """
     assert instance.engine is not None
+    if instance.use_states_partitions:
+        try:
+            with session_scope(session=instance.get_session()) as session:
+                create_upcoming_states_partitions(session, dt_util.utcnow())
+        except SQLAlchemyError:
+            _LOGGER.exception("Error creating the states partitions")
     if instance.engine.dialect.name == SupportedDialect.SQLITE:
         # Execute sqlite to create a wal checkpoint and free up disk space
         _LOGGER.debug("WAL checkpoint")
@@ -48,6 +48,7 @@ from homeassistant.helpers.issue_registry import (
     async_create_issue,
     async_delete_issue,
 )
+from homeassistant.helpers.reference_index import ReferenceIndex
 from homeassistant.helpers.restore_state import RestoreEntity
 from homeassistant.helpers.script import (
     ATTR_CUR,
@@ -64,6 +65,7 @@ from homeassistant.helpers.typing import ConfigType
 from homeassistant.loader import bind_hass
 from homeassistant.util.async_ import create_eager_task
 from homeassistant.util.dt import parse_datetime
+from homeassistant.util.hass_dict import HassKey
 
 from .config import ScriptConfig, ValidationStatus
 from .const import (
@@ -80,6 +82,8 @@ from .const import (
 from .helpers import async_get_blueprints
 from .trace import trace_script
 
+DATA_REFERENCE_INDEX: HassKey[ReferenceIndex] = HassKey(f"{DOMAIN}_reference_index")
+
 SCRIPT_SERVICE_SCHEMA = vol.Schema(dict)
 SCRIPT_TURN_ONOFF_SCHEMA = make_entity_service_schema(
     {vol.Optional(ATTR_VARIABLES): {str: cv.match_all}}
@@ -97,16 +101,10 @@ def _scripts_with_x(
     hass: HomeAssistant, referenced_id: str, property_name: str
 ) -> list[str]:
     """Return all scripts that reference the x."""
-    if DOMAIN not in hass.data:
+    if DATA_REFERENCE_INDEX not in hass.data:
         return []
 
-    component: EntityComponent[BaseScriptEntity] = hass.data[DOMAIN]
-
-    return [
-        script_entity.entity_id
-        for script_entity in component.entities
-        if referenced_id in getattr(script_entity, property_name)
-    ]
+    return hass.data[DATA_REFERENCE_INDEX].async_get(property_name, referenced_id)
 
 
 def _x_in_script(hass: HomeAssistant, entity_id: str, property_name: str) -> list[str]:
@@ -185,16 +183,7 @@ def labels_in_script(hass: HomeAssistant, entity_id: str) -> list[str]:
 @callback
 def scripts_with_blueprint(hass: HomeAssistant, blueprint_path: str) -> list[str]:
     """Return all scripts that reference the blueprint."""
-    if DOMAIN not in hass.data:
-        return []
-
-    component: EntityComponent[BaseScriptEntity] = hass.data[DOMAIN]
-
-    return [
-        script_entity.entity_id
-        for script_entity in component.entities
-        if script_entity.referenced_blueprint == blueprint_path
-    ]
+    return _scripts_with_x(hass, blueprint_path, "referenced_blueprint")
 
 
 @callback
@@ -216,6 +205,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     hass.data[DOMAIN] = component = EntityComponent[BaseScriptEntity](
         LOGGER, DOMAIN, hass
     )
+    hass.data[DATA_REFERENCE_INDEX] = ReferenceIndex()
 
     # Register script as valid domain for Blueprint
     async_get_blueprints(hass)
@@ -457,6 +447,16 @@ class BaseScriptEntity(ToggleEntity, ABC):
     def referenced_entities(self) -> set[str]:
         """Return a set of referenced entities."""
 
+    async def async_internal_added_to_hass(self) -> None:
+        """Add the script to the reference index."""
+        await super().async_internal_added_to_hass()
+        self.hass.data[DATA_REFERENCE_INDEX].async_add(self)
+
+    async def async_internal_will_remove_from_hass(self) -> None:
+        """Remove the script from the reference index."""
+        self.hass.data[DATA_REFERENCE_INDEX].async_remove(self)
+        await super().async_internal_will_remove_from_hass()
+
 
 class UnavailableScriptEntity(BaseScriptEntity):
     """A non-functional script entity with its state set to unavailable.
@@ -2,23 +2,26 @@
 
 from __future__ import annotations
 
-from collections import defaultdict
+from collections import defaultdict, deque
 from collections.abc import Callable, Iterable
 from contextlib import suppress
 import datetime
 import itertools
 import logging
 import math
+import time
 from typing import Any
 
 from sqlalchemy.orm.session import Session
 
 from homeassistant.components.recorder import (
     DOMAIN as RECORDER_DOMAIN,
+    Recorder,
     get_instance,
     history,
     statistics,
 )
+from homeassistant.components.recorder.db_schema import StatisticsShortTerm
 from homeassistant.components.recorder.models import (
     StatisticData,
     StatisticMetaData,
@@ -26,12 +29,22 @@ from homeassistant.components.recorder.models import (
 )
 from homeassistant.const import (
     ATTR_UNIT_OF_MEASUREMENT,
+    EVENT_HOMEASSISTANT_FINAL_WRITE,
+    EVENT_STATE_CHANGED,
     REVOLUTIONS_PER_MINUTE,
     UnitOfIrradiance,
     UnitOfSoundPressure,
     UnitOfVolume,
 )
-from homeassistant.core import HomeAssistant, State, callback, split_entity_id
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    State,
+    callback,
+    split_entity_id,
+)
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import issue_registry as ir
 from homeassistant.helpers.entity import entity_sources
@@ -78,18 +91,26 @@ WARN_UNSUPPORTED_UNIT: HassKey[set[str]] = HassKey(f"{DOMAIN}_warn_unsupported_u
 WARN_UNSTABLE_UNIT: HassKey[set[str]] = HassKey(f"{DOMAIN}_warn_unstable_unit")
 # Link to dev statistics where issues around LTS can be fixed
 LINK_DEV_STATISTICS = "https://my.home-assistant.io/redirect/developer_statistics"
+# Short term statistics accumulated while the states are recorded
+SHORT_TERM_ACCUMULATORS: HassKey[ShortTermStatisticsAccumulators] = HassKey(
+    f"{DOMAIN}_short_term_statistics_accumulators"
+)
 
 
 def _get_sensor_states(hass: HomeAssistant) -> list[State]:
     """Get the current state of all sensors for which to compile statistics."""
-    instance = get_instance(hass)
+    return _filter_sensor_states(get_instance(hass), hass.states.all(DOMAIN))
+
+
+def _filter_sensor_states(instance: Recorder, states: list[State]) -> list[State]:
+    """Filter the states of sensors for which to compile statistics."""
     # We check for state class first before calling the filter
     # function as the filter function is much more expensive
     # than checking the state class
     entity_filter = instance.entity_filter
     return [
         state
-        for state in hass.states.all(DOMAIN)
+        for state in states
         if (state_class := state.attributes.get(ATTR_STATE_CLASS))
         and (
             type(state_class) is SensorStateClass
@@ -402,6 +423,272 @@ def _timestamp_to_isoformat_or_none(timestamp: float | None) -> str | None:
     return dt_util.utc_from_timestamp(timestamp).isoformat()
 
 
+def _float_or_none(state: State) -> float | None:
+    """Return the state as a finite float or None."""
+    with suppress(ValueError, TypeError):
+        if math.isfinite(float_state := float(state.state)):
+            return float_state
+    return None
+
+
+class PeriodAccumulator:
+    """Accumulate the states of a sensor during a short term statistics period.
+
+    The states are accumulated the same way compile_statistics handles the
+    states it loads from the database. The time weighted average, min and
+    max of measurements are updated as each state is added. The states of
+    sensors with a sum are kept since every state is needed to detect a
+    new cycle.
+    """
+
+    __slots__ = (
+        "max",
+        "mean_start_ts",
+        "min",
+        "start_state",
+        "states",
+        "units",
+        "value",
+        "value_ts",
+        "weighted_sum",
+    )
+
+    def __init__(
+        self, period_start_ts: float, start_state: State, has_sum: bool
+    ) -> None:
+        """Initialize the accumulator with the state at the start of the period."""
+        self.start_state = start_state
+        self.states: list[State] | None = [start_state] if has_sum else None
+        self.units: set[str | None] = set()
+        self.value: float | None = None
+        self.value_ts = 0.0
+        self.mean_start_ts = 0.0
+        self.weighted_sum = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        if not has_sum and (fstate := _float_or_none(start_state)) is not None:
+            self._add_value(fstate, start_state, period_start_ts)
+
+    def add_state(self, state: State) -> None:
+        """Add a state recorded during the period."""
+        if self.states is not None:
+            self.states.append(state)
+            return
+        # Only state changes are significant for measurements
+        if state.last_changed_timestamp != state.last_updated_timestamp:
+            return
+        if (fstate := _float_or_none(state)) is not None:
+            self._add_value(fstate, state, state.last_updated_timestamp)
+
+    def _add_value(self, fstate: float, state: State, timestamp: float) -> None:
+        """Add a numeric state to the measurement."""
+        if self.value is None:
+            self.mean_start_ts = timestamp
+        else:
+            # Weight the previous value by the duration until the state change
+            self.weighted_sum += self.value * (timestamp - self.value_ts)
+        self.value = fstate
+        self.value_ts = timestamp
+        self.min = min(self.min, fstate)
+        self.max = max(self.max, fstate)
+        self.units.add(state.attributes.get(ATTR_UNIT_OF_MEASUREMENT))
+
+    def mean(self, end_ts: float) -> float:
+        """Return the time weighted average of the measurement."""
+        assert self.value is not None
+        if not (period_seconds := end_ts - self.mean_start_ts):
+            # See _time_weighted_average
+            return 0.0
+        return (
+            self.weighted_sum + self.value * (end_ts - self.value_ts)
+        ) / period_seconds
+
+
+class _EntityAccumulators:
+    """The period accumulators of a sensor."""
+
+    __slots__ = ("has_sum", "last_period_ts", "last_state", "periods", "tracked_since")
+
+    def __init__(self, tracked_since: float, has_sum: bool, state: State) -> None:
+        """Initialize the accumulators with the current state of the sensor."""
+        self.tracked_since = max(tracked_since, state.last_updated_timestamp)
+        self.has_sum = has_sum
+        self.last_state = state
+        self.last_period_ts = 0.0
+        self.periods: dict[float, PeriodAccumulator] = {}
+
+    def add_state(self, state: State, queued_ts: float, period_seconds: float) -> None:
+        """Add a recorded state."""
+        timestamp = state.last_updated_timestamp
+        period_ts = timestamp - timestamp % period_seconds
+        if period_ts < self.last_period_ts:
+            # The state is older than the states already accumulated,
+            # start over since the accumulated periods are incomplete.
+            self.tracked_since = max(queued_ts, timestamp)
+            self.periods.clear()
+        if (accumulator := self.periods.get(period_ts)) is None:
+            accumulator = self.periods[period_ts] = PeriodAccumulator(
+                period_ts, self.last_state, self.has_sum
+            )
+        accumulator.add_state(state)
+        self.last_state = state
+        self.last_period_ts = period_ts
+
+    def pop_period(self, start_ts: float) -> PeriodAccumulator:
+        """Return the accumulator of a period and drop the older periods."""
+        periods = self.periods
+        if (accumulator := periods.get(start_ts)) is None:
+            # No state was recorded during the period, the state at
+            # the start of the period is the state at the start of
+            # the next period with recorded states.
+            start_state = self.last_state
+            for period_ts in sorted(periods):
+                if period_ts > start_ts:
+                    start_state = periods[period_ts].start_state
+                    break
+            accumulator = PeriodAccumulator(start_ts, start_state, self.has_sum)
+        for period_ts in [period_ts for period_ts in periods if period_ts <= start_ts]:
+            del periods[period_ts]
+        return accumulator
+
+
+class ShortTermStatisticsAccumulators:
+    """Accumulate the short term statistics of sensors as states are recorded.
+
+    The accumulators start at the first compile after the recorder was
+    started. Periods which started before the accumulators, or before a
+    sensor was first seen, are compiled from the database.
+
+    The event loop only queues the state changes of sensors. The queued
+    states are added to the accumulators by the recorder thread when the
+    statistics are compiled, so the event loop never waits for a compile.
+    """
+
+    def __init__(self, hass: HomeAssistant, instance: Recorder) -> None:
+        """Initialize the accumulators."""
+        self._hass = hass
+        self._instance = instance
+        # Appending to and popping from a deque is thread-safe, the queued
+        # items are the entity id, the recorded state, or None if the state
+        # is not recorded, and the time the state was queued.
+        self._queue: deque[tuple[str, State | None, float]] = deque()
+        self._entities: dict[str, _EntityAccumulators] = {}
+        self._period_seconds = StatisticsShortTerm.duration.total_seconds()
+        # Periods before this timestamp were dropped after they were compiled
+        self._compiled_before_ts = 0.0
+        self._unsub_state_changed: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_start(self) -> None:
+        """Start accumulating the states of the sensors."""
+        now_ts = time.time()
+        enabled = self._instance.enabled
+        for state in self._hass.states.async_all(DOMAIN):
+            self._queue.append((state.entity_id, state if enabled else None, now_ts))
+        self._unsub_state_changed = self._hass.bus.async_listen_keyed(
+            EVENT_STATE_CHANGED, self._async_state_changed, domains=(DOMAIN,)
+        )
+        self._hass.bus.async_listen_once(
+            EVENT_HOMEASSISTANT_FINAL_WRITE, self._async_stop
+        )
+
+    @callback
+    def _async_stop(self, event: Event) -> None:
+        """Stop accumulating when the recorder stops."""
+        if self._unsub_state_changed:
+            self._unsub_state_changed()
+            self._unsub_state_changed = None
+        self._queue.clear()
+
+    @callback
+    def _async_state_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Queue a sensor state change."""
+        self._queue.append(
+            (
+                event.data["entity_id"],
+                event.data["new_state"] if self._instance.enabled else None,
+                event.time_fired_timestamp,
+            )
+        )
+
+    def _add_queued_states(self) -> None:
+        """Add the queued states to the accumulators."""
+        queue = self._queue
+        entities = self._entities
+        for _ in range(len(queue)):
+            entity_id, state, queued_ts = queue.popleft()
+            entity = entities.get(entity_id)
+            if (
+                # The state is not recorded
+                state is None
+                or not (state_class := state.attributes.get(ATTR_STATE_CLASS))
+                or not (
+                    type(state_class) is SensorStateClass
+                    or try_parse_enum(SensorStateClass, state_class)
+                )
+            ):
+                if entity is not None:
+                    del entities[entity_id]
+                continue
+            has_sum = _has_sum(state_class)
+            if entity is None or entity.has_sum != has_sum:
+                if (
+                    entity_filter := self._instance.entity_filter
+                ) and not entity_filter(entity_id):
+                    continue
+                entities[entity_id] = _EntityAccumulators(queued_ts, has_sum, state)
+                continue
+            entity.add_state(state, queued_ts, self._period_seconds)
+
+    def pop_period(
+        self, entity_ids: Iterable[str], start: datetime.datetime
+    ) -> dict[str, PeriodAccumulator]:
+        """Return the accumulators of the sensors which cover the period.
+
+        Must be called from the recorder thread.
+        """
+        self._add_queued_states()
+        start_ts = start.timestamp()
+        accumulators: dict[str, PeriodAccumulator] = {}
+        if start_ts < self._compiled_before_ts:
+            return accumulators
+        self._compiled_before_ts = start_ts + self._period_seconds
+        entities = self._entities
+        for entity_id in entity_ids:
+            if (
+                entity := entities.get(entity_id)
+            ) is not None and entity.tracked_since < start_ts:
+                accumulators[entity_id] = entity.pop_period(start_ts)
+        return accumulators
+
+
+def _has_sum(state_class: SensorStateClass) -> bool:
+    """Return if the statistics of a state class have a sum."""
+    return "sum" in DEFAULT_STATISTICS[state_class]
+
+
+@callback
+def _async_start_accumulators(hass: HomeAssistant) -> None:
+    """Start accumulating short term statistics."""
+    if SHORT_TERM_ACCUMULATORS in hass.data:
+        return
+    accumulators = ShortTermStatisticsAccumulators(hass, get_instance(hass))
+    hass.data[SHORT_TERM_ACCUMULATORS] = accumulators
+    accumulators.async_start()
+
+
+def _pop_period_accumulators(
+    hass: HomeAssistant, sensor_states: list[State], start: datetime.datetime
+) -> dict[str, PeriodAccumulator]:
+    """Return the accumulated statistics of the period."""
+    if (accumulators := hass.data.get(SHORT_TERM_ACCUMULATORS)) is None:
+        # The statistics are compiled from the database until
+        # the accumulators cover a full period
+        hass.loop.call_soon_threadsafe(_async_start_accumulators, hass)
+        return {}
+    return accumulators.pop_period((state.entity_id for state in sensor_states), start)
+
+
 def compile_statistics(  # noqa: C901
     hass: HomeAssistant,
     session: Session,
@@ -413,9 +700,40 @@ def compile_statistics(  # noqa: C901
 
     sensor_states = _get_sensor_states(hass)
     wanted_statistics = _wanted_statistics(sensor_states)
+    instance = get_instance(hass)
+    # Use the statistics accumulated while the states were recorded
+    # instead of loading the states from the database when possible
+    accumulators = _pop_period_accumulators(hass, sensor_states, start)
+    accumulated_history: dict[str, list[State]] = {}
+    measurements: dict[str, PeriodAccumulator] = {}
+    for entity_id, period_accumulator in accumulators.items():
+        if period_accumulator.states is not None:
+            accumulated_history[entity_id] = period_accumulator.states
+        # Measurements with a changing unit are loaded from the database
+        # since their states must be normalized one by one
+        elif len(period_accumulator.units) < 2:
+            measurements[entity_id] = period_accumulator
+    old_metadatas: dict[str, tuple[int, StatisticMetaData]] = {}
+    if measurements_with_values := {
+        entity_id
+        for entity_id, measurement in measurements.items()
+        if measurement.value is not None
+    }:
+        old_metadatas = statistics.get_metadata_with_session(
+            instance, session, statistic_ids=measurements_with_values
+        )
+        for entity_id, (_, metadata) in list(old_metadatas.items()):
+            if metadata["unit_of_measurement"] not in measurements[entity_id].units:
+                # The states must be converted to the unit of the statistics
+                del measurements[entity_id]
+                del old_metadatas[entity_id]
+
     # Get history between start and end
     entities_full_history = [
-        i.entity_id for i in sensor_states if "sum" in wanted_statistics[i.entity_id]
+        i.entity_id
+        for i in sensor_states
+        if "sum" in wanted_statistics[i.entity_id]
+        and i.entity_id not in accumulated_history
     ]
     history_list: dict[str, list[State]] = {}
     if entities_full_history:
@@ -431,6 +749,7 @@ def compile_statistics(  # noqa: C901
         i.entity_id
         for i in sensor_states
         if "sum" not in wanted_statistics[i.entity_id]
+        and i.entity_id not in measurements
     ]
     if entities_significant_history:
         _history_list = history.get_full_significant_states_with_session(
@@ -441,10 +760,13 @@ def compile_statistics(  # noqa: C901
             entity_ids=entities_significant_history,
         )
         history_list = {**history_list, **_history_list}
+    history_list.update(accumulated_history)
 
     entities_with_float_states: dict[str, list[tuple[float, State]]] = {}
     for _state in sensor_states:
         entity_id = _state.entity_id
+        if entity_id in measurements:
+            continue
         # If there are no recent state changes, the sensor's state may already be pruned
         # from the recorder. Get the state from the state machine instead.
         if not (entity_history := history_list.get(entity_id, [_state])):
@@ -457,13 +779,36 @@ def compile_statistics(  # noqa: C901
     # since it will result in cache misses for statistic_ids
     # that are not in the metadata table and we are not working
     # with them anyway.
-    old_metadatas = statistics.get_metadata_with_session(
-        get_instance(hass), session, statistic_ids=set(entities_with_float_states)
+    old_metadatas.update(
+        statistics.get_metadata_with_session(
+            instance, session, statistic_ids=set(entities_with_float_states)
+        )
     )
-    to_process: list[tuple[str, str | None, str, list[tuple[float, State]]]] = []
+    to_process: list[
+        tuple[
+            str,
+            str | None,
+            str,
+            list[tuple[float, State]],
+            PeriodAccumulator | None,
+        ]
+    ] = []
     to_query: set[str] = set()
     for _state in sensor_states:
         entity_id = _state.entity_id
+        if (measurement := measurements.get(entity_id)) is not None:
+            if measurement.value is not None:
+                (unit,) = measurement.units
+                to_process.append(
+                    (
+                        entity_id,
+                        unit,
+                        _state.attributes[ATTR_STATE_CLASS],
+                        [],
+                        measurement,
+                    )
+                )
+            continue
         if not (maybe_float_states := entities_with_float_states.get(entity_id)):
             continue
         statistics_unit, valid_float_states = _normalize_states(
@@ -475,7 +820,9 @@ def compile_statistics(  # noqa: C901
         if not valid_float_states:
             continue
         state_class: str = _state.attributes[ATTR_STATE_CLASS]
-        to_process.append((entity_id, statistics_unit, state_class, valid_float_states))
+        to_process.append(
+            (entity_id, statistics_unit, state_class, valid_float_states, None)
+        )
         if "sum" in wanted_statistics[entity_id]:
             to_query.add(entity_id)
 
@@ -487,6 +834,7 @@ def compile_statistics(  # noqa: C901
         statistics_unit,
         state_class,
         valid_float_states,
+        accumulated_measurement,
     ) in to_process:
         # Check metadata
         if old_metadata := old_metadatas.get(entity_id):
@@ -525,6 +873,14 @@ def compile_statistics(  # noqa: C901
 
         # Make calculations
         stat: StatisticData = {"start": start}
+        if accumulated_measurement is not None:
+            # The measurement was accumulated while the states were recorded
+            stat["max"] = accumulated_measurement.max
+            stat["min"] = accumulated_measurement.min
+            stat["mean"] = accumulated_measurement.mean(end.timestamp())
+            result.append({"meta": meta, "stat": stat})
+            continue
+
         if "max" in wanted_statistics[entity_id]:
             stat["max"] = max(
                 *itertools.islice(zip(*valid_float_states, strict=False), 1)
@@ -0,0 +1,329 @@
+"""Buffer of the samples of a statistics sensor."""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left, insort
+import math
+
+# Removing samples from the running sums accumulates rounding errors, so the
+# running sums are recalculated from the samples after as many samples were
+# removed as the buffer holds, but not more often than this.
+MIN_REMOVALS_BEFORE_REFRESH = 1024
+
+INITIAL_CAPACITY = 16
+
+
+class SampleBuffer:
+    """Ring buffer of the sample values and their ages.
+
+    The values and ages are stored in arrays of floats which are used as
+    ring buffers. The running sums the characteristics are calculated from
+    are updated as samples are added and removed, so most characteristics
+    are calculated in constant time instead of iterating over all samples
+    on every update.
+
+    If order_statistics is set, a sorted list of the values is kept up to
+    date for the median, the percentiles and the extremes.
+    """
+
+    __slots__ = (
+        "_abs_differences",
+        "_ages",
+        "_capacity",
+        "_cos_sum",
+        "_head",
+        "_len",
+        "_linear_area",
+        "_m2",
+        "_maxlen",
+        "_mean",
+        "_nonnegative_differences",
+        "_removals",
+        "_sin_sum",
+        "_sorted",
+        "_step_area",
+        "_sum",
+        "_sum_compensation",
+        "_values",
+    )
+
+    def __init__(
+        self, maxlen: int | None = None, order_statistics: bool = False
+    ) -> None:
+        """Initialize the buffer.
+
+        Like a deque, the oldest sample is dropped when a sample is added
+        to a buffer which holds maxlen samples.
+        """
+        self._maxlen = None if maxlen is None else max(int(maxlen), 0)
+        self._capacity = (
+            INITIAL_CAPACITY
+            if self._maxlen is None
+            else max(min(self._maxlen, INITIAL_CAPACITY), 1)
+        )
+        self._values = array("d", bytes(8 * self._capacity))
+        self._ages = array("d", bytes(8 * self._capacity))
+        self._head = 0
+        self._len = 0
+        self._sorted: list[float] | None = [] if order_statistics else None
+        self._reset_sums()
+
+    def __len__(self) -> int:
+        """Return the number of samples."""
+        return self._len
+
+    def __repr__(self) -> str:
+        """Return the representation of the samples."""
+        return f"<SampleBuffer values={self.values()} ages={self.ages()}>"
+
+    def _reset_sums(self) -> None:
+        """Reset the running sums."""
+        self._sum = 0.0
+        self._sum_compensation = 0.0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._sin_sum = 0.0
+        self._cos_sum = 0.0
+        self._linear_area = 0.0
+        self._step_area = 0.0
+        self._abs_differences = 0.0
+        self._nonnegative_differences = 0.0
+        self._removals = 0
+
+    def _linear(self, data: array[float]) -> array[float]:
+        """Return the samples of a ring buffer from the oldest to the newest."""
+        head = self._head
+        end = head + self._len
+        if end <= self._capacity:
+            return data[head:end]
+        return data[head:] + data[: end - self._capacity]
+
+    def _grow(self) -> None:
+        """Double the capacity of the ring buffers."""
+        capacity = self._capacity * 2
+        if self._maxlen is not None:
+            capacity = min(capacity, self._maxlen)
+        padding = array("d", bytes(8 * (capacity - self._len)))
+        self._values = self._linear(self._values) + padding
+        self._ages = self._linear(self._ages) + padding
+        self._head = 0
+        self._capacity = capacity
+
+    def values(self) -> list[float]:
+        """Return the values from the oldest to the newest."""
+        return self._linear(self._values).tolist()
+
+    def ages(self) -> list[float]:
+        """Return the ages from the oldest to the newest."""
+        return self._linear(self._ages).tolist()
+
+    def value(self, idx: int) -> float:
+        """Return the value at an index, negative indexes count from the newest."""
+        return self._values[self._physical_index(idx)]
+
+    def age(self, idx: int) -> float:
+        """Return the age at an index, negative indexes count from the newest."""
+        return self._ages[self._physical_index(idx)]
+
+    def _physical_index(self, idx: int) -> int:
+        """Return the index in the ring buffers."""
+        if idx < 0:
+            idx += self._len
+        if not 0 <= idx < self._len:
+            raise IndexError("sample index out of range")
+        return (self._head + idx) % self._capacity
+
+    def append(self, value: float, age: float) -> None:
+        """Add a sample as the newest sample."""
+        if self._len == self._maxlen:
+            if not self._len:
+                return
+            self.popleft()
+        if self._len:
+            last = (self._head + self._len - 1) % self._capacity
+            self._update_pair_sums(
+                self._values[last], value, age - self._ages[last], 1.0
+            )
+        if self._len == self._capacity:
+            self._grow()
+        idx = (self._head + self._len) % self._capacity
+        self._values[idx] = value
+        self._ages[idx] = age
+        self._len += 1
+        self._update_sums(value, self._len, 1.0)
+        if self._sorted is not None:
+            insort(self._sorted, value)
+
+    def popleft(self) -> None:
+        """Remove the oldest sample."""
+        if not self._len:
+            raise IndexError("pop from an empty buffer")
+        head = self._head
+        value = self._values[head]
+        if self._len > 1:
+            second = (head + 1) % self._capacity
+            self._update_pair_sums(
+                value, self._values[second], self._ages[second] - self._ages[head], -1.0
+            )
+        self._head = (head + 1) % self._capacity
+        self._len -= 1
+        if (sorted_values := self._sorted) is not None:
+            idx = bisect_left(sorted_values, value)
+            if idx < len(sorted_values) and sorted_values[idx] == value:
+                del sorted_values[idx]
+            else:
+                # NaN values can not be found by bisecting
+                self._sorted = sorted(self.values())
+        if not self._len:
+            self._reset_sums()
+            return
+        if not math.isfinite(value):
+            # The running sums became inf or NaN when the value was added,
+            # removing it again can not restore them.
+            self._refresh_sums()
+            return
+        self._update_sums(value, self._len, -1.0)
+        self._removals += 1
+        if self._removals >= max(self._len, MIN_REMOVALS_BEFORE_REFRESH):
+            self._refresh_sums()
+
+    def _update_sums(self, value: float, count: int, sign: float) -> None:
+        """Add (sign 1) or remove (sign -1) a value from the running sums.
+
+        count is the number of values after the update.
+        """
+        # Neumaier summation, which is also used by the builtin sum of floats
+        addend = sign * value
+        total = self._sum + addend
+        if abs(self._sum) >= abs(addend):
+            self._sum_compensation += (self._sum - total) + addend
+        else:
+            self._sum_compensation += (addend - total) + self._sum
+        self._sum = total
+        # Welford's algorithm for the variance
+        delta = value - self._mean
+        self._mean += sign * delta / count
+        self._m2 += sign * delta * (value - self._mean)
+        if math.isfinite(value):
+            radians = math.radians(value)
+            self._sin_sum += sign * math.sin(radians)
+            self._cos_sum += sign * math.cos(radians)
+        else:
+            # math.sin and math.cos raise for infinite values
+            self._sin_sum = self._cos_sum = math.nan
+
+    def _update_pair_sums(
+        self, prev_value: float, value: float, elapsed: float, sign: float
+    ) -> None:
+        """Add (sign 1) or remove (sign -1) two consecutive samples from the running sums."""
+        self._linear_area += sign * 0.5 * (value + prev_value) * elapsed
+        self._step_area += sign * prev_value * elapsed
+        self._abs_differences += sign * abs(value - prev_value)
+        self._nonnegative_differences += sign * (
+            value - prev_value if value >= prev_value else value
+        )
+
+    def _refresh_sums(self) -> None:
+        """Recalculate the running sums from the samples."""
+        values = self.values()
+        ages = self.ages()
+        self._reset_sums()
+        for idx, value in enumerate(values):
+            if idx:
+                self._update_pair_sums(
+                    values[idx - 1], value, ages[idx] - ages[idx - 1], 1.0
+                )
+            self._update_sums(value, idx + 1, 1.0)
+
+    @property
+    def sum(self) -> float:
+        """Return the sum of the values."""
+        return self._sum + self._sum_compensation
+
+    @property
+    def mean(self) -> float:
+        """Return the mean of the values."""
+        return self.sum / self._len
+
+    @property
+    def variance(self) -> float:
+        """Return the sample variance of the values."""
+        if self._len < 2:
+            return 0.0
+        return max(self._m2, 0.0) / (self._len - 1)
+
+    @property
+    def mean_circular(self) -> float:
+        """Return the circular mean of the values in degrees."""
+        return (math.degrees(math.atan2(self._sin_sum, self._cos_sum)) + 360) % 360
+
+    @property
+    def linear_area(self) -> float:
+        """Return the area under the linearly interpolated values."""
+        return self._linear_area
+
+    @property
+    def step_area(self) -> float:
+        """Return the area under the values held until the next sample."""
+        return self._step_area
+
+    @property
+    def sum_differences(self) -> float:
+        """Return the sum of the absolute differences of consecutive values."""
+        return self._abs_differences
+
+    @property
+    def sum_differences_nonnegative(self) -> float:
+        """Return the sum of the differences of consecutive values.
+
+        A value lower than the previous value is treated as a reset to zero.
+        """
+        return self._nonnegative_differences
+
+    def _sorted_values(self) -> list[float]:
+        """Return the sorted values."""
+        if self._sorted is None:
+            return sorted(self.values())
+        return self._sorted
+
+    @property
+    def max(self) -> float:
+        """Return the highest value."""
+        if self._sorted is None:
+            return max(self._linear(self._values))
+        return self._sorted[-1]
+
+    @property
+    def min(self) -> float:
+        """Return the lowest value."""
+        if self._sorted is None:
+            return min(self._linear(self._values))
+        return self._sorted[0]
+
+    def index(self, value: float) -> int:
+        """Return the index of the oldest sample with the value."""
+        return self._linear(self._values).index(value)
+
+    @property
+    def median(self) -> float:
+        """Return the median of the values."""
+        data = self._sorted_values()
+        middle = self._len // 2
+        if self._len % 2:
+            return data[middle]
+        return (data[middle - 1] + data[middle]) / 2
+
+    def percentile(self, percentile: int) -> float:
+        """Return a percentile of the values.
+
+        Uses the exclusive method of statistics.quantiles.
+        """
+        data = self._sorted_values()
+        length = self._len
+        # Rescale the percentile to the samples, the same way as quantiles does
+        # it with exact integer math.
+        idx = percentile * (length + 1) // 100
+        idx = max(min(idx, length - 1), 1)
+        delta = percentile * (length + 1) - idx * 100
+        return (data[idx - 1] * (100 - delta) + data[idx] * delta) / 100
@@ -65,7 +65,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     hass.data.setdefault(DOMAIN, {})
 
     await integration_platform.async_process_integration_platforms(
-        hass, DOMAIN, _register_system_health_platform
+        hass, DOMAIN, _register_system_health_platform, lazy=True
     )
 
     return True
@@ -104,6 +104,7 @@ async def get_integration_info(
 async def _registered_domain_data(
     hass: HomeAssistant,
 ) -> AsyncGenerator[tuple[str, dict[str, Any]]]:
+    await integration_platform.async_process_lazy_integration_platforms(hass, DOMAIN)
     registrations: dict[str, SystemHealthRegistration] = hass.data[DOMAIN]
     for domain, domain_data in zip(
         registrations,
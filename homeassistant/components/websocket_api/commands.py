@@ -19,6 +19,7 @@ from homeassistant.const import (
     SIGNAL_BOOTSTRAP_INTEGRATIONS,
 )
 from homeassistant.core import (
+    CALLBACK_TYPE,
     Context,
     Event,
     EventStateChangedData,
@@ -60,6 +61,7 @@ from homeassistant.loader import (
     async_get_integrations,
 )
 from homeassistant.setup import async_get_loaded_integrations, async_get_setup_timings
+from homeassistant.util.hass_dict import HassKey
 from homeassistant.util.json import format_unserializable_data
 
 from . import const, decorators, messages
@@ -67,6 +69,9 @@ from .connection import ActiveConnection
 from .messages import construct_result_message
 
 ALL_SERVICE_DESCRIPTIONS_JSON_CACHE = "websocket_api_all_service_descriptions_json"
+ENTITY_SUBSCRIPTIONS: HassKey[_EntitySubscriptions] = HassKey(
+    "websocket_api_entity_subscriptions"
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -367,31 +372,132 @@ def _send_handle_get_states_response(
     )
 
 
+class _EntitySubscription:
+    """A subscribe_entities subscription of a connection."""
+
+    __slots__ = (
+        "coalesce_state_changed",
+        "entity_filter",
+        "message_suffix",
+        "msg_id",
+        "send_message",
+        "user",
+    )
+
+    def __init__(
+        self,
+        connection: ActiveConnection,
+        entity_filter: Callable[[str], bool] | None,
+        msg_id: int,
+        message_id_as_bytes: bytes,
+    ) -> None:
+        """Initialize the subscription."""
+        self.send_message = connection.send_message
+        self.coalesce_state_changed = connection.coalesce_state_changed
+        self.entity_filter = entity_filter
+        self.user = connection.user
+        self.msg_id = msg_id
+        self.message_suffix = b"".join((b',"id":', message_id_as_bytes, b"}"))
+
+
+class _EntitySubscriptions:
+    """Forward state changes to the subscribe_entities subscriptions.
+
+    All subscriptions share a single state changed listener. Subscriptions
+    for specific entities are indexed by entity_id, the state diff is
+    serialized once per state change and the read permission is checked
+    once per user, so a state change only costs work for the connections
+    which receive it.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the subscriptions."""
+        self._hass = hass
+        self._by_entity_id: dict[str, set[_EntitySubscription]] = {}
+        self._all_entities: set[_EntitySubscription] = set()
+        self._unsub_listener: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_subscribe(
+        self, subscription: _EntitySubscription, entity_ids: set[str] | None
+    ) -> CALLBACK_TYPE:
+        """Subscribe to the state changes of entity_ids or of all entities."""
+        if entity_ids:
+            for entity_id in entity_ids:
+                self._by_entity_id.setdefault(entity_id, set()).add(subscription)
+        else:
+            self._all_entities.add(subscription)
+        if self._unsub_listener is None:
+            self._unsub_listener = self._hass.bus.async_listen(
+                EVENT_STATE_CHANGED, self._async_forward_state_changed
+            )
+        return partial(self._async_unsubscribe, subscription, entity_ids)
+
+    @callback
+    def _async_unsubscribe(
+        self, subscription: _EntitySubscription, entity_ids: set[str] | None
+    ) -> None:
+        """Unsubscribe a subscription."""
+        if entity_ids:
+            for entity_id in entity_ids:
+                if subscriptions := self._by_entity_id.get(entity_id):
+                    subscriptions.discard(subscription)
+                    if not subscriptions:
+                        del self._by_entity_id[entity_id]
+        else:
+            self._all_entities.discard(subscription)
+        if (
+            not self._by_entity_id
+            and not self._all_entities
+            and self._unsub_listener is not None
+        ):
+            self._unsub_listener()
+            self._unsub_listener = None
+
+    @callback
+    def _async_forward_state_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Forward a state changed event to the matching subscriptions."""
+        entity_id = event.data["entity_id"]
+        entity_subscriptions = self._by_entity_id.get(entity_id)
+        if not entity_subscriptions and not self._all_entities:
+            return
+        message_prefix: bytes | None = None
+        # We have to lookup the permissions for every state change because
+        # the user might have changed since the subscription was created.
+        users_can_read: dict[str, bool] = {}
+        for subscriptions in (entity_subscriptions, self._all_entities):
+            if not subscriptions:
+                continue
+            for subscription in list(subscriptions):
+                if (entity_filter := subscription.entity_filter) and not entity_filter(
+                    entity_id
+                ):
+                    continue
+                user = subscription.user
+                if (can_read := users_can_read.get(user.id)) is None:
+                    permissions = user.permissions
+                    can_read = users_can_read[user.id] = (
+                        user.is_admin
+                        or permissions.access_all_entities(POLICY_READ)
+                        or permissions.check_entity(entity_id, POLICY_READ)
+                    )
+                if not can_read:
+                    continue
+                if (
+                    coalesce_state_changed := subscription.coalesce_state_changed
+                ) is not None and coalesce_state_changed(subscription.msg_id, event):
+                    continue
+                if message_prefix is None:
+                    message_prefix = messages.cached_state_diff_message_prefix(event)
+                subscription.send_message(message_prefix + subscription.message_suffix)
+
+
 @callback
-def _forward_entity_changes(
-    send_message: Callable[[str | bytes | dict[str, Any]], None],
-    entity_ids: set[str] | None,
-    entity_filter: Callable[[str], bool] | None,
-    user: User,
-    message_id_as_bytes: bytes,
-    event: Event[EventStateChangedData],
-) -> None:
-    """Forward entity state changed events to websocket."""
-    entity_id = event.data["entity_id"]
-    if (entity_ids and entity_id not in entity_ids) or (
-        entity_filter and not entity_filter(entity_id)
-    ):
-        return
-    # We have to lookup the permissions again because the user might have
-    # changed since the subscription was created.
-    permissions = user.permissions
-    if (
-        not user.is_admin
-        and not permissions.access_all_entities(POLICY_READ)
-        and not permissions.check_entity(entity_id, POLICY_READ)
-    ):
-        return
-    send_message(messages.cached_state_diff_message(message_id_as_bytes, event))
+def _async_get_entity_subscriptions(hass: HomeAssistant) -> _EntitySubscriptions:
+    """Return the subscribe_entities subscriptions."""
+    if (subscriptions := hass.data.get(ENTITY_SUBSCRIPTIONS)) is None:
+        subscriptions = hass.data[ENTITY_SUBSCRIPTIONS] = _EntitySubscriptions(hass)
+    return subscriptions
 
 
 @callback
@@ -415,16 +521,11 @@ def handle_subscribe_entities(
     states = _async_get_allowed_states(hass, connection)
     msg_id = msg["id"]
     message_id_as_bytes = str(msg_id).encode()
-    connection.subscriptions[msg_id] = hass.bus.async_listen(
-        EVENT_STATE_CHANGED,
-        partial(
-            _forward_entity_changes,
-            connection.send_message,
-            entity_ids,
-            entity_filter,
-            connection.user,
-            message_id_as_bytes,
-        ),
+    connection.subscriptions[msg_id] = _async_get_entity_subscriptions(
+        hass
+    ).async_subscribe(
+        _EntitySubscription(connection, entity_filter, msg_id, message_id_as_bytes),
+        entity_ids,
     )
     connection.send_result(msg_id)
 
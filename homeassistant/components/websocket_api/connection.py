@@ -10,7 +10,13 @@ from aiohttp import web
 import voluptuous as vol
 
 from homeassistant.auth.models import RefreshToken, User
-from homeassistant.core import Context, HomeAssistant, callback
+from homeassistant.core import (
+    Context,
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    callback,
+)
 from homeassistant.exceptions import HomeAssistantError, Unauthorized
 from homeassistant.helpers.http import current_request
 from homeassistant.util.json import JsonValueType
@@ -42,6 +48,7 @@ class ActiveConnection:
     __slots__ = (
         "binary_handlers",
         "can_coalesce",
+        "coalesce_state_changed",
         "handlers",
         "hass",
         "last_id",
@@ -70,6 +77,12 @@ class ActiveConnection:
         self.subscriptions: dict[Hashable, Callable[[], Any]] = {}
         self.last_id = 0
         self.can_coalesce = False
+        # Set by the websocket handler to merge the state changes of
+        # subscribe_entities subscriptions while the client is behind.
+        # It returns False if the state change has to be sent as is.
+        self.coalesce_state_changed: (
+            Callable[[int, Event[EventStateChangedData]], bool] | None
+        ) = None
         self.supported_features: dict[str, float] = {}
         self.handlers: dict[str, tuple[MessageHandler, vol.Schema | Literal[False]]] = (
             self.hass.data[const.DOMAIN]
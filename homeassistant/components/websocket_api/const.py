@@ -34,6 +34,11 @@ MAX_PENDING_MSG: Final = 4096
 # resolve the ready future.
 PENDING_MSG_MAX_FORCE_READY: Final = 256
 
+# Number of pending messages after which the state changes of
+# subscribe_entities subscriptions are merged per entity instead
+# of being queued one message per state change.
+PENDING_MSG_COALESCE_STATE_CHANGES: Final = 128
+
 ERR_ID_REUSE: Final = "id_reuse"
 ERR_INVALID_FORMAT: Final = "invalid_format"
 ERR_NOT_ALLOWED: Final = "not_allowed"
@@ -15,7 +15,7 @@ from aiohttp.http_websocket import WebSocketWriter
 
 from homeassistant.components.http import KEY_HASS, HomeAssistantView
 from homeassistant.const import EVENT_HOMEASSISTANT_STOP
-from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.core import Event, EventStateChangedData, HomeAssistant, callback
 from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.event import async_call_later
 from homeassistant.util.async_ import create_eager_task
@@ -25,6 +25,7 @@ from .auth import AUTH_REQUIRED_MESSAGE, AuthPhase
 from .const import (
     DATA_CONNECTIONS,
     MAX_PENDING_MSG,
+    PENDING_MSG_COALESCE_STATE_CHANGES,
     PENDING_MSG_MAX_FORCE_READY,
     PENDING_MSG_PEAK,
     PENDING_MSG_PEAK_TIME,
@@ -33,7 +34,7 @@ from .const import (
     URL,
 )
 from .error import Disconnect
-from .messages import message_to_json_bytes
+from .messages import CoalescedStateDiffs, message_to_json_bytes
 from .util import describe_request
 
 CLOSE_MSG_TYPES = {WSMsgType.CLOSE, WSMsgType.CLOSED, WSMsgType.CLOSING}
@@ -79,6 +80,7 @@ class WebSocketHandler:
         "_loop",
         "_message_queue",
         "_peak_checker_unsub",
+        "_pending_state_diffs",
         "_ready_future",
         "_release_ready_queue_size",
         "_request",
@@ -104,7 +106,10 @@ class WebSocketHandler:
         # to where messages are queued. This allows the implementation
         # to use a deque and an asyncio.Future to avoid the overhead of
         # an asyncio.Queue.
-        self._message_queue: deque[bytes] = deque()
+        self._message_queue: deque[bytes | CoalescedStateDiffs] = deque()
+        # State changes of subscribe_entities subscriptions which are
+        # merged while they wait in the queue, by subscription id.
+        self._pending_state_diffs: dict[int, CoalescedStateDiffs] = {}
         self._ready_future: asyncio.Future[int] | None = None
         self._release_ready_queue_size: int = 0
 
@@ -157,12 +162,25 @@ class WebSocketHandler:
 
                 if not can_coalesce or ready_message_count == 1:
                     message = message_queue.popleft()
+                    if isinstance(message, CoalescedStateDiffs):
+                        message = self._serialize_state_diffs(message)
                     if is_debug_log_enabled():
                         debug("%s: Sending %s", self.description, message)
                     await send_bytes_text(message)
                     continue
 
-                coalesced_messages = b"".join((b"[", b",".join(message_queue), b"]"))
+                if self._pending_state_diffs:
+                    messages: list[bytes] = [
+                        self._serialize_state_diffs(message)
+                        if isinstance(message, CoalescedStateDiffs)
+                        else message
+                        for message in message_queue
+                    ]
+                    coalesced_messages = b"".join((b"[", b",".join(messages), b"]"))
+                else:
+                    coalesced_messages = b"".join(
+                        (b"[", b",".join(message_queue), b"]")  # type: ignore[arg-type]
+                    )
                 message_queue.clear()
                 if is_debug_log_enabled():
                     debug("%s: Sending %s", self.description, coalesced_messages)
@@ -177,6 +195,15 @@ class WebSocketHandler:
             # Clean up the peak checker when we shut down the writer
             self._cancel_peak_checker()
 
+    def _serialize_state_diffs(self, state_diffs: CoalescedStateDiffs) -> bytes:
+        """Serialize merged state changes which are about to be sent.
+
+        State changes of the subscription which happen after this are
+        queued again, so they are sent after these changes.
+        """
+        del self._pending_state_diffs[state_diffs.msg_id]
+        return state_diffs.as_bytes()
+
     @callback
     def _cancel_peak_checker(self) -> None:
         """Cancel the peak checker."""
@@ -185,7 +212,9 @@ class WebSocketHandler:
             self._peak_checker_unsub = None
 
     @callback
-    def _send_message(self, message: str | bytes | dict[str, Any]) -> None:
+    def _send_message(
+        self, message: str | bytes | dict[str, Any] | CoalescedStateDiffs
+    ) -> None:
         """Queue sending a message to the client.
 
         Closes connection if the client is not reading the messages.
@@ -236,6 +265,31 @@ class WebSocketHandler:
                 self._hass, PENDING_MSG_PEAK_TIME, self._check_write_peak
             )
 
+    @callback
+    def _coalesce_state_changed(
+        self, msg_id: int, event: Event[EventStateChangedData]
+    ) -> bool:
+        """Merge a state change of a subscribe_entities subscription.
+
+        When the client is behind, the state changes of a subscription are
+        merged per entity into a single queued message instead of being
+        queued one message per state change, so a slow client receives
+        fewer, larger updates instead of being disconnected.
+
+        Returns False if the state change has to be sent as is.
+        """
+        if self._closing:
+            return True
+        if (state_diffs := self._pending_state_diffs.get(msg_id)) is None:
+            if len(self._message_queue) < PENDING_MSG_COALESCE_STATE_CHANGES:
+                return False
+            state_diffs = self._pending_state_diffs[msg_id] = CoalescedStateDiffs(
+                msg_id
+            )
+            self._send_message(state_diffs)
+        state_diffs.add(event)
+        return True
+
     @callback
     def _release_ready_future_or_reschedule(self) -> None:
         """Release the ready future or reschedule.
@@ -410,6 +464,7 @@ class WebSocketHandler:
         # We only start the writer queue after the auth phase is completed
         # since there is no need to queue messages before the auth phase
         self._connection = connection
+        connection.coalesce_state_changed = self._coalesce_state_changed
         self._writer_task = create_eager_task(self._writer(connection, send_bytes_text))
         self._hass.data[DATA_CONNECTIONS] = self._hass.data.get(DATA_CONNECTIONS, 0) + 1
         async_dispatcher_send(self._hass, SIGNAL_WEBSOCKET_CONNECTED)
@@ -546,6 +601,7 @@ class WebSocketHandler:
                 self._hass = None  # type: ignore[assignment]
                 self._logger = None  # type: ignore[assignment]
                 self._message_queue = None  # type: ignore[assignment]
+                self._pending_state_diffs = None  # type: ignore[assignment]
                 self._handle_task = None
                 self._writer_task = None
                 self._ready_future = None
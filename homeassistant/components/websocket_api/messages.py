@@ -15,7 +15,7 @@ from homeassistant.const import (
     COMPRESSED_STATE_LAST_UPDATED,
     COMPRESSED_STATE_STATE,
 )
-from homeassistant.core import CompressedState, Event, EventStateChangedData
+from homeassistant.core import CompressedState, Event, EventStateChangedData, State
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.json import (
     JSON_DUMP,
@@ -141,25 +141,13 @@ def _partial_cached_event_message(event: Event) -> bytes:
     )
 
 
-def cached_state_diff_message(
-    message_id_as_bytes: bytes, event: Event[EventStateChangedData]
-) -> bytes:
-    """Return an event message.
-
-    Serialize to json once per message.
+def cached_state_diff_message_prefix(event: Event[EventStateChangedData]) -> bytes:
+    """Return an event message without the id and the closing brace.
 
-    Since we can have many clients connected that are
-    all getting many of the same events (mostly state changed)
-    we can avoid serializing the same data for each connection.
+    The message is serialized once per event and the id of each
+    subscription is appended to it.
     """
-    return b"".join(
-        (
-            _partial_cached_state_diff_message(event)[:-1],
-            b',"id":',
-            message_id_as_bytes,
-            b"}",
-        )
-    )
+    return _partial_cached_state_diff_message(event)[:-1]
 
 
 @lru_cache(maxsize=128)
@@ -167,7 +155,7 @@ def _partial_cached_state_diff_message(event: Event[EventStateChangedData]) -> b
     """Cache and serialize the event to json.
 
     The message is constructed without the id which
-    will be appended in cached_state_diff_message
+    is appended to cached_state_diff_message_prefix
     """
     return (
         _message_to_json_bytes_or_none(
@@ -199,6 +187,13 @@ def _state_diff_event(
         return {ENTITY_EVENT_REMOVE: [event.data["entity_id"]]}
     if (old_state := event.data["old_state"]) is None:
         return {ENTITY_EVENT_ADD: {new_state.entity_id: new_state.as_compressed_state}}
+    return {
+        ENTITY_EVENT_CHANGE: {new_state.entity_id: _state_diff(old_state, new_state)}
+    }
+
+
+def _state_diff(old_state: State, new_state: State) -> dict[str, dict[str, Any]]:
+    """Return the diff between two states of an entity."""
     additions: dict[str, Any] = {}
     diff: dict[str, dict[str, Any]] = {STATE_DIFF_ADDITIONS: additions}
     new_state_context = new_state.context
@@ -235,7 +230,64 @@ def _state_diff_event(
             # here if there are any values to avoid jumping into the json_encoder_default
             # for every state diff with a removed attribute
             diff[STATE_DIFF_REMOVALS] = {COMPRESSED_STATE_ATTRIBUTES: list(removed)}
-    return {ENTITY_EVENT_CHANGE: {new_state.entity_id: diff}}
+    return diff
+
+
+class CoalescedStateDiffs:
+    """Pending state changes of a subscribe_entities subscription.
+
+    While the changes wait in the queue of a connection which can not keep
+    up, only the state the client knows and the newest state of each entity
+    are kept, so the client receives a single message with one diff per
+    entity however often the entities changed.
+    """
+
+    __slots__ = ("_states", "msg_id")
+
+    def __init__(self, msg_id: int) -> None:
+        """Initialize the pending state changes."""
+        self.msg_id = msg_id
+        self._states: dict[str, tuple[State | None, State | None]] = {}
+
+    def __len__(self) -> int:
+        """Return the number of changed entities."""
+        return len(self._states)
+
+    def __repr__(self) -> str:
+        """Return the representation."""
+        return f"<CoalescedStateDiffs msg_id={self.msg_id} entities={len(self)}>"
+
+    def add(self, event: Event[EventStateChangedData]) -> None:
+        """Merge a state change into the pending changes."""
+        data = event.data
+        entity_id = data["entity_id"]
+        if (states := self._states.get(entity_id)) is None:
+            self._states[entity_id] = (data["old_state"], data["new_state"])
+        else:
+            self._states[entity_id] = (states[0], data["new_state"])
+
+    def as_bytes(self) -> bytes:
+        """Serialize the pending changes to a single event message."""
+        additions: dict[str, CompressedState] = {}
+        changes: dict[str, dict[str, dict[str, Any]]] = {}
+        removals: list[str] = []
+        for entity_id, (old_state, new_state) in self._states.items():
+            if new_state is None:
+                # An entity which was added and removed again is not sent
+                if old_state is not None:
+                    removals.append(entity_id)
+            elif old_state is None:
+                additions[entity_id] = new_state.as_compressed_state
+            else:
+                changes[entity_id] = _state_diff(old_state, new_state)
+        event: dict[str, Any] = {}
+        if additions:
+            event[ENTITY_EVENT_ADD] = additions
+        if changes:
+            event[ENTITY_EVENT_CHANGE] = changes
+        if removals:
+            event[ENTITY_EVENT_REMOVE] = removals
+        return message_to_json_bytes(event_message(self.msg_id, event))
 
 
 def _message_to_json_bytes_or_none(message: dict[str, Any]) -> bytes | None:
@@ -47,6 +47,7 @@ import voluptuous as vol
 from . import util
 from .const import (
     ATTR_DOMAIN,
+    ATTR_ENTITY_ID,
     ATTR_FRIENDLY_NAME,
     ATTR_SERVICE,
     ATTR_SERVICE_DATA,
@@ -1459,13 +1460,25 @@ def _verify_event_type_length_or_raise(event_type: EventType[_DataT] | str) -> N
 class EventBus:
     """Allow the firing of and listening for events."""
 
-    __slots__ = ("_debug", "_hass", "_listeners", "_match_all_listeners")
+    __slots__ = (
+        "_debug",
+        "_hass",
+        "_keyed_listeners",
+        "_listeners",
+        "_match_all_listeners",
+    )
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize a new event bus."""
         self._listeners: defaultdict[
             EventType[Any] | str, list[_FilterableJobType[Any]]
         ] = defaultdict(list)
+        # Listeners of events for specific entity ids or domains, keyed by
+        # event type and then by entity id or domain. Entity ids always
+        # contain a dot and domains never do so they can share the keys.
+        self._keyed_listeners: dict[
+            EventType[Any] | str, dict[str, list[_FilterableJobType[Any]]]
+        ] = {}
         self._match_all_listeners: list[_FilterableJobType[Any]] = []
         self._listeners[MATCH_ALL] = self._match_all_listeners
         self._hass = hass
@@ -1483,7 +1496,16 @@ class EventBus:
 
         This method must be run in the event loop.
         """
-        return {key: len(listeners) for key, listeners in self._listeners.items()}
+        listeners = {key: len(listeners) for key, listeners in self._listeners.items()}
+        for key, keyed_listeners in self._keyed_listeners.items():
+            listeners[key] = listeners.get(key, 0) + len(
+                {
+                    id(filterable_job)
+                    for filterable_jobs in keyed_listeners.values()
+                    for filterable_job in filterable_jobs
+                }
+            )
+        return listeners
 
     @property
     def listeners(self) -> dict[EventType[Any] | str, int]:
@@ -1549,6 +1571,10 @@ class EventBus:
             )
 
         listeners = self._listeners.get(event_type, EMPTY_LIST)
+        if (
+            keyed_listeners := self._keyed_listeners.get(event_type)
+        ) is not None and event_data is not None:
+            listeners = listeners + _keyed_filterable_jobs(keyed_listeners, event_data)
         if event_type not in EVENTS_EXCLUDED_FROM_MATCH_ALL:
             match_all_listeners = self._match_all_listeners
         else:
@@ -1653,6 +1679,59 @@ class EventBus:
             self._async_remove_listener, event_type, filterable_job
         )
 
+    @callback
+    def async_listen_keyed(
+        self,
+        event_type: EventType[_DataT] | str,
+        listener: Callable[[Event[_DataT]], Coroutine[Any, Any, None] | None],
+        *,
+        entity_ids: Iterable[str] = (),
+        domains: Iterable[str] = (),
+        event_filter: Callable[[_DataT], bool] | None = None,
+    ) -> CALLBACK_TYPE:
+        """Listen for events of a specific type for entity ids or domains.
+
+        The listener only runs for events which have an ``entity_id`` in
+        their data that is one of the entity_ids or is in one of the
+        domains. Matching listeners are looked up by the entity_id of the
+        event so the cost of firing an event does not grow with the number
+        of keyed listeners for other entities.
+
+        A listener that matches an event by both its entity id and its
+        domain runs once.
+
+        An optional event_filter, which must be a callable decorated with
+        @callback that returns a boolean value, determines if the
+        listener callable should run.
+
+        This method must be run in the event loop.
+        """
+        if event_type == MATCH_ALL:
+            raise HomeAssistantError(
+                f"Keyed listeners can not listen to {MATCH_ALL} events"
+            )
+        if event_filter is not None and not is_callback_check_partial(event_filter):
+            raise HomeAssistantError(f"Event filter {event_filter} is not a callback")
+        keys = {entity_id.lower() for entity_id in entity_ids}
+        for domain in domains:
+            if "." in domain:
+                raise HomeAssistantError(f"Invalid domain {domain}")
+            keys.add(domain.lower())
+        if not keys:
+            raise HomeAssistantError(
+                f"Keyed listener for {event_type} requires entity_ids or domains"
+            )
+        filterable_job: _FilterableJobType[_DataT] = (
+            HassJob(listener, f"listen {event_type} {sorted(keys)}"),
+            event_filter,
+        )
+        keyed_listeners = self._keyed_listeners.setdefault(event_type, {})
+        for key in keys:
+            keyed_listeners.setdefault(key, []).append(filterable_job)
+        return functools.partial(
+            self._async_remove_keyed_listener, event_type, keys, filterable_job
+        )
+
     def listen_once(
         self,
         event_type: EventType[_DataT] | str,
@@ -1741,6 +1820,52 @@ class EventBus:
                 "Unable to remove unknown job listener %s", filterable_job
             )
 
+    @callback
+    def _async_remove_keyed_listener(
+        self,
+        event_type: EventType[_DataT] | str,
+        keys: set[str],
+        filterable_job: _FilterableJobType[_DataT],
+    ) -> None:
+        """Remove a keyed listener of a specific event_type.
+
+        This method must be run in the event loop.
+        """
+        try:
+            keyed_listeners = self._keyed_listeners[event_type]
+            for key in keys:
+                filterable_jobs = keyed_listeners[key]
+                filterable_jobs.remove(filterable_job)
+                if not filterable_jobs:
+                    del keyed_listeners[key]
+            if not keyed_listeners:
+                del self._keyed_listeners[event_type]
+        except (KeyError, ValueError):
+            # KeyError if there are no keyed listeners for the event_type or key
+            # ValueError if listener did not exist within the key
+            _LOGGER.exception(
+                "Unable to remove unknown job listener %s", filterable_job
+            )
+
+
+def _keyed_filterable_jobs(
+    keyed_listeners: dict[str, list[_FilterableJobType[Any]]],
+    event_data: Mapping[str, Any],
+) -> list[_FilterableJobType[Any]]:
+    """Return the keyed listeners of the entity_id of an event."""
+    if type(entity_id := event_data.get(ATTR_ENTITY_ID)) is not str:
+        return EMPTY_LIST
+    filterable_jobs = keyed_listeners.get(entity_id, EMPTY_LIST)
+    if domain_filterable_jobs := keyed_listeners.get(entity_id.partition(".")[0]):
+        if not filterable_jobs:
+            return domain_filterable_jobs
+        return filterable_jobs + [
+            filterable_job
+            for filterable_job in domain_filterable_jobs
+            if filterable_job not in filterable_jobs
+        ]
+    return filterable_jobs
+
 
 class CompressedState(TypedDict):
     """Compressed dict of a state."""
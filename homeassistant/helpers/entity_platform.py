@@ -44,6 +44,7 @@ from . import (
     service,
     translation,
 )
+from .device_registry import DeviceInfo
 from .entity_registry import EntityRegistry, RegistryEntryDisabler, RegistryEntryHider
 from .event import async_call_later
 from .issue_registry import IssueSeverity, async_create_issue
@@ -68,6 +69,9 @@ DATA_DOMAIN_PLATFORM_ENTITIES: HassKey[dict[tuple[str, str], dict[str, Entity]]]
 )
 PLATFORM_NOT_READY_BASE_WAIT_TIME = 30  # seconds
 
+# Identifiers and connections of a device
+type _DeviceKey = tuple[frozenset[tuple[str, str]], frozenset[tuple[str, str]]]
+
 _LOGGER = getLogger(__name__)
 
 
@@ -615,24 +619,43 @@ class EntityPlatform:
 
     async def _async_add_entities(
         self,
-        coros: list[Coroutine[Any, Any, None]],
         entities: list[Entity],
+        entity_registry: EntityRegistry,
+        config_subentry_id: str | None,
         timeout: float,
     ) -> None:
         """Add entities for a single platform without updating.
 
-        In this case we are not updating the entities before adding them
-        which means it is likely that we will not have to yield control
-        to the event loop so we can await the coros directly without
-        scheduling them as tasks.
+        In this case we are not updating the entities before adding them,
+        so all entities are registered in one pass before any of them is
+        added to hass. Entities which share a device only have it resolved
+        in the device registry once.
         """
+        devices: dict[_DeviceKey, tuple[DeviceInfo, dev_reg.DeviceEntry]] = {}
+        registered: list[Entity] = []
+        for entity in entities:
+            try:
+                self._async_start_add_entity(entity)
+                if self._async_register_entity(
+                    entity, entity_registry, config_subentry_id, devices
+                ):
+                    registered.append(entity)
+            except Exception as ex:
+                self.logger.exception(
+                    "Error adding entity %s for domain %s with platform %s",
+                    entity.entity_id,
+                    self.domain,
+                    self.platform_name,
+                    exc_info=ex,
+                )
+
+        finished = 0
         try:
             async with self.hass.timeout.async_timeout(timeout, self.domain):
-                for idx, coro in enumerate(coros):
+                for entity in registered:
                     try:
-                        await coro
+                        await entity.add_to_platform_finish()
                     except Exception as ex:
-                        entity = entities[idx]
                         self.logger.exception(
                             "Error adding entity %s for domain %s with platform %s",
                             entity.entity_id,
@@ -640,6 +663,7 @@ class EntityPlatform:
                             self.platform_name,
                             exc_info=ex,
                         )
+                    finished += 1
         except TimeoutError:
             self.logger.warning(
                 "Timed out adding entities for domain %s with platform %s after %ds",
@@ -647,6 +671,13 @@ class EntityPlatform:
                 self.platform_name,
                 timeout,
             )
+            for entity in registered[finished:]:
+                entity_id = entity.entity_id
+                entity.add_to_platform_abort()
+                if self.hass.states.get(entity_id) is None:
+                    # Release the reserved entity id so the entity can be
+                    # added again
+                    self.hass.states.async_remove(entity_id)
 
     async def async_add_entities(
         self,
@@ -676,27 +707,23 @@ class EntityPlatform:
 
         hass = self.hass
         entity_registry = ent_reg.async_get(hass)
-        coros: list[Coroutine[Any, Any, None]] = []
-        entities: list[Entity] = []
-        for entity in new_entities:
-            coros.append(
-                self._async_add_entity(
-                    entity, update_before_add, entity_registry, config_subentry_id
-                )
-            )
-            entities.append(entity)
+        entities: list[Entity] = list(new_entities)
 
         # No entities for processing
-        if not coros:
+        if not entities:
             return
 
-        timeout = max(SLOW_ADD_ENTITY_MAX_WAIT * len(coros), SLOW_ADD_MIN_TIMEOUT)
+        timeout = max(SLOW_ADD_ENTITY_MAX_WAIT * len(entities), SLOW_ADD_MIN_TIMEOUT)
         if update_before_add:
-            add_func = self._async_add_and_update_entities
+            coros = [
+                self._async_add_entity(entity, entity_registry, config_subentry_id)
+                for entity in entities
+            ]
+            await self._async_add_and_update_entities(coros, entities, timeout)
         else:
-            add_func = self._async_add_entities
-
-        await add_func(coros, entities, timeout)
+            await self._async_add_entities(
+                entities, entity_registry, config_subentry_id, timeout
+            )
 
         if (
             (self.config_entry and self.config_entry.pref_disable_polling)
@@ -756,14 +783,30 @@ class EntityPlatform:
                 already_exists = True
         return (already_exists, restored)
 
-    async def _async_add_entity(  # noqa: C901
+    async def _async_add_entity(
         self,
         entity: Entity,
-        update_before_add: bool,
         entity_registry: EntityRegistry,
         config_subentry_id: str | None,
     ) -> None:
-        """Add an entity to the platform."""
+        """Update an entity and add it to the platform."""
+        self._async_start_add_entity(entity)
+
+        # Update properties before we generate the entity_id. This will happen
+        # also for disabled entities.
+        try:
+            await entity.async_device_update(warning=False)
+        except Exception:
+            self.logger.exception("%s: Error on device update!", self.platform_name)
+            entity.add_to_platform_abort()
+            return
+
+        if self._async_register_entity(entity, entity_registry, config_subentry_id):
+            await entity.add_to_platform_finish()
+
+    @callback
+    def _async_start_add_entity(self, entity: Entity) -> None:
+        """Start adding an entity to the platform."""
         if entity is None:
             raise ValueError("Entity cannot be None")
 
@@ -773,129 +816,182 @@ class EntityPlatform:
             self._get_parallel_updates_semaphore(hasattr(entity, "update")),
         )
 
-        # Update properties before we generate the entity_id. This will happen
-        # also for disabled entities.
-        if update_before_add:
-            try:
-                await entity.async_device_update(warning=False)
-            except Exception:
-                self.logger.exception("%s: Error on device update!", self.platform_name)
-                entity.add_to_platform_abort()
-                return
+    @callback
+    def _async_get_or_create_device(
+        self,
+        device_info: DeviceInfo,
+        config_subentry_id: str | None,
+        devices: dict[_DeviceKey, tuple[DeviceInfo, dev_reg.DeviceEntry]] | None,
+    ) -> dev_reg.DeviceEntry:
+        """Get or create the device of an entity.
 
-        suggested_object_id: str | None = None
+        If devices is passed, devices which were already resolved for the same
+        device info are reused as long as the device was not updated since.
+        """
+        assert self.config_entry is not None
+        device_registry = dev_reg.async_get(self.hass)
+        key: _DeviceKey | None = None
+        if devices is not None:
+            key = (
+                frozenset(device_info.get("identifiers") or ()),
+                frozenset(device_info.get("connections") or ()),
+            )
+            if (
+                (cached := devices.get(key)) is not None
+                and cached[0] == device_info
+                and device_registry.async_get(cached[1].id) is cached[1]
+            ):
+                return cached[1]
 
-        entity_name = entity.name
-        if entity_name is UNDEFINED:
-            entity_name = None
+        device = device_registry.async_get_or_create(
+            config_entry_id=self.config_entry.entry_id,
+            config_subentry_id=config_subentry_id,
+            **device_info,
+        )
+        if devices is not None and key is not None:
+            # Copy the device info in case the integration changes it
+            devices[key] = (DeviceInfo(**device_info), device)
+        return device
 
-        # Get entity_id from unique ID registration
-        if entity.unique_id is not None:
-            registered_entity_id = entity_registry.async_get_entity_id(
-                self.domain, self.platform_name, entity.unique_id
-            )
-            if registered_entity_id:
-                already_exists, _ = self._entity_id_already_exists(registered_entity_id)
-
-                if already_exists:
-                    # If there's a collision, the entry belongs to another entity
-                    entity.registry_entry = None
-                    msg = (
-                        f"Platform {self.platform_name} does not generate unique IDs. "
-                    )
-                    if entity.entity_id:
-                        msg += (
-                            f"ID {entity.unique_id} is already used by"
-                            f" {registered_entity_id} - ignoring {entity.entity_id}"
-                        )
-                    else:
-                        msg += (
-                            f"ID {entity.unique_id} already exists - ignoring"
-                            f" {registered_entity_id}"
-                        )
-                    self.logger.error(msg)
-                    entity.add_to_platform_abort()
-                    return
-
-            if self.config_entry and (device_info := entity.device_info):
-                try:
-                    device = dev_reg.async_get(self.hass).async_get_or_create(
-                        config_entry_id=self.config_entry.entry_id,
-                        config_subentry_id=config_subentry_id,
-                        **device_info,
+    @callback
+    def _async_register_unique_id_entity(
+        self,
+        entity: Entity,
+        entity_registry: EntityRegistry,
+        config_subentry_id: str | None,
+        devices: dict[_DeviceKey, tuple[DeviceInfo, dev_reg.DeviceEntry]] | None,
+        entity_name: str | None,
+    ) -> bool:
+        """Get or create the registry entry of an entity with a unique ID.
+
+        Returns False if the entity should not be added.
+        """
+        assert entity.unique_id is not None
+        suggested_object_id: str | None = None
+        registered_entity_id = entity_registry.async_get_entity_id(
+            self.domain, self.platform_name, entity.unique_id
+        )
+        if registered_entity_id:
+            already_exists, _ = self._entity_id_already_exists(registered_entity_id)
+
+            if already_exists:
+                # If there's a collision, the entry belongs to another entity
+                entity.registry_entry = None
+                msg = f"Platform {self.platform_name} does not generate unique IDs. "
+                if entity.entity_id:
+                    msg += (
+                        f"ID {entity.unique_id} is already used by"
+                        f" {registered_entity_id} - ignoring {entity.entity_id}"
                     )
-                except dev_reg.DeviceInfoError as exc:
-                    self.logger.error(
-                        "%s: Not adding entity with invalid device info: %s",
-                        self.platform_name,
-                        str(exc),
+                else:
+                    msg += (
+                        f"ID {entity.unique_id} already exists - ignoring"
+                        f" {registered_entity_id}"
                     )
-                    entity.add_to_platform_abort()
-                    return
-            else:
-                device = None
+                self.logger.error(msg)
+                entity.add_to_platform_abort()
+                return False
 
-            # An entity may suggest the entity_id by setting entity_id itself
-            suggested_entity_id: str | None = entity.entity_id
-            if suggested_entity_id is not None:
-                suggested_object_id = split_entity_id(entity.entity_id)[1]
-            else:
-                if device and entity.has_entity_name:
-                    device_name = device.name_by_user or device.name
-                    if entity.use_device_name:
-                        suggested_object_id = device_name
-                    else:
-                        suggested_object_id = (
-                            f"{device_name} {entity.suggested_object_id}"
-                        )
-                if not suggested_object_id:
-                    suggested_object_id = entity.suggested_object_id
+        if self.config_entry and (device_info := entity.device_info):
+            try:
+                device = self._async_get_or_create_device(
+                    device_info, config_subentry_id, devices
+                )
+            except dev_reg.DeviceInfoError as exc:
+                self.logger.error(
+                    "%s: Not adding entity with invalid device info: %s",
+                    self.platform_name,
+                    str(exc),
+                )
+                entity.add_to_platform_abort()
+                return False
+        else:
+            device = None
 
-            if self.entity_namespace is not None:
-                suggested_object_id = f"{self.entity_namespace} {suggested_object_id}"
+        # An entity may suggest the entity_id by setting entity_id itself
+        suggested_entity_id: str | None = entity.entity_id
+        if suggested_entity_id is not None:
+            suggested_object_id = split_entity_id(entity.entity_id)[1]
+        else:
+            if device and entity.has_entity_name:
+                device_name = device.name_by_user or device.name
+                if entity.use_device_name:
+                    suggested_object_id = device_name
+                else:
+                    suggested_object_id = f"{device_name} {entity.suggested_object_id}"
+            if not suggested_object_id:
+                suggested_object_id = entity.suggested_object_id
+
+        if self.entity_namespace is not None:
+            suggested_object_id = f"{self.entity_namespace} {suggested_object_id}"
+
+        disabled_by: RegistryEntryDisabler | None = None
+        if not entity.entity_registry_enabled_default:
+            disabled_by = RegistryEntryDisabler.INTEGRATION
+
+        hidden_by: RegistryEntryHider | None = None
+        if not entity.entity_registry_visible_default:
+            hidden_by = RegistryEntryHider.INTEGRATION
+
+        entry = entity_registry.async_get_or_create(
+            self.domain,
+            self.platform_name,
+            entity.unique_id,
+            capabilities=entity.capability_attributes,
+            config_entry=self.config_entry,
+            config_subentry_id=config_subentry_id,
+            device_id=device.id if device else None,
+            disabled_by=disabled_by,
+            entity_category=entity.entity_category,
+            get_initial_options=entity.get_initial_entity_options,
+            has_entity_name=entity.has_entity_name,
+            hidden_by=hidden_by,
+            known_object_ids=self.entities,
+            original_device_class=entity.device_class,
+            original_icon=entity.icon,
+            original_name=entity_name,
+            suggested_object_id=suggested_object_id,
+            supported_features=entity.supported_features,
+            translation_key=entity.translation_key,
+            unit_of_measurement=entity.unit_of_measurement,
+        )
 
-            disabled_by: RegistryEntryDisabler | None = None
-            if not entity.entity_registry_enabled_default:
-                disabled_by = RegistryEntryDisabler.INTEGRATION
+        if device and device.disabled and not entry.disabled:
+            entry = entity_registry.async_update_entity(
+                entry.entity_id, disabled_by=RegistryEntryDisabler.DEVICE
+            )
 
-            hidden_by: RegistryEntryHider | None = None
-            if not entity.entity_registry_visible_default:
-                hidden_by = RegistryEntryHider.INTEGRATION
+        entity.registry_entry = entry
+        if device:
+            entity.device_entry = device
+        entity.entity_id = entry.entity_id
+        return True
 
-            entry = entity_registry.async_get_or_create(
-                self.domain,
-                self.platform_name,
-                entity.unique_id,
-                capabilities=entity.capability_attributes,
-                config_entry=self.config_entry,
-                config_subentry_id=config_subentry_id,
-                device_id=device.id if device else None,
-                disabled_by=disabled_by,
-                entity_category=entity.entity_category,
-                get_initial_options=entity.get_initial_entity_options,
-                has_entity_name=entity.has_entity_name,
-                hidden_by=hidden_by,
-                known_object_ids=self.entities,
-                original_device_class=entity.device_class,
-                original_icon=entity.icon,
-                original_name=entity_name,
-                suggested_object_id=suggested_object_id,
-                supported_features=entity.supported_features,
-                translation_key=entity.translation_key,
-                unit_of_measurement=entity.unit_of_measurement,
-            )
+    @callback
+    def _async_register_entity(
+        self,
+        entity: Entity,
+        entity_registry: EntityRegistry,
+        config_subentry_id: str | None,
+        devices: dict[_DeviceKey, tuple[DeviceInfo, dev_reg.DeviceEntry]] | None = None,
+    ) -> bool:
+        """Register an entity and reserve its entity id.
 
-            if device and device.disabled and not entry.disabled:
-                entry = entity_registry.async_update_entity(
-                    entry.entity_id, disabled_by=RegistryEntryDisabler.DEVICE
-                )
+        Returns False if the entity should not be added.
+        """
+        suggested_object_id: str | None = None
 
-            entity.registry_entry = entry
-            if device:
-                entity.device_entry = device
-            entity.entity_id = entry.entity_id
+        entity_name = entity.name
+        if entity_name is UNDEFINED:
+            entity_name = None
 
-        else:  # entity.unique_id is None
+        if entity.unique_id is not None:
+            # Get entity_id from unique ID registration
+            if not self._async_register_unique_id_entity(
+                entity, entity_registry, config_subentry_id, devices, entity_name
+            ):
+                return False
+        else:
             generate_new_entity_id = False
             # We won't generate an entity ID if the platform has already set one
             # We will however make sure that platform cannot pick a registered ID
@@ -936,17 +1032,17 @@ class EntityPlatform:
                 "Entity id already exists - ignoring: %s", entity.entity_id
             )
             entity.add_to_platform_abort()
-            return
+            return False
 
         if entity.registry_entry and entity.registry_entry.disabled:
             self.logger.debug(
                 "Not adding entity %s because it's disabled",
-                entry.name
+                entity.registry_entry.name
                 or entity_name
                 or f'"{self.platform_name} {entity.unique_id}"',
             )
             entity.add_to_platform_abort()
-            return
+            return False
 
         entity_id = entity.entity_id
         self.entities[entity_id] = entity
@@ -968,8 +1064,7 @@ class EntityPlatform:
             del self.domain_platform_entities[entity_id]
 
         entity.async_on_remove(remove_entity_cb)
-
-        await entity.add_to_platform_finish()
+        return True
 
     async def async_reset(self) -> None:
         """Remove all entities and reset data.
@@ -756,6 +756,7 @@ class EntityRegistry(BaseRegistry):
             STORAGE_KEY,
             atomic_writes=True,
             minor_version=STORAGE_VERSION_MINOR,
+            delta_log=True,
         )
         self.hass.bus.async_listen(
             EVENT_DEVICE_REGISTRY_UPDATED,
@@ -6,7 +6,7 @@ import asyncio
 from collections import defaultdict
 from collections.abc import Callable, Coroutine, Iterable, Mapping, Sequence
 import copy
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from functools import partial, wraps
 import logging
@@ -75,6 +75,11 @@ _TRACK_ENTITY_REGISTRY_UPDATED_DATA: HassKey[
 _TRACK_DEVICE_REGISTRY_UPDATED_DATA: HassKey[
     _KeyedEventData[EventDeviceRegistryUpdatedData]
 ] = HassKey("track_device_registry_updated_data")
+# Matching seconds, minutes and hours and if the pattern is in local time
+type _TimePatternKey = tuple[tuple[int, ...], tuple[int, ...], tuple[int, ...], bool]
+_TRACK_UTC_TIME_CHANGE_DATA: HassKey[dict[_TimePatternKey, _TrackUTCTimeChange]] = (
+    HassKey("track_utc_time_change_data")
+)
 
 _ALL_LISTENER = "all"
 _DOMAINS_LISTENER = "domains"
@@ -1789,12 +1794,22 @@ time_tracker_timestamp = time.time
 
 @dataclass(slots=True)
 class _TrackUTCTimeChange:
+    """Track a time pattern for all listeners with the same time expressions.
+
+    The listeners share one timer, so the next time the pattern matches is
+    calculated once per fire instead of once per listener.
+    """
+
     hass: HomeAssistant
+    key: _TimePatternKey
     time_match_expression: tuple[list[int], list[int], list[int]]
     microsecond: int
     local: bool
-    job: HassJob[[datetime], Coroutine[Any, Any, None] | None]
     listener_job_name: str
+    # The jobs in the order they were added
+    jobs: dict[HassJob[[datetime], Coroutine[Any, Any, None] | None], None] = field(
+        default_factory=dict
+    )
     _pattern_time_change_listener_job: HassJob[[datetime], None] | None = None
     _cancel_callback: CALLBACK_TYPE | None = None
 
@@ -1833,14 +1848,41 @@ class _TrackUTCTimeChange:
             self._pattern_time_change_listener_job,
             self._calculate_next(utc_now + timedelta(seconds=1)),
         )
-        hass.async_run_hass_job(self.job, localized_now, background=True)
+        jobs = self.jobs
+        for job in list(jobs):
+            # A job may have removed another listener of this pattern
+            if job not in jobs:
+                continue
+            # Callback jobs run directly, so a failing listener must not
+            # keep the other listeners of the pattern from running
+            try:
+                hass.async_run_hass_job(job, localized_now, background=True)
+            except Exception:
+                _LOGGER.exception("Error running job: %s", job)
 
     @callback
-    def async_cancel(self) -> None:
-        """Cancel the call_at."""
+    def async_add_job(
+        self, job: HassJob[[datetime], Coroutine[Any, Any, None] | None]
+    ) -> CALLBACK_TYPE:
+        """Add a job to run when the pattern matches."""
+        self.jobs[job] = None
+        return partial(self._async_remove_job, job)
+
+    @callback
+    def _async_remove_job(
+        self, job: HassJob[[datetime], Coroutine[Any, Any, None] | None]
+    ) -> None:
+        """Remove a job and cancel the timer after the last job was removed."""
+        jobs = self.jobs
+        if job not in jobs:
+            return
+        del jobs[job]
+        if jobs:
+            return
         if TYPE_CHECKING:
             assert self._cancel_callback is not None
         self._cancel_callback()
+        del self.hass.data[_TRACK_UTC_TIME_CHANGE_DATA][self.key]
 
 
 @callback
@@ -1871,21 +1913,31 @@ def async_track_utc_time_change(
     matching_seconds = dt_util.parse_time_expression(second, 0, 59)
     matching_minutes = dt_util.parse_time_expression(minute, 0, 59)
     matching_hours = dt_util.parse_time_expression(hour, 0, 23)
-    # Avoid aligning all time trackers to the same fraction of a second
-    # since it can create a thundering herd problem
-    # https://github.com/home-assistant/core/issues/82231
-    microsecond = randint(RANDOM_MICROSECOND_MIN, RANDOM_MICROSECOND_MAX)
-    listener_job_name = f"time change listener {hour}:{minute}:{second} {action}"
-    track = _TrackUTCTimeChange(
-        hass,
-        (matching_seconds, matching_minutes, matching_hours),
-        microsecond,
+    # Listeners with the same time expressions are grouped so they share
+    # a timer and fire from the same tick
+    key = (
+        tuple(matching_seconds),
+        tuple(matching_minutes),
+        tuple(matching_hours),
         local,
-        job,
-        listener_job_name,
     )
-    track.async_attach()
-    return track.async_cancel
+    tracks = hass.data.setdefault(_TRACK_UTC_TIME_CHANGE_DATA, {})
+    if (track := tracks.get(key)) is None:
+        # Avoid aligning all time trackers to the same fraction of a second
+        # since it can create a thundering herd problem
+        # https://github.com/home-assistant/core/issues/82231
+        microsecond = randint(RANDOM_MICROSECOND_MIN, RANDOM_MICROSECOND_MAX)
+        listener_job_name = f"time change listener {hour}:{minute}:{second}"
+        track = tracks[key] = _TrackUTCTimeChange(
+            hass,
+            key,
+            (matching_seconds, matching_minutes, matching_hours),
+            microsecond,
+            local,
+            listener_job_name,
+        )
+        track.async_attach()
+    return track.async_add_job(job)
 
 
 track_utc_time_change = threaded_listener_factory(async_track_utc_time_change)
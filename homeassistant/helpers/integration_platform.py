@@ -36,6 +36,10 @@ class IntegrationPlatform:
     platform_name: str
     process_job: HassJob[[HomeAssistant, str, Any], Awaitable[None] | None]
     seen_components: set[str]
+    # Lazy platforms are only imported when they are first needed,
+    # until then the loaded components are pending.
+    pending_components: set[str] | None = None
+    lock: asyncio.Lock | None = None
 
 
 @callback
@@ -55,6 +59,9 @@ def _async_integration_platform_component_loaded(
         if component_name in integration_platform.seen_components:
             continue
         integration_platform.seen_components.add(component_name)
+        if (pending := integration_platform.pending_components) is not None:
+            pending.add(component_name)
+            continue
         integration_platforms_by_name[integration_platform.platform_name] = (
             integration_platform
         )
@@ -160,8 +167,14 @@ async def async_process_integration_platforms(
     # Any = platform.
     process_platform: Callable[[HomeAssistant, str, Any], Awaitable[None] | None],
     wait_for_platforms: bool = False,
+    lazy: bool = False,
 ) -> None:
-    """Process a specific platform for all current and future loaded integrations."""
+    """Process a specific platform for all current and future loaded integrations.
+
+    If lazy is set, the platforms are not imported as integrations are loaded
+    but when async_process_lazy_integration_platforms is called, which has to
+    be done before the processed platforms are used.
+    """
     if DATA_INTEGRATION_PLATFORMS not in hass.data:
         integration_platforms = hass.data[DATA_INTEGRATION_PLATFORMS] = []
         hass.bus.async_listen(
@@ -175,10 +188,6 @@ async def async_process_integration_platforms(
     else:
         integration_platforms = hass.data[DATA_INTEGRATION_PLATFORMS]
 
-    # Tell the loader that it should try to pre-load the integration
-    # for any future components that are loaded so we can reduce the
-    # amount of import executor usage.
-    async_register_preload_platform(hass, platform_name)
     top_level_components = hass.config.top_level_components.copy()
     process_job = HassJob(
         catch_log_exception(
@@ -187,6 +196,22 @@ async def async_process_integration_platforms(
         ),
         f"process_platform {platform_name}",
     )
+    if lazy:
+        integration_platforms.append(
+            IntegrationPlatform(
+                platform_name,
+                process_job,
+                top_level_components,
+                top_level_components.copy(),
+                asyncio.Lock(),
+            )
+        )
+        return
+
+    # Tell the loader that it should try to pre-load the integration
+    # for any future components that are loaded so we can reduce the
+    # amount of import executor usage.
+    async_register_preload_platform(hass, platform_name)
     integration_platform = IntegrationPlatform(
         platform_name, process_job, top_level_components
     )
@@ -217,6 +242,27 @@ async def async_process_integration_platforms(
         await future
 
 
+async def async_process_lazy_integration_platforms(
+    hass: HomeAssistant, platform_name: str
+) -> None:
+    """Import and process the pending lazy platforms of loaded integrations."""
+    for integration_platform in hass.data.get(DATA_INTEGRATION_PLATFORMS, ()):
+        if (
+            integration_platform.platform_name != platform_name
+            or (lock := integration_platform.lock) is None
+        ):
+            continue
+        # Concurrent callers wait until the pending platforms are processed
+        async with lock:
+            if not (pending := integration_platform.pending_components):
+                continue
+            components = pending.copy()
+            pending.clear()
+            await _async_process_integration_platforms(
+                hass, platform_name, components, integration_platform.process_job
+            )
+
+
 async def _async_process_integration_platforms(
     hass: HomeAssistant,
     platform_name: str,
@@ -0,0 +1,131 @@
+"""Scheduler which aligns the polling of data update coordinators."""
+
+from __future__ import annotations
+
+import asyncio
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from functools import partial
+from random import randint
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.util.hass_dict import HassKey
+
+from . import event
+from .singleton import singleton
+
+DATA_POLL_SCHEDULER: HassKey[PollScheduler] = HassKey("poll_scheduler")
+
+# A refresh may be delayed by this fraction of its interval, but not more
+# than MAX_POLL_DELAY seconds, to share a time slot with other refreshes.
+POLL_DELAY_FRACTION = 0.1
+MAX_POLL_DELAY = 10
+
+MAX_CONCURRENT_REFRESHES_PER_HOST = 2
+
+# Upper bounds of the latency histogram buckets in seconds
+LATENCY_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+@dataclass(slots=True)
+class LatencyHistogram:
+    """Histogram of refresh latencies in seconds.
+
+    counts[idx] is the number of latencies above LATENCY_BUCKETS[idx - 1]
+    and up to LATENCY_BUCKETS[idx], the last count is the number of
+    latencies above the last bucket.
+    """
+
+    counts: list[int] = field(default_factory=lambda: [0] * (len(LATENCY_BUCKETS) + 1))
+    count: int = 0
+    sum: float = 0.0
+
+    def record(self, latency: float) -> None:
+        """Record a latency."""
+        self.counts[bisect_left(LATENCY_BUCKETS, latency)] += 1
+        self.count += 1
+        self.sum += latency
+
+
+@dataclass(slots=True)
+class _PollSlot:
+    """Jobs which run in the same second."""
+
+    handle: asyncio.TimerHandle
+    jobs: dict[int, CALLBACK_TYPE]
+
+
+class PollScheduler:
+    """Scheduler which aligns polling into shared time slots.
+
+    Each refresh is added to the first slot within its delay tolerance,
+    so coordinators with similar intervals wake up the event loop once
+    instead of at unrelated moments. The slots are whole seconds of the
+    loop time offset by the same random microsecond.
+    """
+
+    __slots__ = ("_hass", "_last_job_id", "_microsecond", "_semaphores", "_slots")
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the scheduler."""
+        self._hass = hass
+        self._microsecond = (
+            randint(event.RANDOM_MICROSECOND_MIN, event.RANDOM_MICROSECOND_MAX) / 10**6
+        )
+        self._last_job_id = 0
+        self._slots: dict[int, _PollSlot] = {}
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
+
+    @callback
+    def async_schedule(self, interval: float, job: CALLBACK_TYPE) -> CALLBACK_TYPE:
+        """Schedule a job to run once after interval seconds.
+
+        Returns a callback to cancel the job.
+        """
+        when = self._hass.loop.time() + interval
+        first = int(when)
+        last = int(when + min(interval * POLL_DELAY_FRACTION, MAX_POLL_DELAY))
+        slots = self._slots
+        second = next(
+            (second for second in range(first, last + 1) if second in slots), first
+        )
+        if (slot := slots.get(second)) is None:
+            handle = self._hass.loop.call_at(
+                second + self._microsecond, self._async_run_slot, second
+            )
+            slot = slots[second] = _PollSlot(handle, {})
+        self._last_job_id += 1
+        slot.jobs[self._last_job_id] = job
+        return partial(self._async_cancel, second, self._last_job_id)
+
+    @callback
+    def _async_cancel(self, second: int, job_id: int) -> None:
+        """Cancel a scheduled job."""
+        if (slot := self._slots.get(second)) is None:
+            return
+        slot.jobs.pop(job_id, None)
+        if not slot.jobs:
+            slot.handle.cancel()
+            del self._slots[second]
+
+    @callback
+    def _async_run_slot(self, second: int) -> None:
+        """Run the jobs of a slot."""
+        for job in self._slots.pop(second).jobs.values():
+            job()
+
+    @callback
+    def async_get_host_semaphore(self, host: str) -> asyncio.Semaphore:
+        """Return the semaphore which limits the concurrent refreshes of a host."""
+        if (semaphore := self._semaphores.get(host)) is None:
+            semaphore = self._semaphores[host] = asyncio.Semaphore(
+                MAX_CONCURRENT_REFRESHES_PER_HOST
+            )
+        return semaphore
+
+
+@callback
+@singleton(DATA_POLL_SCHEDULER)
+def async_get(hass: HomeAssistant) -> PollScheduler:
+    """Get the poll scheduler."""
+    return PollScheduler(hass)
@@ -0,0 +1,102 @@
+"""Reverse index of the items referenced by entities."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+from homeassistant.core import callback
+
+from .entity import Entity
+
+REFERENCE_PROPERTIES = (
+    "referenced_areas",
+    "referenced_blueprint",
+    "referenced_devices",
+    "referenced_entities",
+    "referenced_floors",
+    "referenced_labels",
+)
+
+
+def _references(entity: Entity, property_name: str) -> Iterable[str]:
+    """Return the items an entity references with a property."""
+    value: str | Iterable[str] | None = getattr(entity, property_name)
+    if value is None:
+        return ()
+    if isinstance(value, str):
+        return (value,)
+    return value
+
+
+def _index_entity(
+    index: dict[str, dict[str, dict[str, None]]], entity_id: str, entity: Entity
+) -> None:
+    """Add the items an entity references to the index."""
+    for property_name, references in index.items():
+        for referenced_id in _references(entity, property_name):
+            references.setdefault(referenced_id, {})[entity_id] = None
+
+
+class ReferenceIndex:
+    """Reverse index of the items referenced by entities.
+
+    Used by automations and scripts to look up which of them reference an
+    entity, device, area, floor, label or blueprint without scanning the
+    referenced_* properties of every entity on each lookup.
+
+    The referenced items of an entity do not change while it is added to
+    hass, reloading replaces the entities. The index is built on the first
+    lookup and then kept up to date as entities are added and removed.
+    """
+
+    __slots__ = ("_entities", "_index")
+
+    def __init__(self) -> None:
+        """Initialize the reference index."""
+        self._entities: dict[str, Entity] = {}
+        # property name -> referenced id -> entity ids, dicts are used
+        # instead of sets to keep the entity ids in the order they were added
+        self._index: dict[str, dict[str, dict[str, None]]] | None = None
+
+    @callback
+    def async_add(self, entity: Entity) -> None:
+        """Add an entity to the index."""
+        entity_id = entity.entity_id
+        self._entities[entity_id] = entity
+        if (index := self._index) is not None:
+            _index_entity(index, entity_id, entity)
+
+    @callback
+    def async_remove(self, entity: Entity) -> None:
+        """Remove an entity from the index."""
+        entity_id = entity.entity_id
+        if self._entities.get(entity_id) is not entity:
+            return
+        del self._entities[entity_id]
+        if (index := self._index) is None:
+            return
+        for property_name, references in index.items():
+            for referenced_id in _references(entity, property_name):
+                if (entity_ids := references.get(referenced_id)) is None:
+                    continue
+                entity_ids.pop(entity_id, None)
+                if not entity_ids:
+                    del references[referenced_id]
+
+    @callback
+    def async_get(self, property_name: str, referenced_id: str) -> list[str]:
+        """Return the entity ids of the entities referencing an item."""
+        if (index := self._index) is None:
+            index = self._index = self._build_index()
+        if (entity_ids := index[property_name].get(referenced_id)) is None:
+            return []
+        return list(entity_ids)
+
+    def _build_index(self) -> dict[str, dict[str, dict[str, None]]]:
+        """Build the index from the entities."""
+        index: dict[str, dict[str, dict[str, None]]] = {
+            property_name: {} for property_name in REFERENCE_PROPERTIES
+        }
+        for entity_id, entity in self._entities.items():
+            _index_entity(index, entity_id, entity)
+        return index
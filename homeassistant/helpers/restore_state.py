@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 import logging
 from typing import Any, Self, cast
@@ -17,7 +18,7 @@ from homeassistant.util.json import json_loads
 from . import start
 from .entity import Entity
 from .event import async_track_time_interval
-from .json import JSONEncoder
+from .json import json_bytes, json_fragment
 from .singleton import singleton
 from .storage import Store
 
@@ -34,6 +35,11 @@ STATE_DUMP_INTERVAL = timedelta(minutes=15)
 # How long should a saved state be preserved if the entity no longer exists
 STATE_EXPIRATION = timedelta(days=7)
 
+# How often the last seen time of the saved states of existing entities is
+# updated. Unchanged states are not written again until then, saved states
+# are preserved up to this much longer than STATE_EXPIRATION.
+LAST_SEEN_UPDATE_INTERVAL = timedelta(days=1)
+
 
 class ExtraStoredData(ABC):
     """Object to hold extra stored data."""
@@ -95,6 +101,16 @@ class StoredState:
         )
 
 
+@dataclass(slots=True)
+class _DumpedState:
+    """A serialized stored state and the data it was serialized from."""
+
+    state: State
+    extra_data: bytes
+    last_seen: datetime
+    record: json_fragment
+
+
 async def async_load(hass: HomeAssistant) -> None:
     """Load the restore state task."""
     await async_get(hass).async_setup()
@@ -118,11 +134,13 @@ class RestoreStateData:
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize the restore state data class."""
         self.hass: HomeAssistant = hass
-        self.store = Store[list[dict[str, Any]]](
-            hass, STORAGE_VERSION, STORAGE_KEY, encoder=JSONEncoder
+        self.store = Store[list[Any]](
+            hass, STORAGE_VERSION, STORAGE_KEY, delta_log=True
         )
         self.last_states: dict[str, StoredState] = {}
         self.entities: dict[str, RestoreEntity] = {}
+        # The stored states of the last dump by entity id
+        self._dumped_states: dict[str, _DumpedState] = {}
 
     async def async_setup(self) -> None:
         """Set up up the instance of this data helper."""
@@ -171,17 +189,24 @@ class RestoreStateData:
             if not state.attributes.get(ATTR_RESTORED)
         }
 
-        # Start with the currently registered states
-        stored_states = [
-            StoredState(
-                current_states_by_entity_id[entity_id],
-                entity.extra_restore_state_data,
-                now,
+        # Start with the currently registered states. Their last seen time
+        # is only updated periodically, so the stored states of unchanged
+        # entities stay the same and are not appended to the delta log.
+        update_last_seen_time = now - LAST_SEEN_UPDATE_INTERVAL
+        dumped_states = self._dumped_states
+        stored_states: list[StoredState] = []
+        for entity_id, entity in self.entities.items():
+            if (state := current_states_by_entity_id.get(entity_id)) is None:
+                continue
+            last_seen = now
+            if (
+                dumped_state := dumped_states.get(entity_id)
+            ) is not None and dumped_state.last_seen >= update_last_seen_time:
+                last_seen = dumped_state.last_seen
+            stored_states.append(
+                StoredState(state, entity.extra_restore_state_data, last_seen)
             )
-            for entity_id, entity in self.entities.items()
-            if entity_id in current_states_by_entity_id
-        ]
-        expiration_time = now - STATE_EXPIRATION
+        expiration_time = now - STATE_EXPIRATION - LAST_SEEN_UPDATE_INTERVAL
 
         for entity_id, stored_state in self.last_states.items():
             # Don't save old states that have entities in the current run
@@ -202,15 +227,57 @@ class RestoreStateData:
         """Save the current state machine to storage."""
         _LOGGER.debug("Dumping states")
         try:
-            await self.store.async_save(
-                [
-                    stored_state.as_dict()
-                    for stored_state in self.async_get_stored_states()
-                ]
-            )
+            await self.store.async_save(self._async_serialize_stored_states())
         except HomeAssistantError as exc:
             _LOGGER.error("Error saving current states", exc_info=exc)
 
+    @callback
+    def _async_serialize_stored_states(self) -> list[json_fragment]:
+        """Serialize the stored states.
+
+        Stored states which did not change since the last dump are not
+        serialized again. The store only appends the changed stored states
+        to its delta log.
+        """
+        previous = self._dumped_states
+        dumped_states: dict[str, _DumpedState] = {}
+        for stored_state in self.async_get_stored_states():
+            state = stored_state.state
+            entity_id = state.entity_id
+            last_seen = stored_state.last_seen
+            try:
+                extra_data = (
+                    json_bytes(stored_state.extra_data.as_dict())
+                    if stored_state.extra_data
+                    else b"null"
+                )
+                if (
+                    (dumped_state := previous.get(entity_id)) is None
+                    or dumped_state.state is not state
+                    or dumped_state.extra_data != extra_data
+                    or dumped_state.last_seen != last_seen
+                ):
+                    record = b"".join(
+                        (
+                            b'{"state":',
+                            state.as_dict_json,
+                            b',"extra_data":',
+                            extra_data,
+                            b',"last_seen":',
+                            json_bytes(last_seen),
+                            b"}",
+                        )
+                    )
+                    dumped_state = _DumpedState(
+                        state, extra_data, last_seen, json_fragment(record)
+                    )
+            except TypeError:
+                _LOGGER.exception("Error serializing the stored state of %s", entity_id)
+                continue
+            dumped_states[entity_id] = dumped_state
+        self._dumped_states = dumped_states
+        return [dumped_state.record for dumped_state in dumped_states.values()]
+
     @callback
     def async_setup_dump(self, *args: Any) -> None:
         """Set up the restore state listeners."""
@@ -48,6 +48,11 @@ STORAGE_MANAGER: HassKey[_StoreManager] = HassKey("storage_manager")
 
 MANAGER_CLEANUP_DELAY = 60
 
+DELTA_LOG_SUFFIX = ".log"
+# The delta log is compacted into the base file when it has this many
+# records, or when it is as large as the base file.
+DELTA_LOG_MAX_RECORDS = 500
+
 
 @bind_hass
 async def async_migrator[_T: Mapping[str, Any] | Sequence[Any]](
@@ -226,6 +231,317 @@ class _StoreManager:
             self._files = set(os.listdir(self._storage_path))
 
 
+# The serialized data of a store, lists are serialized item by item
+type _Snapshot = dict[str, list[bytes] | bytes] | list[bytes]
+
+
+class _DeltaLog:
+    """Append-only log of the changes to the data of a store.
+
+    Instead of rewriting the whole file, a write appends the changes since
+    the previous write to the log. Lists are diffed item by item, so
+    changing one registry entry only appends that entry. If the data is a
+    list, it is diffed item by item the same way. The log is
+    replayed when the store is loaded, and compacted into the base file
+    when it has too many records or grows as large as the base file.
+
+    Older versions only read the base file, so the log is also compacted
+    at the final write, and right after loading a log which was left
+    behind by an unclean shutdown or which has an invalid record.
+
+    Every record has a sequence number and the base file stores the
+    sequence number of the last record it contains, so records which
+    were left behind by an interrupted compaction are skipped.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the delta log."""
+        self.sequence = 0
+        self._records = 0
+        self._size = 0
+        self._base_size = 0
+        # The serialized data and version of the last write, only set
+        # after the base file was written during this run.
+        self._snapshot: _Snapshot | None = None
+        self._version: tuple[int, int] | None = None
+        self._appending = True
+
+    def replay(self, path: str, data: dict[str, Any]) -> bool:
+        """Apply the changes in the log to the data loaded from the base file.
+
+        Returns True if the log should be compacted into the base file
+        because it changed the data or could not be replayed completely.
+        """
+        self.sequence = data.pop("delta_log_sequence", 0)
+        log_path = f"{path}{DELTA_LOG_SUFFIX}"
+        try:
+            with open(log_path, "rb") as log_file:
+                lines = log_file.read().splitlines()
+        except FileNotFoundError:
+            return False
+
+        compact = False
+        stored = data["data"]
+        for line in lines:
+            try:
+                record: dict[str, Any] = json_util.json_loads_object(line)
+            except ValueError:
+                _LOGGER.warning(
+                    "Ignoring the incomplete end of the delta log %s", log_path
+                )
+                return True
+            try:
+                if (sequence := record["sequence"]) <= self.sequence:
+                    continue
+                stored = _apply_record(stored, record)
+            except (KeyError, TypeError, ValueError, IndexError) as err:
+                _LOGGER.warning(
+                    "Ignoring the rest of the delta log %s from the invalid record %s: %r",
+                    log_path,
+                    line,
+                    err,
+                )
+                return True
+            data["data"] = stored
+            self.sequence = sequence
+            compact = True
+        return compact
+
+    def write_changes(
+        self, path: str, data: dict[str, Any], private: bool, fsync: bool
+    ) -> bool:
+        """Append the changes since the previous write to the log.
+
+        Returns False if the data must be written to the base file instead.
+        """
+        stored = data["data"]
+        if (
+            not self._appending
+            or self._snapshot is None
+            or not isinstance(stored, (dict, list))
+            or self._version != (data["version"], data["minor_version"])
+            or self._records >= DELTA_LOG_MAX_RECORDS
+            or self._size >= self._base_size
+        ):
+            return False
+
+        snapshot = _snapshot_data(stored)
+        if not (record := _snapshot_changes(self._snapshot, snapshot)):
+            return True
+        record["sequence"] = self.sequence + 1
+        line = json_helper.json_bytes(record) + b"\n"
+        # Write the complete base file next time if appending fails
+        self._snapshot = None
+        _append_file(f"{path}{DELTA_LOG_SUFFIX}", line, private, fsync)
+        self._snapshot = snapshot
+        self.sequence += 1
+        self._records += 1
+        self._size += len(line)
+        return True
+
+    def compacted(self, path: str, data: dict[str, Any]) -> None:
+        """Remove the log after the data was written to the base file."""
+        with suppress(FileNotFoundError):
+            os.unlink(f"{path}{DELTA_LOG_SUFFIX}")
+        stored = data["data"]
+        self._records = 0
+        self._size = 0
+        self._base_size = os.path.getsize(path)
+        self._snapshot = (
+            _snapshot_data(stored) if isinstance(stored, (dict, list)) else None
+        )
+        self._version = (data["version"], data.get("minor_version", 1))
+
+    def reset(self) -> None:
+        """Forget the last written data."""
+        self._snapshot = None
+
+    def stop_appending(self) -> None:
+        """Write the base file instead of appending to the log from now on."""
+        self._appending = False
+
+    def uncompacted_data(self, key: str) -> dict[str, Any] | None:
+        """Return the last written data if it is only in the log."""
+        if not self._records or self._snapshot is None or self._version is None:
+            return None
+        snapshot = self._snapshot
+        stored: dict[str, Any] | list[Any]
+        if isinstance(snapshot, list):
+            stored = [json_helper.json_fragment(item) for item in snapshot]
+        else:
+            stored = {
+                name: [json_helper.json_fragment(item) for item in value]
+                if isinstance(value, list)
+                else json_helper.json_fragment(value)
+                for name, value in snapshot.items()
+            }
+        return {
+            "version": self._version[0],
+            "minor_version": self._version[1],
+            "key": key,
+            "data": stored,
+        }
+
+    @property
+    def uncompacted(self) -> bool:
+        """Return if changes were appended to the log since it was compacted."""
+        return self._records > 0
+
+
+def _apply_record(
+    stored: dict[str, Any] | list[Any], record: dict[str, Any]
+) -> dict[str, Any] | list[Any]:
+    """Return the data with the changes of a delta log record applied.
+
+    The data is copied before it is changed, so an invalid record
+    leaves the data as it was.
+    """
+    if "splice_data" in record:
+        if not isinstance(stored, list):
+            raise TypeError(f"Can not splice {type(stored).__name__} data")
+        stored = list(stored)
+        _apply_splices(stored, record["splice_data"])
+        return stored
+    if not isinstance(stored, dict):
+        raise TypeError(f"Can not change keys of {type(stored).__name__} data")
+    stored = dict(stored)
+    for key, value in record.get("set", {}).items():
+        stored[key] = value
+    for key in record.get("remove", ()):
+        stored.pop(key, None)
+    for key, splices in record.get("splice", {}).items():
+        items = stored[key] = list(stored[key])
+        _apply_splices(items, splices)
+    return stored
+
+
+def _apply_splices(items: list[Any], splices: list[list[Any]]) -> None:
+    """Apply the splices of a delta log record to a list."""
+    for start, end, new_items in reversed(splices):
+        if not 0 <= start <= end <= len(items):
+            raise IndexError(f"Splice {start}:{end} out of range")
+        items[start:end] = new_items
+
+
+def _snapshot_data(data: dict[str, Any] | list[Any]) -> _Snapshot:
+    """Serialize the data, lists are serialized item by item."""
+    if isinstance(data, list):
+        return [json_helper.json_bytes(item) for item in data]
+    return {
+        key: [json_helper.json_bytes(item) for item in value]
+        if isinstance(value, list)
+        else json_helper.json_bytes(value)
+        for key, value in data.items()
+    }
+
+
+def _snapshot_fragment(value: list[bytes] | bytes) -> json_helper.json_fragment:
+    """Return the json fragment of a serialized value."""
+    if isinstance(value, list):
+        return json_helper.json_fragment(b"[" + b",".join(value) + b"]")
+    return json_helper.json_fragment(value)
+
+
+def _snapshot_changes(old: _Snapshot, new: _Snapshot) -> dict[str, Any]:
+    """Return the delta log record of the changes between two snapshots."""
+    if isinstance(new, list) or isinstance(old, list):
+        # The type of the data only changes with its version, which
+        # compacts the log
+        assert isinstance(new, list) and isinstance(old, list)
+        if old == new:
+            return {}
+        return {"splice_data": _list_splices(old, new)}
+    record: dict[str, Any] = {}
+    for key, value in new.items():
+        if (old_value := old.get(key)) == value:
+            continue
+        if isinstance(value, list) and isinstance(old_value, list):
+            record.setdefault("splice", {})[key] = _list_splices(old_value, value)
+        else:
+            record.setdefault("set", {})[key] = _snapshot_fragment(value)
+    if removed := [key for key in old if key not in new]:
+        record["remove"] = removed
+    return record
+
+
+def _list_splices(old: list[bytes], new: list[bytes]) -> list[list[Any]]:
+    """Return the splices which turn the old list into the new list.
+
+    The items are matched in a single pass instead of searching for the
+    longest common subsequence, which is slow when many items changed.
+    Moved items may replace more items than necessary.
+    """
+    if len(old) == len(new):
+        # Usually items were changed in place, unless most of them differ
+        # because items were removed and added
+        changed = [idx for idx, item in enumerate(new) if item != old[idx]]
+        if len(changed) * 2 < len(new):
+            splices: list[list[Any]] = []
+            for idx in changed:
+                if splices and splices[-1][1] == idx:
+                    splices[-1][1] = idx + 1
+                    splices[-1][2].append(json_helper.json_fragment(new[idx]))
+                else:
+                    splices.append(
+                        [idx, idx + 1, [json_helper.json_fragment(new[idx])]]
+                    )
+            return splices
+
+    # The first position of each item in the old list
+    positions: dict[bytes, int] = {}
+    for idx in range(len(old) - 1, -1, -1):
+        positions[old[idx]] = idx
+
+    splices = []
+    old_len = len(old)
+    new_len = len(new)
+    old_idx = new_idx = 0
+    while new_idx < new_len:
+        if old_idx < old_len and old[old_idx] == new[new_idx]:
+            old_idx += 1
+            new_idx += 1
+            continue
+        # Replace the old items up to the next new item which is still
+        # ahead in the old list
+        first = new_idx
+        end = old_len
+        while new_idx < new_len:
+            if (position := positions.get(new[new_idx], -1)) >= old_idx:
+                end = position
+                break
+            new_idx += 1
+        splices.append(
+            [
+                old_idx,
+                end,
+                [json_helper.json_fragment(item) for item in new[first:new_idx]],
+            ]
+        )
+        old_idx = end
+    if old_idx < old_len:
+        splices.append([old_idx, old_len, []])
+    return splices
+
+
+def _append_file(filename: str, data: bytes, private: bool, fsync: bool) -> None:
+    """Append data to a file."""
+    try:
+        fd = os.open(
+            filename,
+            os.O_WRONLY | os.O_CREAT | os.O_APPEND,
+            0o600 if private else 0o644,
+        )
+        try:
+            os.write(fd, data)
+            if fsync:
+                os.fsync(fd)
+        finally:
+            os.close(fd)
+    except OSError as error:
+        _LOGGER.exception("Appending to file failed: %s", filename)
+        raise WriteError(error) from error
+
+
 @bind_hass
 class Store[_T: Mapping[str, Any] | Sequence[Any]]:
     """Class to help storing data."""
@@ -241,8 +557,16 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         encoder: type[JSONEncoder] | None = None,
         minor_version: int = 1,
         read_only: bool = False,
+        delta_log: bool = False,
     ) -> None:
-        """Initialize storage class."""
+        """Initialize storage class.
+
+        If delta_log is set, writes append the changes to a log which is
+        compacted into the file periodically. The data must be a dict or a
+        list and must be serializable with the default encoder.
+        """
+        if delta_log and encoder:
+            raise ValueError("A delta log can not be used with a custom encoder")
         self.version = version
         self.minor_version = minor_version
         self.key = key
@@ -258,6 +582,7 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         self._read_only = read_only
         self._next_write_time = 0.0
         self._manager = get_internal_store_manager(hass)
+        self._delta_log = _DeltaLog() if delta_log else None
 
     @cached_property
     def path(self):
@@ -325,6 +650,8 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
             exists, data = cache
             if not exists:
                 return None
+            if self._delta_log:
+                await self.hass.async_add_executor_job(self._replay_delta_log, data)
         else:
             try:
                 data = await self.hass.async_add_executor_job(
@@ -386,6 +713,8 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
 
             if data == {}:
                 return None
+            if self._delta_log:
+                await self.hass.async_add_executor_job(self._replay_delta_log, data)
 
         # Add minor_version if not set
         if "minor_version" not in data:
@@ -517,6 +846,11 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
     async def _async_callback_final_write(self, _event: Event) -> None:
         """Handle a write because Home Assistant is in final write state."""
         self._unsub_final_write_listener = None
+        if (delta_log := self._delta_log) is not None:
+            # Compact the delta log since older versions do not read it
+            if self._data is None:
+                self._data = delta_log.uncompacted_data(self.key)
+            delta_log.stop_appending()
         await self._async_handle_write_data()
 
     async def _async_handle_write_data(self, *_args):
@@ -541,9 +875,24 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
             except (json_util.SerializationError, WriteError) as err:
                 _LOGGER.error("Error writing config for %s: %s", self.key, err)
 
+            if self._delta_log is not None and self._delta_log.uncompacted:
+                self._async_ensure_final_write_listener()
+
     async def _async_write_data(self, path: str, data: dict) -> None:
         await self.hass.async_add_executor_job(self._write_data, self.path, data)
 
+    def _replay_delta_log(self, data: dict[str, Any]) -> None:
+        """Replay the delta log and compact it into the base file."""
+        assert self._delta_log is not None
+        if not self._delta_log.replay(self.path, data) or self._read_only:
+            return
+        # Compact the log right away, it is only left behind when Home
+        # Assistant did not shut down cleanly or when it is invalid
+        try:
+            self._write_data(self.path, {**data})
+        except (json_util.SerializationError, WriteError) as err:
+            _LOGGER.error("Error writing config for %s: %s", self.key, err)
+
     def _write_data(self, path: str, data: dict) -> None:
         """Write the data."""
         os.makedirs(os.path.dirname(path), exist_ok=True)
@@ -551,6 +900,12 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         if "data_func" in data:
             data["data"] = data.pop("data_func")()
 
+        if (delta_log := self._delta_log) is not None:
+            if delta_log.write_changes(path, data, self._private, self._atomic_writes):
+                _LOGGER.debug("Appended changes for %s to the delta log", self.key)
+                return
+            data["delta_log_sequence"] = delta_log.sequence
+
         _LOGGER.debug("Writing data for %s to %s", self.key, path)
         json_helper.save_json(
             path,
@@ -559,6 +914,8 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
             encoder=self._encoder,
             atomic_writes=self._atomic_writes,
         )
+        if delta_log is not None:
+            delta_log.compacted(path, data)
 
     async def _async_migrate_func(self, old_major_version, old_minor_version, old_data):
         """Migrate to the new version."""
@@ -572,3 +929,9 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
 
         with suppress(FileNotFoundError):
             await self.hass.async_add_executor_job(os.unlink, self.path)
+        if self._delta_log:
+            self._delta_log.reset()
+            with suppress(FileNotFoundError):
+                await self.hass.async_add_executor_job(
+                    os.unlink, f"{self.path}{DELTA_LOG_SUFFIX}"
+                )
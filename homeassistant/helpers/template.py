@@ -12,8 +12,11 @@ from contextvars import ContextVar
 from copy import deepcopy
 from datetime import date, datetime, time, timedelta
 from functools import cache, lru_cache, partial, wraps
+import hashlib
+from importlib.util import MAGIC_NUMBER
 import json
 import logging
+import marshal
 import math
 from operator import contains
 import pathlib
@@ -35,6 +38,7 @@ from typing import (
 )
 from urllib.parse import urlencode as urllib_urlencode
 import weakref
+import zlib
 
 from awesomeversion import AwesomeVersion
 import jinja2
@@ -54,6 +58,7 @@ from homeassistant.const import (
     ATTR_PERSONS,
     ATTR_UNIT_OF_MEASUREMENT,
     EVENT_HOMEASSISTANT_START,
+    EVENT_HOMEASSISTANT_STARTED,
     EVENT_HOMEASSISTANT_STOP,
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
@@ -61,6 +66,7 @@ from homeassistant.const import (
 )
 from homeassistant.core import (
     Context,
+    Event,
     HomeAssistant,
     ServiceResponse,
     State,
@@ -94,6 +100,7 @@ from . import (
 )
 from .deprecation import deprecated_function
 from .singleton import singleton
+from .storage import Store
 from .translation import async_translate_state
 from .typing import TemplateVarsType
 
@@ -169,6 +176,10 @@ MAX_TEMPLATE_OUTPUT = 256 * 1024  # 256KiB
 
 CACHED_TEMPLATE_LRU: LRU[State, TemplateState] = LRU(CACHED_TEMPLATE_STATES)
 CACHED_TEMPLATE_NO_COLLECT_LRU: LRU[State, TemplateState] = LRU(CACHED_TEMPLATE_STATES)
+
+COMPILED_TEMPLATE_CACHE_SIZE = 4096
+TEMPLATE_BYTECODE_STORAGE_KEY = "core.template_bytecode"
+TEMPLATE_BYTECODE_STORAGE_VERSION = 1
 ENTITY_COUNT_GROWTH_FACTOR = 1.2
 
 ORJSON_PASSTHROUGH_OPTIONS = (
@@ -194,6 +205,72 @@ def _template_state(hass: HomeAssistant, state: State) -> TemplateState:
     return template_state
 
 
+class CompiledTemplateCache:
+    """Process-wide LRU cache of the compiled code of templates.
+
+    The code is keyed by a hash of the template source and of the
+    environment it was compiled in, see _compiled_template_key.
+
+    Code loaded from the bytecode cache of the previous run is only moved
+    to the LRU once it is used so templates which have been removed from
+    the configuration are not saved again.
+    """
+
+    __slots__ = ("_codes", "_loaded", "hits", "misses")
+
+    def __init__(self, size: int) -> None:
+        """Initialize the cache."""
+        self._codes: LRU[str, CodeType] = LRU(size)
+        self._loaded: dict[str, CodeType] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> CodeType | None:
+        """Return the compiled code of a template."""
+        if (code := self._codes.get(key)) is None and (
+            code := self._loaded.pop(key, None)
+        ) is not None:
+            self._codes[key] = code
+        if code is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return code
+
+    def set(self, key: str, code: CodeType) -> None:
+        """Add the compiled code of a template."""
+        self._codes[key] = code
+
+    def cache_info(self) -> dict[str, int]:
+        """Return the hit and miss counters and the size of the cache."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._codes),
+            "maxsize": self._codes.get_size(),
+        }
+
+    def load(self, codes: dict[str, CodeType]) -> None:
+        """Load the compiled code saved by a previous run."""
+        self._loaded = {
+            key: code for key, code in codes.items() if key not in self._codes
+        }
+
+    def dump(self) -> dict[str, CodeType]:
+        """Return the compiled code of the templates that are in use."""
+        return dict(self._codes.items())
+
+    def clear(self) -> None:
+        """Clear the cache and reset the counters."""
+        self._codes.clear()
+        self._loaded.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+COMPILED_TEMPLATE_CACHE = CompiledTemplateCache(COMPILED_TEMPLATE_CACHE_SIZE)
+
+
 def async_setup(hass: HomeAssistant) -> bool:
     """Set up tracking the template LRUs."""
 
@@ -2808,6 +2885,77 @@ def make_logging_undefined(
     return LoggingUndefined
 
 
+async def async_load_template_bytecode(hass: HomeAssistant) -> None:
+    """Load the compiled templates saved by the previous run.
+
+    Compiling templates is expensive, loading the code compiled by the
+    previous run avoids compiling every template again at startup. The
+    compiled templates are saved once Home Assistant has started and
+    again on shutdown if new templates have been compiled.
+    """
+    store = Store[dict[str, str]](
+        hass,
+        TEMPLATE_BYTECODE_STORAGE_VERSION,
+        TEMPLATE_BYTECODE_STORAGE_KEY,
+        private=True,
+    )
+    if data := await store.async_load():
+        COMPILED_TEMPLATE_CACHE.load(
+            await hass.async_add_executor_job(_decode_template_bytecode, data)
+        )
+    saved_misses = 0
+
+    async def _async_save_template_bytecode(_: Event) -> None:
+        """Save the compiled templates if new templates were compiled."""
+        nonlocal saved_misses
+        if COMPILED_TEMPLATE_CACHE.misses == saved_misses:
+            return
+        saved_misses = COMPILED_TEMPLATE_CACHE.misses
+        await store.async_save(
+            await hass.async_add_executor_job(
+                _encode_template_bytecode, COMPILED_TEMPLATE_CACHE.dump()
+            )
+        )
+
+    hass.bus.async_listen_once(
+        EVENT_HOMEASSISTANT_STARTED, _async_save_template_bytecode
+    )
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_save_template_bytecode)
+
+
+def _encode_template_bytecode(codes: dict[str, CodeType]) -> dict[str, str]:
+    """Encode compiled templates to be saved."""
+    return {
+        "magic": MAGIC_NUMBER.hex(),
+        "jinja2": jinja2.__version__,
+        "bytecode": base64.b64encode(zlib.compress(marshal.dumps(codes))).decode(),
+    }
+
+
+def _decode_template_bytecode(data: dict[str, str]) -> dict[str, CodeType]:
+    """Decode saved compiled templates.
+
+    The code is only used if it was compiled by the same version of
+    Python and jinja2.
+    """
+    if data.get("magic") != MAGIC_NUMBER.hex() or data.get("jinja2") != (
+        jinja2.__version__
+    ):
+        return {}
+    try:
+        codes = marshal.loads(zlib.decompress(base64.b64decode(data["bytecode"])))
+    except (EOFError, KeyError, TypeError, ValueError, zlib.error) as err:
+        _LOGGER.warning("Unable to load the compiled templates: %s", err)
+        return {}
+    if not isinstance(codes, dict):
+        return {}
+    return {
+        key: code
+        for key, code in codes.items()
+        if isinstance(key, str) and isinstance(code, CodeType)
+    }
+
+
 async def async_load_custom_templates(hass: HomeAssistant) -> None:
     """Load all custom jinja files under 5MiB into memory."""
     custom_templates = await hass.async_add_executor_job(_load_custom_templates, hass)
@@ -2875,6 +3023,7 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
         """Initialise template environment."""
         super().__init__(undefined=make_logging_undefined(strict, log_fn))
         self.hass = hass
+        self._compiled_template_key_prefix: bytes | None = None
         self.template_cache: weakref.WeakValueDictionary[
             str | jinja2.nodes.Template, CodeType | None
         ] = weakref.WeakValueDictionary()
@@ -3230,9 +3379,36 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
                 defer_init,
             )
 
-        compiled = super().compile(source)
+        if not isinstance(source, str):
+            compiled = super().compile(source)
+        elif (
+            cached := COMPILED_TEMPLATE_CACHE.get(
+                key := self._compiled_template_key(source)
+            )
+        ) is not None:
+            compiled = cached
+        else:
+            compiled = super().compile(source)
+            COMPILED_TEMPLATE_CACHE.set(key, compiled)
         self.template_cache[source] = compiled
         return compiled
 
+    def _compiled_template_key(self, source: str) -> str:
+        """Return the key of a template in the compiled template cache.
+
+        The generated code depends on the names of the filters and tests of
+        the environment and on the arguments they are passed, so templates
+        compiled in environments with different filters and tests do not
+        share the compiled code.
+        """
+        if (prefix := self._compiled_template_key_prefix) is None:
+            signature = hashlib.sha256()
+            for kind, functions in (("f", self.filters), ("t", self.tests)):
+                for name in sorted(functions):
+                    pass_arg = getattr(functions[name], "jinja_pass_arg", None)
+                    signature.update(f"{kind}:{name}:{pass_arg}\n".encode())
+            prefix = self._compiled_template_key_prefix = signature.digest()
+        return hashlib.sha256(prefix + source.encode()).hexdigest()
+
 
 _NO_HASS_ENV = TemplateEnvironment(None)
@@ -18,7 +18,7 @@ from propcache.api import cached_property
 import requests
 
 from homeassistant import config_entries
-from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.const import CONF_HOST, EVENT_HOMEASSISTANT_STOP
 from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
 from homeassistant.exceptions import (
     ConfigEntryAuthFailed,
@@ -28,7 +28,7 @@ from homeassistant.exceptions import (
 )
 from homeassistant.util.dt import utcnow
 
-from . import entity, event
+from . import entity, event, poll_scheduler
 from .debounce import Debouncer
 from .frame import report_usage
 from .typing import UNDEFINED, UndefinedType
@@ -59,6 +59,13 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
     Setting :attr:`always_update` to ``False`` will cause coordinator to only
     callback listeners when data has changed. This requires that the data
     implements ``__eq__`` or uses a python object that already does.
+
+    Setting :attr:`aggregate_polling` to ``True`` will schedule the refreshes
+    with the shared poll scheduler, which aligns them with the refreshes of
+    other coordinators and limits the concurrent refreshes per host. The
+    host is the ``host`` of the config entry data if it has one, otherwise
+    the domain of the config entry. The latencies of the scheduled refreshes
+    are recorded in :attr:`refresh_latency`.
     """
 
     def __init__(
@@ -73,6 +80,7 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         setup_method: Callable[[], Awaitable[None]] | None = None,
         request_refresh_debouncer: Debouncer[Coroutine[Any, Any, None]] | None = None,
         always_update: bool = True,
+        aggregate_polling: bool = False,
     ) -> None:
         """Initialize global data updater."""
         self.hass = hass
@@ -91,6 +99,17 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
             self.config_entry = config_entry
         self.always_update = always_update
 
+        self._poll_scheduler: poll_scheduler.PollScheduler | None = None
+        self._poll_host = name
+        self.refresh_latency: poll_scheduler.LatencyHistogram | None = None
+        if aggregate_polling:
+            self._poll_scheduler = poll_scheduler.async_get(hass)
+            self.refresh_latency = poll_scheduler.LatencyHistogram()
+            if self.config_entry:
+                self._poll_host = self.config_entry.data.get(
+                    CONF_HOST, self.config_entry.domain
+                )
+
         # It's None before the first successful update.
         # Components should call async_config_entry_first_refresh
         # to make sure the first update was successful.
@@ -232,6 +251,12 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         # than the debouncer cooldown, this would cause the debounce to never be called
         self._async_unsub_refresh()
 
+        if self._poll_scheduler is not None:
+            self._unsub_refresh = self._poll_scheduler.async_schedule(
+                self._update_interval_seconds, self.__wrap_handle_refresh_interval
+            )
+            return
+
         # We use loop.call_at because DataUpdateCoordinator does
         # not need an exact update interval which also avoids
         # calling dt_util.utcnow() on every update.
@@ -265,7 +290,16 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
     async def _handle_refresh_interval(self, _now: datetime | None = None) -> None:
         """Handle a refresh interval occurrence."""
         self._unsub_refresh = None
-        await self._async_refresh(log_failures=True, scheduled=True)
+        if self._poll_scheduler is None:
+            await self._async_refresh(log_failures=True, scheduled=True)
+            return
+
+        loop = self.hass.loop
+        start = loop.time()
+        async with self._poll_scheduler.async_get_host_semaphore(self._poll_host):
+            await self._async_refresh(log_failures=True, scheduled=True)
+        if self.refresh_latency is not None:
+            self.refresh_latency.record(loop.time() - start)
 
     async def async_request_refresh(self) -> None:
         """Request a refresh.
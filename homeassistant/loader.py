@@ -29,7 +29,7 @@ from propcache.api import cached_property
 import voluptuous as vol
 
 from . import generated
-from .const import Platform
+from .const import Platform, __version__ as HA_VERSION
 from .core import HomeAssistant, callback
 from .generated.application_credentials import APPLICATION_CREDENTIALS
 from .generated.bluetooth import BLUETOOTH
@@ -49,6 +49,7 @@ if TYPE_CHECKING:
     # because they would cause a circular import otherwise.
     from .config_entries import ConfigEntry
     from .helpers import device_registry as dr
+    from .helpers.storage import Store
     from .helpers.typing import ConfigType
 
 _LOGGER = logging.getLogger(__name__)
@@ -64,11 +65,13 @@ _LOGGER = logging.getLogger(__name__)
 #
 # This list can be extended by calling async_register_preload_platform
 #
+# Platforms which are processed lazily, like diagnostics and system_health,
+# are not preloaded since they are only imported when they are first needed.
+#
 BASE_PRELOAD_PLATFORMS = [
     "backup",
     "config",
     "config_flow",
-    "diagnostics",
     "energy",
     "group",
     "hardware",
@@ -77,7 +80,6 @@ BASE_PRELOAD_PLATFORMS = [
     "media_source",
     "recorder",
     "repairs",
-    "system_health",
     "trigger",
 ]
 
@@ -133,6 +135,11 @@ DATA_CUSTOM_COMPONENTS: HassKey[
     dict[str, Integration] | asyncio.Future[dict[str, Integration]]
 ] = HassKey("custom_components")
 DATA_PRELOAD_PLATFORMS: HassKey[list[str]] = HassKey("preload_platforms")
+DATA_PLATFORM_IMPORT_TIMES: HassKey[dict[str, float]] = HassKey("platform_import_times")
+DATA_INTEGRATION_CACHE: HassKey[_IntegrationCache] = HassKey("integration_cache")
+INTEGRATION_CACHE_STORAGE_KEY = "core.integration_cache"
+INTEGRATION_CACHE_STORAGE_VERSION = 1
+INTEGRATION_CACHE_SAVE_DELAY = 10
 PACKAGE_CUSTOM_COMPONENTS = "custom_components"
 PACKAGE_BUILTIN = "homeassistant.components"
 CUSTOM_WARNING = (
@@ -271,6 +278,7 @@ def async_setup(hass: HomeAssistant) -> None:
     hass.data[DATA_INTEGRATIONS] = {}
     hass.data[DATA_MISSING_PLATFORMS] = {}
     hass.data[DATA_PRELOAD_PLATFORMS] = BASE_PRELOAD_PLATFORMS.copy()
+    hass.data[DATA_PLATFORM_IMPORT_TIMES] = {}
 
 
 def manifest_from_legacy_module(domain: str, module: ModuleType) -> Manifest:
@@ -653,30 +661,24 @@ class Integration:
         cls, hass: HomeAssistant, root_module: ModuleType, domain: str
     ) -> Integration | None:
         """Resolve an integration from a root module."""
+        cache = hass.data.get(DATA_INTEGRATION_CACHE)
         for base in root_module.__path__:
-            manifest_path = pathlib.Path(base) / domain / "manifest.json"
-
-            if not manifest_path.is_file():
-                continue
+            file_path = pathlib.Path(base) / domain
 
-            try:
-                manifest = cast(Manifest, json_loads(manifest_path.read_text()))
-            except JSON_DECODE_EXCEPTIONS as err:
-                _LOGGER.error(
-                    "Error parsing manifest.json file at %s: %s", manifest_path, err
-                )
+            if cache is not None:
+                resolved = cache.resolve(file_path)
+            else:
+                resolved = _resolve_manifest(file_path)
+            if resolved is None:
                 continue
 
-            file_path = manifest_path.parent
-            # Avoid the listdir for virtual integrations
-            # as they cannot have any platforms
-            is_virtual = manifest.get("integration_type") == "virtual"
+            manifest, top_level_files = resolved
             integration = cls(
                 hass,
                 f"{root_module.__name__}.{domain}",
                 file_path,
                 manifest,
-                None if is_virtual else set(os.listdir(file_path)),
+                top_level_files,
             )
 
             if not integration.import_executor:
@@ -770,6 +772,7 @@ class Integration:
         self._import_futures: dict[str, asyncio.Future[ModuleType]] = {}
         self._cache = hass.data[DATA_COMPONENTS]
         self._missing_platforms_cache = hass.data[DATA_MISSING_PLATFORMS]
+        self._platform_import_times = hass.data[DATA_PLATFORM_IMPORT_TIMES]
         self._top_level_files = top_level_files or set()
         _LOGGER.info("Loaded %s from %s", self.domain, pkg_path)
 
@@ -948,6 +951,20 @@ class Integration:
             return self._all_dependencies_resolved
 
         self._all_dependencies_resolved = False
+        cache = self.hass.data.get(DATA_INTEGRATION_CACHE)
+        if (
+            cache is not None
+            and (
+                dependencies := await _async_cached_component_dependencies(
+                    self.hass, cache, self
+                )
+            )
+            is not None
+        ):
+            self._all_dependencies = dependencies
+            self._all_dependencies_resolved = True
+            return True
+
         try:
             dependencies = await _async_component_dependencies(self.hass, self)
         except IntegrationNotFound as err:
@@ -973,6 +990,8 @@ class Integration:
             dependencies.discard(self.domain)
             self._all_dependencies = dependencies
             self._all_dependencies_resolved = True
+            if cache is not None:
+                cache.async_set_dependencies(self, dependencies)
 
         return self._all_dependencies_resolved
 
@@ -1268,6 +1287,7 @@ class Integration:
         """
         full_name = f"{self.domain}.{platform_name}"
         cache = self.hass.data[DATA_COMPONENTS]
+        start = time.perf_counter()
         try:
             cache[full_name] = self._import_platform(platform_name)
         except ModuleNotFoundError:
@@ -1293,6 +1313,7 @@ class Integration:
                 f"Exception importing {self.pkg_path}.{platform_name}"
             ) from err
 
+        self._platform_import_times[full_name] = time.perf_counter() - start
         return cast(ModuleType, cache[full_name])
 
     def _import_platform(self, platform_name: str) -> ModuleType:
@@ -1308,6 +1329,18 @@ class Integration:
         return f"<Integration {self.domain}: {self.pkg_path}>"
 
 
+@callback
+def async_get_platform_import_timings(hass: HomeAssistant) -> dict[str, float]:
+    """Return the time it took to import each platform, slowest first."""
+    return dict(
+        sorted(
+            hass.data[DATA_PLATFORM_IMPORT_TIMES].items(),
+            key=lambda item: item[1],
+            reverse=True,
+        )
+    )
+
+
 def _version_blocked(
     integration_version: AwesomeVersion,
     blocked_integration: BlockedIntegration,
@@ -1322,6 +1355,184 @@ def _version_blocked(
     return True
 
 
+def _resolve_manifest(
+    file_path: pathlib.Path,
+) -> tuple[Manifest, set[str] | None] | None:
+    """Read the manifest and the top level files of an integration directory."""
+    manifest_path = file_path / "manifest.json"
+
+    if not manifest_path.is_file():
+        return None
+
+    try:
+        manifest = cast(Manifest, json_loads(manifest_path.read_text()))
+    except JSON_DECODE_EXCEPTIONS as err:
+        _LOGGER.error("Error parsing manifest.json file at %s: %s", manifest_path, err)
+        return None
+
+    # Avoid the listdir for virtual integrations
+    # as they cannot have any platforms
+    if manifest.get("integration_type") == "virtual":
+        return manifest, None
+    return manifest, set(os.listdir(file_path))
+
+
+class _IntegrationCache:
+    """Cache of resolved integrations which is persisted between restarts.
+
+    The manifest, the top level files and the resolved dependencies of
+    every integration directory are stored with the modification times of
+    the manifest and the directory, so a restart only has to stat the
+    directories of the integrations instead of reading and parsing their
+    manifests and listing their files. The whole cache is discarded when
+    the version of Home Assistant changes.
+
+    Integrations are resolved in the executor, so the cache is filled from
+    executor threads, while the dependencies are stored from the event loop.
+    """
+
+    def __init__(self, store: Store[dict[str, Any]], entries: dict[str, Any]) -> None:
+        """Initialize the cache."""
+        self._store = store
+        self._entries: dict[str, dict[str, Any]] = entries
+        # The fingerprints of the entries which were validated in this run
+        self._current: dict[str, str] = {}
+        self.hits = 0
+        self.misses = 0
+        self.resolve_time = 0.0
+
+    def resolve(
+        self, file_path: pathlib.Path
+    ) -> tuple[Manifest, set[str] | None] | None:
+        """Resolve the manifest and the top level files of an integration.
+
+        Runs in the executor.
+        """
+        start = time.monotonic()
+        key = str(file_path)
+        try:
+            # The directory is stat'ed before reading the manifest, so a
+            # change while reading invalidates the entry on the next start.
+            fingerprint = (
+                f"{os.stat(os.path.join(key, 'manifest.json')).st_mtime_ns}"
+                f":{os.stat(key).st_mtime_ns}"
+            )
+        except OSError:
+            self._entries.pop(key, None)
+            self.resolve_time += time.monotonic() - start
+            return None
+
+        if (entry := self._entries.get(key)) is not None and entry[
+            "fingerprint"
+        ] == fingerprint:
+            self.hits += 1
+            self._current[key] = fingerprint
+            top_level_files = entry["top_level_files"]
+            self.resolve_time += time.monotonic() - start
+            return (
+                cast(Manifest, dict(entry["manifest"])),
+                None if top_level_files is None else set(top_level_files),
+            )
+
+        self.misses += 1
+        if (resolved := _resolve_manifest(file_path)) is not None:
+            manifest, top_level_files = resolved
+            self._entries[key] = {
+                "fingerprint": fingerprint,
+                "manifest": dict(manifest),
+                "top_level_files": (
+                    None if top_level_files is None else sorted(top_level_files)
+                ),
+            }
+            self._current[key] = fingerprint
+        self.resolve_time += time.monotonic() - start
+        return resolved
+
+    def dependencies(self, integration: Integration) -> dict[str, str] | None:
+        """Return the cached dependencies of an integration.
+
+        The dependencies map the domains to the fingerprints of their
+        entries when the dependencies were resolved.
+        """
+        key = str(integration.file_path)
+        if key not in self._current:
+            return None
+        return self._entries[key].get("dependencies")
+
+    def fingerprint(self, integration: Integration) -> str | None:
+        """Return the fingerprint of an integration validated in this run."""
+        return self._current.get(str(integration.file_path))
+
+    @callback
+    def async_set_dependencies(
+        self, integration: Integration, dependencies: set[str]
+    ) -> None:
+        """Store the resolved dependencies of an integration."""
+        if (entry := self._entries.get(str(integration.file_path))) is None:
+            return
+        fingerprints: dict[str, str] = {}
+        for domain in dependencies:
+            if (dep_integration := self._loaded_integration(domain)) is None or (
+                fingerprint := self.fingerprint(dep_integration)
+            ) is None:
+                return
+            fingerprints[domain] = fingerprint
+        entry["dependencies"] = fingerprints
+        self._store.async_delay_save(self._data_to_save, INTEGRATION_CACHE_SAVE_DELAY)
+
+    def _loaded_integration(self, domain: str) -> Integration | None:
+        """Return an integration which is already loaded."""
+        try:
+            return async_get_loaded_integration(self._store.hass, domain)
+        except IntegrationNotLoaded:
+            return None
+
+    @callback
+    def async_save(self) -> None:
+        """Save the cache if integrations were resolved from disk."""
+        if self.misses:
+            self._store.async_delay_save(
+                self._data_to_save, INTEGRATION_CACHE_SAVE_DELAY
+            )
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data to save."""
+        return {"ha_version": HA_VERSION, "integrations": dict(self._entries)}
+
+
+async def async_load_integration_cache(hass: HomeAssistant) -> None:
+    """Load the cache of resolved integrations."""
+    # pylint: disable-next=import-outside-toplevel
+    from .helpers.storage import Store
+
+    store = Store[dict[str, Any]](
+        hass, INTEGRATION_CACHE_STORAGE_VERSION, INTEGRATION_CACHE_STORAGE_KEY
+    )
+    entries: dict[str, Any] = {}
+    if (data := await store.async_load()) and data.get("ha_version") == HA_VERSION:
+        entries = data["integrations"]
+    hass.data[DATA_INTEGRATION_CACHE] = _IntegrationCache(store, entries)
+
+
+@callback
+def async_save_integration_cache(hass: HomeAssistant) -> None:
+    """Save the cache of resolved integrations."""
+    if (cache := hass.data.get(DATA_INTEGRATION_CACHE)) is not None:
+        cache.async_save()
+
+
+@callback
+def async_describe_integration_cache(hass: HomeAssistant) -> str:
+    """Describe how the integrations were resolved for the startup timings."""
+    if (cache := hass.data.get(DATA_INTEGRATION_CACHE)) is None:
+        return "integration cache not loaded"
+    return (
+        f"{cache.hits + cache.misses} integration directories resolved in"
+        f" {cache.resolve_time:.2f}s, {cache.hits} from the integration cache"
+    )
+
+
 def _resolve_integrations_from_root(
     hass: HomeAssistant, root_module: ModuleType, domains: Iterable[str]
 ) -> dict[str, Integration]:
@@ -1662,6 +1873,25 @@ async def _async_component_dependencies(
     return loaded
 
 
+async def _async_cached_component_dependencies(
+    hass: HomeAssistant, cache: _IntegrationCache, integration: Integration
+) -> set[str] | None:
+    """Get the cached component dependencies.
+
+    The cached dependencies are only used if none of the integrations
+    they were resolved from changed.
+    """
+    if not (cached := cache.dependencies(integration)):
+        return None
+    for dep_integration in (await async_get_integrations(hass, cached)).values():
+        if (
+            not isinstance(dep_integration, Integration)
+            or cache.fingerprint(dep_integration) != cached[dep_integration.domain]
+        ):
+            return None
+    return set(cached)
+
+
 def _async_mount_config_dir(hass: HomeAssistant) -> None:
     """Mount config dir in order to load custom_component.
 
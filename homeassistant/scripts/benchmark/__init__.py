@@ -4,13 +4,19 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+from collections import deque
 from collections.abc import Callable
 from contextlib import suppress
+from datetime import timedelta
 import logging
+import os
+import tempfile
 from timeit import default_timer as timer
+from types import MappingProxyType
+import uuid
 
-from homeassistant import core
-from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant import config_entries, core, loader
+from homeassistant.const import EVENT_HOMEASSISTANT_STARTED, EVENT_STATE_CHANGED
 from homeassistant.helpers.entityfilter import convert_include_exclude_filter
 from homeassistant.helpers.event import (
     async_track_state_change,
@@ -223,6 +229,67 @@ async def state_changed_event_filter_helper(hass: core.HomeAssistant) -> float:
     return timer() - start
 
 
+async def _state_changed_listeners(
+    hass: core.HomeAssistant, keyed_listeners: bool
+) -> float:
+    """Fire 100k state changed events of 5k entities with 2k listeners."""
+    count = 0
+    events_to_fire = 10**5
+    entity_ids = [f"sensor.entity_{idx}" for idx in range(5000)]
+
+    @core.callback
+    def listener(*args):
+        """Handle event."""
+        nonlocal count
+        count += 1
+
+    for idx in range(2000):
+        entity_id = entity_ids[idx * 2]
+        if keyed_listeners:
+            hass.bus.async_listen_keyed(
+                EVENT_STATE_CHANGED, listener, entity_ids=[entity_id]
+            )
+            continue
+
+        @core.callback
+        def event_filter(event_data, entity_id=entity_id):
+            """Filter event."""
+            return event_data["entity_id"] == entity_id
+
+        hass.bus.async_listen(EVENT_STATE_CHANGED, listener, event_filter=event_filter)
+
+    old_state = core.State(entity_ids[0], "off")
+    new_state = core.State(entity_ids[0], "on")
+    events_data = [
+        {"entity_id": entity_id, "old_state": old_state, "new_state": new_state}
+        for entity_id in entity_ids
+    ]
+    size = len(events_data)
+
+    start = timer()
+
+    for i in range(events_to_fire):
+        hass.bus.async_fire(EVENT_STATE_CHANGED, events_data[i % size])  # type: ignore[misc]
+
+    await hass.async_block_till_done()
+
+    assert count == events_to_fire * 2000 // 5000
+
+    return timer() - start
+
+
+@benchmark
+async def state_changed_filtered_listeners(hass: core.HomeAssistant) -> float:
+    """Fire 100k state changed events through 2k filtered listeners."""
+    return await _state_changed_listeners(hass, False)
+
+
+@benchmark
+async def state_changed_keyed_listeners(hass: core.HomeAssistant) -> float:
+    """Fire 100k state changed events through 2k keyed listeners."""
+    return await _state_changed_listeners(hass, True)
+
+
 @benchmark
 async def filtering_entity_id(hass: core.HomeAssistant) -> float:
     """Run a 100k state changes through entity filter."""
@@ -308,3 +375,572 @@ async def json_serialize_states(hass: core.HomeAssistant) -> float:
     start = timer()
     JSON_DUMP(states)
     return timer() - start
+
+
+@benchmark
+async def mqtt_dispatch_wildcard_subscriptions(hass: core.HomeAssistant) -> float:
+    """Match 100k MQTT messages against 5k wildcard subscriptions."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.mqtt.client import Subscription, SubscriptionTrie
+
+    @core.callback
+    def listener(msg):
+        """Handle message."""
+
+    job = core.HassJob(listener)
+    trie = SubscriptionTrie()
+    for idx in range(5000):
+        if idx % 2:
+            topic = f"zigbee2mqtt/device_{idx}/+"
+        else:
+            topic = f"tasmota/discovery/{idx}/#"
+        trie.add(Subscription(topic, False, job))
+
+    topics = [
+        f"zigbee2mqtt/device_{idx}/set"
+        if idx % 2
+        else f"tasmota/discovery/{idx}/config"
+        for idx in range(5000)
+    ]
+    size = len(topics)
+    count = 0
+
+    start = timer()
+
+    for i in range(10**5):
+        count += len(trie.match(topics[i % size]))
+
+    assert count == 10**5
+
+    return timer() - start
+
+
+async def _compile_templates(hass: core.HomeAssistant, from_bytecode: bool) -> float:
+    """Compile 3000 templates."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers import template
+
+    sources = [
+        f"{{{{ states('sensor.power_{idx}') | float(0) * 2 "
+        f"if is_state('switch.outlet_{idx}', 'on') else 0 }}}}"
+        for idx in range(3000)
+    ]
+    template.COMPILED_TEMPLATE_CACHE.clear()
+    if from_bytecode:
+        # Save the code compiled by a previous run
+        for source in sources:
+            template.Template(source, hass).ensure_valid()
+        saved = template._encode_template_bytecode(  # noqa: SLF001
+            template.COMPILED_TEMPLATE_CACHE.dump()
+        )
+        template.COMPILED_TEMPLATE_CACHE.clear()
+        hass.data.clear()
+
+    start = timer()
+
+    if from_bytecode:
+        template.COMPILED_TEMPLATE_CACHE.load(
+            template._decode_template_bytecode(saved)  # noqa: SLF001
+        )
+    for source in sources:
+        template.Template(source, hass).ensure_valid()
+
+    return timer() - start
+
+
+@benchmark
+async def compile_templates(hass: core.HomeAssistant) -> float:
+    """Compile 3000 templates."""
+    return await _compile_templates(hass, False)
+
+
+@benchmark
+async def compile_templates_from_bytecode(hass: core.HomeAssistant) -> float:
+    """Load 3000 templates from the bytecode saved by a previous run."""
+    return await _compile_templates(hass, True)
+
+
+async def _recorder_state_writes(
+    hass: core.HomeAssistant, bulk_insert_states: bool
+) -> float:
+    """Record 100k state changes of 1000 entities."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components import recorder
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers import recorder as recorder_helper
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.setup import async_setup_component
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        hass.config.config_dir = tmpdir
+        hass.config_entries = config_entries.ConfigEntries(hass, {})
+        loader.async_setup(hass)
+        recorder_helper.async_initialize_recorder(hass)
+        assert await async_setup_component(
+            hass,
+            recorder.DOMAIN,
+            {
+                recorder.DOMAIN: {
+                    recorder.CONF_BULK_INSERT_STATES: bulk_insert_states,
+                    recorder.CONF_COMMIT_INTERVAL: 1,
+                }
+            },
+        )
+        hass.set_state(core.CoreState.running)
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_STARTED)
+        instance = recorder.get_instance(hass)
+        await instance.async_block_till_done()
+
+        start = timer()
+
+        for idx in range(10**5):
+            hass.states.async_set(
+                f"sensor.power_{idx % 1000}", str(idx), {"unit_of_measurement": "W"}
+            )
+            if idx % 1000 == 0:
+                await hass.async_block_till_done()
+        await instance.async_block_till_done()
+
+        runtime = timer() - start
+        await hass.async_stop()
+    return runtime
+
+
+@benchmark
+async def recorder_state_writes_orm(hass: core.HomeAssistant) -> float:
+    """Record 100k state changes through the ORM unit of work."""
+    return await _recorder_state_writes(hass, False)
+
+
+@benchmark
+async def recorder_state_writes_bulk_insert(hass: core.HomeAssistant) -> float:
+    """Record 100k state changes with multi row inserts."""
+    return await _recorder_state_writes(hass, True)
+
+
+async def _recorder_partitioned_states(
+    hass: core.HomeAssistant, partition_states: bool, purge: bool
+) -> float:
+    """Purge or query 10 days of states in a scratch PostgreSQL database.
+
+    The database server is read from BENCHMARK_RECORDER_DB_URL, the number
+    of states from BENCHMARK_RECORDER_STATES (1 million by default).
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from sqlalchemy import create_engine, text
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components import recorder
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.recorder import history
+    from homeassistant.components.recorder.db_schema import (  # pylint: disable=import-outside-toplevel
+        StatesMeta,
+    )
+    from homeassistant.components.recorder.partition import (  # pylint: disable=import-outside-toplevel
+        create_states_partitions,
+        states_partitions_between,
+    )
+    from homeassistant.components.recorder.purge import (  # pylint: disable=import-outside-toplevel
+        purge_old_data,
+    )
+    from homeassistant.components.recorder.util import (  # pylint: disable=import-outside-toplevel
+        session_scope,
+    )
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers import recorder as recorder_helper
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.setup import async_setup_component
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.util import dt as dt_util
+
+    server_url = os.environ["BENCHMARK_RECORDER_DB_URL"]
+    rows = int(os.environ.get("BENCHMARK_RECORDER_STATES", 10**6))
+    database = f"benchmark_{uuid.uuid4().hex}"
+    server_engine = create_engine(server_url, isolation_level="AUTOCOMMIT")
+    with server_engine.connect() as conn:
+        conn.execute(text(f"CREATE DATABASE {database}"))
+
+    now = dt_util.utcnow()
+    start = now - timedelta(days=10)
+    entity_id = "sensor.power"
+
+    def _fill_states(instance: recorder.Recorder) -> None:
+        with session_scope(session=instance.get_session()) as session:
+            if instance.use_states_partitions:
+                create_states_partitions(session, states_partitions_between(start, now))
+            states_meta = StatesMeta(entity_id=entity_id)
+            session.add(states_meta)
+            session.flush()
+            session.execute(
+                text(
+                    "INSERT INTO states (state, last_updated_ts, metadata_id)"
+                    " SELECT n::text, :start_ts + n * :step, :metadata_id"
+                    " FROM generate_series(1, :rows) AS n"
+                ),
+                {
+                    "start_ts": start.timestamp(),
+                    "step": (now - start).total_seconds() / (rows + 1),
+                    "metadata_id": states_meta.metadata_id,
+                    "rows": rows,
+                },
+            )
+            session.execute(text("ANALYZE states"))
+
+    def _purge(instance: recorder.Recorder) -> None:
+        while not purge_old_data(instance, now - timedelta(days=5), repack=False):
+            pass
+
+    def _query_history() -> None:
+        history.get_significant_states(hass, now - timedelta(hours=1), now, [entity_id])
+
+    try:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            hass.config.config_dir = tmpdir
+            hass.config_entries = config_entries.ConfigEntries(hass, {})
+            loader.async_setup(hass)
+            recorder_helper.async_initialize_recorder(hass)
+            assert await async_setup_component(
+                hass,
+                recorder.DOMAIN,
+                {
+                    recorder.DOMAIN: {
+                        recorder.CONF_DB_URL: str(
+                            server_engine.url.set(database=database)
+                        ),
+                        recorder.CONF_AUTO_PURGE: False,
+                        recorder.CONF_PARTITION_STATES: partition_states,
+                    }
+                },
+            )
+            hass.set_state(core.CoreState.running)
+            hass.bus.async_fire(EVENT_HOMEASSISTANT_STARTED)
+            instance = recorder.get_instance(hass)
+            await instance.async_block_till_done()
+            await instance.async_add_executor_job(_fill_states, instance)
+
+            start_timer = timer()
+            if purge:
+                await instance.async_add_executor_job(_purge, instance)
+            else:
+                await instance.async_add_executor_job(_query_history)
+            runtime = timer() - start_timer
+            await hass.async_stop()
+    finally:
+        with server_engine.connect() as conn:
+            conn.execute(text(f"DROP DATABASE IF EXISTS {database}"))
+        server_engine.dispose()
+    return runtime
+
+
+@benchmark
+async def recorder_purge_states_rows(hass: core.HomeAssistant) -> float:
+    """Purge half of the states by deleting the rows."""
+    return await _recorder_partitioned_states(hass, False, True)
+
+
+@benchmark
+async def recorder_purge_states_partitions(hass: core.HomeAssistant) -> float:
+    """Purge half of the states by dropping the daily partitions."""
+    return await _recorder_partitioned_states(hass, True, True)
+
+
+@benchmark
+async def recorder_history_states_rows(hass: core.HomeAssistant) -> float:
+    """Query the last hour of states from the states table."""
+    return await _recorder_partitioned_states(hass, False, False)
+
+
+@benchmark
+async def recorder_history_states_partitions(hass: core.HomeAssistant) -> float:
+    """Query the last hour of states from the partitioned states table."""
+    return await _recorder_partitioned_states(hass, True, False)
+
+
+async def _statistics_characteristics(
+    hass: core.HomeAssistant, sample_buffer: bool
+) -> float:
+    """Update five characteristics of a 10k samples window 1000 times."""
+    # pylint: disable-next=import-outside-toplevel
+    import statistics
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.statistics import sensor as statistics_sensor
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.statistics.buffer import SampleBuffer
+
+    size = 10**4
+    samples = SampleBuffer(size, order_statistics=True)
+    states: deque[float] = deque(maxlen=size)
+    ages: deque[float] = deque(maxlen=size)
+    for idx in range(size):
+        samples.append(float(idx % 97), float(idx))
+        states.append(float(idx % 97))
+        ages.append(float(idx))
+    characteristics = (
+        statistics_sensor._stat_mean,  # noqa: SLF001
+        statistics_sensor._stat_median,  # noqa: SLF001
+        statistics_sensor._stat_percentile,  # noqa: SLF001
+        statistics_sensor._stat_noisiness,  # noqa: SLF001
+        statistics_sensor._stat_average_linear,  # noqa: SLF001
+    )
+
+    start = timer()
+
+    for idx in range(size, size + 1000):
+        value = float(idx % 89)
+        if sample_buffer:
+            samples.append(value, float(idx))
+            for characteristic in characteristics:
+                characteristic(samples, 95)
+            continue
+        # The characteristics as they were calculated from the deques
+        states.append(value)
+        ages.append(float(idx))
+        statistics.mean(states)
+        statistics.median(states)
+        statistics.quantiles(states, n=100, method="exclusive")[94]
+        sum(abs(j - i) for i, j in zip(list(states), list(states)[1:], strict=False))
+        area: float = 0
+        for i in range(1, len(states)):
+            area += 0.5 * (states[i] + states[i - 1]) * (ages[i] - ages[i - 1])
+
+    return timer() - start
+
+
+@benchmark
+async def statistics_characteristics_deque(hass: core.HomeAssistant) -> float:
+    """Calculate statistics characteristics over deques of 10k samples."""
+    return await _statistics_characteristics(hass, False)
+
+
+@benchmark
+async def statistics_characteristics_sample_buffer(hass: core.HomeAssistant) -> float:
+    """Calculate statistics characteristics from a sample buffer of 10k samples."""
+    return await _statistics_characteristics(hass, True)
+
+
+@benchmark
+async def websocket_subscribe_entities(hass: core.HomeAssistant) -> float:
+    """Send 50k state changes to 40 subscribe_entities connections."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.auth.models import RefreshToken, User
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.websocket_api import commands, const
+    from homeassistant.components.websocket_api.connection import (  # pylint: disable=import-outside-toplevel
+        ActiveConnection,
+    )
+
+    count = 0
+
+    def send_message(message):
+        nonlocal count
+        count += 1
+
+    logger = logging.getLogger(__name__)
+    schema = commands.handle_subscribe_entities._ws_schema  # noqa: SLF001
+    # The connections are only used to subscribe, no command handlers are needed
+    hass.data[const.DOMAIN] = {}
+    for idx in range(40):
+        user = User(name=f"User {idx}", perm_lookup=None, is_owner=True)
+        refresh_token = RefreshToken(user, None, timedelta(minutes=30))
+        connection = ActiveConnection(logger, hass, send_message, user, refresh_token)
+        msg = {"id": 1, "type": "subscribe_entities"}
+        if idx % 2:
+            # Dashboards which show a few entities
+            msg["entity_ids"] = [f"sensor.power_{idx * 10 + num}" for num in range(10)]
+        commands.handle_subscribe_entities(hass, connection, schema(msg))
+    await hass.async_block_till_done()
+    count = 0
+
+    start = timer()
+
+    for idx in range(50000):
+        hass.states.async_set(f"sensor.power_{idx % 1000}", str(idx))
+
+    assert count == 50000 * 20 + 50000 * 20 // 100
+    return timer() - start
+
+
+@benchmark
+async def statistics_unit_conversion(hass: core.HomeAssistant) -> float:
+    """Convert a year of 5-minute statistics from Wh to kWh."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.recorder import statistics
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.util.unit_conversion import EnergyConverter
+
+    count = 365 * 24 * 12
+    db_rows = [
+        (1, 1700000000.0 + idx * 300, idx * 0.5, idx * 0.25, idx * 1.0, idx * 2.0)
+        for idx in range(count)
+    ]
+    row_mapping = (("mean", 2), ("min", 3), ("max", 4), ("sum", 5))
+    convert = EnergyConverter.converter_factory_batch("Wh", "kWh")
+
+    start = timer()
+
+    stats = statistics._build_converted_stats(  # noqa: SLF001
+        db_rows,  # type: ignore[arg-type]
+        300,
+        1,
+        row_mapping,
+        convert,
+    )
+
+    assert len(stats) == count
+    return timer() - start
+
+
+@benchmark
+async def track_time_pattern_listeners(hass: core.HomeAssistant) -> float:
+    """Attach, fire 60 times and detach 1000 time pattern listeners."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers import event
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.util import dt as dt_util
+
+    count = 0
+
+    @core.callback
+    def listener(now):
+        nonlocal count
+        count += 1
+
+    # Time pattern automations mostly use a few distinct patterns
+    patterns = [(None, f"/{idx % 30 + 1}", 0) for idx in range(1000)]
+
+    start = timer()
+
+    unsubs = [
+        event.async_track_utc_time_change(hass, listener, *pattern)
+        for pattern in patterns
+    ]
+    # Fire all patterns the way their loop timers do when they match
+    tracks = hass.data[event._TRACK_UTC_TIME_CHANGE_DATA]  # noqa: SLF001
+    for _ in range(60):
+        now = dt_util.utcnow()
+        for track in list(tracks.values()):
+            track._pattern_time_change_listener(now)  # noqa: SLF001
+    for unsub in unsubs:
+        unsub()
+
+    assert count == 60000
+    return timer() - start
+
+
+@benchmark
+async def add_entities(hass: core.HomeAssistant) -> float:
+    """Add 10k entities of 1000 devices to a config entry platform."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers import device_registry as dr, entity_registry as er
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers.entity import Entity
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers.entity_platform import EntityPlatform
+
+    class BenchmarkEntity(Entity):
+        """Entity without state updates."""
+
+        _attr_should_poll = False
+
+        def __init__(self, idx: int) -> None:
+            """Initialize the entity."""
+            self._attr_name = f"Power {idx}"
+            self._attr_unique_id = f"power_{idx}"
+            self._attr_device_info = dr.DeviceInfo(
+                identifiers={("benchmark", f"device_{idx // 10}")},
+                manufacturer="Benchmark",
+                name=f"Device {idx // 10}",
+            )
+
+    # Registering entities logs every new entity
+    logging.getLogger(er.__name__).setLevel(logging.WARNING)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        hass.config.config_dir = tmpdir
+        hass.config_entries = config_entries.ConfigEntries(hass, {})
+        loader.async_setup(hass)
+        await dr.async_load(hass)
+        await er.async_load(hass)
+        config_entry = config_entries.ConfigEntry(
+            data={},
+            discovery_keys=MappingProxyType({}),
+            domain="benchmark",
+            minor_version=1,
+            options={},
+            source=config_entries.SOURCE_USER,
+            subentries_data=None,
+            title="Benchmark",
+            unique_id=None,
+            version=1,
+        )
+        hass.config_entries._entries[config_entry.entry_id] = config_entry  # noqa: SLF001
+        platform = EntityPlatform(
+            hass=hass,
+            logger=logging.getLogger(__name__),
+            domain="sensor",
+            platform_name="benchmark",
+            platform=None,
+            scan_interval=timedelta(seconds=30),
+            entity_namespace=None,
+        )
+        platform.config_entry = config_entry
+        entities = [BenchmarkEntity(idx) for idx in range(10**4)]
+
+        start = timer()
+
+        await platform.async_add_entities(entities)
+
+        runtime = timer() - start
+        assert len(hass.states.async_entity_ids()) == 10**4
+        await hass.async_stop()
+    return runtime
+
+
+@benchmark
+async def restore_state_dumps(hass: core.HomeAssistant) -> float:
+    """Dump the states of 8000 restore entities 20 times with 5% changes."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers import restore_state
+
+    class BenchmarkRestoreEntity:
+        """Restore entity without extra data."""
+
+        extra_restore_state_data = None
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        hass.config.config_dir = tmpdir
+        data = restore_state.async_get(hass)
+        entity_ids = [f"sensor.power_{idx}" for idx in range(8000)]
+        attributes = {
+            "unit_of_measurement": "W",
+            "device_class": "power",
+            "state_class": "measurement",
+            "friendly_name": "Power",
+        }
+        for entity_id in entity_ids:
+            hass.states.async_set(entity_id, "0", attributes)
+            data.entities[entity_id] = BenchmarkRestoreEntity()  # type: ignore[assignment]
+
+        start = timer()
+
+        for dump in range(20):
+            for entity_id in entity_ids[dump::20]:
+                hass.states.async_set(entity_id, str(dump), attributes)
+            await data.async_dump_states()
+
+        runtime = timer() - start
+        await hass.async_stop()
+    return runtime
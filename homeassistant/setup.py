@@ -10,9 +10,10 @@ import contextvars
 from enum import StrEnum
 from functools import partial
 import logging.handlers
+from operator import attrgetter
 import time
 from types import ModuleType
-from typing import Any, Final, TypedDict
+from typing import Any, Final, NamedTuple, TypedDict
 
 from . import config as conf_util, core, loader, requirements
 from .const import (
@@ -72,6 +73,10 @@ DATA_SETUP_TIME: HassKey[
     defaultdict[str, defaultdict[str | None, defaultdict[SetupPhases, float]]]
 ] = HassKey("setup_time")
 
+# DATA_SETUP_TRACE is a list of the spans of time, such as setup phases and
+# waits for dependencies, spent setting up integrations during startup.
+DATA_SETUP_TRACE: HassKey[list[SetupTraceSpan]] = HassKey("setup_trace")
+
 DATA_DEPS_REQS: HassKey[set[str]] = HassKey("deps_reqs_processed")
 
 DATA_PERSISTENT_ERRORS: HassKey[dict[str, str | None]] = HassKey(
@@ -337,7 +342,8 @@ async def _async_setup_component(
     # Some integrations fail on import because they call functions incorrectly.
     # So we do it before validating config to catch these errors.
     try:
-        component = await integration.async_get_component()
+        with async_trace_setup(hass, domain, TRACE_IMPORT_COMPONENT):
+            component = await integration.async_get_component()
     except ImportError as err:
         log_error(f"Unable to import component: {err}", err)
         return False
@@ -574,13 +580,16 @@ async def async_process_deps_reqs(
     elif integration.domain in processed:
         return
 
-    if failed_deps := await _async_process_dependencies(hass, config, integration):
+    with async_trace_setup(hass, integration.domain, TRACE_WAIT_DEPENDENCIES):
+        failed_deps = await _async_process_dependencies(hass, config, integration)
+    if failed_deps:
         raise DependencyError(failed_deps)
 
     async with hass.timeout.async_freeze(integration.domain):
-        await requirements.async_get_integration_with_requirements(
-            hass, integration.domain
-        )
+        with async_trace_setup(hass, integration.domain, TRACE_REQUIREMENTS):
+            await requirements.async_get_integration_with_requirements(
+                hass, integration.domain
+            )
 
     processed.add(integration.domain)
 
@@ -719,6 +728,9 @@ def async_pause_setup(hass: core.HomeAssistant, phase: SetupPhases) -> Generator
         integration, group = running
         # Add negative time for the time we waited
         _setup_times(hass)[integration][group][phase] = -time_taken
+        _setup_trace(hass).append(
+            SetupTraceSpan(integration, group, phase, started, started + time_taken)
+        )
         _LOGGER.debug(
             "Adding wait for %s for %s (%s) of %.2f",
             phase,
@@ -736,6 +748,52 @@ def _setup_times(
     return defaultdict(lambda: defaultdict(lambda: defaultdict(float)))
 
 
+class SetupTraceSpan(NamedTuple):
+    """A span of time spent setting up an integration during startup."""
+
+    integration: str
+    group: str | None
+    name: str
+    start: float
+    end: float
+
+
+TRACE_IMPORT_COMPONENT: Final = "import_component"
+TRACE_REQUIREMENTS: Final = "requirements"
+TRACE_WAIT_DEPENDENCIES: Final = "wait_dependencies"
+
+
+@singleton.singleton(DATA_SETUP_TRACE)
+def _setup_trace(hass: core.HomeAssistant) -> list[SetupTraceSpan]:
+    """Return the setup trace list."""
+    return []
+
+
+@contextlib.contextmanager
+def async_trace_setup(
+    hass: core.HomeAssistant,
+    integration: str,
+    name: str,
+    group: str | None = None,
+) -> Generator[None]:
+    """Record a span of the startup trace.
+
+    Like the setup times, nothing is recorded once Home Assistant is
+    running or stopping.
+    """
+    if hass.is_stopping or hass.state is core.CoreState.running:
+        yield
+        return
+
+    started = time.monotonic()
+    try:
+        yield
+    finally:
+        _setup_trace(hass).append(
+            SetupTraceSpan(integration, group, name, started, time.monotonic())
+        )
+
+
 @contextlib.contextmanager
 def async_start_setup(
     hass: core.HomeAssistant,
@@ -782,6 +840,9 @@ def async_start_setup(
         # We may see the phase multiple times if there are multiple
         # platforms, but we only care about the longest time.
         group_setup_times[phase] = max(group_setup_times[phase], time_taken)
+        _setup_trace(hass).append(
+            SetupTraceSpan(integration, group, phase, started, started + time_taken)
+        )
         if group is None:
             _LOGGER.info(
                 "Setup of domain %s took %.2f seconds", integration, time_taken
@@ -828,3 +889,9 @@ def async_get_domain_setup_times(
 ) -> Mapping[str | None, dict[SetupPhases, float]]:
     """Return timing data for each integration."""
     return _setup_times(hass).get(domain, {})
+
+
+@callback
+def async_get_setup_trace(hass: core.HomeAssistant) -> list[SetupTraceSpan]:
+    """Return the spans recorded while setting up integrations, oldest first."""
+    return sorted(_setup_trace(hass), key=attrgetter("start"))
@@ -74,6 +74,7 @@ from homeassistant.helpers import (
     entity_registry as er,
     event,
     floor_registry as fr,
+    integration_platform,
     intent,
     issue_registry as ir,
     label_registry as lr,
@@ -1515,6 +1516,9 @@ async def flush_store(store: storage.Store) -> None:
 
 async def get_system_health_info(hass: HomeAssistant, domain: str) -> dict[str, Any]:
     """Get system health info."""
+    await integration_platform.async_process_lazy_integration_platforms(
+        hass, "system_health"
+    )
     return await hass.data["system_health"][domain].info_callback(hass)
 
 
@@ -1931,6 +1931,48 @@ async def test_extraction_functions_unavailable_automation(hass: HomeAssistant)
     assert automation.labels_in_automation(hass, entity_id) == []
 
 
+async def test_extraction_functions_reload(
+    hass: HomeAssistant, hass_admin_user: MockUser
+) -> None:
+    """Test extraction functions are updated when automations are reloaded."""
+
+    def _config(alias: str, entity_id: str) -> dict[str, Any]:
+        return {
+            DOMAIN: {
+                "alias": alias,
+                "trigger": {"platform": "event", "event_type": "test_event"},
+                "action": {
+                    "action": "test.script",
+                    "target": {"entity_id": entity_id},
+                },
+            }
+        }
+
+    assert await async_setup_component(hass, DOMAIN, _config("hello", "light.first"))
+    assert automation.automations_with_entity(hass, "light.first") == [
+        "automation.hello"
+    ]
+    assert automation.automations_with_entity(hass, "light.second") == []
+
+    with patch(
+        "homeassistant.config.load_yaml_config_file",
+        autospec=True,
+        return_value=_config("bye", "light.second"),
+    ):
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_RELOAD,
+            context=Context(user_id=hass_admin_user.id),
+            blocking=True,
+        )
+        await hass.async_block_till_done()
+
+    assert automation.automations_with_entity(hass, "light.first") == []
+    assert automation.automations_with_entity(hass, "light.second") == [
+        "automation.bye"
+    ]
+
+
 async def test_extraction_functions(
     hass: HomeAssistant, device_registry: dr.DeviceRegistry
 ) -> None:
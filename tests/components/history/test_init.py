@@ -1,12 +1,15 @@
 """The tests the History component."""
 
+import asyncio
 from datetime import datetime, timedelta
 from http import HTTPStatus
 import json
-from unittest.mock import sentinel
+import threading
+from unittest.mock import patch, sentinel
 
 from freezegun import freeze_time
 import pytest
+from sqlalchemy.exc import SQLAlchemyError
 
 from homeassistant.components import history
 from homeassistant.components.recorder import Recorder
@@ -450,6 +453,138 @@ async def test_fetch_period_api_with_minimal_response(
     ).replace('"', "")
 
 
+@pytest.mark.parametrize(
+    "params", ["", "&minimal_response&no_attributes", "&skip_initial_state"]
+)
+async def test_fetch_period_api_stream(
+    hass: HomeAssistant,
+    recorder_mock: Recorder,
+    hass_client: ClientSessionGenerator,
+    params: str,
+) -> None:
+    """Test the fetch period view streams the same states as it returns.
+
+    The streamed entities are in the order of the database.
+    """
+    now = dt_util.utcnow()
+    await async_setup_component(hass, "history", {})
+    hass.states.async_set("light.kitchen", "on", {"brightness": 10})
+    hass.states.async_set("sensor.power", 0, {"attr": "any"})
+    await async_wait_recording_done(hass)
+    hass.states.async_set("sensor.power", 50, {"attr": "any"})
+    hass.states.async_set("light.kitchen", "off")
+    await async_wait_recording_done(hass)
+    client = await hass_client()
+
+    url = (
+        f"/api/history/period/{now.isoformat()}"
+        "?filter_entity_id=sensor.power,light.unknown,light.kitchen,sensor.power"
+        f"{params}"
+    )
+    response = await client.get(url)
+    assert response.status == HTTPStatus.OK
+    expected = await response.json()
+    assert len(expected) == 2
+
+    response = await client.get(f"{url}&stream")
+    assert response.status == HTTPStatus.OK
+    assert response.headers["Content-Type"] == "application/json"
+    streamed = await response.json()
+    assert sorted(streamed, key=lambda states: states[0]["entity_id"]) == sorted(
+        expected, key=lambda states: states[0]["entity_id"]
+    )
+
+    # No states at all
+    response = await client.get(
+        f"/api/history/period/{now.isoformat()}?filter_entity_id=light.unknown&stream"
+    )
+    assert response.status == HTTPStatus.OK
+    assert await response.json() == []
+
+
+async def test_fetch_period_api_stream_many_entities(
+    hass: HomeAssistant,
+    recorder_mock: Recorder,
+    hass_client: ClientSessionGenerator,
+) -> None:
+    """Test the fetch period view streams the states of many entities."""
+    now = dt_util.utcnow()
+    await async_setup_component(hass, "history", {})
+    entity_ids = [f"sensor.power_{idx}" for idx in range(10)]
+    for entity_id in entity_ids:
+        hass.states.async_set(entity_id, 0)
+    await async_wait_recording_done(hass)
+    client = await hass_client()
+
+    response = await client.get(
+        f"/api/history/period/{now.isoformat()}"
+        f"?filter_entity_id={','.join(entity_ids)}&stream"
+    )
+    assert response.status == HTTPStatus.OK
+    assert sorted(states[0]["entity_id"] for states in await response.json()) == (
+        entity_ids
+    )
+
+
+async def test_fetch_period_api_stream_does_not_wait_on_client(
+    hass: HomeAssistant,
+    recorder_mock: Recorder,
+) -> None:
+    """Test the states are read from the database without waiting on the client."""
+    now = dt_util.utcnow()
+    entity_ids = [f"sensor.power_{idx}" for idx in range(10)]
+    for entity_id in entity_ids:
+        hass.states.async_set(entity_id, 0)
+    await async_wait_recording_done(hass)
+
+    queue: asyncio.Queue[bytes | None] = asyncio.Queue()
+    await recorder_mock.async_add_executor_job(
+        history.HistoryPeriodView()._stream_significant_states_json,
+        hass,
+        queue,
+        threading.Event(),
+        now,
+        dt_util.utcnow(),
+        entity_ids,
+        True,
+        True,
+        False,
+        False,
+    )
+    await hass.async_block_till_done()
+
+    chunks = [queue.get_nowait() for _ in range(queue.qsize())]
+    assert chunks[-1] is None
+    assert (
+        sorted(json.loads(chunk)[0]["entity_id"] for chunk in chunks[:-1] if chunk)
+        == entity_ids
+    )
+
+
+async def test_fetch_period_api_stream_database_error(
+    hass: HomeAssistant,
+    recorder_mock: Recorder,
+    hass_client: ClientSessionGenerator,
+) -> None:
+    """Test a database error fails the stream before the response is sent."""
+    now = dt_util.utcnow()
+    await async_setup_component(hass, "history", {})
+    hass.states.async_set("sensor.power", 0)
+    await async_wait_recording_done(hass)
+    client = await hass_client()
+
+    with patch.object(
+        history.history,
+        "iter_significant_states_with_session",
+        side_effect=SQLAlchemyError,
+    ):
+        response = await client.get(
+            f"/api/history/period/{now.isoformat()}"
+            "?filter_entity_id=sensor.power&stream"
+        )
+    assert response.status == HTTPStatus.INTERNAL_SERVER_ERROR
+
+
 async def test_fetch_period_api_with_no_timestamp(
     hass: HomeAssistant, recorder_mock: Recorder, hass_client: ClientSessionGenerator
 ) -> None:
@@ -4,7 +4,8 @@ import asyncio
 from collections.abc import Callable
 from datetime import datetime, timedelta
 from http import HTTPStatus
-from unittest.mock import Mock
+from typing import Any
+from unittest.mock import Mock, patch
 
 from freezegun import freeze_time
 import pytest
@@ -16,8 +17,14 @@ from homeassistant.components import logbook, recorder
 # pylint: disable-next=hass-component-root-import
 from homeassistant.components.alexa.smart_home import EVENT_ALEXA_SMART_HOME
 from homeassistant.components.automation import EVENT_AUTOMATION_TRIGGERED
+from homeassistant.components.logbook.helpers import async_determine_event_types
+from homeassistant.components.logbook import processor
 from homeassistant.components.logbook.models import EventAsRow, LazyEventPartialState
-from homeassistant.components.logbook.processor import EventProcessor
+from homeassistant.components.logbook.processor import (
+    EntityNameCache,
+    EventProcessor,
+    events_to_json_array,
+)
 from homeassistant.components.logbook.queries.common import PSEUDO_EVENT_STATE_CHANGED
 from homeassistant.components.recorder import Recorder
 from homeassistant.components.script import EVENT_SCRIPT_STARTED
@@ -46,6 +53,7 @@ from homeassistant.helpers import device_registry as dr, entity_registry as er
 from homeassistant.helpers.entityfilter import CONF_ENTITY_GLOBS
 from homeassistant.setup import async_setup_component
 from homeassistant.util import dt as dt_util
+from homeassistant.util.json import json_loads
 
 from .common import MockRow, mock_humanify
 
@@ -781,6 +789,95 @@ async def test_logbook_entity_no_longer_in_state_machine(
     assert json_dict[0]["name"] == "area 001"
 
 
+@pytest.mark.usefixtures("recorder_mock")
+async def test_iter_events_to_json_array(hass: HomeAssistant) -> None:
+    """Test the events are converted to JSON one at a time."""
+    await async_setup_component(hass, "logbook", {})
+    await async_wait_recording_done(hass)
+
+    start = dt_util.utcnow()
+    for state in (STATE_OFF, STATE_ON, STATE_OFF):
+        hass.states.async_set("light.kitchen", state, {ATTR_FRIENDLY_NAME: "Kitchen"})
+    await async_wait_recording_done(hass)
+    end = dt_util.utcnow()
+
+    def _get_events(entity_ids: list[str]) -> tuple[bytes, dict | None]:
+        event_processor = EventProcessor(
+            hass,
+            async_determine_event_types(hass, entity_ids, None),
+            entity_ids,
+            timestamp=True,
+        )
+        return events_to_json_array(event_processor.iter_events(start, end))
+
+    instance = recorder.get_instance(hass)
+    events_json, last_event = await instance.async_add_executor_job(
+        _get_events, ["light.kitchen"]
+    )
+    events = json_loads(events_json)
+    assert [(event["entity_id"], event["state"]) for event in events] == [
+        ("light.kitchen", STATE_ON),
+        ("light.kitchen", STATE_OFF),
+    ]
+    assert events[0]["name"] == "Kitchen"
+    assert last_event == events[-1]
+
+    assert await instance.async_add_executor_job(
+        _get_events, ["light.does_not_exist"]
+    ) == (b"[]", None)
+
+
+@pytest.mark.usefixtures("recorder_mock")
+@pytest.mark.parametrize(
+    ("context_lookup_size", "context_entity_id"),
+    [(processor.CONTEXT_LOOKUP_SIZE, "switch.origin"), (2, None)],
+)
+async def test_iter_events_context_lookup_size(
+    hass: HomeAssistant, context_lookup_size: int, context_entity_id: str | None
+) -> None:
+    """Test entries are not augmented once the origin of their context is evicted."""
+    await async_setup_component(hass, "logbook", {})
+    await async_wait_recording_done(hass)
+
+    for entity_id in ("switch.origin", "light.first", "light.second", "light.kitchen"):
+        hass.states.async_set(entity_id, STATE_OFF)
+    await async_wait_recording_done(hass)
+
+    start = dt_util.utcnow()
+    context = ha.Context()
+    hass.states.async_set("switch.origin", STATE_ON, context=context)
+    hass.states.async_set("light.first", STATE_ON)
+    hass.states.async_set("light.second", STATE_ON)
+    hass.states.async_set("light.kitchen", STATE_ON, context=context)
+    await async_wait_recording_done(hass)
+    end = dt_util.utcnow()
+
+    def _get_events() -> list[dict[str, Any]]:
+        with patch.object(processor, "CONTEXT_LOOKUP_SIZE", context_lookup_size):
+            event_processor = EventProcessor(
+                hass, async_determine_event_types(hass, None, None)
+            )
+        return list(event_processor.iter_events(start, end))
+
+    events = await recorder.get_instance(hass).async_add_executor_job(_get_events)
+    assert events[-1]["entity_id"] == "light.kitchen"
+    assert events[-1].get("context_entity_id") == context_entity_id
+
+
+async def test_entity_name_cache(hass: HomeAssistant) -> None:
+    """Test the entity name cache also caches names of missing entities."""
+    entity_name_cache = EntityNameCache(hass)
+    hass.states.async_set("light.kitchen", STATE_ON, {ATTR_FRIENDLY_NAME: "Kitchen"})
+    assert entity_name_cache.get("light.kitchen") == "Kitchen"
+    assert entity_name_cache.get("light.living_room") == "living room"
+
+    hass.states.async_set(
+        "light.living_room", STATE_ON, {ATTR_FRIENDLY_NAME: "Living Room"}
+    )
+    assert entity_name_cache.get("light.living_room") == "living room"
+    assert EntityNameCache(hass).get("light.living_room") == "Living Room"
+
+
 @pytest.mark.usefixtures("recorder_mock", "set_utc")
 async def test_filter_continuous_sensor_values(
     hass: HomeAssistant,
@@ -13,7 +13,11 @@ import paho.mqtt.client as paho_mqtt
 import pytest
 
 from homeassistant.components import mqtt
-from homeassistant.components.mqtt.client import RECONNECT_INTERVAL_SECONDS
+from homeassistant.components.mqtt.client import (
+    RECONNECT_INTERVAL_SECONDS,
+    Subscription,
+    SubscriptionTrie,
+)
 from homeassistant.components.mqtt.const import SUPPORTED_COMPONENTS
 from homeassistant.components.mqtt.models import MessageCallbackType, ReceiveMessage
 from homeassistant.config_entries import ConfigEntryDisabler, ConfigEntryState
@@ -23,7 +27,13 @@ from homeassistant.const import (
     EVENT_HOMEASSISTANT_STOP,
     UnitOfTemperature,
 )
-from homeassistant.core import CALLBACK_TYPE, CoreState, HomeAssistant, callback
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    CoreState,
+    HassJob,
+    HomeAssistant,
+    callback,
+)
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.util.dt import utcnow
 
@@ -2183,3 +2193,70 @@ async def test_loop_write_failure(
     await hass.async_block_till_done()
 
     assert "Error returned from MQTT server: The connection was lost." in caplog.text
+
+
+def _trie_subscription(topic: str) -> Subscription:
+    """Return a wildcard subscription for the subscription trie tests."""
+    return Subscription(topic, False, HassJob(lambda msg: None))
+
+
+@pytest.mark.parametrize(
+    ("topic_filter", "topic", "matches"),
+    [
+        ("test-topic/+/on", "test-topic/bier/on", True),
+        ("test-topic/+/on", "test-topic/bier", False),
+        ("test-topic/+/on", "test-topic/bier/on/off", False),
+        ("test-topic/#", "test-topic", True),
+        ("test-topic/#", "test-topic/bier/on", True),
+        ("test-topic/#", "test-topic-123", False),
+        ("+/+", "test-topic/bier", True),
+        ("+/+", "test-topic", False),
+        ("+/#", "test-topic", True),
+        ("#", "test-topic/bier/on", True),
+        ("#", "$sys/broker/uptime", False),
+        ("+/broker/uptime", "$sys/broker/uptime", False),
+        ("$sys/#", "$sys/broker/uptime", True),
+        ("$sys/+/uptime", "$sys/broker/uptime", True),
+        ("test-topic/+/on", "test-topic//on", True),
+    ],
+)
+def test_subscription_trie_match(topic_filter: str, topic: str, matches: bool) -> None:
+    """Test matching topics against the wildcard subscription trie."""
+    trie = SubscriptionTrie()
+    subscription = _trie_subscription(topic_filter)
+    trie.add(subscription)
+    assert (trie.match(topic) == [subscription]) is matches
+
+
+def test_subscription_trie_multiple_matches_and_remove() -> None:
+    """Test the subscription trie with overlapping filters and removal."""
+    trie = SubscriptionTrie()
+    level = _trie_subscription("zigbee2mqtt/+/set")
+    level_duplicate = _trie_subscription("zigbee2mqtt/+/set")
+    subtree = _trie_subscription("zigbee2mqtt/#")
+    other = _trie_subscription("tasmota/+/state")
+    for subscription in (level, level_duplicate, subtree, other):
+        trie.add(subscription)
+
+    assert set(trie.match("zigbee2mqtt/lamp/set")) == {
+        level,
+        level_duplicate,
+        subtree,
+    }
+    assert trie.match("tasmota/plug/state") == [other]
+    assert trie.has_topic("zigbee2mqtt/+/set")
+    assert not trie.has_topic("zigbee2mqtt/+")
+
+    trie.remove(level)
+    assert set(trie.match("zigbee2mqtt/lamp/set")) == {level_duplicate, subtree}
+    trie.remove(level_duplicate)
+    assert not trie.has_topic("zigbee2mqtt/+/set")
+    assert trie.match("zigbee2mqtt/lamp/set") == [subtree]
+
+    with pytest.raises(KeyError):
+        trie.remove(level)
+
+    trie.remove(subtree)
+    trie.remove(other)
+    assert trie.match("zigbee2mqtt/lamp/set") == []
+    assert trie.match("tasmota/plug/state") == []
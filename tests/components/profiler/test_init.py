@@ -18,6 +18,7 @@ from homeassistant.components.profiler import (
     CONF_ENABLED,
     CONF_SECONDS,
     SERVICE_DUMP_LOG_OBJECTS,
+    SERVICE_DUMP_STARTUP_TRACE,
     SERVICE_LOG_CURRENT_TASKS,
     SERVICE_LOG_EVENT_LOOP_SCHEDULED,
     SERVICE_LOG_THREAD_FRAMES,
@@ -34,7 +35,9 @@ from homeassistant.components.profiler.const import DOMAIN
 from homeassistant.const import CONF_SCAN_INTERVAL, CONF_TYPE
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.setup import SetupPhases, SetupTraceSpan, _setup_trace
 from homeassistant.util import dt as dt_util
+from homeassistant.util.json import load_json
 
 from tests.common import MockConfigEntry, async_fire_time_changed
 
@@ -70,6 +73,94 @@ async def test_basic_usage(hass: HomeAssistant, tmp_path: Path) -> None:
     await hass.async_block_till_done()
 
 
+async def test_dump_startup_trace(hass: HomeAssistant, tmp_path: Path) -> None:
+    """Test we can write the startup trace in the Chrome trace event format."""
+    test_dir = tmp_path / "traces"
+    test_dir.mkdir()
+
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert hass.services.has_service(DOMAIN, SERVICE_DUMP_STARTUP_TRACE)
+
+    _setup_trace(hass).extend(
+        [
+            SetupTraceSpan("august", None, SetupPhases.SETUP, 10.0, 10.5),
+            SetupTraceSpan("bootstrap", None, "stage 2", 9.5, 12.0),
+            SetupTraceSpan(
+                "august", "entry_id", SetupPhases.CONFIG_ENTRY_SETUP, 11, 12
+            ),
+        ]
+    )
+
+    last_filename = None
+
+    def _mock_path(filename: str) -> str:
+        nonlocal last_filename
+        last_filename = str(test_dir / filename)
+        return last_filename
+
+    with patch.object(hass.config, "path", _mock_path):
+        await hass.services.async_call(
+            DOMAIN, SERVICE_DUMP_STARTUP_TRACE, {}, blocking=True
+        )
+
+    trace = load_json(last_filename)
+    assert trace["traceEvents"] == [
+        {
+            "name": "thread_name",
+            "ph": "M",
+            "pid": 1,
+            "tid": 1,
+            "args": {"name": "bootstrap"},
+        },
+        {
+            "name": "stage 2",
+            "cat": "bootstrap",
+            "ph": "X",
+            "pid": 1,
+            "tid": 1,
+            "ts": 0,
+            "dur": 2500000,
+            "args": {"group": None},
+        },
+        {
+            "name": "thread_name",
+            "ph": "M",
+            "pid": 1,
+            "tid": 2,
+            "args": {"name": "august"},
+        },
+        {
+            "name": "setup",
+            "cat": "august",
+            "ph": "X",
+            "pid": 1,
+            "tid": 2,
+            "ts": 500000,
+            "dur": 500000,
+            "args": {"group": None},
+        },
+        {
+            "name": "config_entry_setup",
+            "cat": "august",
+            "ph": "X",
+            "pid": 1,
+            "tid": 2,
+            "ts": 1500000,
+            "dur": 1000000,
+            "args": {"group": "entry_id"},
+        },
+    ]
+    assert "platform_import_times" in trace["otherData"]
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+
 async def test_memory_usage(hass: HomeAssistant, tmp_path: Path) -> None:
     """Test we can setup and the service is registered."""
     test_dir = tmp_path / "profiles"
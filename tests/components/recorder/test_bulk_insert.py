@@ -0,0 +1,158 @@
+"""The tests for the recorder bulk insert pipeline."""
+
+from __future__ import annotations
+
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from homeassistant.components.recorder import CONF_BULK_INSERT_STATES, get_instance
+from homeassistant.components.recorder.bulk_insert import StatesBulkInserter
+from homeassistant.components.recorder.db_schema import (
+    StateAttributes,
+    States,
+    StatesMeta,
+)
+from homeassistant.components.recorder.util import session_scope
+from homeassistant.core import HomeAssistant
+
+from .common import async_wait_recording_done
+
+from tests.typing import RecorderInstanceContextManager, RecorderInstanceGenerator
+
+
+@pytest.fixture
+async def mock_recorder_before_hass(
+    async_test_recorder: RecorderInstanceContextManager,
+) -> None:
+    """Set up recorder."""
+
+
+def _fetch_states(hass: HomeAssistant) -> dict[str, list[tuple[Any, ...]]]:
+    """Return the recorded states per entity in the order of their state_id."""
+    with session_scope(hass=hass, read_only=True) as session:
+        state_by_id: dict[int, str | None] = {}
+        states: dict[str, list[tuple[Any, ...]]] = {}
+        for db_state, shared_attrs, entity_id in (
+            session.query(States, StateAttributes.shared_attrs, StatesMeta.entity_id)
+            .outerjoin(
+                StateAttributes, States.attributes_id == StateAttributes.attributes_id
+            )
+            .outerjoin(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+            .order_by(States.state_id)
+        ):
+            state_by_id[db_state.state_id] = db_state.state
+            states.setdefault(entity_id, []).append(
+                (
+                    db_state.state,
+                    shared_attrs,
+                    state_by_id[db_state.old_state_id]
+                    if db_state.old_state_id
+                    else None,
+                )
+            )
+        return states
+
+
+@pytest.mark.parametrize("bulk_insert_states", [True, False])
+async def test_bulk_insert_matches_orm_path(
+    hass: HomeAssistant,
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    bulk_insert_states: bool,
+) -> None:
+    """Test the bulk insert path writes the same rows as the ORM path."""
+    instance = await async_setup_recorder_instance(
+        hass, {CONF_BULK_INSERT_STATES: bulk_insert_states}
+    )
+    assert isinstance(instance.states_bulk_inserter, StatesBulkInserter) is (
+        bulk_insert_states
+    )
+
+    for idx in range(3):
+        hass.states.async_set("sensor.power", str(idx), {"unit": "W"})
+        hass.states.async_set("sensor.energy", str(idx * 10), {"unit": "kWh"})
+    hass.states.async_set("light.kitchen", "on", {"unit": "W"})
+    hass.states.async_remove("light.kitchen")
+    hass.states.async_set("light.kitchen", "on", {"unit": "W"})
+    hass.states.async_set("light.short_lived", "on")
+    hass.states.async_remove("light.short_lived")
+    await async_wait_recording_done(hass)
+
+    # Also write states referencing states of the previous commit
+    hass.states.async_set("sensor.power", "3", {"unit": "W"})
+    hass.states.async_set("light.kitchen", "off", {"unit": "W"})
+    await async_wait_recording_done(hass)
+
+    assert _fetch_states(hass) == {
+        "sensor.power": [
+            ("0", '{"unit":"W"}', None),
+            ("1", '{"unit":"W"}', "0"),
+            ("2", '{"unit":"W"}', "1"),
+            ("3", '{"unit":"W"}', "2"),
+        ],
+        "sensor.energy": [
+            ("0", '{"unit":"kWh"}', None),
+            ("10", '{"unit":"kWh"}', "0"),
+            ("20", '{"unit":"kWh"}', "10"),
+        ],
+        "light.kitchen": [
+            ("on", '{"unit":"W"}', None),
+            (None, "{}", "on"),
+            ("on", '{"unit":"W"}', None),
+            ("off", '{"unit":"W"}', "on"),
+        ],
+        "light.short_lived": [
+            ("on", "{}", None),
+            (None, "{}", "on"),
+        ],
+    }
+
+    with session_scope(hass=hass, read_only=True) as session:
+        assert session.query(StatesMeta).count() == 4
+        assert session.query(StateAttributes).count() == 3
+
+
+async def test_bulk_insert_resolves_ids_from_database(
+    hass: HomeAssistant,
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+) -> None:
+    """Test ids missing from the caches are resolved from the database."""
+    instance = await async_setup_recorder_instance(
+        hass, {CONF_BULK_INSERT_STATES: True}
+    )
+    hass.states.async_set("sensor.power", "1", {"unit": "W"})
+    await async_wait_recording_done(hass)
+
+    # Forget the cached ids to force resolving them in bulk
+    instance.states_meta_manager.reset()
+    instance.state_attributes_manager.reset()
+    instance.states_manager.reset()
+
+    hass.states.async_set("sensor.power", "2", {"unit": "W"})
+    hass.states.async_set("sensor.other", "2", {"unit": "W"})
+    await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        assert session.query(StatesMeta).count() == 2
+        assert session.query(StateAttributes).count() == 1
+        assert session.query(States).count() == 3
+
+
+async def test_bulk_insert_not_supported(
+    hass: HomeAssistant,
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test the ORM path is used when the database does not support bulk inserts."""
+    with patch.object(StatesBulkInserter, "is_supported", return_value=False):
+        instance = await async_setup_recorder_instance(
+            hass, {CONF_BULK_INSERT_STATES: True}
+        )
+    assert instance.states_bulk_inserter is None
+    assert "states will be written one row at a time" in caplog.text
+
+    hass.states.async_set("sensor.power", "1", {"unit": "W"})
+    await async_wait_recording_done(hass)
+    assert get_instance(hass).states_bulk_inserter is None
+    assert len(_fetch_states(hass)) == 1
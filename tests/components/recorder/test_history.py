@@ -5,7 +5,8 @@ from __future__ import annotations
 from copy import copy
 from datetime import datetime, timedelta
 import json
-from unittest.mock import sentinel
+from typing import Any
+from unittest.mock import patch, sentinel
 
 from freezegun import freeze_time
 import pytest
@@ -19,7 +20,10 @@ from homeassistant.components.recorder.db_schema import (
 )
 from homeassistant.components.recorder.filters import Filters
 from homeassistant.components.recorder.models import process_timestamp
-from homeassistant.components.recorder.util import session_scope
+from homeassistant.components.recorder.util import (
+    session_scope,
+    stream_stmt_lambda_element,
+)
 from homeassistant.core import HomeAssistant, State
 from homeassistant.helpers.json import JSONEncoder
 from homeassistant.util import dt as dt_util
@@ -637,6 +641,72 @@ async def test_get_significant_states_are_ordered(
     assert list(hist.keys()) == entity_ids
 
 
+@pytest.mark.parametrize("minimal_response", [True, False])
+@pytest.mark.parametrize("compressed_state_format", [True, False])
+async def test_iter_significant_states_with_session(
+    hass: HomeAssistant, minimal_response: bool, compressed_state_format: bool
+) -> None:
+    """Test the states of each entity are yielded as the rows are streamed."""
+    zero, four, states = record_states(hass)
+    await async_wait_recording_done(hass)
+    entity_ids = [*states, "sensor.not_recorded"]
+
+    def _as_dicts(
+        states: list[State | dict[str, Any]],
+    ) -> list[dict[str, Any]]:
+        return [
+            state.as_dict() if isinstance(state, State) else state for state in states
+        ]
+
+    with session_scope(hass=hass, read_only=True) as session:
+        expected = history.get_significant_states_with_session(
+            hass,
+            session,
+            zero,
+            four,
+            entity_ids,
+            minimal_response=minimal_response,
+            compressed_state_format=compressed_state_format,
+        )
+        with patch(
+            "homeassistant.components.recorder.history.modern.stream_stmt_lambda_element",
+            wraps=stream_stmt_lambda_element,
+        ) as stream_mock:
+            streamed = history.iter_significant_states_with_session(
+                hass,
+                session,
+                zero,
+                four,
+                entity_ids,
+                minimal_response=minimal_response,
+                compressed_state_format=compressed_state_format,
+            )
+            assert stream_mock.call_count == 1
+        yielded = {entity_id: _as_dicts(states) for entity_id, states in streamed}
+
+    assert yielded == {
+        entity_id: _as_dicts(states) for entity_id, states in expected.items()
+    }
+
+
+async def test_iter_significant_states_with_session_no_matches(
+    hass: HomeAssistant,
+) -> None:
+    """Test nothing is yielded when the entities are not in the database."""
+    now = dt_util.utcnow()
+    with session_scope(hass=hass, read_only=True) as session:
+        assert (
+            list(
+                history.iter_significant_states_with_session(
+                    hass, session, now, None, ["nonexistent.entity"]
+                )
+            )
+            == []
+        )
+        with pytest.raises(ValueError, match="entity_ids must be provided"):
+            history.iter_significant_states_with_session(hass, session, now)
+
+
 async def test_get_significant_states_only(
     hass: HomeAssistant,
 ) -> None:
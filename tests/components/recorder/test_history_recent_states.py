@@ -0,0 +1,240 @@
+"""The tests for the recent history cache of the recorder."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from functools import partial
+from unittest.mock import patch
+
+from freezegun.api import FrozenDateTimeFactory
+import pytest
+
+from homeassistant.components.recorder import (
+    CONF_RECENT_HISTORY_WINDOW,
+    get_instance,
+    history,
+)
+from homeassistant.components.recorder.db_schema import States
+from homeassistant.components.recorder.history.recent_states import (
+    MIN_STATES_TO_TRIM,
+    RecentStatesCache,
+)
+from homeassistant.components.recorder.purge import purge_old_data
+from homeassistant.core import HomeAssistant, State
+from homeassistant.util import dt as dt_util
+
+from .common import async_wait_recording_done
+
+from tests.typing import RecorderInstanceContextManager, RecorderInstanceGenerator
+
+ENTITY_IDS = ["sensor.power", "climate.living_room", "light.kitchen"]
+
+
+@pytest.fixture
+async def mock_recorder_before_hass(
+    async_test_recorder: RecorderInstanceContextManager,
+) -> None:
+    """Set up recorder."""
+
+
+async def _async_record_states(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Record state and attribute changes of a few entities."""
+    for idx in range(5):
+        freezer.tick(timedelta(minutes=10))
+        hass.states.async_set("sensor.power", str(idx % 3), {"unit": "W"})
+        hass.states.async_set(
+            "climate.living_room", "heat", {"current_temperature": 18 + idx}
+        )
+        freezer.tick(timedelta(minutes=1))
+        hass.states.async_set("sensor.power", str(idx % 3), {"unit": "kW"})
+        if idx == 2:
+            hass.states.async_set("light.kitchen", "on")
+        if idx == 3:
+            hass.states.async_remove("light.kitchen")
+        await async_wait_recording_done(hass)
+
+
+def _get_significant_states(hass: HomeAssistant, **kwargs) -> dict[str, list]:
+    """Return the significant states as dicts."""
+    return {
+        entity_id: [
+            state.as_dict() if isinstance(state, State) else state for state in states
+        ]
+        for entity_id, states in history.get_significant_states(hass, **kwargs).items()
+    }
+
+
+def _get_significant_states_from_database(
+    hass: HomeAssistant, **kwargs
+) -> dict[str, list]:
+    """Return the significant states without using the recent states cache."""
+    instance = get_instance(hass)
+    with patch.object(instance, "recent_states_cache", None):
+        return _get_significant_states(hass, **kwargs)
+
+
+@pytest.mark.parametrize("significant_changes_only", [True, False])
+@pytest.mark.parametrize("minimal_response", [True, False])
+@pytest.mark.parametrize("no_attributes", [True, False])
+@pytest.mark.parametrize("compressed_state_format", [True, False])
+async def test_recent_states_cache_matches_database(
+    hass: HomeAssistant,
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    freezer: FrozenDateTimeFactory,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+    compressed_state_format: bool,
+) -> None:
+    """Test queries served from the cache return the same states as the database."""
+    instance = await async_setup_recorder_instance(
+        hass, {CONF_RECENT_HISTORY_WINDOW: {"days": 1}}
+    )
+    assert isinstance(instance.recent_states_cache, RecentStatesCache)
+    start = dt_util.utcnow()
+    await _async_record_states(hass, freezer)
+    end = dt_util.utcnow()
+
+    for start_time, end_time, entity_ids in (
+        (start + timedelta(minutes=35), None, ENTITY_IDS),
+        (start + timedelta(minutes=35), end - timedelta(minutes=10), ENTITY_IDS),
+        (start + timedelta(minutes=15), None, ["sensor.power"]),
+        # Starting at the exact time a state was recorded
+        (start + timedelta(minutes=21), None, ["climate.living_room"]),
+    ):
+        kwargs = {
+            "start_time": start_time,
+            "end_time": end_time,
+            "entity_ids": entity_ids,
+            "significant_changes_only": significant_changes_only,
+            "minimal_response": minimal_response,
+            "no_attributes": no_attributes,
+            "compressed_state_format": compressed_state_format,
+        }
+        # The database must not be queried for the states
+        with patch(
+            "homeassistant.components.recorder.history.modern.execute_stmt_lambda_element",
+            side_effect=AssertionError,
+        ):
+            cached = await instance.async_add_executor_job(
+                partial(_get_significant_states, hass, **kwargs)
+            )
+        assert cached == await instance.async_add_executor_job(
+            partial(_get_significant_states_from_database, hass, **kwargs)
+        )
+
+
+async def test_recent_states_cache_falls_back_to_database(
+    hass: HomeAssistant,
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test queries which are not fully in the cache are served from the database."""
+    instance = await async_setup_recorder_instance(
+        hass, {CONF_RECENT_HISTORY_WINDOW: {"days": 1}}
+    )
+    start = dt_util.utcnow()
+    await _async_record_states(hass, freezer)
+    end = dt_util.utcnow()
+
+    for start_time, entity_ids in (
+        # Before the cache was started
+        (start - timedelta(minutes=10), ["sensor.power"]),
+        # Before the first state of the light, the start state is unknown
+        (start + timedelta(minutes=25), ["sensor.power", "light.kitchen"]),
+        # Entity that was never recorded
+        (start + timedelta(minutes=25), ["sensor.power", "sensor.unknown"]),
+    ):
+        with patch.object(
+            RecentStatesCache, "get_rows", wraps=instance.recent_states_cache.get_rows
+        ) as get_rows_mock:
+            states = await instance.async_add_executor_job(
+                partial(
+                    _get_significant_states,
+                    hass,
+                    start_time=start_time,
+                    end_time=end,
+                    entity_ids=entity_ids,
+                )
+            )
+        assert states
+        assert get_rows_mock.call_count == 1
+        assert states == await instance.async_add_executor_job(
+            partial(
+                _get_significant_states_from_database,
+                hass,
+                start_time=start_time,
+                end_time=end,
+                entity_ids=entity_ids,
+            )
+        )
+
+
+async def test_recent_states_cache_disabled_by_default(
+    hass: HomeAssistant,
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+) -> None:
+    """Test the cache is only used when a window is configured."""
+    instance = await async_setup_recorder_instance(hass)
+    assert instance.recent_states_cache is None
+
+
+async def test_recent_states_cache_purge(
+    hass: HomeAssistant,
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test purged states are dropped from the cache."""
+    instance = await async_setup_recorder_instance(
+        hass, {CONF_RECENT_HISTORY_WINDOW: {"days": 1}}
+    )
+    start = dt_util.utcnow()
+    await _async_record_states(hass, freezer)
+    end = dt_util.utcnow()
+    purge_before = start + timedelta(minutes=34)
+
+    assert await instance.async_add_executor_job(
+        purge_old_data, instance, purge_before, False
+    )
+    # The states at the start time were purged from the database
+    # and the cache so the database is queried
+    start_time = start + timedelta(minutes=35)
+    states = await instance.async_add_executor_job(
+        partial(
+            _get_significant_states,
+            hass,
+            start_time=start_time,
+            end_time=end,
+            entity_ids=ENTITY_IDS,
+        )
+    )
+    assert states == await instance.async_add_executor_job(
+        partial(
+            _get_significant_states_from_database,
+            hass,
+            start_time=start_time,
+            end_time=end,
+            entity_ids=ENTITY_IDS,
+        )
+    )
+    assert states["sensor.power"][0]["last_updated"] > purge_before.isoformat()
+
+
+def test_recent_states_cache_trims_window() -> None:
+    """Test states that are older than the window are trimmed."""
+    cache = RecentStatesCache(100, 0)
+    metadata_id = 1
+    for ts in range(1, 1000):
+        state = States(state=str(ts), last_updated_ts=ts, metadata_id=metadata_id)
+        cache.add_pending(state, "{}")
+        cache.post_commit_pending(ts)
+
+    # Only states that cover the window are kept
+    rows = cache.get_rows([metadata_id], 949.5, None, True, True, [], True)
+    assert rows is not None
+    assert [row.state for row in rows] == [str(ts) for ts in range(949, 1000)]
+    assert rows[0].last_updated_ts == 0
+    assert cache.get_rows([metadata_id], 800, None, True, True, [], True) is None
+    assert len(cache._entities[metadata_id].states) < 100 + MIN_STATES_TO_TRIM + 2
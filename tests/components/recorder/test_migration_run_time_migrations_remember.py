@@ -101,6 +101,7 @@ def _create_engine_test(
                 "entity_id_migration": (2, 1),
                 "event_id_post_migration": (1, 1),
                 "entity_id_post_migration": (0, 1),
+                "statistics_rollup": (1, 1),
             },
             [
                 "ix_states_context_id",
@@ -117,6 +118,7 @@ def _create_engine_test(
                 "entity_id_migration": (2, 1),
                 "event_id_post_migration": (0, 0),
                 "entity_id_post_migration": (0, 1),
+                "statistics_rollup": (1, 1),
             },
             [
                 "ix_states_context_id",
@@ -133,6 +135,7 @@ def _create_engine_test(
                 "entity_id_migration": (2, 1),
                 "event_id_post_migration": (0, 0),
                 "entity_id_post_migration": (0, 1),
+                "statistics_rollup": (1, 1),
             },
             ["ix_states_entity_id_last_updated_ts"],
         ),
@@ -145,6 +148,7 @@ def _create_engine_test(
                 "entity_id_migration": (2, 1),
                 "event_id_post_migration": (0, 0),
                 "entity_id_post_migration": (0, 1),
+                "statistics_rollup": (1, 1),
             },
             ["ix_states_entity_id_last_updated_ts"],
         ),
@@ -157,6 +161,7 @@ def _create_engine_test(
                 "entity_id_migration": (0, 0),
                 "event_id_post_migration": (0, 0),
                 "entity_id_post_migration": (0, 0),
+                "statistics_rollup": (1, 1),
             },
             [],
         ),
@@ -169,6 +174,7 @@ def _create_engine_test(
                 "entity_id_migration": (0, 0),
                 "event_id_post_migration": (0, 0),
                 "entity_id_post_migration": (0, 0),
+                "statistics_rollup": (0, 0),
             },
             [],
         ),
@@ -205,6 +211,7 @@ async def test_data_migrator_logic(
         "entity_id_migration": migrator_mock(),
         "event_id_post_migration": migrator_mock(),
         "entity_id_post_migration": migrator_mock(),
+        "statistics_rollup": migrator_mock(),
     }
 
     def patch_check(
@@ -232,12 +239,14 @@ async def test_data_migrator_logic(
         patch_check("entity_id_migration", migration.EntityIDMigration),
         patch_check("event_id_post_migration", migration.EventIDPostMigration),
         patch_check("entity_id_post_migration", migration.EntityIDPostMigration),
+        patch_check("statistics_rollup", migration.StatisticsRollupMigration),
         patch_migrate("state_context_id_as_binary", migration.StatesContextIDMigration),
         patch_migrate("event_context_id_as_binary", migration.EventsContextIDMigration),
         patch_migrate("event_type_id_migration", migration.EventTypeIDMigration),
         patch_migrate("entity_id_migration", migration.EntityIDMigration),
         patch_migrate("event_id_post_migration", migration.EventIDPostMigration),
         patch_migrate("entity_id_post_migration", migration.EntityIDPostMigration),
+        patch_migrate("statistics_rollup", migration.StatisticsRollupMigration),
         patch(
             CREATE_ENGINE_TARGET,
             new=_create_engine_test(
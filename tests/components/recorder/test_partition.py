@@ -0,0 +1,305 @@
+"""The tests for the partitioned states table."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+
+from homeassistant.components.recorder import CONF_PARTITION_STATES
+from homeassistant.components.recorder.db_schema import (
+    StateAttributes,
+    States,
+    StatesMeta,
+)
+from homeassistant.components.recorder.migration import (
+    _restore_foreign_key_constraints,
+    migrate_states_to_partitions,
+)
+from homeassistant.components.recorder.partition import (
+    STATES_DEFAULT_PARTITION,
+    STATES_PARTITION_DAYS_AHEAD,
+    StatesPartition,
+    create_states_partitions,
+    create_upcoming_states_partitions,
+    get_states_partitions,
+    states_partitions_between,
+    states_table_is_partitioned,
+)
+from homeassistant.components.recorder.purge import purge_old_data
+from homeassistant.components.recorder.util import periodic_db_cleanups, session_scope
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from .common import async_wait_recording_done
+
+from tests.typing import RecorderInstanceContextManager, RecorderInstanceGenerator
+
+
+@pytest.fixture
+async def mock_recorder_before_hass(
+    async_test_recorder: RecorderInstanceContextManager,
+) -> None:
+    """Set up recorder."""
+
+
+def _fetch_states(hass: HomeAssistant) -> list[tuple[str, str | None, str | None]]:
+    """Return the recorded states with the state they replaced."""
+    with session_scope(hass=hass, read_only=True) as session:
+        state_by_id: dict[int, str | None] = {}
+        states: list[tuple[str, str | None, str | None]] = []
+        for db_state, entity_id in (
+            session.query(States, StatesMeta.entity_id)
+            .outerjoin(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+            .order_by(States.state_id)
+        ):
+            state_by_id[db_state.state_id] = db_state.state
+            states.append(
+                (
+                    entity_id,
+                    db_state.state,
+                    state_by_id.get(db_state.old_state_id)
+                    if db_state.old_state_id
+                    else None,
+                )
+            )
+        return states
+
+
+def test_states_partitions_between() -> None:
+    """Test the daily partitions are aligned on UTC days."""
+    start = datetime(2024, 2, 27, 23, 30, tzinfo=dt_util.get_time_zone("Europe/Paris"))
+    end = datetime(2024, 3, 1, 0, 0, tzinfo=dt_util.UTC)
+
+    assert states_partitions_between(start, end) == [
+        StatesPartition(
+            "states_p20240227",
+            datetime(2024, 2, 27, tzinfo=dt_util.UTC).timestamp(),
+            datetime(2024, 2, 28, tzinfo=dt_util.UTC).timestamp(),
+        ),
+        StatesPartition(
+            "states_p20240228",
+            datetime(2024, 2, 28, tzinfo=dt_util.UTC).timestamp(),
+            datetime(2024, 2, 29, tzinfo=dt_util.UTC).timestamp(),
+        ),
+        StatesPartition(
+            "states_p20240229",
+            datetime(2024, 2, 29, tzinfo=dt_util.UTC).timestamp(),
+            datetime(2024, 3, 1, tzinfo=dt_util.UTC).timestamp(),
+        ),
+    ]
+    assert states_partitions_between(end, end) == []
+
+
+@pytest.mark.skip_on_db_engine(["mysql", "postgresql"])
+@pytest.mark.usefixtures("skip_by_db_engine")
+async def test_partition_states_requires_postgresql(
+    hass: HomeAssistant,
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test the states table is not partitioned with other databases."""
+    instance = await async_setup_recorder_instance(hass, {CONF_PARTITION_STATES: True})
+
+    hass.states.async_set("sensor.power", "1")
+    await async_wait_recording_done(hass)
+
+    assert instance.use_states_partitions is False
+    assert "only supported with PostgreSQL" in caplog.text
+    assert _fetch_states(hass) == [("sensor.power", "1", None)]
+
+
+@pytest.mark.skip_on_db_engine(["sqlite", "mysql"])
+@pytest.mark.usefixtures("skip_by_db_engine")
+async def test_migrate_states_to_partitions(
+    hass: HomeAssistant,
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+) -> None:
+    """Test the recorded states survive the conversion to partitions."""
+    instance = await async_setup_recorder_instance(hass)
+    for idx in range(3):
+        hass.states.async_set("sensor.power", str(idx))
+    hass.states.async_set("sensor.energy", "10")
+    await async_wait_recording_done(hass)
+    states_before = _fetch_states(hass)
+
+    await instance.async_add_executor_job(
+        migrate_states_to_partitions, instance, instance.get_session
+    )
+    instance.use_states_partitions = True
+
+    def _check_partitions() -> list[StatesPartition]:
+        with session_scope(hass=hass, read_only=True) as session:
+            assert states_table_is_partitioned(session)
+            return get_states_partitions(session)
+
+    now = dt_util.utcnow()
+    partitions = await instance.async_add_executor_job(_check_partitions)
+    assert partitions[0].start_ts <= now.timestamp()
+    assert (
+        partitions[-1].end_ts
+        >= (now + timedelta(days=STATES_PARTITION_DAYS_AHEAD)).timestamp()
+    )
+    assert _fetch_states(hass) == states_before
+
+    hass.states.async_set("sensor.power", "3")
+    await async_wait_recording_done(hass)
+
+    assert _fetch_states(hass) == [*states_before, ("sensor.power", "3", "2")]
+
+    # The self referencing foreign key is not restored by later migrations
+    await instance.async_add_executor_job(
+        _restore_foreign_key_constraints,
+        instance.get_session,
+        instance.engine,
+        [("states", "old_state_id", "states", "state_id")],
+    )
+
+
+def _count_states(hass: HomeAssistant, table: str) -> int:
+    """Return the number of states in a table or partition."""
+    with session_scope(hass=hass, read_only=True) as session:
+        return session.execute(
+            text(f"SELECT count(*) FROM {table}")  # noqa: S608
+        ).scalar()
+
+
+@pytest.mark.skip_on_db_engine(["sqlite", "mysql"])
+@pytest.mark.usefixtures("skip_by_db_engine")
+async def test_migrate_skewed_states_to_partitions(
+    hass: HomeAssistant,
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+) -> None:
+    """Test states outside of the daily partitions go to the default partition."""
+    instance = await async_setup_recorder_instance(hass)
+    hass.states.async_set("sensor.power", "now")
+    await async_wait_recording_done(hass)
+
+    now = dt_util.utcnow()
+    past_ts = (now - timedelta(days=365)).timestamp()
+    future_ts = (now + timedelta(days=30)).timestamp()
+
+    def _add_skewed_states() -> None:
+        with session_scope(hass=hass) as session:
+            states_meta = StatesMeta(entity_id="sensor.skewed")
+            session.add(states_meta)
+            session.flush()
+            session.add_all(
+                States(
+                    state=state,
+                    last_updated_ts=last_updated_ts,
+                    metadata_id=states_meta.metadata_id,
+                )
+                for state, last_updated_ts in (("past", past_ts), ("future", future_ts))
+            )
+
+    await instance.async_add_executor_job(_add_skewed_states)
+    states_before = _fetch_states(hass)
+
+    await instance.async_add_executor_job(
+        migrate_states_to_partitions, instance, instance.get_session
+    )
+
+    assert _fetch_states(hass) == states_before
+    assert _count_states(hass, STATES_DEFAULT_PARTITION) == 2
+    with session_scope(hass=hass, read_only=True) as session:
+        partitions = get_states_partitions(session)
+    assert partitions[0].start_ts > past_ts
+    assert partitions[-1].end_ts < future_ts
+
+    # Creating the partition of the future state moves it out of the
+    # default partition
+    def _create_future_partitions() -> None:
+        with session_scope(hass=hass) as session:
+            create_upcoming_states_partitions(
+                session, dt_util.utc_from_timestamp(future_ts)
+            )
+
+    await instance.async_add_executor_job(_create_future_partitions)
+
+    future_partition = states_partitions_between(
+        dt_util.utc_from_timestamp(future_ts), dt_util.utc_from_timestamp(future_ts)
+    )
+    assert _count_states(hass, STATES_DEFAULT_PARTITION) == 1
+    assert _count_states(hass, future_partition[0].name) == 1
+    assert _fetch_states(hass) == states_before
+
+    hass.states.async_set("sensor.power", "later")
+    await async_wait_recording_done(hass)
+    assert _fetch_states(hass) == [*states_before, ("sensor.power", "later", "now")]
+
+
+async def test_periodic_db_cleanups_partition_error(
+    hass: HomeAssistant,
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test an error creating the partitions does not abort the cleanups."""
+    instance = await async_setup_recorder_instance(hass)
+    instance.use_states_partitions = True
+
+    with patch(
+        "homeassistant.components.recorder.util.create_upcoming_states_partitions",
+        side_effect=SQLAlchemyError,
+    ) as create_partitions:
+        await instance.async_add_executor_job(periodic_db_cleanups, instance)
+
+    instance.use_states_partitions = False
+    assert len(create_partitions.mock_calls) == 1
+    assert "Error creating the states partitions" in caplog.text
+
+
+@pytest.mark.skip_on_db_engine(["sqlite", "mysql"])
+@pytest.mark.usefixtures("skip_by_db_engine")
+async def test_purge_drops_states_partitions(
+    hass: HomeAssistant,
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+) -> None:
+    """Test purging drops the partitions older than purge_before."""
+    instance = await async_setup_recorder_instance(hass, {CONF_PARTITION_STATES: True})
+    assert instance.use_states_partitions is True
+
+    now = dt_util.utcnow()
+    old_partition = states_partitions_between(
+        now - timedelta(days=10), now - timedelta(days=9)
+    )[0]
+
+    def _add_old_states() -> None:
+        with session_scope(hass=hass) as session:
+            create_states_partitions(session, [old_partition])
+            states_meta = StatesMeta(entity_id="sensor.old_power")
+            state_attributes = StateAttributes(shared_attrs="{}", hash=1234)
+            session.add_all([states_meta, state_attributes])
+            session.flush()
+            session.add(
+                States(
+                    state="purgeme",
+                    last_updated_ts=old_partition.start_ts + 60,
+                    metadata_id=states_meta.metadata_id,
+                    attributes_id=state_attributes.attributes_id,
+                )
+            )
+
+    await instance.async_add_executor_job(_add_old_states)
+    hass.states.async_set("sensor.power", "keep")
+    await async_wait_recording_done(hass)
+
+    def _purge() -> bool:
+        return purge_old_data(instance, now - timedelta(days=5), repack=False)
+
+    while not await instance.async_add_executor_job(_purge):
+        pass
+
+    def _partition_names() -> list[str]:
+        with session_scope(hass=hass, read_only=True) as session:
+            return [partition.name for partition in get_states_partitions(session)]
+
+    assert old_partition.name not in await instance.async_add_executor_job(
+        _partition_names
+    )
+    assert _fetch_states(hass) == [("sensor.power", "keep", None)]
+    with session_scope(hass=hass, read_only=True) as session:
+        assert session.query(StateAttributes).filter_by(hash=1234).count() == 0
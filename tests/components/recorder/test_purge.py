@@ -25,7 +25,7 @@ from homeassistant.components.recorder.db_schema import (
     StatisticsShortTerm,
 )
 from homeassistant.components.recorder.history import get_significant_states
-from homeassistant.components.recorder.purge import purge_old_data
+from homeassistant.components.recorder.purge import purge_old_data, purge_throttle_delay
 from homeassistant.components.recorder.queries import select_event_type_ids
 from homeassistant.components.recorder.services import (
     SERVICE_PURGE,
@@ -110,6 +110,44 @@ async def test_purge_big_database(hass: HomeAssistant, recorder_mock: Recorder)
             assert state_attributes.count() == 1
 
 
+async def test_purge_with_rows_per_second_budget(
+    hass: HomeAssistant, recorder_mock: Recorder
+) -> None:
+    """Test a purge within a rows per second budget reports its progress."""
+    for _ in range(12):
+        await _add_test_states(hass, wait_recording_done=False)
+    await async_wait_recording_done(hass)
+
+    purge_before = dt_util.utcnow() - timedelta(days=4)
+    with patch.object(recorder_mock, "purge_rows_per_second", 10):
+        finished = purge_old_data(recorder_mock, purge_before, repack=False)
+        assert not finished
+        progress = recorder_mock.purge_progress
+        assert progress is not None
+        assert progress.cycles == 1
+        # 10 states and the attributes no other state uses anymore
+        assert progress.cycle_rows == progress.rows
+        assert 10 <= progress.rows <= 12
+        assert 0 <= progress.fraction_done < 1
+        assert purge_throttle_delay(recorder_mock, 0) == progress.cycle_rows / 10
+        assert purge_throttle_delay(recorder_mock, 60) == 0
+
+        with session_scope(hass=hass) as session:
+            assert session.query(States).count() == 62
+
+        while not purge_old_data(recorder_mock, purge_before, repack=False):
+            pass
+
+    assert recorder_mock.purge_progress is progress
+    assert progress.finished
+    assert progress.fraction_done == 1
+    assert progress.cycles > 5
+    with session_scope(hass=hass) as session:
+        assert session.query(States).count() == 24
+        assert session.query(StateAttributes).count() == 1
+    assert progress.rows == 48 + 2
+
+
 async def test_purge_old_states(hass: HomeAssistant, recorder_mock: Recorder) -> None:
     """Test deleting old states."""
     assert recorder_mock.states_manager.oldest_ts is None
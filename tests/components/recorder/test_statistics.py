@@ -1,6 +1,6 @@
 """The tests for sensor recorder platform."""
 
-from datetime import timedelta
+from datetime import datetime, timedelta
 from typing import Any
 from unittest.mock import ANY, Mock, patch
 
@@ -8,8 +8,12 @@ import pytest
 from sqlalchemy import select
 
 from homeassistant.components import recorder
-from homeassistant.components.recorder import Recorder, history, statistics
-from homeassistant.components.recorder.db_schema import StatisticsShortTerm
+from homeassistant.components.recorder import Recorder, history, migration, statistics
+from homeassistant.components.recorder.db_schema import (
+    StatisticsDaily,
+    StatisticsMonthly,
+    StatisticsShortTerm,
+)
 from homeassistant.components.recorder.models import (
     datetime_to_timestamp_or_none,
     process_timestamp,
@@ -20,6 +24,7 @@ from homeassistant.components.recorder.statistics import (
     _generate_max_mean_min_statistic_in_sub_period_stmt,
     _generate_statistics_at_time_stmt,
     _generate_statistics_during_period_stmt,
+    _statistics_rollups_cover_period,
     async_add_external_statistics,
     async_import_statistics,
     async_list_statistic_ids,
@@ -1844,6 +1849,233 @@ async def test_monthly_statistics_sum(
     assert stats == {}
 
 
+@pytest.mark.freeze_time("2021-12-01 00:00:00+00:00")
+async def test_statistics_rollups(
+    hass: HomeAssistant,
+    setup_recorder: None,
+) -> None:
+    """Test daily and monthly statistics are read from the rollups."""
+    await hass.config.async_set_time_zone("Europe/Vienna")
+    await async_wait_recording_done(hass)
+    instance = recorder.get_instance(hass)
+    assert instance.use_statistics_rollups
+
+    zero = dt_util.utcnow() - timedelta(days=60)
+    period1 = dt_util.as_utc(dt_util.parse_datetime("2021-10-29 20:00:00"))
+    external_statistics = [
+        {
+            "start": period1 + timedelta(hours=idx),
+            "last_reset": None,
+            "mean": (idx * 7) % 13 + 0.1,
+            "min": (idx * 7) % 13 - 1.3,
+            "max": (idx * 7) % 13 + 1.7,
+            "state": idx,
+            "sum": idx * 1.5,
+        }
+        for idx in range(150)
+        if idx % 11
+    ]
+    external_metadata = {
+        "has_mean": True,
+        "has_sum": True,
+        "name": "Total imported energy",
+        "source": "test",
+        "statistic_id": "test:total_energy_import",
+        "unit_of_measurement": "kWh",
+    }
+
+    def _statistics_during_period(period: str) -> dict[str, list[dict[str, Any]]]:
+        return statistics_during_period(
+            hass,
+            zero,
+            period=period,
+            statistic_ids={"test:total_energy_import"},
+            types={"change", "last_reset", "max", "mean", "min", "state", "sum"},
+        )
+
+    def _assert_rollups_match_hourly_statistics() -> None:
+        for period in ("day", "month"):
+            stats = _statistics_during_period(period)
+            instance.use_statistics_rollups = False
+            expected_stats = _statistics_during_period(period)
+            instance.use_statistics_rollups = True
+            assert len(expected_stats["test:total_energy_import"]) > 1
+            assert stats == {
+                statistic_id: [
+                    {
+                        key: value if value is None else pytest.approx(value)
+                        for key, value in row.items()
+                    }
+                    for row in rows
+                ]
+                for statistic_id, rows in expected_stats.items()
+            }
+
+    async_add_external_statistics(hass, external_metadata, external_statistics)
+    await async_wait_recording_done(hass)
+    _assert_rollups_match_hourly_statistics()
+
+    # Import statistics which change an existing hour
+    async_add_external_statistics(
+        hass,
+        external_metadata,
+        [{**external_statistics[60], "mean": 100.0, "max": 200.0}],
+    )
+    await async_wait_recording_done(hass)
+    _assert_rollups_match_hourly_statistics()
+
+    instance.async_adjust_statistics(
+        "test:total_energy_import", period1 + timedelta(hours=50), 1000.0, "kWh"
+    )
+    await async_wait_recording_done(hass)
+    _assert_rollups_match_hourly_statistics()
+    assert _statistics_during_period("month")["test:total_energy_import"][-1][
+        "sum"
+    ] == pytest.approx(149 * 1.5 + 1000.0)
+
+    # Rollups of another time zone are not used, they are compiled again
+    await hass.config.async_set_time_zone("America/Regina")
+    instance.use_statistics_rollups = False
+    expected_stats = _statistics_during_period("day")
+    instance.use_statistics_rollups = True
+    assert _statistics_during_period("day") == expected_stats
+    assert not instance.use_statistics_rollups
+    # The rollups are compiled one month at a time
+    await async_wait_recording_done(hass)
+    assert not instance.use_statistics_rollups
+    await async_wait_recording_done(hass)
+    assert instance.use_statistics_rollups
+    _assert_rollups_match_hourly_statistics()
+
+
+@pytest.mark.freeze_time("2021-12-01 00:00:00+00:00")
+async def test_statistics_rollup_migration(
+    hass: HomeAssistant,
+    setup_recorder: None,
+) -> None:
+    """Test the rollups of existing statistics are compiled by the migration."""
+    await async_wait_recording_done(hass)
+    instance = recorder.get_instance(hass)
+    period1 = dt_util.as_utc(dt_util.parse_datetime("2021-10-30 00:00:00"))
+    external_statistics = [
+        {"start": period1 + timedelta(hours=idx), "state": idx, "sum": idx}
+        for idx in range(0, 72, 5)
+    ]
+    external_metadata = {
+        "has_mean": False,
+        "has_sum": True,
+        "name": "Total imported energy",
+        "source": "test",
+        "statistic_id": "test:total_energy_import",
+        "unit_of_measurement": "kWh",
+    }
+    async_add_external_statistics(hass, external_metadata, external_statistics)
+    await async_wait_recording_done(hass)
+    instance.use_statistics_rollups = False
+    expected_stats = statistics_during_period(hass, period1, period="day")
+
+    def _delete_rollups() -> None:
+        with session_scope(hass=hass) as session:
+            session.query(StatisticsDaily).delete()
+            session.query(StatisticsMonthly).delete()
+
+    await instance.async_add_executor_job(_delete_rollups)
+    migrator = migration.StatisticsRollupMigration(
+        initial_schema_version=48, start_schema_version=48, migration_changes={}
+    )
+    instance.queue_task(migration.MigrationTask(migrator))
+    await async_wait_recording_done(hass)
+    assert not instance.use_statistics_rollups
+    await async_wait_recording_done(hass)
+    assert instance.use_statistics_rollups
+    assert statistics_during_period(hass, period1, period="day") == expected_stats
+    assert len(expected_stats["test:total_energy_import"]) == 3
+
+
+@pytest.mark.freeze_time("2021-12-01 00:00:00+00:00")
+async def test_statistics_rollups_unaligned_period(
+    hass: HomeAssistant,
+    setup_recorder: None,
+) -> None:
+    """Test windows which don't start or end at a day or month start."""
+    await hass.config.async_set_time_zone("Europe/Vienna")
+    await async_wait_recording_done(hass)
+    instance = recorder.get_instance(hass)
+    assert instance.use_statistics_rollups
+
+    period1 = dt_util.as_utc(dt_util.parse_datetime("2021-10-29 20:00:00"))
+    external_statistics = [
+        {
+            "start": period1 + timedelta(hours=idx),
+            "last_reset": None,
+            "mean": (idx * 7) % 13 + 0.1,
+            "min": (idx * 7) % 13 - 1.3,
+            "max": (idx * 7) % 13 + 1.7,
+            "state": idx,
+            "sum": idx * 1.5,
+        }
+        for idx in range(0, 700, 3)
+    ]
+    external_metadata = {
+        "has_mean": True,
+        "has_sum": True,
+        "name": "Total imported energy",
+        "source": "test",
+        "statistic_id": "test:total_energy_import",
+        "unit_of_measurement": "kWh",
+    }
+    async_add_external_statistics(hass, external_metadata, external_statistics)
+    await async_wait_recording_done(hass)
+
+    def _statistics_during_period(
+        start_time: datetime, end_time: datetime | None, period: str
+    ) -> dict[str, list[dict[str, Any]]]:
+        return statistics_during_period(
+            hass,
+            start_time,
+            end_time,
+            period=period,
+            statistic_ids={"test:total_energy_import"},
+            types={"change", "last_reset", "max", "mean", "min", "state", "sum"},
+        )
+
+    windows = (
+        ("2021-10-30 13:17:00", "2021-11-02 05:40:00"),
+        ("2021-10-31 02:30:00", None),
+        ("2021-11-12 23:59:59", "2021-11-30 00:00:01"),
+    )
+    for start, end in windows:
+        start_time = dt_util.as_utc(dt_util.parse_datetime(start))
+        end_time = dt_util.as_utc(dt_util.parse_datetime(end)) if end else None
+        assert not _statistics_rollups_cover_period("day", start_time, end_time)
+        assert not _statistics_rollups_cover_period("month", start_time, end_time)
+        for period in ("day", "month"):
+            stats = _statistics_during_period(start_time, end_time, period)
+            instance.use_statistics_rollups = False
+            expected_stats = _statistics_during_period(start_time, end_time, period)
+            instance.use_statistics_rollups = True
+            assert expected_stats["test:total_energy_import"]
+            assert stats == {
+                statistic_id: [
+                    {
+                        key: value if value is None else pytest.approx(value)
+                        for key, value in row.items()
+                    }
+                    for row in rows
+                ]
+                for statistic_id, rows in expected_stats.items()
+            }
+
+    day_start = dt_util.as_utc(dt_util.parse_datetime("2021-11-01 00:00:00+01:00"))
+    assert _statistics_rollups_cover_period("day", day_start, None)
+    assert _statistics_rollups_cover_period(
+        "month", day_start, day_start + timedelta(days=30)
+    )
+    assert not _statistics_rollups_cover_period(
+        "month", day_start, day_start + timedelta(days=29)
+    )
+
+
 def test_cache_key_for_generate_statistics_during_period_stmt() -> None:
     """Test cache key for _generate_statistics_during_period_stmt."""
     stmt = _generate_statistics_during_period_stmt(
@@ -6,6 +6,7 @@ import pytest
 
 from homeassistant.components.recorder import Recorder, get_instance
 from homeassistant.components.recorder.const import SupportedDialect
+from homeassistant.components.recorder.purge import PurgeProgress
 from homeassistant.core import HomeAssistant
 from homeassistant.setup import async_setup_component
 
@@ -38,6 +39,27 @@ async def test_recorder_system_health(
     }
 
 
+@pytest.mark.skip_on_db_engine(["mysql", "postgresql"])
+@pytest.mark.usefixtures("skip_by_db_engine")
+async def test_recorder_system_health_purge_progress(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Test recorder system health reports the progress of the purge."""
+    assert await async_setup_component(hass, "system_health", {})
+    await async_wait_recording_done(hass)
+    recorder_mock.purge_progress = PurgeProgress(
+        purge_before=200.0,
+        started=10.0,
+        oldest_ts=100.0,
+        current_ts=125.0,
+        rows=5000,
+        updated=14.0,
+    )
+    info = await get_system_health_info(hass, "recorder")
+    assert info["purge_progress"] == "25%"
+    assert info["purge_rows_per_second"] == "1250"
+
+
 @pytest.mark.parametrize(
     "db_engine", [SupportedDialect.MYSQL, SupportedDialect.POSTGRESQL]
 )
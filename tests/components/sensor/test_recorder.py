@@ -35,8 +35,17 @@ from homeassistant.components.recorder.statistics import (
     list_statistic_ids,
 )
 from homeassistant.components.recorder.util import get_instance, session_scope
-from homeassistant.components.sensor import ATTR_OPTIONS, DOMAIN, SensorDeviceClass
-from homeassistant.const import ATTR_FRIENDLY_NAME, STATE_UNAVAILABLE
+from homeassistant.components.sensor import (
+    ATTR_OPTIONS,
+    DOMAIN,
+    SensorDeviceClass,
+    recorder as sensor_recorder,
+)
+from homeassistant.const import (
+    ATTR_FRIENDLY_NAME,
+    EVENT_HOMEASSISTANT_FINAL_WRITE,
+    STATE_UNAVAILABLE,
+)
 from homeassistant.core import HomeAssistant, State
 from homeassistant.helpers import issue_registry as ir
 from homeassistant.setup import async_setup_component
@@ -5506,3 +5515,117 @@ async def test_clean_up_repairs(
         ("sensor", "test_issue_1"),
         ("sensor", "test_issue_2"),
     }
+
+
+@pytest.mark.freeze_time("2021-09-01 05:01:00")
+async def test_compile_statistics_from_accumulators(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test statistics compiled from accumulators match statistics from the states."""
+    instance = get_instance(hass)
+    await async_setup_component(hass, "sensor", {})
+    # Wait for the sensor recorder platform to be added
+    await async_recorder_block_till_done(hass)
+    # The accumulators are started by the first compile
+    sensor_recorder._async_start_accumulators(hass)
+    accumulators = hass.data[sensor_recorder.SHORT_TERM_ACCUMULATORS]
+
+    temperature = {"state_class": "measurement", "unit_of_measurement": "°C"}
+    power = {"state_class": "measurement", "unit_of_measurement": "W"}
+    energy = {"state_class": "total_increasing", "unit_of_measurement": "kWh"}
+    start = datetime(2021, 9, 1, 5, 5, tzinfo=dt_util.UTC)
+    end = start + timedelta(minutes=5)
+
+    freezer.move_to(start - timedelta(minutes=2))
+    hass.states.async_set("sensor.temperature", "20", temperature)
+    hass.states.async_set("sensor.power", "100", power)
+    hass.states.async_set("sensor.energy", "10", energy)
+    for offset, temperature_state, power_state, power_unit, energy_state in (
+        (0, "21", "150", "W", "11"),
+        (30, "21", "150", "W", "12"),
+        (60, STATE_UNAVAILABLE, "0.2", "kW", "5"),
+        (150, "23", "0.1", "kW", "6"),
+        (250, "22.5", "0.1", "kW", "6"),
+    ):
+        freezer.move_to(start + timedelta(seconds=offset))
+        hass.states.async_set(
+            "sensor.temperature",
+            temperature_state,
+            {**temperature, "offset": offset},
+        )
+        hass.states.async_set(
+            "sensor.power",
+            power_state,
+            {**power, "unit_of_measurement": power_unit},
+        )
+        hass.states.async_set("sensor.energy", energy_state, energy)
+    freezer.move_to(end + timedelta(seconds=10))
+    hass.states.async_set("sensor.temperature", "30", temperature)
+    await async_wait_recording_done(hass)
+
+    def _compile_statistics(use_accumulators: bool) -> list[dict[str, Any]]:
+        with session_scope(hass=hass, read_only=True) as session:
+            if use_accumulators:
+                return sensor_recorder.compile_statistics(
+                    hass, session, start, end
+                ).platform_stats
+            with patch.object(
+                sensor_recorder, "_pop_period_accumulators", return_value={}
+            ):
+                return sensor_recorder.compile_statistics(
+                    hass, session, start, end
+                ).platform_stats
+
+    expected = await instance.async_add_executor_job(_compile_statistics, False)
+    popped: dict[str, sensor_recorder.PeriodAccumulator] = {}
+    pop_period = accumulators.pop_period
+
+    def _pop_period(*args: Any) -> dict[str, sensor_recorder.PeriodAccumulator]:
+        popped.update(pop_period(*args))
+        return popped
+
+    with patch.object(accumulators, "pop_period", _pop_period):
+        compiled = await instance.async_add_executor_job(_compile_statistics, True)
+    assert set(popped) == {"sensor.temperature", "sensor.power", "sensor.energy"}
+    # The power changed unit during the period, it is compiled from the states
+    assert popped["sensor.power"].units == {"W", "kW"}
+    assert [result["meta"]["statistic_id"] for result in compiled] == [
+        "sensor.temperature",
+        "sensor.power",
+        "sensor.energy",
+    ]
+    assert compiled == [
+        {
+            "meta": result["meta"],
+            "stat": {
+                key: pytest.approx(value) if isinstance(value, float) else value
+                for key, value in result["stat"].items()
+            },
+        }
+        for result in expected
+    ]
+    assert compiled[0]["stat"]["mean"] == pytest.approx(
+        (21 * 150 + 23 * 100 + 22.5 * 50) / 300
+    )
+
+    # Compiling the period again falls back to the states
+    assert accumulators.pop_period(["sensor.temperature"], start) == {}
+
+
+async def test_accumulators_stop_with_recorder(hass: HomeAssistant) -> None:
+    """Test the accumulators only queue sensor states until the recorder stops."""
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+    sensor_recorder._async_start_accumulators(hass)
+    accumulators = hass.data[sensor_recorder.SHORT_TERM_ACCUMULATORS]
+
+    hass.states.async_set("light.kitchen", "on")
+    hass.states.async_set("sensor.temperature", "20")
+    assert [item[0] for item in accumulators._queue] == ["sensor.temperature"]
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+    await hass.async_block_till_done()
+    assert not accumulators._queue
+    hass.states.async_set("sensor.temperature", "21")
+    assert not accumulators._queue
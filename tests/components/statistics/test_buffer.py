@@ -0,0 +1,115 @@
+"""Test the sample buffer of the statistics sensor."""
+
+from __future__ import annotations
+
+from collections import deque
+import math
+import random
+import statistics
+from unittest.mock import patch
+
+import pytest
+
+from homeassistant.components.statistics import buffer
+from homeassistant.components.statistics.buffer import SampleBuffer
+
+
+def _assert_matches(
+    samples: SampleBuffer, values: deque[float], ages: deque[float]
+) -> None:
+    """Assert the characteristics of the buffer match the samples."""
+    assert len(samples) == len(values)
+    assert samples.values() == list(values)
+    assert samples.ages() == list(ages)
+    if not values:
+        return
+    assert samples.sum == pytest.approx(sum(values))
+    assert samples.mean == pytest.approx(statistics.mean(values))
+    assert samples.median == statistics.median(values)
+    assert samples.max == max(values)
+    assert samples.min == min(values)
+    assert samples.index(samples.max) == values.index(max(values))
+    sin_sum = sum(math.sin(math.radians(x)) for x in values)
+    cos_sum = sum(math.cos(math.radians(x)) for x in values)
+    assert samples.mean_circular == pytest.approx(
+        (math.degrees(math.atan2(sin_sum, cos_sum)) + 360) % 360
+    )
+    if len(values) < 2:
+        return
+    assert samples.variance == pytest.approx(statistics.variance(values))
+    percentiles = statistics.quantiles(values, n=100, method="exclusive")
+    for percentile in (1, 5, 50, 95, 99):
+        assert samples.percentile(percentile) == pytest.approx(
+            percentiles[percentile - 1]
+        )
+    pairs = list(zip(values, list(values)[1:], strict=False))
+    elapsed = [ages[idx + 1] - ages[idx] for idx in range(len(pairs))]
+    assert samples.linear_area == pytest.approx(
+        sum(0.5 * (j + i) * e for (i, j), e in zip(pairs, elapsed, strict=True))
+    )
+    assert samples.step_area == pytest.approx(
+        sum(i * e for (i, _), e in zip(pairs, elapsed, strict=True))
+    )
+    assert samples.sum_differences == pytest.approx(sum(abs(j - i) for i, j in pairs))
+    assert samples.sum_differences_nonnegative == pytest.approx(
+        sum(j - i if j >= i else j for i, j in pairs)
+    )
+
+
+@pytest.mark.parametrize("order_statistics", [True, False])
+@pytest.mark.parametrize("maxlen", [None, 1, 7, 50])
+def test_sample_buffer_matches_samples(
+    maxlen: int | None, order_statistics: bool
+) -> None:
+    """Test the characteristics match the samples as samples are added and removed."""
+    rand = random.Random(maxlen)
+    samples = SampleBuffer(maxlen, order_statistics=order_statistics)
+    values: deque[float] = deque(maxlen=maxlen)
+    ages: deque[float] = deque(maxlen=maxlen)
+    age = 1700000000.0
+
+    with patch.object(buffer, "MIN_REMOVALS_BEFORE_REFRESH", 10):
+        for _ in range(300):
+            if values and rand.random() < 0.3:
+                samples.popleft()
+                values.popleft()
+                ages.popleft()
+            else:
+                age += rand.uniform(0, 60)
+                value = round(rand.uniform(-50, 400), rand.randint(0, 2))
+                samples.append(value, age)
+                values.append(value)
+                ages.append(age)
+            _assert_matches(samples, values, ages)
+
+    assert samples.value(0) == values[0]
+    assert samples.age(-1) == ages[-1]
+
+
+def test_sample_buffer_empty() -> None:
+    """Test an empty buffer."""
+    samples = SampleBuffer(0)
+    samples.append(1.0, 1.0)
+    assert len(samples) == 0
+    with pytest.raises(IndexError):
+        samples.popleft()
+    with pytest.raises(IndexError):
+        samples.value(0)
+
+
+@pytest.mark.parametrize("value", [math.nan, math.inf, -math.inf])
+def test_sample_buffer_recovers_from_non_finite_value(value: float) -> None:
+    """Test the characteristics recover when a non-finite value is removed."""
+    samples = SampleBuffer(3, order_statistics=True)
+    values: deque[float] = deque(maxlen=3)
+    ages: deque[float] = deque(maxlen=3)
+    for idx, sample in enumerate((1.0, value, 2.0, 4.0)):
+        samples.append(sample, float(idx))
+        values.append(sample)
+        ages.append(float(idx))
+    assert not math.isfinite(samples.mean)
+
+    samples.append(8.0, 4.0)
+    values.append(8.0)
+    ages.append(4.0)
+    _assert_matches(samples, values, ages)
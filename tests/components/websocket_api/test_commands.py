@@ -19,7 +19,7 @@ from homeassistant.components.websocket_api.auth import (
 )
 from homeassistant.components.websocket_api.const import FEATURE_COALESCE_MESSAGES, URL
 from homeassistant.config_entries import ConfigEntryState
-from homeassistant.const import SIGNAL_BOOTSTRAP_INTEGRATIONS
+from homeassistant.const import EVENT_STATE_CHANGED, SIGNAL_BOOTSTRAP_INTEGRATIONS
 from homeassistant.core import Context, HomeAssistant, State, SupportsResponse, callback
 from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
 from homeassistant.helpers import device_registry as dr
@@ -1262,6 +1262,49 @@ async def test_subscribe_unsubscribe_entities_specific_entities(
     }
 
 
+async def test_subscribe_entities_shares_listener(
+    hass: HomeAssistant,
+    websocket_client: MockHAClientWebSocket,
+) -> None:
+    """Test subscribe_entities subscriptions share a state changed listener."""
+    hass.states.async_set("light.kitchen", "off")
+    hass.states.async_set("light.bedroom", "off")
+    initial_listeners = hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0)
+
+    for msg_id, entity_ids in ((7, ["light.kitchen"]), (8, None)):
+        await websocket_client.send_json(
+            {"id": msg_id, "type": "subscribe_entities"}
+            | ({"entity_ids": entity_ids} if entity_ids else {})
+        )
+        msg = await websocket_client.receive_json()
+        assert msg["id"] == msg_id
+        assert msg["success"]
+        msg = await websocket_client.receive_json()
+        assert msg["id"] == msg_id
+        assert msg["type"] == "event"
+
+    assert hass.bus.async_listeners()[EVENT_STATE_CHANGED] == initial_listeners + 1
+
+    hass.states.async_set("light.bedroom", "on")
+    hass.states.async_set("light.kitchen", "on")
+    received = [await websocket_client.receive_json() for _ in range(3)]
+    assert [(msg["id"], list(msg["event"]["c"])) for msg in received] == [
+        (8, ["light.bedroom"]),
+        (7, ["light.kitchen"]),
+        (8, ["light.kitchen"]),
+    ]
+
+    for msg_id, subscription in ((9, 7), (10, 8)):
+        await websocket_client.send_json(
+            {"id": msg_id, "type": "unsubscribe_events", "subscription": subscription}
+        )
+        msg = await websocket_client.receive_json()
+        assert msg["id"] == msg_id
+        assert msg["success"]
+
+    assert hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0) == initial_listeners
+
+
 async def test_subscribe_unsubscribe_entities_with_filter(
     hass: HomeAssistant,
     websocket_client: MockHAClientWebSocket,
@@ -3,7 +3,7 @@
 import asyncio
 from datetime import timedelta
 from typing import Any, cast
-from unittest.mock import patch
+from unittest.mock import ANY, patch
 
 from aiohttp import ServerDisconnectedError, WSMsgType, web
 import pytest
@@ -523,3 +523,57 @@ async def test_binary_message(
     assert "Received binary message for non-existing handler 0" in caplog.text
     assert "Received binary message for non-existing handler 3" in caplog.text
     assert "Received binary message for non-existing handler 10" in caplog.text
+
+
+async def test_coalesce_state_changes_when_behind(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test state changes are merged per entity while the client is behind."""
+    hass.states.async_set("light.kitchen", "off")
+    hass.states.async_set("light.hall", "on")
+    websocket_client = await hass_ws_client(hass)
+    await websocket_client.send_json({"id": 1, "type": "subscribe_entities"})
+    msg = await websocket_client.receive_json()
+    assert msg["success"] is True
+    msg = await websocket_client.receive_json()
+    assert msg["event"]["a"].keys() == {"light.kitchen", "light.hall"}
+
+    with patch(
+        "homeassistant.components.websocket_api.http.PENDING_MSG_COALESCE_STATE_CHANGES",
+        1,
+    ):
+        # The first change is queued as is, the client is behind after that
+        hass.states.async_set("light.kitchen", "on")
+        hass.states.async_set("light.kitchen", "off", {"brightness": 10})
+        hass.states.async_set("light.kitchen", "on", {"brightness": 20})
+        hass.states.async_remove("light.hall")
+        hass.states.async_set("light.porch", "off")
+        hass.states.async_set("light.porch", "on")
+        hass.states.async_set("light.garage", "on")
+        hass.states.async_remove("light.garage")
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 1
+    assert msg["event"]["c"]["light.kitchen"]["+"]["s"] == "on"
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 1
+    assert msg["type"] == "event"
+    event = msg["event"]
+    assert event["c"].keys() == {"light.kitchen"}
+    assert event["c"]["light.kitchen"]["+"]["a"] == {"brightness": 20}
+    assert "s" not in event["c"]["light.kitchen"]["+"]
+    assert event["r"] == ["light.hall"]
+    assert event["a"] == {
+        "light.porch": {
+            "s": "on",
+            "a": {},
+            "c": ANY,
+            "lc": ANY,
+        }
+    }
+
+    # The client caught up, so state changes are sent as is again
+    hass.states.async_set("light.porch", "off")
+    msg = await websocket_client.receive_json()
+    assert msg["event"]["c"]["light.porch"]["+"]["s"] == "off"
@@ -1313,6 +1313,61 @@ async def test_device_info_not_overrides(
     assert device2.model == "test-model"
 
 
+async def test_device_info_shared_between_entities(
+    hass: HomeAssistant, device_registry: dr.DeviceRegistry
+) -> None:
+    """Test entities sharing a device only resolve it once."""
+    config_entry = MockConfigEntry(entry_id="super-mock-id")
+    config_entry.add_to_hass(hass)
+    device_info: DeviceInfo = {
+        "identifiers": {("hue", "1234")},
+        "manufacturer": "test-manuf",
+        "sw_version": "1.0",
+    }
+
+    async def async_setup_entry(
+        hass: HomeAssistant,
+        config_entry: ConfigEntry,
+        async_add_entities: AddConfigEntryEntitiesCallback,
+    ) -> None:
+        """Mock setup entry method."""
+        async_add_entities(
+            [
+                MockEntity(unique_id="abcd", device_info=device_info),
+                MockEntity(unique_id="efgh", device_info=device_info),
+                # The same device with changed device info
+                MockEntity(
+                    unique_id="ijkl", device_info={**device_info, "sw_version": "2.0"}
+                ),
+                MockEntity(unique_id="mnop", device_info=device_info),
+            ]
+        )
+
+    platform = MockPlatform(async_setup_entry=async_setup_entry)
+    entity_platform = MockEntityPlatform(
+        hass, platform_name=config_entry.domain, platform=platform
+    )
+
+    with patch.object(
+        device_registry,
+        "async_get_or_create",
+        wraps=device_registry.async_get_or_create,
+    ) as mock_get_or_create:
+        assert await entity_platform.async_setup_entry(config_entry)
+        await hass.async_block_till_done()
+
+    assert mock_get_or_create.call_count == 3
+    assert len(hass.states.async_entity_ids()) == 4
+    device = device_registry.async_get_device(identifiers={("hue", "1234")})
+    assert device is not None
+    assert device.sw_version == "1.0"
+    entity_registry = er.async_get(hass)
+    for entity_id in hass.states.async_entity_ids():
+        entry = entity_registry.async_get(entity_id)
+        assert entry is not None
+        assert entry.device_id == device.id
+
+
 async def test_device_info_homeassistant_url(
     hass: HomeAssistant,
     device_registry: dr.DeviceRegistry,
@@ -1973,6 +2028,31 @@ async def test_setup_entry_with_entities_that_block_forever(
     assert "test" in caplog.text
 
 
+async def test_entities_aborted_after_add_timeout(
+    hass: HomeAssistant,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test entities which did not finish adding before the timeout are aborted."""
+    platform = MockEntityPlatform(hass)
+    blocking_entity = MockBlockingEntity(name="test1", unique_id="unique")
+
+    with (
+        patch.object(entity_platform, "SLOW_ADD_ENTITY_MAX_WAIT", 0.01),
+        patch.object(entity_platform, "SLOW_ADD_MIN_TIMEOUT", 0.01),
+    ):
+        await platform.async_add_entities([blocking_entity])
+        await hass.async_block_till_done()
+
+    assert "Timed out adding entities" in caplog.text
+    assert platform.entities == {}
+    assert blocking_entity.hass is None
+    assert hass.states.async_available("test_domain.test1")
+
+    await platform.async_add_entities([MockEntity(name="test1", unique_id="unique")])
+    assert "Entity id already exists" not in caplog.text
+    assert hass.states.get("test_domain.test1") is not None
+
+
 class MockCancellingEntity(MockEntity):
     """Class to mock an entity get cancelled while adding."""
 
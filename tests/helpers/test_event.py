@@ -26,6 +26,7 @@ from homeassistant.exceptions import TemplateError
 from homeassistant.helpers.device_registry import EVENT_DEVICE_REGISTRY_UPDATED
 from homeassistant.helpers.entity_registry import EVENT_ENTITY_REGISTRY_UPDATED
 from homeassistant.helpers.event import (
+    _TRACK_UTC_TIME_CHANGE_DATA,
     TrackStates,
     TrackTemplate,
     TrackTemplateResult,
@@ -3936,6 +3937,123 @@ async def test_periodic_task_minute(
     assert len(specific_runs) == 2
 
 
+async def test_periodic_task_shared_pattern(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test listeners with the same pattern share a timer."""
+    first_runs = []
+    second_runs = []
+    other_runs = []
+
+    now = dt_util.utcnow()
+
+    time_that_will_not_match_right_away = datetime(
+        now.year + 1, 5, 24, 11, 59, 55, tzinfo=dt_util.UTC
+    )
+    freezer.move_to(time_that_will_not_match_right_away)
+
+    @callback
+    def _first_listener(now: datetime) -> None:
+        first_runs.append(now)
+        # Listeners removed by another listener are not run anymore
+        unsub_second()
+
+    unsub_first = async_track_utc_time_change(
+        hass, _first_listener, minute="/5", second=0
+    )
+    unsub_second = async_track_utc_time_change(
+        hass,
+        # pylint: disable-next=unnecessary-lambda
+        callback(lambda x: second_runs.append(x)),
+        minute="/5",
+        second=0,
+    )
+    unsub_other = async_track_utc_time_change(
+        hass,
+        # pylint: disable-next=unnecessary-lambda
+        callback(lambda x: other_runs.append(x)),
+        minute="/10",
+        second=0,
+    )
+    assert len(hass.data[_TRACK_UTC_TIME_CHANGE_DATA]) == 2
+
+    async_fire_time_changed(
+        hass, datetime(now.year + 1, 5, 24, 12, 0, 0, 999999, tzinfo=dt_util.UTC)
+    )
+    await hass.async_block_till_done()
+    assert len(first_runs) == 1
+    assert len(second_runs) == 0
+    assert len(other_runs) == 1
+
+    async_fire_time_changed(
+        hass, datetime(now.year + 1, 5, 24, 12, 5, 0, 999999, tzinfo=dt_util.UTC)
+    )
+    await hass.async_block_till_done()
+    assert len(first_runs) == 2
+    assert len(second_runs) == 0
+    assert len(other_runs) == 1
+
+    unsub_first()
+    assert len(hass.data[_TRACK_UTC_TIME_CHANGE_DATA]) == 1
+    async_fire_time_changed(
+        hass, datetime(now.year + 1, 5, 24, 12, 10, 0, 999999, tzinfo=dt_util.UTC)
+    )
+    await hass.async_block_till_done()
+    assert len(first_runs) == 2
+    assert len(other_runs) == 2
+
+    unsub_other()
+    assert not hass.data[_TRACK_UTC_TIME_CHANGE_DATA]
+
+
+async def test_periodic_task_shared_pattern_listener_raises(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test a raising listener does not stop the other listeners of a pattern."""
+    runs = []
+
+    now = dt_util.utcnow()
+
+    time_that_will_not_match_right_away = datetime(
+        now.year + 1, 5, 24, 11, 59, 55, tzinfo=dt_util.UTC
+    )
+    freezer.move_to(time_that_will_not_match_right_away)
+
+    @callback
+    def _raising_listener(now: datetime) -> None:
+        raise ValueError("listener failed")
+
+    @callback
+    def _listener(now: datetime) -> None:
+        runs.append(now)
+
+    unsub_raising = async_track_utc_time_change(
+        hass, _raising_listener, minute="/5", second=0
+    )
+    unsub = async_track_utc_time_change(hass, _listener, minute="/5", second=0)
+    (track,) = hass.data[_TRACK_UTC_TIME_CHANGE_DATA].values()
+    assert len(track.jobs) == 2
+
+    for minute in (0, 5):
+        async_fire_time_changed(
+            hass,
+            datetime(now.year + 1, 5, 24, 12, minute, 0, 999999, tzinfo=dt_util.UTC),
+        )
+        await hass.async_block_till_done()
+    assert len(runs) == 2
+    assert caplog.text.count("Error running job") == 2
+    # The failing listener is named in the log, not in the shared job
+    assert "_raising_listener" in caplog.text
+
+    unsub_raising()
+    assert len(track.jobs) == 1
+    unsub()
+    assert not hass.data[_TRACK_UTC_TIME_CHANGE_DATA]
+
+
 async def test_periodic_task_hour(
     hass: HomeAssistant,
     freezer: FrozenDateTimeFactory,
@@ -13,6 +13,7 @@ from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.integration_platform import (
     async_process_integration_platforms,
+    async_process_lazy_integration_platforms,
 )
 from homeassistant.setup import ATTR_COMPONENT
 
@@ -288,3 +289,47 @@ async def test_process_integration_platforms_no_integrations(
     await hass.async_block_till_done()
 
     assert len(processed) == 0
+
+
+async def test_process_lazy_integration_platforms(hass: HomeAssistant) -> None:
+    """Test lazy integration platforms are only processed when needed."""
+    loaded_platform = Mock()
+    mock_platform(hass, "loaded.platform_to_check", loaded_platform)
+    hass.config.components.add("loaded")
+
+    event_platform = Mock()
+    mock_platform(hass, "event.platform_to_check", event_platform)
+
+    processed = []
+
+    async def _process_platform(
+        hass: HomeAssistant, domain: str, platform: Any
+    ) -> None:
+        """Process platform."""
+        processed.append((domain, platform))
+
+    with patch(
+        "homeassistant.helpers.integration_platform.async_register_preload_platform"
+    ) as mock_register_preload_platform:
+        await async_process_integration_platforms(
+            hass, "platform_to_check", _process_platform, lazy=True
+        )
+    assert not mock_register_preload_platform.called
+
+    hass.bus.async_fire(EVENT_COMPONENT_LOADED, {ATTR_COMPONENT: "event"})
+    await hass.async_block_till_done()
+    assert processed == []
+
+    await async_process_lazy_integration_platforms(hass, "platform_to_check")
+    assert sorted(processed) == sorted(
+        [("loaded", loaded_platform), ("event", event_platform)]
+    )
+
+    # Platforms are only processed once
+    await async_process_lazy_integration_platforms(hass, "platform_to_check")
+    assert len(processed) == 2
+
+    hass.bus.async_fire(EVENT_COMPONENT_LOADED, {ATTR_COMPONENT: "event"})
+    await hass.async_block_till_done()
+    await async_process_lazy_integration_platforms(hass, "platform_to_check")
+    assert len(processed) == 2
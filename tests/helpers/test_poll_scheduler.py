@@ -0,0 +1,86 @@
+"""Tests for the poll scheduler."""
+
+from datetime import timedelta
+from unittest.mock import Mock
+
+import pytest
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import poll_scheduler
+from homeassistant.util.dt import utcnow
+
+from tests.common import async_fire_time_changed
+
+
+async def test_jobs_share_slots(hass: HomeAssistant) -> None:
+    """Test jobs within their delay tolerance run in the same slot."""
+    scheduler = poll_scheduler.async_get(hass)
+    assert poll_scheduler.async_get(hass) is scheduler
+
+    first = Mock()
+    second = Mock()
+    later = Mock()
+    scheduler.async_schedule(30, first)
+    scheduler.async_schedule(31, second)
+    scheduler.async_schedule(60, later)
+
+    async_fire_time_changed(hass, utcnow() + timedelta(seconds=31))
+    await hass.async_block_till_done()
+    first.assert_called_once()
+    second.assert_called_once()
+    later.assert_not_called()
+
+    async_fire_time_changed(hass, utcnow() + timedelta(seconds=61))
+    await hass.async_block_till_done()
+    later.assert_called_once()
+
+
+async def test_cancel_job(hass: HomeAssistant) -> None:
+    """Test cancelling jobs."""
+    scheduler = poll_scheduler.async_get(hass)
+
+    cancelled = Mock()
+    kept = Mock()
+    cancel = scheduler.async_schedule(30, cancelled)
+    scheduler.async_schedule(30, kept)
+    cancel()
+    cancel_alone = scheduler.async_schedule(120, cancelled)
+    cancel_alone()
+
+    async_fire_time_changed(hass, utcnow() + timedelta(seconds=121))
+    await hass.async_block_till_done()
+    cancelled.assert_not_called()
+    kept.assert_called_once()
+
+    # Cancelling a job which already ran does nothing
+    cancel()
+
+
+async def test_host_semaphore(hass: HomeAssistant) -> None:
+    """Test refreshes are limited per host."""
+    scheduler = poll_scheduler.async_get(hass)
+
+    semaphore = scheduler.async_get_host_semaphore("192.168.1.2")
+    assert scheduler.async_get_host_semaphore("192.168.1.2") is semaphore
+    assert scheduler.async_get_host_semaphore("192.168.1.3") is not semaphore
+    for _ in range(poll_scheduler.MAX_CONCURRENT_REFRESHES_PER_HOST):
+        await semaphore.acquire()
+    assert semaphore.locked()
+
+
+@pytest.mark.parametrize(
+    ("latency", "bucket"),
+    [(0.0, 0), (0.1, 0), (0.2, 1), (5.0, 5), (60.0, 8), (61.0, 9)],
+)
+def test_latency_histogram(latency: float, bucket: int) -> None:
+    """Test latencies are counted in the right bucket."""
+    histogram = poll_scheduler.LatencyHistogram()
+    histogram.record(latency)
+    histogram.record(1.0)
+
+    expected = [0] * (len(poll_scheduler.LATENCY_BUCKETS) + 1)
+    expected[bucket] += 1
+    expected[3] += 1
+    assert histogram.counts == expected
+    assert histogram.count == 2
+    assert histogram.sum == latency + 1.0
@@ -0,0 +1,78 @@
+"""Tests for the reference index."""
+
+from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.reference_index import ReferenceIndex
+
+
+class ReferencingEntity(Entity):
+    """Entity which references other items."""
+
+    def __init__(
+        self,
+        entity_id: str,
+        entities: set[str],
+        devices: set[str] | None = None,
+        blueprint: str | None = None,
+    ) -> None:
+        """Initialize the entity."""
+        self.entity_id = entity_id
+        self.referenced_areas: set[str] = set()
+        self.referenced_blueprint = blueprint
+        self.referenced_devices = devices or set()
+        self.referenced_entities = entities
+        self.referenced_floors: set[str] = set()
+        self.referenced_labels: set[str] = set()
+
+
+def test_reference_index() -> None:
+    """Test the index is built lazily and updated incrementally."""
+    index = ReferenceIndex()
+    first = ReferencingEntity(
+        "automation.first", {"light.kitchen", "light.hall"}, {"device-1"}, "a.yaml"
+    )
+    second = ReferencingEntity("automation.second", {"light.kitchen"})
+    index.async_add(first)
+    index.async_add(second)
+
+    assert index.async_get("referenced_entities", "light.kitchen") == [
+        "automation.first",
+        "automation.second",
+    ]
+    assert index.async_get("referenced_entities", "light.hall") == ["automation.first"]
+    assert index.async_get("referenced_devices", "device-1") == ["automation.first"]
+    assert index.async_get("referenced_blueprint", "a.yaml") == ["automation.first"]
+    assert index.async_get("referenced_areas", "kitchen") == []
+
+    # The index is updated after it was built
+    third = ReferencingEntity("automation.third", {"light.hall"}, None, "a.yaml")
+    index.async_add(third)
+    assert index.async_get("referenced_entities", "light.hall") == [
+        "automation.first",
+        "automation.third",
+    ]
+
+    index.async_remove(first)
+    assert index.async_get("referenced_entities", "light.kitchen") == [
+        "automation.second"
+    ]
+    assert index.async_get("referenced_entities", "light.hall") == ["automation.third"]
+    assert index.async_get("referenced_devices", "device-1") == []
+    assert index.async_get("referenced_blueprint", "a.yaml") == ["automation.third"]
+
+    # Removing an entity which is not in the index does nothing
+    index.async_remove(first)
+    index.async_remove(ReferencingEntity("automation.second", {"light.hall"}))
+    assert index.async_get("referenced_entities", "light.kitchen") == [
+        "automation.second"
+    ]
+
+
+def test_reference_index_removed_before_built() -> None:
+    """Test entities removed before the index is built are not indexed."""
+    index = ReferenceIndex()
+    first = ReferencingEntity("script.first", {"light.kitchen"})
+    index.async_add(first)
+    index.async_add(ReferencingEntity("script.second", {"light.kitchen"}))
+    index.async_remove(first)
+
+    assert index.async_get("referenced_entities", "light.kitchen") == ["script.second"]
@@ -6,6 +6,8 @@ import logging
 from typing import Any
 from unittest.mock import Mock, patch
 
+from freezegun.api import FrozenDateTimeFactory
+
 from homeassistant.const import EVENT_HOMEASSISTANT_START, EVENT_HOMEASSISTANT_STOP
 from homeassistant.core import CoreState, HomeAssistant, State
 from homeassistant.exceptions import HomeAssistantError
@@ -15,6 +17,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.reload import async_get_platform_without_config_entry
 from homeassistant.helpers.restore_state import (
     DATA_RESTORE_STATE,
+    LAST_SEEN_UPDATE_INTERVAL,
     STORAGE_KEY,
     RestoreEntity,
     RestoreStateData,
@@ -342,6 +345,57 @@ async def test_dump_data(hass: HomeAssistant) -> None:
     assert state1["state"]["state"] == "off"
 
 
+async def test_dump_unchanged_states(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test unchanged stored states are not serialized again."""
+    platform = MockEntityPlatform(hass, domain="input_boolean")
+    entities = []
+    for idx in range(2):
+        entity = RestoreEntity()
+        entity.hass = hass
+        entity.entity_id = f"input_boolean.b{idx}"
+        entities.append(entity)
+    await platform.async_add_entities(entities)
+    hass.states.async_set("input_boolean.b0", "on")
+    hass.states.async_set("input_boolean.b1", "on")
+    data = async_get(hass)
+
+    async def _async_dump() -> list[Any]:
+        with patch(
+            "homeassistant.helpers.restore_state.Store.async_save"
+        ) as mock_write_data:
+            await data.async_dump_states()
+        return mock_write_data.mock_calls[0][1][0]
+
+    first_seen = dt_util.utcnow()
+    written_states = await _async_dump()
+    assert [json_round_trip(item)["last_seen"] for item in written_states] == [
+        first_seen.isoformat(),
+        first_seen.isoformat(),
+    ]
+
+    # Only the changed state is serialized again, its last seen time is kept
+    freezer.tick(timedelta(hours=1))
+    hass.states.async_set("input_boolean.b1", "off")
+    previous_states = written_states
+    written_states = await _async_dump()
+    assert written_states[0] is previous_states[0]
+    assert json_round_trip(written_states[1]) == {
+        "state": json_round_trip(hass.states.get("input_boolean.b1")),
+        "extra_data": None,
+        "last_seen": first_seen.isoformat(),
+    }
+
+    # The last seen time is updated periodically
+    freezer.tick(LAST_SEEN_UPDATE_INTERVAL)
+    written_states = await _async_dump()
+    assert [json_round_trip(item)["last_seen"] for item in written_states] == [
+        dt_util.utcnow().isoformat(),
+        dt_util.utcnow().isoformat(),
+    ]
+
+
 async def test_dump_error(hass: HomeAssistant) -> None:
     """Test that we cache data."""
     states = [
@@ -842,6 +842,201 @@ async def test_json_load_failure(tmpdir: py.path.local) -> None:
         await hass.async_stop(force=True)
 
 
+async def test_delta_log(tmpdir: py.path.local) -> None:
+    """Test changes are appended to the delta log and replayed on load."""
+    loop = asyncio.get_running_loop()
+    tmp_storage = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=tmp_storage.strpath) as hass:
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, delta_log=True)
+        log_path = f"{store.path}{storage.DELTA_LOG_SUFFIX}"
+        items = [{"id": str(idx), "name": f"item {idx}"} for idx in range(50)]
+        data: dict[str, Any] = {"items": items, "name": "initial"}
+
+        def _read_files() -> tuple[dict[str, Any], list[str]]:
+            with open(store.path, encoding="utf8") as base_file:
+                base = json.load(base_file)
+            if not os.path.exists(log_path):
+                return base, []
+            with open(log_path, encoding="utf8") as log_file:
+                return base, log_file.read().splitlines()
+
+        def _write_log(mode: str, text: str) -> None:
+            with open(log_path, mode, encoding="utf8") as log_file:
+                log_file.write(text)
+
+        async def _async_load_new_store() -> Any:
+            return await storage.Store(
+                hass, MOCK_VERSION, MOCK_KEY, delta_log=True
+            ).async_load()
+
+        # The first write writes the base file
+        await store.async_save(data)
+        base, log = await hass.async_add_executor_job(_read_files)
+        assert base["data"] == data
+        assert log == []
+
+        # Changes are appended to the log
+        items[10] = {"id": "10", "name": "renamed"}
+        del items[20]
+        items.append({"id": "50", "name": "item 50"})
+        data = {"items": items, "extra": True}
+        await store.async_save(data)
+        # Saving unchanged data does not write anything
+        await store.async_save(data)
+        base, log = await hass.async_add_executor_job(_read_files)
+        assert base["data"] == {
+            "items": [{"id": str(idx), "name": f"item {idx}"} for idx in range(50)],
+            "name": "initial",
+        }
+        assert len(log) == 1
+        assert len(log[0]) < 200
+        assert await _async_load_new_store() == data
+
+        # An incomplete record at the end of the log is ignored
+        await hass.async_add_executor_job(_write_log, "a", '{"seq')
+        assert await _async_load_new_store() == data
+
+        # A new store writes the base file the first time and removes the log
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, delta_log=True)
+        assert await store.async_load() == data
+        data = {"items": items[:5]}
+        await store.async_save(data)
+        base, log = await hass.async_add_executor_job(_read_files)
+        assert base["data"] == data
+        assert log == []
+
+        # The log is compacted into the base file when it has too many records
+        with patch.object(storage, "DELTA_LOG_MAX_RECORDS", 2):
+            for idx in range(3):
+                data = {"items": [*items[:5], {"id": "new", "name": str(idx)}]}
+                await store.async_save(data)
+        base, log = await hass.async_add_executor_job(_read_files)
+        assert base["data"] == data
+        assert base["delta_log_sequence"] == 3
+        assert log == []
+        assert await _async_load_new_store() == data
+
+        # Records which are in the base file already are skipped
+        await hass.async_add_executor_job(
+            _write_log, "w", '{"set":{"items":[]},"sequence":3}\n'
+        )
+        assert await _async_load_new_store() == data
+
+        await store.async_remove()
+        assert not await hass.async_add_executor_job(os.path.exists, log_path)
+        await hass.async_stop(force=True)
+
+
+async def test_delta_log_list(tmpdir: py.path.local) -> None:
+    """Test changes of list data are appended to the delta log."""
+    loop = asyncio.get_running_loop()
+    tmp_storage = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=tmp_storage.strpath) as hass:
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, delta_log=True)
+        log_path = f"{store.path}{storage.DELTA_LOG_SUFFIX}"
+        data = [{"id": str(idx), "state": "off"} for idx in range(100)]
+        await store.async_save(data)
+
+        def _read_log() -> list[str]:
+            with open(log_path, encoding="utf8") as log_file:
+                return log_file.read().splitlines()
+
+        async def _async_load_new_store() -> Any:
+            return await storage.Store(
+                hass, MOCK_VERSION, MOCK_KEY, delta_log=True
+            ).async_load()
+
+        # Items changed in place
+        data = [*data]
+        data[5] = {"id": "5", "state": "on"}
+        data[6] = {"id": "6", "state": "on"}
+        data[70] = {"id": "70", "state": "on"}
+        await store.async_save(data)
+        log = await hass.async_add_executor_job(_read_log)
+        assert len(log) == 1
+        assert len(log[0]) < 200
+        assert await _async_load_new_store() == data
+
+        # Items removed and added, loading the store compacted the log
+        data = [*data[:10], *data[11:], {"id": "100", "state": "off"}]
+        await store.async_save(data)
+        log = await hass.async_add_executor_job(_read_log)
+        assert len(log) == 1
+        assert len(log[0]) < 200
+        assert await _async_load_new_store() == data
+        await hass.async_stop(force=True)
+
+
+@pytest.mark.parametrize(
+    "record",
+    [
+        '{"set":{"name":"invalid"}}',
+        '{"splice":{"unknown":[[0,0,[]]]},"sequence":2}',
+        '{"splice":{"items":[[5,9,[]]]},"sequence":2}',
+        '{"splice":{"items":"invalid"},"sequence":2}',
+        '{"splice_data":[[0,0,[]]],"sequence":2}',
+    ],
+)
+async def test_delta_log_invalid_record(
+    tmpdir: py.path.local, caplog: pytest.LogCaptureFixture, record: str
+) -> None:
+    """Test replaying the delta log stops at an invalid record."""
+    loop = asyncio.get_running_loop()
+    tmp_storage = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=tmp_storage.strpath) as hass:
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, delta_log=True)
+        log_path = f"{store.path}{storage.DELTA_LOG_SUFFIX}"
+        await store.async_save({"items": [1, 2], "name": "initial"})
+        await store.async_save({"items": [1, 2, 3], "name": "initial"})
+
+        def _write_log() -> None:
+            with open(log_path, "a", encoding="utf8") as log_file:
+                log_file.write(f'{record}\n{{"set":{{"name":"next"}},"sequence":3}}\n')
+
+        await hass.async_add_executor_job(_write_log)
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, delta_log=True)
+        assert await store.async_load() == {"items": [1, 2, 3], "name": "initial"}
+        assert "invalid record" in caplog.text
+
+        # The valid records were compacted into the base file
+        assert not await hass.async_add_executor_job(os.path.exists, log_path)
+        assert await storage.Store(
+            hass, MOCK_VERSION, MOCK_KEY, delta_log=True
+        ).async_load() == {"items": [1, 2, 3], "name": "initial"}
+        await hass.async_stop(force=True)
+
+
+async def test_delta_log_compacted_at_final_write(tmpdir: py.path.local) -> None:
+    """Test the delta log is compacted into the base file at the final write."""
+    loop = asyncio.get_running_loop()
+    tmp_storage = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=tmp_storage.strpath) as hass:
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, delta_log=True)
+        log_path = f"{store.path}{storage.DELTA_LOG_SUFFIX}"
+        data: dict[str, Any] = {"items": [{"id": "1"}, {"id": "2"}], "name": "a"}
+        await store.async_save(data)
+        data = {"items": [{"id": "1"}, {"id": "3"}], "name": "b"}
+        await store.async_save(data)
+        assert await hass.async_add_executor_job(os.path.exists, log_path)
+
+        def _read_base() -> dict[str, Any]:
+            with open(store.path, encoding="utf8") as base_file:
+                return json.load(base_file)
+
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+        await hass.async_block_till_done()
+        assert not await hass.async_add_executor_job(os.path.exists, log_path)
+        base = await hass.async_add_executor_job(_read_base)
+        assert base == {
+            "version": MOCK_VERSION,
+            "minor_version": 1,
+            "key": MOCK_KEY,
+            "data": data,
+            "delta_log_sequence": 1,
+        }
+        await hass.async_stop(force=True)
+
+
 async def test_read_only_store(
     hass: HomeAssistant, read_only_store: storage.Store, hass_storage: dict[str, Any]
 ) -> None:
@@ -13,6 +13,7 @@ from typing import Any
 from unittest.mock import patch
 
 from freezegun import freeze_time
+import jinja2
 import orjson
 import pytest
 from syrupy import SnapshotAssertion
@@ -22,6 +23,8 @@ from homeassistant import config_entries
 from homeassistant.components import group
 from homeassistant.const import (
     ATTR_UNIT_OF_MEASUREMENT,
+    EVENT_HOMEASSISTANT_STARTED,
+    EVENT_HOMEASSISTANT_STOP,
     STATE_ON,
     STATE_UNAVAILABLE,
     UnitOfArea,
@@ -5186,9 +5189,91 @@ async def test_cache_garbage_collection() -> None:
     del tpl
     assert template._NO_HASS_ENV.template_cache.get(template_string)
     del tpl2
+    # The compiled code is kept by the compiled template cache
+    assert template._NO_HASS_ENV.template_cache.get(template_string)
+    template.COMPILED_TEMPLATE_CACHE.clear()
     assert not template._NO_HASS_ENV.template_cache.get(template_string)
 
 
+async def test_compiled_template_cache(hass: HomeAssistant) -> None:
+    """Test compiled templates are shared by templates with the same source."""
+    template_string = "{{ states('sensor.compiled_cache') | float(0) * 2 }}"
+    cache = template.COMPILED_TEMPLATE_CACHE
+    cache.clear()
+
+    template.Template(template_string, hass).ensure_valid()
+    assert cache.cache_info() == {
+        "hits": 0,
+        "misses": 1,
+        "size": 1,
+        "maxsize": template.COMPILED_TEMPLATE_CACHE_SIZE,
+    }
+    # A new environment, for example after a restart of the template integration
+    hass.data.pop(template._ENVIRONMENT)
+    with patch.object(
+        jinja2.sandbox.ImmutableSandboxedEnvironment, "compile"
+    ) as compile_mock:
+        tpl = template.Template(template_string, hass)
+        tpl.ensure_valid()
+    compile_mock.assert_not_called()
+    assert cache.hits == 1
+    hass.states.async_set("sensor.compiled_cache", "2")
+    assert tpl.async_render() == 4.0
+
+    # Environments with other filters do not share the compiled code
+    template.Template(template_string).ensure_valid()
+    assert cache.cache_info()["size"] == 2
+    assert cache.misses == 2
+
+
+async def test_template_bytecode_is_saved_and_loaded(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test the compiled templates are saved and loaded on the next start."""
+    template_string = "{{ states('sensor.bytecode') | float(0) + 1 }}"
+    cache = template.COMPILED_TEMPLATE_CACHE
+    cache.clear()
+    await template.async_load_template_bytecode(hass)
+    template.Template(template_string, hass).ensure_valid()
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STARTED)
+    await hass.async_block_till_done()
+    stored = hass_storage[template.TEMPLATE_BYTECODE_STORAGE_KEY]["data"]
+
+    cache.clear()
+    hass.data.pop(template._ENVIRONMENT)
+    await template.async_load_template_bytecode(hass)
+    with patch.object(
+        jinja2.sandbox.ImmutableSandboxedEnvironment, "compile"
+    ) as compile_mock:
+        tpl = template.Template(template_string, hass)
+        assert tpl.async_render() == 1.0
+    compile_mock.assert_not_called()
+    assert template._decode_template_bytecode(stored) == cache.dump()
+
+    # Only templates which are used are saved again
+    cache.clear()
+    await template.async_load_template_bytecode(hass)
+    template.Template("{{ 1 + 2 }}", hass).ensure_valid()
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STOP)
+    await hass.async_block_till_done()
+    saved = template._decode_template_bytecode(
+        hass_storage[template.TEMPLATE_BYTECODE_STORAGE_KEY]["data"]
+    )
+    assert saved == cache.dump()
+    assert len(saved) == 1
+    assert saved.keys() != template._decode_template_bytecode(stored).keys()
+
+    # Code compiled by other versions is not loaded
+    cache.clear()
+    hass_storage[template.TEMPLATE_BYTECODE_STORAGE_KEY]["data"] = {
+        **stored,
+        "magic": "00000000",
+    }
+    await template.async_load_template_bytecode(hass)
+    assert cache.dump() == {}
+    assert cache._loaded == {}
+
+
 def test_is_template_string() -> None:
     """Test is template string."""
     assert template.is_template_string("{{ x }}") is True
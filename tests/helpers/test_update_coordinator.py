@@ -1,5 +1,6 @@
 """Tests for the update coordinator."""
 
+import asyncio
 from datetime import datetime, timedelta
 import logging
 from unittest.mock import AsyncMock, Mock, patch
@@ -12,7 +13,7 @@ import pytest
 import requests
 
 from homeassistant import config_entries
-from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.const import CONF_HOST, EVENT_HOMEASSISTANT_STOP
 from homeassistant.core import CALLBACK_TYPE, CoreState, HomeAssistant, callback
 from homeassistant.exceptions import (
     ConfigEntryAuthFailed,
@@ -937,3 +938,58 @@ async def test_listener_unsubscribe_releases_coordinator(hass: HomeAssistant) ->
 
     # Ensure the coordinator is released
     assert weak_ref() is None
+
+
+async def test_aggregate_polling(hass: HomeAssistant) -> None:
+    """Test coordinators using the poll scheduler share slots and hosts."""
+    entry = MockConfigEntry(domain="test", data={CONF_HOST: "192.168.1.2"})
+    release = asyncio.Event()
+    running = 0
+    max_running = 0
+
+    async def refresh() -> int:
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await release.wait()
+        running -= 1
+        return 1
+
+    coordinators = [
+        update_coordinator.DataUpdateCoordinator[int](
+            hass,
+            _LOGGER,
+            config_entry=entry,
+            name=f"test {idx}",
+            update_method=refresh,
+            update_interval=timedelta(seconds=30 + idx),
+            aggregate_polling=True,
+        )
+        for idx in range(3)
+    ]
+    for crd in coordinators:
+        crd.async_add_listener(lambda: None)
+
+    async_fire_time_changed(hass, utcnow() + timedelta(seconds=32))
+    await hass.async_block_till_done(wait_background_tasks=False)
+    # All refreshes started in the same slot, but only two run at the same time
+    assert running == 2
+
+    release.set()
+    await hass.async_block_till_done(wait_background_tasks=True)
+    assert running == 0
+    assert max_running == 2
+    for crd in coordinators:
+        assert crd.data == 1
+        assert crd.refresh_latency is not None
+        assert crd.refresh_latency.count == 1
+
+    for crd in coordinators:
+        await crd.async_shutdown()
+
+
+async def test_aggregate_polling_disabled(
+    crd: update_coordinator.DataUpdateCoordinator[int],
+) -> None:
+    """Test coordinators do not use the poll scheduler by default."""
+    assert crd.refresh_latency is None
@@ -1165,6 +1165,94 @@ async def test_eventbus_filtered_listener(hass: HomeAssistant) -> None:
     unsub()
 
 
+async def test_eventbus_keyed_listener(hass: HomeAssistant) -> None:
+    """Test listening for the events of entity ids and domains."""
+    calls = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event.data["entity_id"])
+
+    old_count = hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0)
+    unsub_entity = hass.bus.async_listen_keyed(
+        EVENT_STATE_CHANGED, listener, entity_ids=["light.Kitchen", "switch.fan"]
+    )
+    unsub_domain = hass.bus.async_listen_keyed(
+        EVENT_STATE_CHANGED, listener, domains=["light"], entity_ids=["light.kitchen"]
+    )
+    assert hass.bus.async_listeners()[EVENT_STATE_CHANGED] == old_count + 2
+
+    hass.states.async_set("light.kitchen", "on")
+    hass.states.async_set("light.bedroom", "on")
+    hass.states.async_set("switch.fan", "on")
+    hass.states.async_set("switch.other", "on")
+    hass.bus.async_fire(EVENT_STATE_CHANGED)
+    hass.bus.async_fire(EVENT_STATE_CHANGED, {"entity_id": ["light.kitchen"]})
+    await hass.async_block_till_done()
+
+    # The domain listener of light.kitchen only runs once
+    assert calls == ["light.kitchen", "light.kitchen", "light.bedroom", "switch.fan"]
+
+    unsub_domain()
+    assert hass.bus.async_listeners()[EVENT_STATE_CHANGED] == old_count + 1
+    calls.clear()
+    hass.states.async_set("light.bedroom", "off")
+    hass.states.async_set("switch.fan", "off")
+    await hass.async_block_till_done()
+    assert calls == ["switch.fan"]
+
+    unsub_entity()
+    assert hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0) == old_count
+    assert EVENT_STATE_CHANGED not in hass.bus._keyed_listeners
+
+
+async def test_eventbus_keyed_listener_with_filter(hass: HomeAssistant) -> None:
+    """Test keyed listeners with an event filter."""
+    calls = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event)
+
+    @ha.callback
+    def mock_filter(event_data):
+        """Mock filter."""
+        return event_data["new_state"].state == "on"
+
+    hass.bus.async_listen_keyed(
+        EVENT_STATE_CHANGED,
+        listener,
+        entity_ids=["light.kitchen"],
+        event_filter=mock_filter,
+    )
+    hass.states.async_set("light.kitchen", "off")
+    hass.states.async_set("light.kitchen", "on")
+    await hass.async_block_till_done()
+    assert len(calls) == 1
+
+
+async def test_eventbus_keyed_listener_invalid(hass: HomeAssistant) -> None:
+    """Test invalid keyed listeners are rejected."""
+
+    def listener(event):
+        """Mock listener."""
+
+    with pytest.raises(HomeAssistantError, match="requires entity_ids or domains"):
+        hass.bus.async_listen_keyed(EVENT_STATE_CHANGED, listener)
+    with pytest.raises(HomeAssistantError, match="Invalid domain"):
+        hass.bus.async_listen_keyed(
+            EVENT_STATE_CHANGED, listener, domains=["light.kitchen"]
+        )
+    with pytest.raises(HomeAssistantError, match="can not listen"):
+        hass.bus.async_listen_keyed(MATCH_ALL, listener, domains=["light"])
+    with pytest.raises(HomeAssistantError, match="is not a callback"):
+        hass.bus.async_listen_keyed(
+            EVENT_STATE_CHANGED, listener, domains=["light"], event_filter=listener
+        )
+
+
 async def test_eventbus_run_immediately_callback(hass: HomeAssistant) -> None:
     """Test we can call events immediately with a callback."""
     calls = []
@@ -9,17 +9,24 @@ from typing import Any
 from unittest.mock import MagicMock, patch
 
 from awesomeversion import AwesomeVersion
+from freezegun.api import FrozenDateTimeFactory
 import pytest
 
 from homeassistant import loader
 from homeassistant.components import http, hue
 from homeassistant.components.hue import light as hue_light
+from homeassistant.const import __version__ as HA_VERSION
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import frame
 from homeassistant.helpers.json import json_dumps
 from homeassistant.util.json import json_loads
 
-from .common import MockModule, async_get_persistent_notifications, mock_integration
+from .common import (
+    MockModule,
+    async_fire_time_changed,
+    async_get_persistent_notifications,
+    mock_integration,
+)
 
 
 async def test_circular_component_dependencies(hass: HomeAssistant) -> None:
@@ -2039,3 +2046,87 @@ async def test_manifest_json_fragment_round_trip(hass: HomeAssistant) -> None:
         json_loads(json_dumps(integration.manifest_json_fragment))
         == integration.manifest
     )
+
+
+async def test_integration_cache(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test integrations are resolved from the persistent integration cache."""
+    await loader.async_load_integration_cache(hass)
+    integration = await loader.async_get_integration(hass, "automation")
+    assert await integration.resolve_dependencies()
+    dependencies = integration.all_dependencies
+    assert dependencies == {"blueprint", "trace"}
+    assert "0 from the integration cache" in loader.async_describe_integration_cache(
+        hass
+    )
+
+    loader.async_save_integration_cache(hass)
+    freezer.tick(loader.INTEGRATION_CACHE_SAVE_DELAY + 1)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    stored = hass_storage[loader.INTEGRATION_CACHE_STORAGE_KEY]["data"]
+    assert stored["ha_version"] == HA_VERSION
+    entry = stored["integrations"][str(integration.file_path)]
+    assert entry["manifest"]["domain"] == "automation"
+    assert "__init__.py" in entry["top_level_files"]
+    assert entry["dependencies"].keys() == dependencies
+
+    # Restart with the cache
+    hass.data[loader.DATA_INTEGRATIONS] = {}
+    await loader.async_load_integration_cache(hass)
+    with (
+        patch("homeassistant.loader._resolve_manifest") as mock_resolve_manifest,
+        patch(
+            "homeassistant.loader._async_component_dependencies"
+        ) as mock_component_dependencies,
+    ):
+        integration = await loader.async_get_integration(hass, "automation")
+        assert await integration.resolve_dependencies()
+    assert integration.all_dependencies == dependencies
+    assert integration.platforms_exists(["logbook", "missing"]) == ["logbook"]
+    assert not mock_resolve_manifest.called
+    assert not mock_component_dependencies.called
+    assert (
+        "3 integration directories resolved"
+        in loader.async_describe_integration_cache(hass)
+    )
+    assert "3 from the integration cache" in loader.async_describe_integration_cache(
+        hass
+    )
+
+    # A changed dependency invalidates the cached dependencies
+    stored["integrations"][str(integration.file_path)]["dependencies"]["trace"] = (
+        "changed"
+    )
+    hass.data[loader.DATA_INTEGRATIONS] = {}
+    await loader.async_load_integration_cache(hass)
+    integration = await loader.async_get_integration(hass, "automation")
+    with patch(
+        "homeassistant.loader._async_component_dependencies",
+        wraps=loader._async_component_dependencies,
+    ) as mock_component_dependencies:
+        assert await integration.resolve_dependencies()
+    assert integration.all_dependencies == dependencies
+    assert mock_component_dependencies.called
+
+    # The cache is discarded when the version changes
+    stored["ha_version"] = "0.1.0"
+    hass.data[loader.DATA_INTEGRATIONS] = {}
+    await loader.async_load_integration_cache(hass)
+    await loader.async_get_integration(hass, "automation")
+    assert "0 from the integration cache" in loader.async_describe_integration_cache(
+        hass
+    )
+
+
+async def test_platform_import_timings(hass: HomeAssistant) -> None:
+    """Test the time it takes to import each platform is recorded."""
+    integration = await loader.async_get_integration(hass, "automation")
+    await integration.async_get_platform("logbook")
+
+    timings = loader.async_get_platform_import_timings(hass)
+    assert "automation.logbook" in timings
+    assert timings["automation.logbook"] >= 0
@@ -1163,6 +1163,58 @@ async def test_async_start_setup_simple_integration_end_to_end(
     }
 
 
+async def test_async_get_setup_trace_end_to_end(hass: HomeAssistant) -> None:
+    """Test the startup trace records the setup of an integration and its dependencies."""
+    hass.set_state(CoreState.not_running)
+    mock_integration(hass, MockModule("test_trace_dependency"))
+    mock_integration(
+        hass,
+        MockModule("test_trace_integration", dependencies=["test_trace_dependency"]),
+    )
+    assert await setup.async_setup_component(hass, "test_trace_integration", {})
+    await hass.async_block_till_done()
+
+    spans = setup.async_get_setup_trace(hass)
+    assert [span.start for span in spans] == sorted(span.start for span in spans)
+    assert all(span.end >= span.start for span in spans)
+    assert {
+        (span.integration, span.group, span.name)
+        for span in spans
+        if span.integration.startswith("test_trace")
+    } == {
+        ("test_trace_integration", None, setup.TRACE_WAIT_DEPENDENCIES),
+        ("test_trace_integration", None, setup.TRACE_REQUIREMENTS),
+        ("test_trace_integration", None, setup.TRACE_IMPORT_COMPONENT),
+        ("test_trace_integration", None, setup.SetupPhases.SETUP),
+        ("test_trace_dependency", None, setup.TRACE_WAIT_DEPENDENCIES),
+        ("test_trace_dependency", None, setup.TRACE_REQUIREMENTS),
+        ("test_trace_dependency", None, setup.TRACE_IMPORT_COMPONENT),
+        ("test_trace_dependency", None, setup.SetupPhases.SETUP),
+    }
+    wait_dependencies = next(
+        span
+        for span in spans
+        if span.integration == "test_trace_integration"
+        and span.name == setup.TRACE_WAIT_DEPENDENCIES
+    )
+    dependency_setup = next(
+        span
+        for span in spans
+        if span.integration == "test_trace_dependency"
+        and span.name == setup.SetupPhases.SETUP
+    )
+    assert wait_dependencies.start <= dependency_setup.start
+    assert wait_dependencies.end >= dependency_setup.end
+
+
+async def test_async_get_setup_trace_running(hass: HomeAssistant) -> None:
+    """Test nothing is added to the startup trace once running."""
+    assert hass.state is CoreState.running
+    mock_integration(hass, MockModule("test_trace_integration"))
+    assert await setup.async_setup_component(hass, "test_trace_integration", {})
+    assert setup.async_get_setup_trace(hass) == []
+
+
 async def test_async_get_setup_timings(hass: HomeAssistant) -> None:
     """Test we can get the setup timings from the setup time data."""
     setup_time = setup._setup_times(hass)
@@ -1015,6 +1015,64 @@ def test_unit_conversion_factory_allow_none(
     ) == pytest.approx(expected)
 
 
+@pytest.mark.parametrize(
+    ("converter", "from_unit", "to_unit"),
+    [
+        (converter, from_unit, to_unit)
+        for converter, item in _CONVERTED_VALUE.items()
+        for _, from_unit, _, to_unit in item
+    ],
+)
+def test_unit_conversion_factory_batch(
+    converter: type[BaseUnitConverter],
+    from_unit: str,
+    to_unit: str,
+) -> None:
+    """Test batch conversion gives the same results as converting each value."""
+    values = [0.5, 1.0, None, 12.5, 1234.5678, None]
+    convert = converter.converter_factory_allow_none(from_unit, to_unit)
+    assert converter.converter_factory_batch(from_unit, to_unit)(values) == [
+        convert(value) for value in values
+    ]
+
+
+@pytest.mark.parametrize(
+    ("converter", "valid_unit"),
+    [
+        (converter, valid_unit)
+        for converter, valid_units in _ALL_CONVERTERS.items()
+        for valid_unit in valid_units
+    ],
+)
+def test_unit_conversion_factory_batch_same_unit(
+    converter: type[BaseUnitConverter], valid_unit: str
+) -> None:
+    """Test batch conversion to the same unit."""
+    values = (1.0, None)
+    assert converter.converter_factory_batch(valid_unit, valid_unit)(values) == [
+        1.0,
+        None,
+    ]
+
+
+@pytest.mark.parametrize(
+    ("converter", "valid_unit"),
+    [
+        (converter, valid_unit)
+        for converter, valid_units in _ALL_CONVERTERS.items()
+        for valid_unit in valid_units
+    ],
+)
+def test_unit_conversion_factory_batch_invalid_unit(
+    converter: type[BaseUnitConverter], valid_unit: str
+) -> None:
+    """Test a batch converter is not created for invalid units."""
+    with pytest.raises(HomeAssistantError, match="is not a recognized .* unit"):
+        converter.converter_factory_batch(valid_unit, INVALID_SYMBOL)
+    with pytest.raises(HomeAssistantError, match="is not a recognized .* unit"):
+        converter.converter_factory_batch(INVALID_SYMBOL, valid_unit)
+
+
 @pytest.mark.parametrize(
     ("value", "from_unit", "expected", "to_unit"),
     [